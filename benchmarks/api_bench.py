@@ -0,0 +1,146 @@
+"""
+Requests per second for the local pricing API (pottery_api.py).
+
+    python benchmarks/api_bench.py                       # 1 worker, then one per core
+    python benchmarks/api_bench.py --workers 1 4 --clients 8 --duration 5
+    python benchmarks/api_bench.py --settings my_settings.json
+
+Starts the API on a free port for each worker count (with a synthetic 10k-form
+studio unless --settings is given), then runs --clients client processes,
+each holding one keep-alive connection, for --duration seconds per scenario:
+
+    single   GET /price for one form (warm cache)
+    batch    POST /price with --batch forms (warm cache)
+    cold     POST /price with --batch custom forms that are never cached
+
+Client and server share the machine, so on a small box the clients eat into
+the numbers; compare worker counts against each other rather than across machines.
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from load_test import _free_port  # noqa: E402
+from run_benchmarks import make_settings_state, settings_json_bytes  # noqa: E402
+
+API_PATH = os.path.join(ROOT, "pottery_api.py")
+
+
+def start_api(settings_path: str, port: int, workers: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, API_PATH, settings_path, "--port", str(port), "--workers", str(workers)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("pricing API did not come up within 60 s")
+
+
+def _client(port, scenario, names, batch, duration, seed, out):
+    rng = np.random.default_rng(seed)
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    headers = {"Content-Type": "application/json"}
+    done = forms = 0
+    stop = time.perf_counter() + duration
+    while time.perf_counter() < stop:
+        if scenario == "single":
+            name = names[rng.integers(len(names))]
+            conn.request("GET", "/price?" + urllib.parse.urlencode({"form": name}))
+            n = 1
+        elif scenario == "batch":
+            picks = [names[i] for i in rng.integers(len(names), size=batch)]
+            conn.request("POST", "/price", json.dumps({"forms": picks}), headers)
+            n = batch
+        else:
+            custom = [{"Form": f"Test {seed}-{done}-{i}", "Clay_lb_wet": float(rng.uniform(0.5, 5)),
+                       "Default_glaze_g": float(rng.uniform(20, 400))} for i in range(batch)]
+            conn.request("POST", "/price", json.dumps({"forms": custom}), headers)
+            n = batch
+        resp = conn.getresponse()
+        resp.read()
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}")
+        done += 1
+        forms += n
+    conn.close()
+    out.put((done, forms))
+
+
+def run_scenario(port, scenario, names, clients, batch, duration):
+    out = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_client, args=(port, scenario, names, batch, duration, i, out))
+             for i in range(clients)]
+    for p in procs:
+        p.start()
+    results = [out.get() for _ in procs]
+    for p in procs:
+        p.join()
+    reqs = sum(r[0] for r in results)
+    forms = sum(r[1] for r in results)
+    return reqs / duration, forms / duration
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--settings", default="", help="settings file to serve (default: synthetic studio)")
+    parser.add_argument("--forms", type=int, default=10_000, help="forms in the synthetic studio")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, max(2, os.cpu_count() or 1)])
+    parser.add_argument("--clients", type=int, default=4, help="client processes, one keep-alive connection each")
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds per scenario")
+    parser.add_argument("--batch", type=int, default=100, help="forms per batch request")
+    parser.add_argument("--scenarios", nargs="+", default=["single", "batch", "cold"], choices=["single", "batch", "cold"])
+    args = parser.parse_args(argv)
+
+    tmp = None
+    settings = args.settings
+    if not settings:
+        tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
+        tmp.write(settings_json_bytes(make_settings_state(args.forms, 200)))
+        tmp.close()
+        settings = tmp.name
+
+    print(f"{os.cpu_count()} core(s), {args.clients} client(s), {args.duration:g} s per scenario, batch={args.batch}\n")
+    print(f"{'workers':>7} {'scenario':<8} {'req/s':>10} {'forms/s':>12}")
+    try:
+        for workers in args.workers:
+            port = _free_port()
+            proc = start_api(settings, port, workers)
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/forms") as r:
+                    names = json.load(r)["forms"]
+                # Warm every worker's cache before timing the cached scenarios
+                run_scenario(port, "batch", names, args.clients, args.batch, 1.0)
+                for scenario in args.scenarios:
+                    rps, fps = run_scenario(port, scenario, names, args.clients, args.batch, args.duration)
+                    print(f"{workers:>7} {scenario:<8} {rps:>10,.0f} {fps:>12,.0f}")
+            finally:
+                proc.terminate()
+                proc.wait(timeout=30)
+    finally:
+        if tmp is not None:
+            os.remove(tmp.name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
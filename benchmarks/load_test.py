@@ -0,0 +1,135 @@
+"""
+Load test: many concurrent browser sessions against a running app server.
+
+    python benchmarks/load_test.py                      # starts a local server, 50 sessions
+    python benchmarks/load_test.py --sessions 20 --reruns 10
+    python benchmarks/load_test.py --url http://localhost:8501 --max-p95-ms 3000
+
+Each simulated session opens the app's websocket, asks for a script run the
+way the browser does on page load, then asks for --reruns more with a short
+pause between them. Latency is the time from the request to the server's
+"script finished" message. Reports p50/p95/max for the first run and for
+reruns, and exits with status 1 if --max-p95-ms is given and exceeded.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pottery_pricing_app.py")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(port: int, server_mode: bool) -> subprocess.Popen:
+    env = dict(os.environ, POTTERY_SERVER_MODE="1" if server_mode else "")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH,
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.25)
+    proc.terminate()
+    raise RuntimeError("app server did not come up within 60 s")
+
+def _rerun_msg() -> bytes:
+    msg = BackMsg()
+    msg.rerun_script.SetInParent()
+    return msg.SerializeToString()
+
+async def _run_once(ws) -> float:
+    t0 = time.perf_counter()
+    await ws.send(_rerun_msg())
+    while True:
+        fwd = ForwardMsg()
+        fwd.ParseFromString(await ws.recv())
+        if fwd.WhichOneof("type") == "script_finished" and fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+            return time.perf_counter() - t0
+
+async def session(url: str, reruns: int, think: float, first: list, later: list):
+    ws_url = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+    async with websockets.connect(ws_url, subprotocols=["streamlit"], max_size=None, open_timeout=60) as ws:
+        first.append(await _run_once(ws))
+        for _ in range(reruns):
+            await asyncio.sleep(think)
+            later.append(await _run_once(ws))
+
+async def run_load(url: str, sessions: int, reruns: int, think: float, ramp: float):
+    first, later = [], []
+
+    async def staggered(i):
+        await asyncio.sleep(ramp * i / max(1, sessions))
+        await session(url, reruns, think, first, later)
+
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(staggered(i) for i in range(sessions)), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    return first, later, errors, time.perf_counter() - t0
+
+def summarize(label: str, seconds: list) -> dict:
+    if not seconds:
+        return {}
+    ms = np.asarray(seconds) * 1000
+    row = {"n": len(ms), "p50": np.percentile(ms, 50), "p95": np.percentile(ms, 95), "max": ms.max()}
+    print(f"{label:<12} n={row['n']:<5} p50={row['p50']:8.0f} ms  p95={row['p95']:8.0f} ms  max={row['max']:8.0f} ms")
+    return row
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="", help="app to test (default: start one on a free local port)")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--reruns", type=int, default=5, help="reruns per session after the first run")
+    parser.add_argument("--think", type=float, default=0.5, help="seconds between a session's reruns")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which sessions connect")
+    parser.add_argument("--no-server-mode", action="store_true", help="start the local server without POTTERY_SERVER_MODE")
+    parser.add_argument("--max-p95-ms", type=float, default=0.0, help="fail if rerun p95 is above this")
+    args = parser.parse_args(argv)
+
+    proc = None
+    url = args.url
+    if not url:
+        port = _free_port()
+        proc = start_server(port, server_mode=not args.no_server_mode)
+        url = f"http://127.0.0.1:{port}"
+    try:
+        first, later, errors, wall = asyncio.run(run_load(url, args.sessions, args.reruns, args.think, args.ramp))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+    print(f"{args.sessions} sessions x {args.reruns + 1} runs against {url} in {wall:.1f} s")
+    summarize("first run", first)
+    reruns = summarize("rerun", later)
+    for e in errors[:5]:
+        print(f"session failed: {e!r}")
+    if errors:
+        return 1
+    if args.max_p95_ms and reruns and reruns["p95"] > args.max_p95_ms:
+        print(f"rerun p95 {reruns['p95']:.0f} ms is above {args.max_p95_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,469 @@
+"""
+Benchmarks for the pricing engine and the data-management paths.
+
+    python benchmarks/run_benchmarks.py                  # compare against baseline.json
+    python benchmarks/run_benchmarks.py -k glaze         # only cases whose name contains "glaze"
+    python benchmarks/run_benchmarks.py --save-baseline  # record the current numbers
+
+Every case runs on synthetic data (10 / 1k / 100k forms, 10 / 500 materials,
+5 / 40 ingredient recipes, settings files with thousands of rows) and reports
+the best of a few repeats. Times are stored relative to a calibration workload
+(a Python loop, a numpy sort and a pandas groupby), measured several times
+through the run and taken as the median, so a baseline recorded on one machine
+still means something on another and a busy moment doesn't skew the whole run.
+Exits with status 1 when any case is slower than its baseline by more than
+--tolerance (or the case's own, looser tolerance) on the first measurement and
+on CONFIRM_RUNS more, so a regression fails loudly and a noisy moment doesn't.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pottery_core import (  # noqa: E402
+    DEFAULT_INPUTS, UNIFIED_FORM_SCHEMA, SETTINGS_TABLE_SCHEMAS,
+    ensure_cols, to_json_bytes, to_archive_bytes, stream_settings_import,
+    read_unified_forms_csv, upsert_unified_forms, migrate_to_unified_forms,
+    load_default_presets_unified, get_common_materials_list,
+    glaze_per_piece_from_recipe, glaze_costs_per_gram, glaze_grams_needed, batch_mixing_plan, percent_recipe_table,
+    inventory_positions, append_ledger, ledger_entries, COMMON_MATERIALS, MATERIAL_ALIASES, MaterialIndex, MaterialCatalog, resolve_recipe, recipe_cost_per_piece, glaze_chemistry, material_oxides, cheapest_reformulation, calc_energy, calc_totals, price_sheet,
+    compact_forms, editor_change_set, apply_change_set, update_price_sheet, read_firing_log, fit_kiln_energy,
+    infer_category, sort_by_category_then_form,
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SEED = 20240601
+CALIBRATE_EVERY = 5  # cases between calibration samples
+CONFIRM_RUNS = 2  # extra measurements of a case before it's reported as a regression
+
+
+# ------------ Synthetic data ------------
+def make_forms(n: int, seed: int = SEED) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    names = load_default_presets_unified()["Form"].tolist()
+    return pd.DataFrame({
+        "Form": [f"{names[i % len(names)]} #{i}" for i in range(n)],
+        "Clay_lb_wet": rng.uniform(0.3, 8.0, n).round(2),
+        "Default_glaze_g": rng.uniform(20, 900, n).round(0),
+        "Throwing_min": rng.uniform(0, 20, n).round(1),
+        "Trimming_min": rng.uniform(0, 10, n).round(1),
+        "Handling_min": rng.uniform(0, 8, n).round(1),
+        "Glazing_min": rng.uniform(0, 10, n).round(1),
+        "Pieces_per_shelf": rng.integers(1, 30, n),
+        "Notes": np.where(rng.random(n) < 0.2, "lid", ""),
+    })
+
+def make_catalog(n: int, seed: int = SEED) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    common = get_common_materials_list()
+    names = [common[i] if i < len(common) else f"Material {i}" for i in range(n)]
+    return pd.DataFrame({"Material": names, "Cost_per_lb": rng.uniform(0.2, 40.0, n).round(2)})
+
+def make_recipe(catalog: pd.DataFrame, k: int, seed: int = SEED) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(len(catalog), size=min(k, len(catalog)), replace=False)
+    pct = rng.dirichlet(np.ones(len(picks))) * 100
+    # Same entry quirks people type by hand: padding and mixed case
+    names = [f"  {m.upper()} " if i % 3 == 0 else m for i, m in enumerate(catalog["Material"].iloc[picks])]
+    return pd.DataFrame({"Material": names, "Percent": pct.round(2)})
+
+def make_settings_state(n_forms: int, n_materials: int) -> dict:
+    catalog = make_catalog(n_materials)
+    tables = {
+        "unified_forms": make_forms(n_forms),
+        "catalog_df": catalog,
+        "recipe_df": make_recipe(catalog, 12),
+        "glaze_piece_df": pd.DataFrame({"Material": ["Frit 3134"], "Cost_per_lb": [2.5], "Grams_per_piece": [8.0]}),
+        "other_mat_df": pd.DataFrame({"Item": ["Cork"], "Unit": ["ea"], "Cost_per_unit": [0.4], "Quantity_for_project": [10.0]}),
+    }
+    return {name: ensure_cols(tables.get(name), schema) for name, schema in SETTINGS_TABLE_SCHEMAS.items()}
+
+def make_glaze_library(catalog: pd.DataFrame, n_glazes: int, seed: int = SEED) -> pd.DataFrame:
+    parts = [make_recipe(catalog, 5 + i % 10, seed=seed + i).assign(Glaze=f"Glaze {i}") for i in range(n_glazes)]
+    return pd.concat(parts, ignore_index=True)[["Glaze", "Material", "Percent"]]
+
+def make_form_glazes(forms: pd.DataFrame, n_glazes: int, share: float = 0.5, seed: int = SEED) -> pd.DataFrame:
+    """Liner + exterior for a share of the forms."""
+    rng = np.random.default_rng(seed)
+    picked = forms["Form"].to_numpy()[rng.random(len(forms)) < share]
+    return pd.DataFrame({
+        "Form": np.repeat(picked, 2),
+        "Glaze": [f"Glaze {i}" for i in rng.integers(n_glazes, size=2 * len(picked))],
+        "Grams": rng.uniform(20, 200, 2 * len(picked)).round(0),
+    })
+
+def make_ledger(catalog: pd.DataFrame, n: int, seed: int = SEED) -> pd.DataFrame:
+    """A few years of receipts and uses, unsorted like hand-entered rows."""
+    rng = np.random.default_rng(seed)
+    receipt = rng.random(n) < 0.4
+    grams = np.where(receipt, rng.uniform(2_000, 25_000, n), rng.uniform(50, 3_000, n)).round(1)
+    return pd.DataFrame({
+        "Date": pd.Series(pd.date_range("2023-01-01", periods=n, freq="37min")).sample(frac=1, random_state=seed).dt.strftime("%Y-%m-%d").to_numpy(),
+        "Material": catalog["Material"].to_numpy()[rng.integers(len(catalog), size=n)],
+        "Kind": np.where(receipt, "Receipt", "Use"),
+        "Grams": grams,
+        "Cost": np.where(receipt, grams / 453.592 * rng.uniform(0.3, 30, n), 0.0).round(2),
+        "Note": "",
+    })
+
+def make_firing_log(n_kilns: int, firings_per_kiln: int, seed: int = SEED) -> bytes:
+    """Controller CSV export: one reading a minute through each firing, every 2.5 days per kiln."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for k in range(n_kilns):
+        cone = np.where(rng.random(firings_per_kiln) < 0.45, -4, 6)
+        minutes = np.where(cone < 0, 660, 960)
+        load = rng.uniform(40, 160, firings_per_kiln).round(1)
+        energy = 20 + 10 * k + 1.5 * cone + 0.1 * load
+        firing = np.repeat(np.arange(firings_per_kiln), minutes)
+        step = np.arange(len(firing)) - np.repeat(np.cumsum(minutes) - minutes, minutes)
+        frac = step / np.repeat(minutes - 1, minutes)
+        time = np.datetime64("2022-01-01T00:00") + (firing * 3600 + step).astype("timedelta64[m]")
+        frames.append(pd.DataFrame({
+            "Kiln": f"Kiln {k + 1}",
+            "Time": pd.Series(time).dt.strftime("%Y-%m-%d %H:%M:%S"),
+            "Temp": (70 + np.repeat(np.where(cone < 0, 1880, 2165), minutes) * np.sin(np.pi * frac)).round(1),
+            "kWh": (np.repeat(np.cumsum(energy) - energy, minutes) + np.repeat(energy, minutes) * frac).round(3),
+            "Load_lb": np.repeat(load, minutes),
+        }))
+    return pd.concat(frames).sort_values("Time", kind="stable").to_csv(index=False).encode("utf-8")
+
+def settings_json_bytes(tables: dict) -> bytes:
+    state = dict(inputs=DEFAULT_INPUTS, recipe_grams_per_piece=8.0, **{n: df.to_dict(orient="list") for n, df in tables.items()})
+    return to_json_bytes(state)
+
+
+# ------------ Cases ------------
+def build_cases():
+    """
+    (name, setup, tolerance) triples; setup returns (fn, repeats) with all data
+    prepared up front. tolerance is None for cases held to --tolerance.
+    """
+    cases = []
+
+    def case(name, tolerance=None):
+        def register(setup):
+            cases.append((name, setup, tolerance))
+            return setup
+        return register
+
+    for fuel in ["Propane", "Natural Gas", "Wood", "None"]:
+        # a microsecond or two a call: timer and scheduler noise is a large share
+        @case(f"calc_energy[{fuel}]", tolerance=2.0)
+        def _(fuel=fuel):
+            ip = dict(DEFAULT_INPUTS, fuel_gas=fuel)
+            return (lambda: calc_energy(ip)), 9
+
+    @case("calc_totals[single piece]", tolerance=1.75)
+    def _():
+        return (lambda: calc_totals(DEFAULT_INPUTS, 0.42, 0.1)), 9
+
+    for n in [10, 1_000, 100_000]:
+        @case(f"price_sheet[{n} forms]")
+        def _(n=n):
+            forms, catalog = make_forms(n), make_catalog(500)
+            recipe = make_recipe(catalog, 12)
+            return (lambda: price_sheet(forms, DEFAULT_INPUTS, catalog, recipe, 0.1)), 5
+
+    @case("MaterialIndex[build, common + 500 materials]")
+    def _():
+        names = list(COMMON_MATERIALS) + make_catalog(500)["Material"].tolist()
+        return (lambda: MaterialIndex(names, MATERIAL_ALIASES)), 5
+
+    @case("MaterialIndex.search[100 queries, common + 500 materials]")
+    def _():
+        index = MaterialIndex(list(COMMON_MATERIALS) + make_catalog(500)["Material"].tolist(), MATERIAL_ALIASES)
+        queries = ["silica 325m", "custer", "cobalt carb", "fel", "whitng", "rio", "frit 31", "zirc", "epk", "tio2"] * 10
+        return (lambda: [index.search(q) for q in queries]), 5
+
+    @case("glaze_costs_per_gram[500 materials, 12 glazes]")
+    def _():
+        catalog = make_catalog(500)
+        library = make_glaze_library(catalog, 12)
+        return (lambda: glaze_costs_per_gram(catalog, library)), 5
+
+    @case("price_sheet[100000 forms, half with 2 library glazes]")
+    def _():
+        forms, catalog = make_forms(100_000), make_catalog(500)
+        recipe, library = make_recipe(catalog, 12), make_glaze_library(catalog, 12)
+        form_glazes = make_form_glazes(forms, 12)
+        return (lambda: price_sheet(forms, DEFAULT_INPUTS, catalog, recipe, 0.1,
+                                    form_glazes=form_glazes, glaze_costs=glaze_costs_per_gram(catalog, library))), 5
+
+    @case("update_price_sheet[100000 forms, 3 edited + 1 added]")
+    def _():
+        forms = compact_forms(make_forms(100_000))
+        sheet = price_sheet(forms, DEFAULT_INPUTS, None, None, 0.1, 0.02)
+        state = {"edited_rows": {"10": {"Clay_lb_wet": 2.0}, "5000": {"Throwing_min": 12.0}, "99999": {"Form": "Renamed"}},
+                 "added_rows": [{"Form": "New form", "Clay_lb_wet": 1.5}], "deleted_rows": []}
+
+        def run():
+            changes = editor_change_set(state, UNIFIED_FORM_SCHEMA)
+            after = apply_change_set(forms.copy(deep=False), changes)
+            return update_price_sheet(sheet, after, changes, DEFAULT_INPUTS, 0.1, 0.02)
+        return run, 10
+
+    @case("price_sheet[100000 forms, 4 clay bodies]")
+    def _():
+        forms, catalog = make_forms(100_000), make_catalog(500)
+        recipe = make_recipe(catalog, 12)
+        bodies = pd.DataFrame({"Clay_body": [f"Body {i}" for i in range(4)],
+                               "Price_per_bag": [28.0, 35.0, 52.0, 74.0], "Bag_lb": [25.0, 25.0, 50.0, 25.0],
+                               "Yield": [0.9, 0.85, 0.8, 0.75], "Shrink_pct": [12.0, 12.5, 13.0, 14.0],
+                               "Reclaim_pct": [0.0, 50.0, 70.0, 90.0], "Reclaim_cost_per_lb": [0.0, 0.1, 0.15, 0.2]})
+        forms["Clay_body"] = np.where(np.arange(len(forms)) % 5 == 4, "", bodies["Clay_body"].to_numpy()[np.arange(len(forms)) % 4])
+        return (lambda: price_sheet(forms, DEFAULT_INPUTS, catalog, recipe, 0.1, clay_bodies=bodies)), 5
+
+    @case("glaze_chemistry[500 glazes, common materials]")
+    def _():
+        library = make_glaze_library(make_catalog(len(get_common_materials_list())), 500)
+        return (lambda: glaze_chemistry(library)), 5
+
+    @case("cheapest_reformulation[50 glazes, common materials]")
+    def _():
+        catalog = make_catalog(len(get_common_materials_list()))
+        analyzed = catalog[material_oxides(None, catalog["Material"])[1]].reset_index(drop=True)
+        library = make_glaze_library(analyzed, 50)
+        return (lambda: cheapest_reformulation(catalog, library)), 3
+
+    @case("batch_mixing_plan[1000-form week, 12 glazes, 500 materials]")
+    def _():
+        forms, catalog = make_forms(1_000), make_catalog(500)
+        library, form_glazes = make_glaze_library(catalog, 12), make_form_glazes(forms, 12)
+        schedule = pd.DataFrame({"Form": forms["Form"], "Pieces": np.arange(len(forms)) % 20 + 1, "Due": ""})
+
+        def run():
+            grams = glaze_grams_needed(schedule, forms, form_glazes, 10.0)
+            return batch_mixing_plan(catalog, library, grams)
+        return run, 5
+
+    for method in ["FIFO", "Weighted average"]:
+        @case(f"inventory_positions[50000 ledger entries, 500 materials, {method}]")
+        def _(method=method):
+            ledger = ensure_cols(make_ledger(make_catalog(500), 50_000), SETTINGS_TABLE_SCHEMAS["inventory_ledger_df"])
+            return (lambda: inventory_positions(ledger, method)), 5
+
+    @case("append_ledger[1 entry onto 50000]")
+    def _():
+        ledger = ensure_cols(make_ledger(make_catalog(500), 50_000), SETTINGS_TABLE_SCHEMAS["inventory_ledger_df"])
+        return (lambda: append_ledger(ledger, ledger_entries("Silica", 1000.0, "Use", date="2026-01-01"))), 20
+
+    for n_mat in [10, 500]:
+        for k in [5, 40]:
+            if k > n_mat:
+                continue
+            @case(f"glaze_per_piece_from_recipe[{n_mat} materials, {k} ingredients]")
+            def _(n_mat=n_mat, k=k):
+                catalog = make_catalog(n_mat)
+                recipe = make_recipe(catalog, k)
+                return (lambda: glaze_per_piece_from_recipe(catalog, recipe, 8.0)), 5
+
+    @case("MaterialCatalog[500 materials]")
+    def _():
+        catalog = make_catalog(500)
+        return (lambda: MaterialCatalog(catalog)), 5
+
+    @case("recipe_cost_per_piece[resolved, 500 materials, 40 ingredients]")
+    def _():
+        catalog = make_catalog(500)
+        materials = MaterialCatalog(catalog)
+        resolved = resolve_recipe(materials, make_recipe(catalog, 40))
+        return (lambda: recipe_cost_per_piece(materials, resolved, 8.0)), 5
+
+    @case("percent_recipe_table[500 materials, 40 ingredients]")
+    def _():
+        catalog = make_catalog(500)
+        recipe = make_recipe(catalog, 40)
+        return (lambda: percent_recipe_table(catalog, recipe, 5000.0)), 5
+
+    for n in [10, 1_000]:
+        @case(f"migrate_to_unified_forms[{n} forms]")
+        def _(n=n):
+            forms = make_forms(n)
+            presets = forms[["Form", "Clay_lb_wet", "Default_glaze_g", "Notes"]]
+            # Half the timing rows match a preset, half are new forms
+            production = forms.drop(columns=["Clay_lb_wet", "Default_glaze_g"]).iloc[n // 2:]
+            custom = production.assign(Form=production["Form"] + " (custom)")
+            return (lambda: migrate_to_unified_forms(presets, production, custom)), 3
+
+    for n in [1_000, 100_000]:
+        @case(f"infer_category[{n} forms]")
+        def _(n=n):
+            names = make_forms(n)["Form"].tolist()
+            return (lambda: [infer_category(x) for x in names]), 3
+
+        @case(f"sort_by_category_then_form[{n} forms]")
+        def _(n=n):
+            forms = make_forms(n)
+            return (lambda: sort_by_category_then_form(forms)), 3
+
+    for n in [1_000, 100_000]:
+        @case(f"forms_csv_import[{n} rows]")
+        def _(n=n):
+            base = ensure_cols(make_forms(n // 2, seed=SEED + 1), UNIFIED_FORM_SCHEMA)
+            data = make_forms(n).to_csv(index=False).encode("utf-8")
+
+            def run():
+                chunks, _, _ = read_unified_forms_csv(io.BytesIO(data))
+                return upsert_unified_forms(base, chunks)
+            return run, 3
+
+    @case("firing_log_import[2 kilns x 3 years, 1 reading/min] + fit")
+    def _():
+        data = make_firing_log(2, 450)
+
+        def run():
+            firings, _ = read_firing_log(io.BytesIO(data))
+            return fit_kiln_energy(firings)
+        return run, 3
+
+    @case("firing_log_import[1 kiln x 3 years, bad kWh cell past the first block]")
+    def _():
+        data = make_firing_log(1, 450)
+        cut = data.rindex(b"\n", 0, len(data) - 1000)  # a reading near the end, well past Arrow's 8 MB block
+        row = data[cut + 1:data.index(b"\n", cut + 1)].split(b",")
+        row[3] = b"ERR"
+        bad = data[:cut + 1] + b",".join(row) + data[data.index(b"\n", cut + 1):]
+        clean, _ = read_firing_log(io.BytesIO(data))
+        firings, _ = read_firing_log(io.BytesIO(bad))
+        # the checked path starts over, so readings the fast path had counted aren't counted twice
+        assert firings["Readings"].sum() == clean["Readings"].sum(), "readings counted twice after the fallback"
+        assert np.isclose(firings["Energy"].sum(), clean["Energy"].sum(), rtol=1e-3)
+        return (lambda: read_firing_log(io.BytesIO(bad))), 3
+
+    tables = make_settings_state(20_000, 500)
+    json_bytes = settings_json_bytes(tables)
+    archive = to_archive_bytes(dict(inputs=DEFAULT_INPUTS, recipe_grams_per_piece=8.0, **tables))
+
+    @case("settings_json_save[20000 forms]")
+    def _():
+        return (lambda: settings_json_bytes(tables)), 3
+
+    @case("settings_json_load[20000 forms]")
+    def _():
+        return (lambda: stream_settings_import(io.BytesIO(json_bytes))), 3
+
+    @case("settings_archive_save[20000 forms]")
+    def _():
+        return (lambda: to_archive_bytes(dict(inputs=DEFAULT_INPUTS, recipe_grams_per_piece=8.0, **tables))), 3
+
+    @case("settings_archive_load[20000 forms]")
+    def _():
+        return (lambda: stream_settings_import(io.BytesIO(archive))), 3
+
+    return cases
+
+
+# ------------ Timing ------------
+def best_time(fn, repeats: int) -> float:
+    """Best per-call seconds; cheap functions are looped until one sample takes ~50 ms."""
+    t0 = time.perf_counter()
+    fn()
+    once = time.perf_counter() - t0
+    number = max(1, int(0.05 / once)) if once > 0 else 1000
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
+
+def _calibration_work():
+    values = np.random.default_rng(SEED).random(200_000)
+    frame = pd.DataFrame({"key": (values * 500).astype(int), "value": values})
+
+    def python_loop():
+        total = 0
+        for i in range(100_000):
+            total += i * i
+        return total
+
+    return [python_loop, lambda: np.sort(values), lambda: frame.groupby("key")["value"].sum()]
+
+def calibrate(work) -> float:
+    """
+    One calibration sample: geometric mean of the workloads' best times. The
+    cases are mostly numpy and pandas, which a pure-Python loop alone tracks
+    poorly from one machine (or one moment) to the next.
+    """
+    return float(np.exp(np.mean([np.log(best_time(fn, 3)) for fn in work])))
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to baseline.json")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed slowdown factor (default 1.5)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("cases", {})
+
+    work = _calibration_work()
+    samples, timings = [calibrate(work)], []
+    selected = [c for c in build_cases() if args.pattern.lower() in c[0].lower()]
+    for i, (name, setup, tolerance) in enumerate(selected, 1):
+        print(f"running {name}", file=sys.stderr)
+        fn, repeats = setup()
+        timings.append((name, setup, best_time(fn, repeats), tolerance or args.tolerance))
+        if i % CALIBRATE_EVERY == 0:
+            samples.append(calibrate(work))
+    while len(samples) < 3:
+        samples.append(calibrate(work))
+    cal = statistics.median(samples)
+
+    results, failures = {}, []
+    spread = ", ".join(f"{x * 1000:.2f}" for x in samples)
+    print(f"calibration: {cal * 1000:.2f} ms (median of {spread})\n")
+    print(f"{'case':<58} {'time':>12} {'vs baseline':>12}")
+    for name, setup, seconds, tolerance in timings:
+        ratio = seconds / cal / baseline[name]["relative"] if name in baseline else None
+        if ratio is not None and ratio > tolerance and not args.save_baseline:
+            fn, repeats = setup()
+            for _ in range(CONFIRM_RUNS):
+                seconds = min(seconds, best_time(fn, repeats))
+            ratio = seconds / cal / baseline[name]["relative"]
+        relative = seconds / cal
+        results[name] = {"seconds": float(f"{seconds:.4g}"), "relative": float(f"{relative:.4g}")}
+        flag = ""
+        if ratio is not None and ratio > tolerance:
+            failures.append((name, ratio, tolerance))
+            flag = "  << REGRESSION"
+        shown = f"{ratio:.2f}x" if ratio is not None else "new"
+        print(f"{name:<58} {seconds * 1000:>10.3f}ms {shown:>12}{flag}")
+
+    if args.save_baseline:
+        merged = dict(baseline, **results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                "calibration_seconds": float(f"{cal:.4g}"),
+                "cases": dict(sorted(merged.items())),
+            }, f, indent=2)
+            f.write("\n")
+        print(f"\nSaved {len(results)} case(s) to {args.baseline}")
+        return 0
+
+    if failures:
+        print(f"\n{len(failures)} case(s) slower than baseline by more than their tolerance:")
+        for name, ratio, tolerance in failures:
+            print(f"  {name}: {ratio:.2f}x (allowed {tolerance}x)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
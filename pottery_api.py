@@ -0,0 +1,413 @@
+"""
+Local HTTP pricing service for the webshop, point of sale and other studio tools.
+
+    python pottery_api.py pottery_pricing_settings.json              # http://127.0.0.1:8502
+    python pottery_api.py settings.zip --port 9000 --workers 4
+
+Prices come from a saved settings file (JSON or archive, as Save and Load
+writes it) and use the same engine as the app. Connections are kept alive
+(HTTP/1.1). Results are cached in memory, and the cache is dropped whenever the
+settings file changes on disk or inputs are changed through POST /settings.
+
+    GET  /health                    {"ok": true, "version": ...}
+    GET  /forms                     form names
+    GET  /price?form=Mug&form=Bowl  one or more saved forms
+    POST /price                     {"forms": ["Mug", {"Form": "Test jar", "Clay_lb_wet": 1.2, ...}],
+                                     "inputs": {"labor_rate": 25}}   (inputs: optional, this request only)
+    GET  /energy                    energy cost per piece
+    GET  /glaze?grams=8             glaze recipe cost for a piece using that many grams
+                                    ("unpriced" lists recipe materials missing from the catalog)
+    POST /totals                    {"inputs": {...}, "grams_per_piece": 8}  single-piece breakdown
+    GET  /settings                  current inputs
+    POST /settings                  {"inputs": {...}}  change inputs for every later request
+    GET  /stats                     cache hits and misses
+
+Inputs, custom form fields and grams are type-checked: a value that isn't a
+number where one is expected (or is negative, NaN or infinite) gets a 400
+naming the field instead of being priced as zero.
+
+--workers N pre-forks N processes on one listening socket (Unix); each keeps
+its own cache, and they all see POST /settings changes.
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from pottery_core import (
+    UNIFIED_FORM_SCHEMA, ensure_cols, MaterialCatalog, resolve_recipe, recipe_cost_per_piece,
+    calc_energy, calc_totals, price_sheet, clay_body_inputs, coerce_inputs,
+)
+from pottery_pricer import load_pricing_inputs
+
+API_DEFAULT_PORT = 8502
+API_CACHE_MAX_ENTRIES = 200_000  # cleared wholesale when reached; settings changes clear it anyway
+API_MAX_BODY_BYTES = 16 << 20
+MONEY_DECIMALS = 2
+
+
+def _finite(row: dict) -> dict:
+    """JSON has no inf/NaN (e.g. a 100% margin); send null instead."""
+    return {k: (None if isinstance(v, float) and not math.isfinite(v) else v) for k, v in row.items()}
+
+def _grams(value, name: str) -> float:
+    """Glaze grams from a request: a finite number, not negative."""
+    try:
+        grams = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+    if not math.isfinite(grams) or grams < 0:
+        raise ValueError(f"{name} must be a finite number of grams, 0 or more, got {value!r}")
+    return grams
+
+def _custom_form(i: int, item: dict) -> dict:
+    """A form object from a request, checked against the forms schema like inputs are: no silent zeros."""
+    try:
+        form = coerce_inputs(item, UNIFIED_FORM_SCHEMA, what="field")
+    except ValueError as e:
+        raise ValueError(f"forms[{i}]: {e}") from None
+    negative = sorted(k for k, v in form.items() if not isinstance(v, str) and v < 0)
+    if negative:
+        raise ValueError(f"forms[{i}]: field(s) {', '.join(negative)} can't be negative")
+    return form
+
+
+# ------------ Pricing service ------------
+class PricingService:
+    """Prices forms from one settings file; results are cached until the settings change."""
+
+    def __init__(self, settings_path: str, generation=None, overrides_path: str = None):
+        self.settings_path = settings_path
+        # Shared counter bumped by POST /settings so every worker reloads
+        self.generation = generation if generation is not None else multiprocessing.Value("q", 0, lock=False)
+        self.overrides_path = overrides_path
+        self.overrides = {}
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._state = None
+        self.state()
+
+    def _source_key(self):
+        st = os.stat(self.settings_path)
+        return (st.st_mtime_ns, st.st_size, self.generation.value)
+
+    def state(self):
+        """Current settings and cache, reloaded if the file or the inputs changed."""
+        key = self._source_key()
+        s = self._state
+        if s is not None and s.key == key:
+            return s
+        with self._lock:
+            if self._state is not None and self._state.key == key:
+                return self._state
+            if self.overrides_path and os.path.exists(self.overrides_path):
+                with open(self.overrides_path, encoding="utf-8") as f:
+                    self.overrides = json.load(f)
+            ip, forms, catalog_df, recipe_df, other_pp, form_glazes, glaze_costs, clay_bodies = load_pricing_inputs(self.settings_path, self.overrides)
+            forms = forms.drop_duplicates("Form", keep="last")
+            materials = MaterialCatalog(catalog_df)
+            recipe_ids = resolve_recipe(materials, recipe_df)
+            self._state = SimpleNamespace(
+                key=key,
+                version=hashlib.sha1(repr(key).encode()).hexdigest()[:12],
+                ip=ip,
+                forms=forms.set_index("Form", drop=False),
+                catalog_df=catalog_df,
+                recipe_df=recipe_df,
+                other_pp=other_pp,
+                form_glazes=form_glazes,
+                glaze_costs=glaze_costs,
+                clay_bodies=clay_bodies,
+                materials=materials,
+                recipe_ids=recipe_ids,
+                glaze_cost_per_g=recipe_cost_per_piece(materials, recipe_ids, 1.0)[1],
+                energy_pp=calc_energy(ip),
+                cache={},
+            )
+            return self._state
+
+    def update_inputs(self, inputs: dict) -> dict:
+        """
+        Merge new inputs into the overrides for all later requests (and all
+        workers). They are type-checked and priced once first, so a value that
+        can't be priced is refused instead of breaking every later request.
+        """
+        s = self.state()
+        inputs = coerce_inputs(inputs, s.ip)
+        self._dry_run(s, dict(s.ip, **inputs))
+        with self._lock:
+            self.overrides = dict(self.overrides, **inputs)
+            if self.overrides_path:
+                tmp = f"{self.overrides_path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self.overrides, f)
+                os.replace(tmp, self.overrides_path)
+            self.generation.value += 1
+        return self.state().ip
+
+    @staticmethod
+    def _dry_run(s, ip: dict):
+        try:
+            ip = clay_body_inputs(ip, s.clay_bodies)
+            calc_totals(ip, s.glaze_cost_per_g * 8.0, s.other_pp)
+            price_sheet(s.forms.iloc[:1], ip, None, None, s.other_pp, s.glaze_cost_per_g, s.form_glazes, s.glaze_costs, s.clay_bodies)
+        except Exception as e:
+            raise ValueError(f"these inputs can't be priced: {e}") from e
+
+    def _cached(self, s, key, compute):
+        hit = s.cache.get(key)
+        if hit is not None:
+            self.hits += 1
+            return hit
+        self.misses += 1
+        if len(s.cache) >= API_CACHE_MAX_ENTRIES:
+            s.cache.clear()
+        s.cache[key] = value = compute()
+        return value
+
+    def price(self, items: list, inputs: dict = None):
+        """
+        Price rows for a batch of form names and/or form dicts, in request order.
+        Returns (version, rows, unknown_names); cache misses are priced together in one pass.
+        """
+        s = self.state()
+        inputs = coerce_inputs(inputs or {}, s.ip)
+        ikey = json.dumps(inputs, sort_keys=True) if inputs else ""
+        items = list(items)  # custom forms are replaced by their checked values below
+
+        rows = [None] * len(items)
+        unknown, miss_idx, miss_keys, named, custom = [], [], [], [], []
+        for i, item in enumerate(items):
+            if isinstance(item, str):
+                key = ("price", ikey, item)
+            elif isinstance(item, dict) and str(item.get("Form", "")).strip():
+                items[i] = item = _custom_form(i, item)
+                key = ("price", ikey, json.dumps(item, sort_keys=True))
+            else:
+                raise ValueError(f"forms[{i}] must be a form name or an object with a Form")
+            hit = s.cache.get(key)
+            if hit is not None:
+                self.hits += 1
+                rows[i] = hit
+            elif isinstance(item, str) and item not in s.forms.index:
+                unknown.append(item)
+            else:
+                miss_idx.append(i)
+                miss_keys.append(key)
+                (named if isinstance(item, str) else custom).append(item)
+
+        if miss_idx:
+            self.misses += len(miss_idx)
+            parts = []
+            if named:
+                parts.append(s.forms.loc[named].reset_index(drop=True))
+            if custom:
+                parts.append(ensure_cols(pd.DataFrame(custom), UNIFIED_FORM_SCHEMA))
+            # Named forms first, then custom ones: reorder to match miss_idx
+            order = [k for k, i in enumerate(miss_idx) if isinstance(items[i], str)] + \
+                    [k for k, i in enumerate(miss_idx) if not isinstance(items[i], str)]
+            batch = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+            ip = dict(s.ip, **inputs) if inputs else s.ip
+            sheet = price_sheet(batch, ip, None, None, s.other_pp, s.glaze_cost_per_g, s.form_glazes, s.glaze_costs, s.clay_bodies)
+            priced = sheet.round(MONEY_DECIMALS).to_dict(orient="records")
+            if len(s.cache) + len(priced) > API_CACHE_MAX_ENTRIES:
+                s.cache.clear()
+            for k, row in zip(order, priced):
+                row = _finite(row)
+                rows[miss_idx[k]] = row
+                s.cache[miss_keys[k]] = row
+        return s.version, [r for r in rows if r is not None], unknown
+
+    def glaze(self, grams: float):
+        grams = _grams(grams, "grams")
+        s = self.state()
+        return s.version, self._cached(s, ("glaze", grams), lambda: self._glaze_table(s, grams))
+
+    @staticmethod
+    def _glaze_table(s, grams):
+        table, cost = recipe_cost_per_piece(s.materials, s.recipe_ids, grams)
+        unpriced = s.recipe_ids.loc[(s.recipe_ids["Id"] < 0) & (s.recipe_ids["Material"] != ""), "Material"]
+        return {"grams_per_piece": grams, "cost_per_piece": round(cost, 4),
+                "ingredients": [_finite(r) for r in table.to_dict(orient="records")],
+                "unpriced": unpriced.tolist()}
+
+    def totals(self, inputs: dict = None, grams_per_piece: float = 8.0):
+        grams_per_piece = _grams(grams_per_piece, "grams_per_piece")
+        s = self.state()
+        inputs = coerce_inputs(inputs or {}, s.ip)
+        key = ("totals", json.dumps(inputs, sort_keys=True), grams_per_piece)
+
+        def compute():
+            t = calc_totals(dict(s.ip, **inputs), s.glaze_cost_per_g * grams_per_piece, s.other_pp)
+            return _finite({k: (round(v, MONEY_DECIMALS) if isinstance(v, float) else v) for k, v in t.items()})
+        return s.version, self._cached(s, key, compute)
+
+
+# ------------ HTTP ------------
+class PricingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive; every response sets Content-Length
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't wait on delayed ACKs
+    server_version = "PotteryPricing/1"
+    service: PricingService = None
+    quiet = True
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, obj):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > API_MAX_BODY_BYTES:
+            raise ValueError("request body too large")
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(body, dict):
+            raise ValueError("request body must be a JSON object")
+        return body
+
+    def _dispatch(self, routes: dict):
+        url = urlsplit(self.path)
+        route = routes.get(url.path.rstrip("/") or "/")
+        try:
+            if route is None:
+                self._send_json(404, {"error": f"no such endpoint: {url.path}"})
+                return
+            self._send_json(200, route(parse_qs(url.query)))
+        except (ValueError, TypeError, KeyError) as e:
+            self._send_json(400, {"error": str(e)})
+        except OSError as e:
+            self._send_json(503, {"error": f"settings unavailable: {e}"})
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def do_GET(self):
+        svc = self.service
+        self._dispatch({
+            "/health": lambda q: {"ok": True, "version": svc.state().version},
+            "/forms": lambda q: {"version": svc.state().version, "forms": svc.state().forms.index.tolist()},
+            "/price": lambda q: self._price_response(q.get("form", [])),
+            "/energy": lambda q: {"version": svc.state().version, "energy_pp": svc.state().energy_pp},
+            "/glaze": lambda q: dict(zip(("version", "glaze"), svc.glaze(q.get("grams", ["8"])[0]))),
+            "/settings": lambda q: {"version": svc.state().version, "inputs": svc.state().ip},
+            "/stats": lambda q: {"version": svc.state().version, "pid": os.getpid(), "hits": svc.hits,
+                                 "misses": svc.misses, "cached": len(svc.state().cache)},
+        })
+
+    def do_POST(self):
+        svc = self.service
+        self._dispatch({
+            "/price": lambda q: self._price_response(**self._price_body()),
+            "/totals": lambda q: self._totals_response(self._read_json()),
+            "/settings": lambda q: {"inputs": svc.update_inputs(self._read_json().get("inputs", {})),
+                                    "version": svc.state().version},
+        })
+
+    def _price_body(self) -> dict:
+        body = self._read_json()
+        forms = body.get("forms", [])
+        if not isinstance(forms, list):
+            raise ValueError("forms must be a list")
+        return {"forms": forms, "inputs": body.get("inputs") or {}}
+
+    def _price_response(self, forms, inputs=None):
+        version, rows, unknown = self.service.price(forms, inputs)
+        return {"version": version, "prices": rows, "unknown": unknown}
+
+    def _totals_response(self, body):
+        version, totals = self.service.totals(body.get("inputs") or {}, body.get("grams_per_piece", 8.0))
+        return {"version": version, "totals": totals}
+
+
+def make_server(service: PricingService, host: str, port: int, quiet: bool = True, bind: bool = True):
+    handler = type("Handler", (PricingHandler,), {"service": service, "quiet": quiet})
+    server = ThreadingHTTPServer((host, port), handler, bind_and_activate=bind)
+    server.daemon_threads = True
+    return server
+
+
+def serve(settings_path: str, host: str = "127.0.0.1", port: int = API_DEFAULT_PORT, workers: int = 1, quiet: bool = True):
+    if workers <= 1 or not hasattr(os, "fork"):
+        server = make_server(PricingService(settings_path), host, port, quiet)
+        print(f"Pricing API on http://{host}:{server.server_address[1]} ({settings_path})", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    # Pre-fork: bind once, every worker accepts from the same socket
+    listener = socket.create_server((host, port), backlog=1024)
+    listener.setblocking(False)  # a worker that loses the accept race returns to select() instead of blocking
+    generation = multiprocessing.Value("q", 0, lock=False)
+    tmpdir = tempfile.mkdtemp(prefix="pottery_api_")
+    overrides_path = os.path.join(tmpdir, "inputs.json")
+    PricingService(settings_path)  # fail here, not in every worker, if the settings can't be read
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            server = make_server(PricingService(settings_path, generation, overrides_path), host, port, quiet, bind=False)
+            server.socket.close()
+            server.socket = listener
+            server.serve_forever()
+            os._exit(0)
+        children.append(pid)
+    print(f"Pricing API on http://{host}:{listener.getsockname()[1]} with {workers} workers ({settings_path})", file=sys.stderr)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # so the finally below stops the workers too
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        listener.close()
+        for name in os.listdir(tmpdir):
+            os.remove(os.path.join(tmpdir, name))
+        os.rmdir(tmpdir)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("settings", help="settings JSON or compact archive from Save and Load")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=API_DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0 = one per core)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+    try:
+        serve(args.settings, args.host, args.port, args.workers or os.cpu_count() or 1, quiet=not args.verbose)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
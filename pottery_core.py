@@ -0,0 +1,2841 @@
+"""
+Pricing engine and data helpers for the Pottery Cost Analysis App.
+
+Nothing in here touches Streamlit, so the same code runs in the app, in
+scripts and in the benchmarks (benchmarks/run_benchmarks.py).
+"""
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import csv
+import json
+import os
+import re
+import hashlib
+import io
+import codecs
+import sqlite3
+import zipfile
+import datetime as _dt
+
+
+# ------------ Default inputs (one piece, one studio) ------------
+DEFAULT_INPUTS = dict(
+    units_made=1,
+    clay_price_per_bag=50.0,
+    clay_bag_weight_lb=25.0,
+    clay_weight_per_piece_lb=1.0,
+    clay_yield=0.9,
+    clay_reclaim_pct=0.0,  # share of trimmings and slurry recycled back into clay
+    clay_reclaim_cost_per_lb=0.0,  # what reclaiming a pound costs (time, pugmill)
+    clay_body="",  # a row of the clay bodies table; blank uses the clay inputs above
+    packaging_per_piece=0.0,
+    kwh_rate=0.24,  # Al's actual rate
+    kwh_bisque=30.0,  # Keep electric defaults for those who use electric
+    kwh_glaze=35.0,
+    kwh_third=0.0,
+    pieces_per_electric_firing=40,
+    labor_rate=15.0,
+    hours_per_piece=0.25,
+    overhead_per_month=500.0,
+    pieces_per_month=200,
+    use_2x2x2=False,
+    wholesale_margin_pct=50,
+    retail_multiplier=2.0,
+    # Al's propane data
+    fuel_gas="Propane",  # Default to propane since that's what Al uses
+    lp_price_per_gal=3.50,
+    lp_gal_bisque=4.7,  # Al's 1 tank = ~4.7 gallons
+    lp_gal_glaze=9.4,   # Al's 2 tanks = ~9.4 gallons
+    pieces_per_gas_firing=40,  # We can adjust this if Al tells us his typical load
+    ng_price_per_therm=1.20,
+    ng_therms_bisque=0.0,
+    ng_therms_glaze=0.0,
+    # wood firing defaults (keeping your originals)
+    wood_price_per_cord=300.0,
+    wood_price_per_facecord=120.0,
+    wood_cords_bisque=0.0,
+    wood_cords_glaze=0.0,
+    wood_cords_third=0.0,
+    wood_facecords_bisque=0.0,
+    wood_facecords_glaze=0.0,
+    wood_facecords_third=0.0,
+    pieces_per_wood_firing=40,
+    energy_allocation="Per piece",  # or "Clay weight" / "Shelf space" (see energy_weights)
+    typical_piece_lb=1.0,  # the piece a firing's per-piece energy is quoted for
+    typical_pieces_per_shelf=12,
+    pieces_per_shelf=12,  # of the single piece being costed, like clay_weight_per_piece_lb
+    inventory_costing="FIFO",  # or "Weighted average" (see inventory_positions)
+)
+
+def _coerce_input(key: str, value, like, what: str = "input"):
+    if isinstance(like, bool):
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+            return value.strip().lower() == "true"
+        if isinstance(value, (int, float)) and value in (0, 1):
+            return bool(value)
+    elif isinstance(like, (int, float)):
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                pass
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value):
+            if isinstance(like, float):
+                return float(value)
+            if float(value).is_integer():
+                return int(value)
+    elif isinstance(like, str):
+        if isinstance(value, str):
+            return value
+    else:
+        return value
+    raise ValueError(f"{what} {key} must be {type(like).__name__}, got {value!r}")
+
+def coerce_inputs(values: dict, reference: dict = None, what: str = "input") -> dict:
+    """
+    Inputs from outside (API, command line) checked against the type of the
+    same input in reference (default DEFAULT_INPUTS): numbers from numeric
+    strings, whole numbers for counts, true/false for switches. Unknown keys
+    and values that don't fit raise ValueError; `what` names the values in
+    its message (e.g. "field" when checking a form against its schema).
+    """
+    reference = DEFAULT_INPUTS if reference is None else reference
+    if not isinstance(values, dict):
+        raise ValueError(f"{what}s must be an object of name: value")
+    unknown = sorted(set(values) - set(reference))
+    if unknown:
+        raise ValueError(f"unknown {what}(s): {', '.join(map(str, unknown))}")
+    return {key: _coerce_input(key, value, reference[key], what) for key, value in values.items()}
+
+# ------------ Unified Form Management System ------------
+UNIFIED_FORM_SCHEMA = {
+    "Form": "",
+    "Clay_lb_wet": 0.0,
+    "Clay_body": "",
+    "Default_glaze_g": 0.0,
+    "Throwing_min": 0.0,
+    "Trimming_min": 0.0,
+    "Handling_min": 0.0,
+    "Glazing_min": 0.0,
+    "Pieces_per_shelf": 0,
+    "Notes": ""
+}
+
+def migrate_to_unified_forms(form_presets_df=None, production_forms=None, custom_forms=None):
+    """Migrate from 3 separate form databases to 1 unified one"""
+    unified = pd.DataFrame(columns=list(UNIFIED_FORM_SCHEMA.keys()))
+    
+    # Migrate from form_presets_df (clay + glaze data)
+    if form_presets_df is not None and not form_presets_df.empty:
+        for _, row in form_presets_df.iterrows():
+            new_row = {
+                "Form": str(row.get("Form", "")).strip(),
+                "Clay_lb_wet": float(row.get("Clay_lb_wet", 0.0)),
+                "Clay_body": "",
+                "Default_glaze_g": float(row.get("Default_glaze_g", 0.0)),
+                "Throwing_min": 0.0,  # defaults
+                "Trimming_min": 0.0,
+                "Handling_min": 0.0,
+                "Glazing_min": 0.0,
+                "Pieces_per_shelf": 0,
+                "Notes": str(row.get("Notes", "")).strip()
+            }
+            unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
+    
+    # Migrate from production_forms (timing data)
+    if production_forms is not None and not production_forms.empty:
+        for _, row in production_forms.iterrows():
+            form_name = str(row.get("Form", "")).strip()
+            if not form_name:
+                continue
+                
+            # Check if this form already exists from presets
+            existing_idx = unified[unified["Form"] == form_name].index
+            if len(existing_idx) > 0:
+                # Update existing row with timing data
+                idx = existing_idx[0]
+                unified.at[idx, "Throwing_min"] = float(row.get("Throwing_min", 0.0))
+                unified.at[idx, "Trimming_min"] = float(row.get("Trimming_min", 0.0))
+                unified.at[idx, "Handling_min"] = float(row.get("Handling_min", 0.0))
+                unified.at[idx, "Glazing_min"] = float(row.get("Glazing_min", 0.0))
+                unified.at[idx, "Pieces_per_shelf"] = int(row.get("Pieces_per_shelf", 0))
+                # Merge notes
+                existing_notes = str(unified.at[idx, "Notes"]).strip()
+                new_notes = str(row.get("Notes", "")).strip()
+                if existing_notes and new_notes and existing_notes != new_notes:
+                    unified.at[idx, "Notes"] = f"{existing_notes} | {new_notes}"
+                elif new_notes:
+                    unified.at[idx, "Notes"] = new_notes
+            else:
+                # Add new row with timing data
+                new_row = {
+                    "Form": form_name,
+                    "Clay_lb_wet": 0.0,  # defaults
+                    "Clay_body": "",
+                    "Default_glaze_g": 0.0,
+                    "Throwing_min": float(row.get("Throwing_min", 0.0)),
+                    "Trimming_min": float(row.get("Trimming_min", 0.0)),
+                    "Handling_min": float(row.get("Handling_min", 0.0)),
+                    "Glazing_min": float(row.get("Glazing_min", 0.0)),
+                    "Pieces_per_shelf": int(row.get("Pieces_per_shelf", 0)),
+                    "Notes": str(row.get("Notes", "")).strip()
+                }
+                unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
+    
+    # Migrate from custom_forms (user timing data)
+    if custom_forms is not None and not custom_forms.empty:
+        for _, row in custom_forms.iterrows():
+            form_name = str(row.get("Form", "")).strip()
+            if not form_name:
+                continue
+                
+            # Check if this form already exists
+            existing_idx = unified[unified["Form"] == form_name].index
+            if len(existing_idx) > 0:
+                # Update existing row
+                idx = existing_idx[0]
+                unified.at[idx, "Throwing_min"] = float(row.get("Throwing_min", 0.0))
+                unified.at[idx, "Trimming_min"] = float(row.get("Trimming_min", 0.0))
+                unified.at[idx, "Handling_min"] = float(row.get("Handling_min", 0.0))
+                unified.at[idx, "Glazing_min"] = float(row.get("Glazing_min", 0.0))
+                unified.at[idx, "Pieces_per_shelf"] = int(row.get("Pieces_per_shelf", 0))
+                # Merge notes
+                existing_notes = str(unified.at[idx, "Notes"]).strip()
+                new_notes = str(row.get("Notes", "")).strip()
+                if existing_notes and new_notes and existing_notes != new_notes:
+                    unified.at[idx, "Notes"] = f"{existing_notes} | {new_notes}"
+                elif new_notes:
+                    unified.at[idx, "Notes"] = new_notes
+            else:
+                # Add new row
+                new_row = {
+                    "Form": form_name,
+                    "Clay_lb_wet": 0.0,  # defaults
+                    "Clay_body": "",
+                    "Default_glaze_g": 0.0,
+                    "Throwing_min": float(row.get("Throwing_min", 0.0)),
+                    "Trimming_min": float(row.get("Trimming_min", 0.0)),
+                    "Handling_min": float(row.get("Handling_min", 0.0)),
+                    "Glazing_min": float(row.get("Glazing_min", 0.0)),
+                    "Pieces_per_shelf": int(row.get("Pieces_per_shelf", 0)),
+                    "Notes": str(row.get("Notes", "")).strip()
+                }
+                unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
+    
+    # Remove duplicates and clean up
+    unified = unified.drop_duplicates(subset=["Form"], keep="last").reset_index(drop=True)
+    
+    # Ensure proper data types
+    for col, default_val in UNIFIED_FORM_SCHEMA.items():
+        if col not in unified.columns:
+            unified[col] = default_val
+        if isinstance(default_val, str):
+            unified[col] = unified[col].astype(str).str.strip()
+        elif isinstance(default_val, float):
+            unified[col] = pd.to_numeric(unified[col], errors="coerce").fillna(default_val).astype(float)
+        elif isinstance(default_val, int):
+            unified[col] = pd.to_numeric(unified[col], errors="coerce").fillna(default_val).astype(int)
+    
+    return unified[list(UNIFIED_FORM_SCHEMA.keys())]
+
+def _schema_dtype(default):
+    return np.int64 if isinstance(default, int) and not isinstance(default, bool) else np.float64
+
+def compact_forms(df) -> pd.DataFrame:
+    """
+    Unified forms as kept in memory: schema columns, trimmed names, measures as
+    float64 and counts (Pieces_per_shelf) as int64, so saved numbers come back
+    exactly as entered. Returns `df` itself when it is already in that shape.
+    """
+    cols = list(UNIFIED_FORM_SCHEMA.keys())
+    if df is not None and list(df.columns) == cols and all(
+        pd.api.types.is_string_dtype(df[c]) if isinstance(d, str) else df[c].dtype == _schema_dtype(d)
+        for c, d in UNIFIED_FORM_SCHEMA.items()
+    ):
+        return df
+    df = ensure_cols(df, UNIFIED_FORM_SCHEMA)
+    df["Form"] = df["Form"].str.strip()
+    counts = [c for c, d in UNIFIED_FORM_SCHEMA.items() if _schema_dtype(d) is np.int64]
+    return df.assign(**{c: df[c].round().astype(np.int64) for c in counts})
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+def shares_buffers(df: pd.DataFrame, other: pd.DataFrame) -> bool:
+    """True when df's numeric columns are views of other's (a shallow or copy-on-write copy)."""
+    numeric = [c for c in df.columns if c in other.columns and df[c].dtype.kind in "fiu"]
+    return bool(numeric) and all(
+        np.shares_memory(df[c].to_numpy(copy=False), other[c].to_numpy(copy=False)) for c in numeric
+    )
+
+
+def load_default_presets_unified() -> pd.DataFrame:
+    """Load default presets in unified format"""
+    # Built-in fallback data (Sharon's starter list)
+    fallback_data = [
+        {"Form": "Mug (12 oz)", "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "straight"},
+        {"Form": "Mug (14 oz)", "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+        {"Form": "Creamer (small)", "Clay_lb_wet": 0.75, "Default_glaze_g": 93, "Notes": ""},
+        {"Form": "Pitcher (medium)", "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+        {"Form": "Bowl (cereal)", "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "≈6\""},
+        {"Form": "Bowl (small)", "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+        {"Form": "Bowl (medium)", "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+        {"Form": "Bowl (large)", "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+        {"Form": "Plate (10 in dinner)", "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+        {"Form": "Pie plate", "Clay_lb_wet": 3.25, "Default_glaze_g": 403, "Notes": "3¼–3½ lb"},
+        {"Form": "Sugar jar", "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+        {"Form": "Honey jar", "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+        {"Form": "Crock (small)", "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
+        {"Form": "Crock (medium)", "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+        {"Form": "Crock (large)", "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+    ]
+    
+    unified = pd.DataFrame(columns=list(UNIFIED_FORM_SCHEMA.keys()))
+    
+    for preset in fallback_data:
+        new_row = {
+            "Form": str(preset.get("Form", "")).strip(),
+            "Clay_lb_wet": float(preset.get("Clay_lb_wet", 0.0)),
+            "Clay_body": "",
+            "Default_glaze_g": float(preset.get("Default_glaze_g", 0.0)),
+            "Throwing_min": 0.0,  # Default timing - users can customize
+            "Trimming_min": 0.0,
+            "Handling_min": 0.0,
+            "Glazing_min": 6.0,  # Default 6 min glazing
+            "Pieces_per_shelf": 12,  # Default shelf capacity
+            "Notes": str(preset.get("Notes", "")).strip()
+        }
+        unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
+    
+    return ensure_cols(unified, UNIFIED_FORM_SCHEMA)
+
+
+# Common ceramic materials; a tuple so the one copy per process can be shared safely
+COMMON_MATERIALS = (
+    # Feldspars
+    "Custer Feldspar", "F-4 Feldspar", "G-200 Feldspar", "Minspar 200", "NC-4 Feldspar",
+    "K-200 Feldspar", "Kingman Feldspar", "Cornwall Stone", "Nepheline Syenite",
+
+    # Silica sources
+    "Flint (Silica)", "Silica Sand", "Quartz", "Cristobalite",
+
+    # Clays and Kaolins
+    "EPK Kaolin", "Grolleg Kaolin", "OM4 Ball Clay", "Kentucky Ball Clay", "Redart Clay",
+    "Fire Clay", "Albany Slip Clay", "Goldart Stoneware Clay", "Hawthorne Bond Clay",
+
+    # Fluxes
+    "Gerstley Borate", "Whiting (Calcium Carbonate)", "Wollastonite", "Dolomite",
+    "Magnesium Carbonate", "Barium Carbonate", "Strontium Carbonate", "Lithium Carbonate",
+    "Pearl Ash (Potassium Carbonate)", "Soda Ash (Sodium Carbonate)", "Borax",
+
+    # Frits
+    "Frit 3124", "Frit 3134", "Frit 3195", "Frit 3249", "Frit 3269", "Frit 3278",
+    "Frit 90", "Frit 25", "Frit 169", "Pemco P-54", "Pemco P-311",
+
+    # Colorants (Oxides)
+    "Red Iron Oxide", "Black Iron Oxide", "Yellow Iron Oxide", "Cobalt Oxide",
+    "Cobalt Carbonate", "Copper Oxide", "Copper Carbonate", "Chrome Oxide",
+    "Chromium Oxide", "Tin Oxide", "Titanium Dioxide", "Rutile", "Ilmenite",
+    "Manganese Dioxide", "Manganese Carbonate", "Nickel Oxide", "Vanadium Pentoxide",
+
+    # Colorants (Stains)
+    "Mason 6020 Black", "Mason 6006 Blue", "Mason 6021 Brown", "Mason 6304 Coral",
+    "Mason 6242 Crimson", "Mason 6226 Golden Yellow", "Mason 6120 Green",
+
+    # Specialty materials
+    "Bentonite", "Zircopax (Zirconium Silicate)", "Superpax", "Zinc Oxide",
+    "Talc", "Pyrophyllite", "Spodumene", "Petalite", "Bone Ash", "Wood Ash",
+    "Alumina Hydrate", "Calcined Alumina", "CMC (Carboxymethyl Cellulose)", "Veegum T"
+)
+
+def get_common_materials_list():
+    """Returns the common ceramic materials for searchable dropdown"""
+    return COMMON_MATERIALS
+
+# Other names potters and suppliers use (alias -> COMMON_MATERIALS spelling)
+MATERIAL_ALIASES = {
+    "Silica": "Flint (Silica)", "Silica 325m": "Flint (Silica)", "Silica 325 mesh": "Flint (Silica)", "325 mesh silica": "Flint (Silica)",
+    "Silica 200 mesh": "Flint (Silica)", "Ground quartz": "Quartz",
+    "Custer": "Custer Feldspar", "Potash feldspar": "Custer Feldspar", "Soda feldspar": "Minspar 200",
+    "Neph sy": "Nepheline Syenite", "Nepheline": "Nepheline Syenite", "Cornish stone": "Cornwall Stone",
+    "EPK": "EPK Kaolin", "Edgar Plastic Kaolin": "EPK Kaolin", "Kaolin": "EPK Kaolin", "China clay": "Grolleg Kaolin",
+    "OM-4": "OM4 Ball Clay", "Ball clay": "OM4 Ball Clay", "Redart": "Redart Clay", "Goldart": "Goldart Stoneware Clay",
+    "Gerstley": "Gerstley Borate", "Calcium carbonate": "Whiting (Calcium Carbonate)", "Whiting": "Whiting (Calcium Carbonate)",
+    "Calcium silicate": "Wollastonite", "Lithium carb": "Lithium Carbonate", "Strontium carb": "Strontium Carbonate",
+    "Barium carb": "Barium Carbonate", "Mag carb": "Magnesium Carbonate", "Potassium carbonate": "Pearl Ash (Potassium Carbonate)",
+    "Sodium carbonate": "Soda Ash (Sodium Carbonate)", "Ferro 3134": "Frit 3134", "Ferro 3124": "Frit 3124",
+    "RIO": "Red Iron Oxide", "Iron oxide": "Red Iron Oxide", "Fe2O3": "Red Iron Oxide", "Cobalt carb": "Cobalt Carbonate",
+    "Copper carb": "Copper Carbonate", "CuCO3": "Copper Carbonate", "Chrome": "Chrome Oxide", "Tin": "Tin Oxide",
+    "SnO2": "Tin Oxide", "TiO2": "Titanium Dioxide", "Titanium": "Titanium Dioxide", "Manganese": "Manganese Dioxide",
+    "Zircopax": "Zircopax (Zirconium Silicate)", "Zirconium silicate": "Zircopax (Zirconium Silicate)", "Ultrox": "Zircopax (Zirconium Silicate)",
+    "Zinc": "Zinc Oxide", "ZnO": "Zinc Oxide", "Alumina": "Calcined Alumina",
+    "Bone ash": "Bone Ash", "CMC gum": "CMC (Carboxymethyl Cellulose)", "CMC": "CMC (Carboxymethyl Cellulose)",
+}
+
+def material_key(name) -> str:
+    """Lookup key for a material name: case and runs of whitespace don't matter."""
+    return " ".join(str(name).split()).lower()
+
+def material_keys(names):
+    """material_key over a Series or Index of names."""
+    return names.astype(str).str.replace(r"\s+", " ", regex=True).str.strip().str.lower()
+
+def _trigrams(key: str) -> set:
+    # Per token, padded so short queries and prefixes still share grams
+    grams = set()
+    for tok in re.findall(r"[a-z0-9]+", key):
+        padded = f"  {tok} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class MaterialIndex:
+    """
+    Ranked fuzzy search over material names and their aliases. Built once per
+    name list (trigram postings per normalized token); search() answers from the
+    postings without scanning every name. Aliases only count when their target is
+    one of the names, and a hit on an alias returns the target's spelling.
+    """
+
+    def __init__(self, names, aliases=None):
+        self.names, self._by_key = [], {}
+        for name in names:
+            key = material_key(name)
+            if key and key not in self._by_key:
+                self._by_key[key] = len(self.names)
+                self.names.append(" ".join(str(name).split()))
+        entries = list(self._by_key.items())
+        for alias, target in (aliases or {}).items():
+            ident = self._by_key.get(material_key(target))
+            if ident is not None:
+                entries.append((material_key(alias), ident))
+                self._by_key.setdefault(material_key(alias), ident)
+        self._entries = [(key, ident, key.split()) for key, ident in entries]
+        self._sizes = []
+        self._postings = {}
+        for pos, (key, _, _) in enumerate(self._entries):
+            grams = _trigrams(key)
+            self._sizes.append(len(grams))
+            for g in grams:
+                self._postings.setdefault(g, []).append(pos)
+
+    def __len__(self):
+        return len(self.names)
+
+    def resolve(self, name):
+        """The indexed spelling for an exact (normalized) name or alias, else None."""
+        ident = self._by_key.get(material_key(name))
+        return None if ident is None else self.names[ident]
+
+    def search(self, query: str, limit: int = 20, exclude=(), min_score: float = 0.2) -> list:
+        """Names best matching query, best first; exclude is names (any spelling) to leave out."""
+        q = material_key(query)
+        if not q:
+            return []
+        grams = _trigrams(q)
+        shared = {}
+        for g in grams:
+            for pos in self._postings.get(g, ()):
+                shared[pos] = shared.get(pos, 0) + 1
+        skip = {self._by_key[k] for k in map(material_key, exclude) if k in self._by_key}
+        q_tokens = q.split()
+        best = {}
+        for pos, n in shared.items():
+            key, ident, tokens = self._entries[pos]
+            if ident in skip:
+                continue
+            score = n / (len(grams) + self._sizes[pos] - n)
+            score += 0.5 * sum(any(t.startswith(w) for t in tokens) for w in q_tokens) / len(q_tokens)
+            if key == q:
+                score += 2.0
+            elif key.startswith(q):
+                score += 1.0
+            if score >= min_score and score > best.get(ident, 0.0):
+                best[ident] = score
+        ranked = sorted(best, key=lambda i: (-best[i], self.names[i]))
+        return [self.names[i] for i in ranked[:limit]]
+
+
+def ensure_cols(df, schema: dict):
+    if df is None:
+        df = pd.DataFrame()
+    else:
+        df = df.copy()
+    for col, default in schema.items():
+        if col not in df.columns:
+            df[col] = default
+    df = df[list(schema.keys())]
+    for col, default in schema.items():
+        if isinstance(default, str):
+            df[col] = df[col].astype(str)
+        else:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(default).astype(float)
+    return df
+
+def money(n):
+    try:
+        return f"${n:,.2f}"
+    except Exception:
+        return "$0.00"
+
+# ---- Domestic shipping rate card (simple model: base + per lb, scaled by zone and speed) ----
+DOMESTIC_RATE_CARD = {
+    "base": 8.00,
+    "per_lb": 1.10,
+    "zone_factor": {"Local": 0.9, "Zone 2–4": 1.0, "Zone 5–8": 1.25},
+    "speed_factor": {"Ground": 1.0, "2-Day": 1.9, "Overnight": 3.2},
+    "fuel_surcharge_pct": 9.0,
+    "insurance_min": 2.0,
+    "insurance_pct": 1.0,
+    "residential_fee": 4.25,
+    "signature_fee": 3.75,
+}
+
+def load_rate_card(local_path: str = "shipping_rates.json") -> dict:
+    """DOMESTIC_RATE_CARD with any keys from a local JSON file laid over it (tweak to your carrier's table)."""
+    card = json.loads(json.dumps(DOMESTIC_RATE_CARD))
+    try:
+        with open(local_path, encoding="utf-8") as f:
+            card.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return card
+
+def to_json_bytes(obj):
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def from_json_bytes(b):
+    return json.loads(b.decode("utf-8"))
+
+# Clay bodies a studio throws; forms name theirs in Clay_body (blank = the global clay inputs)
+CLAY_BODY_SCHEMA = {
+    "Clay_body": "", "Price_per_bag": 0.0, "Bag_lb": 25.0, "Yield": 0.9,
+    "Shrink_pct": 12.0, "Reclaim_pct": 0.0, "Reclaim_cost_per_lb": 0.0,
+}
+# Oxides the chemistry works in, with molecular weights (g/mol)
+OXIDES = {
+    "SiO2": 60.084, "Al2O3": 101.961, "B2O3": 69.620,
+    "Li2O": 29.881, "Na2O": 61.979, "K2O": 94.196,
+    "MgO": 40.304, "CaO": 56.077, "SrO": 103.619, "BaO": 153.326, "ZnO": 81.379,
+    "Fe2O3": 159.688, "TiO2": 79.866, "ZrO2": 123.218, "P2O5": 141.945,
+    "MnO": 70.937, "CoO": 74.932, "CuO": 79.545, "SnO2": 150.709, "Cr2O3": 151.990,
+}
+R2O_OXIDES = ("Li2O", "Na2O", "K2O")
+RO_OXIDES = ("MgO", "CaO", "SrO", "BaO", "ZnO")
+# Weight % of each oxide in the raw material, plus loss on ignition
+OXIDE_ANALYSIS_SCHEMA = {"Material": "", **{o: 0.0 for o in OXIDES}, "LOI": 0.0}
+# Glaze library: many named recipes in long form, sharing the material catalog
+GLAZE_LIBRARY_SCHEMA = {"Glaze": "", "Material": "", "Percent": 0.0}
+# Which glazes a form gets (liner, exterior, ...) and grams of each per piece
+FORM_GLAZE_SCHEMA = {"Form": "", "Glaze": "", "Grams": 0.0}
+
+# Production week: pieces to make per form (Due is an optional yyyy-mm-dd date)
+PRODUCTION_SCHEDULE_SCHEMA = {"Form": "", "Pieces": 0, "Due": ""}
+# Raw material on the shelf, in grams
+MATERIAL_ON_HAND_SCHEMA = {"Material": "", "On_hand_g": 0.0}
+# Raw material ledger, append-only in practice: Kind is Receipt (Cost = what the
+# grams cost in total), Use, or Adjust (signed grams, e.g. a spill or a stock count)
+INVENTORY_LEDGER_SCHEMA = {"Date": "", "Material": "", "Kind": "", "Grams": 0.0, "Cost": 0.0, "Note": ""}
+
+# ---- Settings tables (shared by JSON export and compact archive) ----
+SETTINGS_TABLE_SCHEMAS = {
+    "glaze_piece_df": {"Material": "", "Cost_per_lb": 0.0, "Grams_per_piece": 0.0},
+    "catalog_df": {"Material": "", "Cost_per_lb": 0.0, "Cost_per_kg": 0.0},
+    "recipe_df": {"Material": "", "Percent": 0.0},
+    "other_mat_df": {"Item": "", "Unit": "", "Cost_per_unit": 0.0, "Quantity_for_project": 0.0},
+    "unified_forms": UNIFIED_FORM_SCHEMA,
+    "glaze_library_df": GLAZE_LIBRARY_SCHEMA,
+    "form_glazes_df": FORM_GLAZE_SCHEMA,
+    "production_schedule_df": PRODUCTION_SCHEDULE_SCHEMA,
+    "inventory_ledger_df": INVENTORY_LEDGER_SCHEMA,
+    "clay_bodies_df": CLAY_BODY_SCHEMA,
+    "oxide_analysis_df": OXIDE_ANALYSIS_SCHEMA,
+}
+
+SETTINGS_ARCHIVE_FORMAT = "pottery-pricing-settings"
+SETTINGS_ARCHIVE_VERSION = 1
+SETTINGS_ARCHIVE_BATCH_ROWS = 65536
+
+def to_archive_bytes(state: dict) -> bytes:
+    """
+    Compact settings archive: a zip holding one Arrow IPC file per DataFrame
+    plus manifest.json for everything else (inputs, grams per piece, ...).
+    """
+    manifest = {
+        "format": SETTINGS_ARCHIVE_FORMAT,
+        "version": SETTINGS_ARCHIVE_VERSION,
+        "tables": {},
+        "values": {},
+    }
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for key, value in state.items():
+            if isinstance(value, pd.DataFrame):
+                table = pa.Table.from_pandas(value, preserve_index=False)
+                sink = pa.BufferOutputStream()
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=SETTINGS_ARCHIVE_BATCH_ROWS)
+                member = f"{key}.arrow"
+                zf.writestr(member, sink.getvalue().to_pybytes())
+                manifest["tables"][key] = {"file": member, "rows": table.num_rows, "columns": table.column_names}
+            else:
+                manifest["values"][key] = value
+        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+    return buf.getvalue()
+
+def from_archive_bytes(b: bytes) -> dict:
+    """Read an archive written by to_archive_bytes; tables come back as DataFrames."""
+    with zipfile.ZipFile(io.BytesIO(b)) as zf:
+        manifest = json.loads(zf.read("manifest.json").decode("utf-8"))
+        if manifest.get("format") != SETTINGS_ARCHIVE_FORMAT:
+            raise ValueError("Not a pottery pricing settings archive")
+        data = dict(manifest.get("values", {}))
+        for key, meta in manifest.get("tables", {}).items():
+            # Arrow reads straight out of the member buffer without re-parsing
+            table = pa.ipc.open_file(pa.py_buffer(zf.read(meta["file"]))).read_all()
+            data[key] = table.to_pandas(split_blocks=True)
+    return data
+
+def is_archive_bytes(b: bytes) -> bool:
+    return b[:4] == b"PK\x03\x04"
+
+def load_settings_bytes(b: bytes) -> dict:
+    """Auto-detect the compact archive or the (backward compatible) JSON export."""
+    if is_archive_bytes(b):
+        return from_archive_bytes(b)
+    return from_json_bytes(b)
+
+# ---- Streaming, validated settings import ----
+# Rows without these are dropped on import (they are the lookup keys)
+SETTINGS_KEY_COLUMNS = {
+    "unified_forms": "Form", "catalog_df": "Material", "recipe_df": "Material",
+    "glaze_library_df": "Glaze", "form_glazes_df": "Form",
+    "production_schedule_df": "Form", "inventory_ledger_df": "Material",
+    "clay_bodies_df": "Clay_body", "oxide_analysis_df": "Material",
+}
+SETTINGS_MAX_REPORTED_ERRORS = 500
+
+class _JsonMemberReader:
+    """
+    Minimal pull parser over a file object. Decodes one JSON value at a time so a
+    settings file never has to exist as a single parsed document in memory.
+    """
+    def __init__(self, fh, chunk_size: int):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.bytes_read = 0
+
+    def _more(self, size: int) -> bool:
+        chunk = self.fh.read(size)
+        if not chunk:
+            self.eof = True
+            self.buf = self.buf[self.pos:] + self.decoder.decode(b"", final=True)
+            self.pos = 0
+            return False
+        self.bytes_read += len(chunk)
+        self.buf = self.buf[self.pos:] + self.decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more(self.chunk_size):
+                return ""
+
+    def expect(self, ch: str):
+        found = self.peek()
+        if found != ch:
+            raise ValueError(f"Malformed settings file near byte {self.bytes_read}: expected '{ch}', found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                val, end = self.json.raw_decode(self.buf, self.pos)
+                # a number at the very end of the buffer may continue in the next chunk
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return val
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise ValueError(f"Malformed settings file: {e.msg}") from None
+            self._more(size)
+            size *= 2
+
+    def members(self):
+        """Yield (key, reader) for each member of the object starting here; caller consumes the value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key, self
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+def validate_settings_table(name: str, df: pd.DataFrame, row_offset: int = 0, errors=None):
+    """
+    Coerce one settings table to its schema and collect row-level problems.
+    Returns (clean_df, rejected_rows). Bad numbers fall back to the schema default,
+    rows missing their key column are dropped.
+    """
+    schema = SETTINGS_TABLE_SCHEMAS[name]
+    errors = [] if errors is None else errors
+
+    def report(mask, column, problem, values):
+        for idx in mask[mask].index:
+            errors.append({
+                "Table": name, "Row": int(idx) + row_offset + 1, "Column": column,
+                "Value": str(values.loc[idx])[:80], "Problem": problem,
+            })
+
+    # columns are collected first and framed once; inserting them one by one costs ~1ms each
+    cols = {}
+    for col, default in schema.items():
+        if col not in df.columns:
+            cols[col] = default
+            continue
+        raw = df[col]
+        if isinstance(default, str):
+            cols[col] = raw.fillna(default).astype(str).str.strip()
+            continue
+        num = pd.to_numeric(raw, errors="coerce")
+        not_number = num.isna() & raw.notna()
+        if not_number.any():
+            # blank cells are fine, they just take the default
+            not_number &= raw.astype(str).str.strip().ne("")
+        negative = num < 0
+        if not_number.any():
+            report(not_number, col, "not a number", raw)
+        if negative.any():
+            report(negative, col, "negative value", raw)
+        values = num.to_numpy(dtype=float, na_value=np.nan)
+        cols[col] = np.where(np.isnan(values) | (values < 0), float(default), values)
+
+    out = pd.DataFrame(cols, index=df.index)
+    rejected = 0
+    key_col = SETTINGS_KEY_COLUMNS.get(name)
+    if key_col and key_col in df.columns:
+        missing = out[key_col].isin(["", "nan", "None"])
+        if missing.any():
+            report(missing, key_col, "missing name, row skipped", df[key_col])
+            out = out[~missing]
+            rejected = int(missing.sum())
+    return out.reset_index(drop=True), rejected
+
+def _new_import_report():
+    return {"errors": [], "error_count": 0, "rows": {}, "rejected": {}}
+
+def _add_table_to_report(report, name, errors, kept, rejected):
+    report["error_count"] += len(errors)
+    room = SETTINGS_MAX_REPORTED_ERRORS - len(report["errors"])
+    if room > 0:
+        report["errors"].extend(errors[:room])
+    report["rows"][name] = report["rows"].get(name, 0) + kept
+    report["rejected"][name] = report["rejected"].get(name, 0) + rejected
+
+def _stream_json_settings(fh, total, progress, chunk_size):
+    data, report = {}, _new_import_report()
+    reader = _JsonMemberReader(fh, chunk_size)
+    for key, r in reader.members():
+        if progress:
+            progress(reader.bytes_read / total if total else 0.0, f"Reading {key}…")
+        if key in SETTINGS_TABLE_SCHEMAS and r.peek() == "{":
+            # one table's columns in memory at a time
+            columns = {col: r.value() for col, _ in r.members()}
+            lengths = {len(v) for v in columns.values() if isinstance(v, list)}
+            if len(lengths) > 1:
+                raise ValueError(f"Table '{key}' has columns of different lengths")
+            errors = []
+            df, rejected = validate_settings_table(key, pd.DataFrame(columns), errors=errors)
+            del columns
+            _add_table_to_report(report, key, errors, len(df), rejected)
+            data[key] = df
+        else:
+            data[key] = r.value()
+    if reader.peek() != "":
+        raise ValueError("Unexpected data after the end of the settings file")
+    return data, report
+
+def _stream_archive_settings(fh, progress):
+    data, report = {}, _new_import_report()
+    with zipfile.ZipFile(fh) as zf:
+        manifest = json.loads(zf.read("manifest.json").decode("utf-8"))
+        if manifest.get("format") != SETTINGS_ARCHIVE_FORMAT:
+            raise ValueError("Not a pottery pricing settings archive")
+        data.update(manifest.get("values", {}))
+        tables = manifest.get("tables", {})
+        for i, (key, meta) in enumerate(tables.items()):
+            if progress:
+                progress(i / max(1, len(tables)), f"Reading {key}…")
+            reader = pa.ipc.open_file(pa.py_buffer(zf.read(meta["file"])))
+            if key not in SETTINGS_TABLE_SCHEMAS:
+                data[key] = reader.read_all().to_pandas()
+                continue
+            parts, errors, rejected, offset = [], [], 0, 0
+            for b in range(reader.num_record_batches):
+                batch = reader.get_batch(b).to_pandas()
+                clean, n_rej = validate_settings_table(key, batch, row_offset=offset, errors=errors)
+                parts.append(clean)
+                rejected += n_rej
+                offset += len(batch)
+            df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=list(SETTINGS_TABLE_SCHEMAS[key]))
+            _add_table_to_report(report, key, errors, len(df), rejected)
+            data[key] = df
+    return data, report
+
+def stream_settings_import(fh, progress=None, chunk_size: int = 1 << 20):
+    """
+    Import a settings JSON or compact archive table by table, validating as it goes.
+    `progress(fraction, message)` is called between tables. Returns (data, report)
+    where data matches load_settings_bytes() with tables as clean DataFrames.
+    """
+    total = fh.seek(0, io.SEEK_END)
+    fh.seek(0)
+    head = fh.read(4)
+    fh.seek(0)
+    if is_archive_bytes(head):
+        data, report = _stream_archive_settings(fh, progress)
+    else:
+        data, report = _stream_json_settings(fh, total, progress, chunk_size)
+    if "inputs" in data and not isinstance(data["inputs"], dict):
+        raise ValueError("'inputs' must be an object of setting names to values")
+    if progress:
+        progress(1.0, "Done")
+    return data, report
+
+# ---- Unified forms CSV import (chunked, typed, upsert by name) ----
+FORMS_CSV_CHUNK_ROWS = 100_000
+
+def _forms_csv_arrow_types():
+    return {
+        col: pa.string() if isinstance(default, str) else pa.float64()
+        for col, default in UNIFIED_FORM_SCHEMA.items()
+    }
+
+def read_unified_forms_csv(fh, chunk_rows: int = FORMS_CSV_CHUNK_ROWS):
+    """
+    Read a unified forms CSV in chunks with column types declared up front.
+    Fast path: Arrow's streaming reader parses numbers natively. If any cell is
+    not a number it falls back to reading text and validating row by row.
+    Returns (list of clean chunks, row-level errors, rejected row count).
+    """
+    chunks, errors, rejected, offset = [], [], 0, 0
+    try:
+        reader = pa_csv.open_csv(
+            fh,
+            read_options=pa_csv.ReadOptions(block_size=1 << 22),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=_forms_csv_arrow_types(),
+                include_columns=list(UNIFIED_FORM_SCHEMA.keys()),
+                include_missing_columns=True,
+            ),
+        )
+        for batch in reader:
+            clean, n_rej = validate_settings_table("unified_forms", batch.to_pandas(), row_offset=offset, errors=errors)
+            chunks.append(clean)
+            rejected += n_rej
+            offset += batch.num_rows
+        return chunks, errors, rejected
+    except pa.ArrowInvalid:
+        pass
+
+    # Checked path: everything as text, then per-cell coercion with row numbers
+    fh.seek(0)
+    chunks, errors, rejected, offset = [], [], 0, 0
+    for raw in pd.read_csv(fh, dtype=str, keep_default_na=False, chunksize=chunk_rows):
+        clean, n_rej = validate_settings_table("unified_forms", raw, row_offset=offset, errors=errors)
+        chunks.append(clean)
+        rejected += n_rej
+        offset += len(raw)
+    return chunks, errors, rejected
+
+def upsert_unified_forms(base: pd.DataFrame, chunks):
+    """
+    Insert or update forms by name. Uses a Form -> row index instead of
+    concatenating everything and de-duplicating. Later rows win.
+    Returns (forms_df, inserted, updated).
+    """
+    cols = list(UNIFIED_FORM_SCHEMA.keys())
+    base = ensure_cols(base, UNIFIED_FORM_SCHEMA).drop_duplicates(subset=["Form"], keep="last").reset_index(drop=True)
+    name_index = {name: i for i, name in enumerate(base["Form"].tolist())}
+    inserts, updates = [], []
+    total = len(base)
+    updated = 0
+
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        dup_in_chunk = int(chunk["Form"].duplicated(keep="last").sum())
+        chunk = chunk.drop_duplicates(subset=["Form"], keep="last")
+        pos = pd.Series([name_index.get(name, -1) for name in chunk["Form"].tolist()], index=chunk.index)
+        hit = pos >= 0
+
+        new = chunk[~hit]
+        if not new.empty:
+            name_index.update(zip(new["Form"].tolist(), range(total, total + len(new))))
+            total += len(new)
+            inserts.append(new)
+        if hit.any():
+            upd = chunk[hit].copy()
+            upd["__pos"] = pos[hit]
+            updates.append(upd)
+        updated += int(hit.sum()) + dup_in_chunk
+
+    forms = pd.concat([base] + inserts, ignore_index=True) if inserts else base.copy()
+    if updates:
+        upd = pd.concat(updates, ignore_index=True).drop_duplicates(subset=["__pos"], keep="last")
+        rows = upd["__pos"].to_numpy()
+        for col in cols:
+            forms.loc[rows, col] = upd[col].to_numpy()
+    return forms[cols], total - len(base), updated
+
+def diff_table(old: pd.DataFrame, new: pd.DataFrame, key: str):
+    """
+    Row-level changes between two versions of a table, matched on `key`.
+    Returns (added_df, changed_df, deleted_keys). Both frames must share columns.
+    """
+    if old is None or old.empty:
+        return new.copy(), new.iloc[0:0].copy(), []
+    if old.shape == new.shape and list(old.columns) == list(new.columns) and old.reset_index(drop=True).equals(new.reset_index(drop=True)):
+        return new.iloc[0:0].copy(), new.iloc[0:0].copy(), []
+    o = old.drop_duplicates(subset=[key], keep="last").set_index(key)
+    n = new.drop_duplicates(subset=[key], keep="last").set_index(key)
+    added = n.loc[n.index.difference(o.index, sort=False)]
+    deleted = o.index.difference(n.index, sort=False).tolist()
+    common = n.index.intersection(o.index, sort=False)
+    a, b = n.loc[common], o.loc[common, n.columns]
+    same = (a == b) | (a.isna() & b.isna())
+    changed = a[~same.all(axis=1)]
+    return added.reset_index(), changed.reset_index(), deleted
+
+def table_row_hashes(df: pd.DataFrame, key: str) -> pd.Series:
+    """One 64-bit hash per row, indexed by `key`. Remembers a table for diffing at a fraction of a copy's size."""
+    df = df.drop_duplicates(subset=[key], keep="last")
+    return pd.Series(pd.util.hash_pandas_object(df, index=False).to_numpy(), index=df[key].to_numpy())
+
+def diff_against_hashes(old_hashes, new: pd.DataFrame, key: str):
+    """diff_table against a version of the table kept only as table_row_hashes."""
+    if old_hashes is None or old_hashes.empty:
+        return new.copy(), new.iloc[0:0].copy(), []
+    n = new.drop_duplicates(subset=[key], keep="last").reset_index(drop=True)
+    keys = pd.Index(n[key].to_numpy())
+    pos = old_hashes.index.get_indexer(keys)
+    known = pos >= 0
+    hashes = pd.util.hash_pandas_object(n, index=False).to_numpy()
+    changed = known & (old_hashes.to_numpy()[np.where(known, pos, 0)] != hashes)
+    deleted = old_hashes.index.difference(keys, sort=False).tolist()
+    return n[~known].reset_index(drop=True), n[changed].reset_index(drop=True), deleted
+
+# ---- Editor change sets ----
+def _cell_value(value, default):
+    if isinstance(default, str):
+        return "" if value is None else str(value).strip()
+    value = pd.to_numeric(value, errors="coerce") if value is not None else np.nan
+    if pd.isna(value):
+        return default
+    return int(round(value)) if _schema_dtype(default) is np.int64 else float(value)
+
+def editor_change_set(state, schema: dict) -> dict:
+    """
+    st.data_editor's widget state (edited_rows / added_rows / deleted_rows, by
+    row position in the table it was shown) as a change set against that table:
+      edited   {position: {column: value}}, only rows that survive the deletes
+      added    DataFrame of new rows in schema columns, blanks as the defaults
+      deleted  sorted positions
+    Columns outside the schema (computed, display-only) are ignored.
+    """
+    state = state or {}
+    deleted = sorted(int(i) for i in state.get("deleted_rows", []))
+    gone = set(deleted)
+    edited = {}
+    for pos, cells in (state.get("edited_rows") or {}).items():
+        cells = {c: _cell_value(v, schema[c]) for c, v in cells.items() if c in schema}
+        if cells and int(pos) not in gone:
+            edited[int(pos)] = cells
+    added = pd.DataFrame(
+        [{c: _cell_value(row.get(c), d) for c, d in schema.items()} for row in state.get("added_rows", [])],
+        columns=list(schema),
+    )
+    return {"edited": edited, "added": ensure_cols(added, schema), "deleted": deleted}
+
+def change_set_empty(changes: dict) -> bool:
+    return not changes["edited"] and not changes["deleted"] and not len(changes["added"])
+
+def apply_change_set(df: pd.DataFrame, changes: dict) -> pd.DataFrame:
+    """
+    The table after a change set, in the order st.data_editor shows it: cell
+    edits, then deletes, then added rows at the end. Edits are written into df
+    itself; df is returned unless rows were added or deleted.
+    """
+    for pos, cells in changes["edited"].items():
+        for col, value in cells.items():
+            df.iat[pos, df.columns.get_loc(col)] = value
+    if changes["deleted"] or len(changes["added"]):
+        keep = np.ones(len(df), dtype=bool)
+        keep[changes["deleted"]] = False
+        added = changes["added"].astype(df.dtypes.to_dict())
+        df = pd.concat([df[keep], added], ignore_index=True) if len(added) else df[keep].reset_index(drop=True)
+    return df
+
+def change_events(table: str, before: pd.DataFrame, changes: dict, key: str = None) -> list:
+    """
+    One event per changed row: Table, Kind (added / edited / deleted), Row
+    (position before the change, after it for added rows), Key (the row's key
+    column value, the new one on a rename) and the edited Columns.
+    """
+    def key_of(pos, cells=None):
+        if key is None:
+            return ""
+        return str((cells or {}).get(key, before[key].iat[pos]))
+    events = [
+        {"Table": table, "Kind": "edited", "Row": pos, "Key": key_of(pos, cells), "Columns": ", ".join(cells)}
+        for pos, cells in changes["edited"].items()
+    ]
+    events += [{"Table": table, "Kind": "deleted", "Row": pos, "Key": key_of(pos), "Columns": ""} for pos in changes["deleted"]]
+    start = len(before) - len(changes["deleted"])
+    events += [
+        {"Table": table, "Kind": "added", "Row": start + i, "Key": str(row[key]) if key else "", "Columns": ""}
+        for i, row in enumerate(changes["added"].to_dict("records"))
+    ]
+    return events
+
+class RecipeState:
+    """
+    The recipe behind the recipe editor. `base` is the table the editor is
+    mounted with; it stays put while the editor's own edits pile up in its
+    widget state, so the editor keeps one key and isn't rebuilt for them.
+    `recipe` is base with those edits applied. Changes made outside the editor
+    (add, move, load) rebase it, the one time the editor remounts.
+      revision       bumps whenever the recipe changes
+      base_revision  bumps on every rebase
+    """
+
+    SCHEMA = {"Material": "", "Percent": 0.0}
+
+    def __init__(self, recipe_df=None):
+        self.revision = self.base_revision = 0
+        self.rebase(recipe_df)
+
+    def rebase(self, recipe_df):
+        self.base = ensure_cols(recipe_df, self.SCHEMA)
+        self.recipe = self.base
+        self.changes = editor_change_set(None, self.SCHEMA)
+        self.revision += 1
+        self.base_revision += 1
+
+    def sync(self, editor_state) -> list:
+        """
+        Take the editor's widget state (all edits since the last rebase). Returns
+        change events for what is new since the previous sync, [] if nothing is.
+        """
+        changes = editor_change_set(editor_state, self.SCHEMA)
+        prev = self.changes
+        if changes["edited"] == prev["edited"] and changes["deleted"] == prev["deleted"] and changes["added"].equals(prev["added"]):
+            return []
+        n_prev = len(prev["added"])
+        fresh = [i for i in range(len(changes["added"]))
+                 if i >= n_prev or not changes["added"].iloc[i].equals(prev["added"].iloc[i])]
+        delta = {
+            "edited": {p: c for p, c in changes["edited"].items() if prev["edited"].get(p) != c},
+            "deleted": sorted(set(changes["deleted"]) - set(prev["deleted"])),
+            "added": changes["added"].iloc[fresh],
+        }
+        events = change_events("recipe_df", self.base, delta)
+        self.recipe = apply_change_set(self.base.copy(), changes)
+        self.changes = changes
+        self.revision += 1
+        return events
+
+    def add(self, material: str, percent: float):
+        """Add a material at the end, replacing a row with the same name (any case or spacing)."""
+        keep = material_keys(self.recipe["Material"]).to_numpy() != material_key(material)
+        self.rebase(pd.concat([self.recipe[keep], pd.DataFrame([{"Material": material, "Percent": float(percent)}])], ignore_index=True))
+
+    def move(self, position: int, offset: int):
+        """Move one ingredient up (offset < 0) or down the list."""
+        order = list(range(len(self.recipe)))
+        target = min(max(position + offset, 0), len(order) - 1)
+        order.insert(target, order.pop(position))
+        self.rebase(self.recipe.iloc[order].reset_index(drop=True))
+
+# ---- Optional local studio database (SQLite, one file) ----
+# session table -> (sql table, key column); keyless tables are stored by row position
+STUDIO_DB_TABLES = {
+    "unified_forms": ("forms", "Form"),
+    "catalog_df": ("catalog", "Material"),
+    "recipe_df": ("recipe", None),
+    "other_mat_df": ("other_materials", None),
+    "glaze_piece_df": ("glaze_piece", None),
+    "glaze_library_df": ("glaze_library", None),
+    "form_glazes_df": ("form_glazes", None),
+    "production_schedule_df": ("production_schedule", None),
+    "inventory_ledger_df": ("inventory_ledger", None),
+    "clay_bodies_df": ("clay_bodies", "Clay_body"),
+    "oxide_analysis_df": ("oxide_analyses", "Material"),
+}
+
+STUDIO_DB_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9 _-]{0,63}\.db", re.IGNORECASE)
+
+def studio_data_dir() -> str:
+    """Where this user's studio databases live: POTTERY_DATA_DIR, else ~/.pottery_pricing."""
+    return os.environ.get("POTTERY_DATA_DIR") or os.path.join(os.path.expanduser("~"), ".pottery_pricing")
+
+def studio_db_path(name: str) -> str:
+    """
+    Full path of the studio database called `name` inside studio_data_dir().
+    Only plain file names are accepted (letters, digits, space, _ and -, ending
+    in .db, which is added when missing); anything with a path in it is refused.
+    """
+    name = (name or "").strip()
+    if name and not name.lower().endswith(".db"):
+        name += ".db"
+    if not STUDIO_DB_NAME.fullmatch(name):
+        raise ValueError("Use a plain file name such as studio.db: letters, digits, spaces, _ and -, no folders.")
+    folder = studio_data_dir()
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, name)
+
+def studio_db_connect(path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Open (and if needed create) the studio database in WAL mode. Pass
+    check_same_thread=False for a connection kept across Streamlit reruns,
+    which may run on different threads (never at the same time).
+    """
+    conn = sqlite3.connect(path, timeout=10, check_same_thread=check_same_thread)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for name, (table, key) in STUDIO_DB_TABLES.items():
+        key = key or "Position"
+        cols = [f'"{key}" {"TEXT" if key != "Position" else "INTEGER"} PRIMARY KEY']
+        cols += [
+            f'"{c}" {"TEXT" if isinstance(d, str) else "REAL"}'
+            for c, d in SETTINGS_TABLE_SCHEMAS[name].items() if c != key
+        ]
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {table} ({", ".join(cols)})')
+        # Databases made before a column was added to the schema
+        have = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for c, d in SETTINGS_TABLE_SCHEMAS[name].items():
+            if c not in have:
+                conn.execute(f'ALTER TABLE {table} ADD COLUMN "{c}" {"TEXT" if isinstance(d, str) else "REAL"} DEFAULT {d!r}')
+    conn.execute('CREATE INDEX IF NOT EXISTS recipe_material ON recipe("Material")')
+    conn.execute("CREATE TABLE IF NOT EXISTS inputs (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute("CREATE TABLE IF NOT EXISTS studio_values (key TEXT PRIMARY KEY, value TEXT)")
+    conn.commit()
+    return conn
+
+def _studio_db_frame(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Session table in the shape it is stored: schema columns, plus Position for keyless tables."""
+    df = ensure_cols(df, SETTINGS_TABLE_SCHEMAS[name]).reset_index(drop=True)
+    if STUDIO_DB_TABLES[name][1] is None:
+        df.insert(0, "Position", range(len(df)))
+    return df
+
+def studio_db_read_table(conn, name: str) -> pd.DataFrame:
+    table, key = STUDIO_DB_TABLES[name]
+    cols = ", ".join(f'"{c}"' for c in SETTINGS_TABLE_SCHEMAS[name])
+    order = "Position" if key is None else "rowid"
+    df = pd.read_sql_query(f"SELECT {cols} FROM {table} ORDER BY {order}", conn)
+    return ensure_cols(df, SETTINGS_TABLE_SCHEMAS[name])
+
+def studio_db_write_changes(conn, name: str, added: pd.DataFrame, changed: pd.DataFrame, deleted: list):
+    """Apply one table's row changes in a single transaction."""
+    table, key = STUDIO_DB_TABLES[name]
+    key = key or "Position"
+    cols = [key] + [c for c in SETTINGS_TABLE_SCHEMAS[name] if c != key]
+    col_sql = ", ".join(f'"{c}"' for c in cols)
+    upsert = (
+        f"INSERT INTO {table} ({col_sql}) VALUES ({', '.join('?' for _ in cols)}) "
+        f'ON CONFLICT("{key}") DO UPDATE SET '
+        + ", ".join(f'"{c}"=excluded."{c}"' for c in cols[1:])
+    )
+    with conn:
+        if deleted:
+            conn.executemany(f'DELETE FROM {table} WHERE "{key}" = ?', [(k,) for k in deleted])
+        for part in (changed, added):
+            if not part.empty:
+                conn.executemany(upsert, part[cols].to_numpy(dtype=object).tolist())
+
+def studio_db_read_values(conn, table: str) -> dict:
+    return {k: json.loads(v) for k, v in conn.execute(f"SELECT key, value FROM {table}")}
+
+def studio_db_write_values(conn, table: str, values: dict):
+    with conn:
+        conn.executemany(
+            f"INSERT INTO {table} (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            [(k, json.dumps(v)) for k, v in values.items()],
+        )
+
+
+
+# ---- Settings snapshots (content-addressed row deltas in the studio database) ----
+SNAPSHOT_KEYFRAME_EVERY = 20  # store a full copy after this many deltas so checkout stays short
+
+def _snapshot_schema(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS snapshots (id INTEGER PRIMARY KEY, parent_id INTEGER, label TEXT, created TEXT, full INTEGER)")
+    conn.execute("CREATE TABLE IF NOT EXISTS snapshot_blobs (hash TEXT PRIMARY KEY, body TEXT)")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS snapshot_rows (snapshot_id INTEGER, table_name TEXT, row_key TEXT, hash TEXT, "
+        "PRIMARY KEY (snapshot_id, table_name, row_key))"
+    )
+
+def _snapshot_chain(conn, snapshot_id):
+    """Snapshot ids from `snapshot_id` back to (and including) the nearest full copy."""
+    chain, sid = [], snapshot_id
+    while sid is not None:
+        row = conn.execute("SELECT full, parent_id FROM snapshots WHERE id = ?", (sid,)).fetchone()
+        if row is None:
+            raise ValueError(f"Snapshot {sid} not found")
+        chain.append(sid)
+        if row[0]:
+            break
+        sid = row[1]
+    return chain
+
+def snapshot_manifest(conn, snapshot_id) -> dict:
+    """{table: {row_key: blob_hash}} for a snapshot, replayed from its last full copy."""
+    manifest = {}
+    for sid in reversed(_snapshot_chain(conn, snapshot_id)):
+        for table, key, h in conn.execute("SELECT table_name, row_key, hash FROM snapshot_rows WHERE snapshot_id = ?", (sid,)):
+            rows = manifest.setdefault(table, {})
+            if h is None:
+                rows.pop(key, None)
+            else:
+                rows[key] = h
+    return manifest
+
+def _hash_rows(bodies: dict, rows):
+    """rows: iterable of (key, JSON-able value) -> {key: hash}, filling `bodies` with hash -> JSON."""
+    out = {}
+    for key, value in rows:
+        body = json.dumps(value, separators=(",", ":"), sort_keys=True)
+        h = hashlib.sha1(body.encode("utf-8")).hexdigest()
+        bodies[h] = body
+        out[key] = h
+    return out
+
+def create_snapshot(conn, frames: dict, inputs: dict, values: dict, label: str = ""):
+    """
+    Store the current settings as a new version. Only rows (and input keys) that
+    differ from the previous version are written; identical row contents share one blob.
+    Returns (snapshot_id, changed_rows).
+    """
+    _snapshot_schema(conn)
+    bodies, current = {}, {}
+    for name, df in frames.items():
+        key = STUDIO_DB_TABLES[name][1] or "Position"
+        cols = list(df.columns)
+        records = (dict(zip(cols, r)) for r in df[cols].to_numpy(dtype=object).tolist())
+        current[name] = _hash_rows(bodies, zip(df[key].astype(str).tolist(), records))
+    current["inputs"] = _hash_rows(bodies, inputs.items())
+    current["values"] = _hash_rows(bodies, values.items())
+
+    head = conn.execute("SELECT MAX(id) FROM snapshots").fetchone()[0]
+    full = head is None or len(_snapshot_chain(conn, head)) >= SNAPSHOT_KEYFRAME_EVERY
+    previous = {} if full else snapshot_manifest(conn, head)
+
+    delta = []
+    for table, rows in current.items():
+        before = previous.get(table, {})
+        delta += [(table, k, h) for k, h in rows.items() if before.get(k) != h]
+        delta += [(table, k, None) for k in before if k not in rows]
+
+    with conn:
+        cur = conn.execute(
+            "INSERT INTO snapshots (parent_id, label, created, full) VALUES (?, ?, ?, ?)",
+            (head, label, _dt.datetime.now().isoformat(timespec="seconds"), int(full)),
+        )
+        sid = cur.lastrowid
+        conn.executemany(
+            "INSERT OR IGNORE INTO snapshot_blobs (hash, body) VALUES (?, ?)",
+            [(h, bodies[h]) for _, _, h in delta if h is not None],
+        )
+        conn.executemany(
+            "INSERT INTO snapshot_rows (snapshot_id, table_name, row_key, hash) VALUES (?, ?, ?, ?)",
+            [(sid, t, k, h) for t, k, h in delta],
+        )
+    return sid, len(delta)
+
+def checkout_snapshot(conn, snapshot_id):
+    """Rebuild a version: returns (frames by session table name, inputs, values)."""
+    manifest = snapshot_manifest(conn, snapshot_id)
+    wanted = list({h for rows in manifest.values() for h in rows.values()})
+    bodies = {}
+    for i in range(0, len(wanted), 900):
+        part = wanted[i:i + 900]
+        bodies.update(conn.execute(f"SELECT hash, body FROM snapshot_blobs WHERE hash IN ({','.join('?' * len(part))})", part))
+
+    frames = {}
+    for name, (_, key) in STUDIO_DB_TABLES.items():
+        rows = manifest.get(name, {})
+        keys = sorted(rows, key=int) if key is None else list(rows)
+        df = pd.DataFrame([json.loads(bodies[rows[k]]) for k in keys])
+        frames[name] = ensure_cols(df, SETTINGS_TABLE_SCHEMAS[name])
+    inputs = {k: json.loads(bodies[h]) for k, h in manifest.get("inputs", {}).items()}
+    values = {k: json.loads(bodies[h]) for k, h in manifest.get("values", {}).items()}
+    return frames, inputs, values
+
+def list_snapshots(conn) -> pd.DataFrame:
+    _snapshot_schema(conn)
+    return pd.read_sql_query(
+        "SELECT s.id AS Id, s.label AS Label, s.created AS Created, COUNT(r.row_key) AS Changed_rows, s.full AS Full "
+        "FROM snapshots s LEFT JOIN snapshot_rows r ON r.snapshot_id = s.id GROUP BY s.id ORDER BY s.id DESC",
+        conn,
+    )
+
+def snapshot_price_sheet(conn, snapshot_id) -> pd.DataFrame:
+    frames, inputs, _ = checkout_snapshot(conn, snapshot_id)
+    other_pp, _, _ = other_materials_pp(frames["other_mat_df"], int(inputs.get("units_made", 1)))
+    return price_sheet(
+        frames["unified_forms"], inputs, frames["catalog_df"], frames["recipe_df"], other_pp,
+        form_glazes=frames["form_glazes_df"], glaze_costs=glaze_costs_per_gram(frames["catalog_df"], frames["glaze_library_df"]),
+        clay_bodies=frames["clay_bodies_df"],
+    )
+
+def snapshot_price_diff(conn, old_id, new_id) -> pd.DataFrame:
+    """Per-form cost and price changes between two snapshots, biggest moves first."""
+    cols = ["Form", "Total_cost", "Wholesale", "Retail"]
+    a = snapshot_price_sheet(conn, old_id)[cols]
+    b = snapshot_price_sheet(conn, new_id)[cols]
+    out = a.merge(b, on="Form", how="outer", suffixes=("_before", "_after"))
+    for c in cols[1:]:
+        out[f"{c}_change"] = out[f"{c}_after"] - out[f"{c}_before"]
+    return out.sort_values("Total_cost_change", key=lambda v: v.abs(), ascending=False, na_position="first").reset_index(drop=True)
+
+def other_materials_pp(df, pieces_in_project: int):
+    df2 = ensure_cols(df, {
+        "Item":"", "Unit":"", "Cost_per_unit":0.0, "Quantity_for_project":0.0
+    }).copy()
+    df2["Line_total"] = df2["Cost_per_unit"] * df2["Quantity_for_project"]
+    project_total = float(df2["Line_total"].sum())
+    per_piece = project_total / max(1, int(pieces_in_project))
+    df2["Cost_per_piece"] = df2["Line_total"] / max(1, int(pieces_in_project))
+    return per_piece, project_total, df2
+
+
+# ---------- Preset categorizer ----------
+CATEGORY_ORDER = [
+    "Mugs and cups",          # most common first
+    "Bowls",
+    "Plates and platters",
+    "Drinkware and bar",
+    "Bakeware and ovensafe",
+    "Serveware and table",
+    "Jars and canisters",
+    "Teaware and coffee",
+    "Pitchers and ewers",
+    "Cookware and kitchen",
+    "Lighting and decor",
+    "Planters and garden",
+    "Tiles and fixtures",
+    "Sculpture and art",
+    "Specialty and other",
+]
+
+def infer_category(name: str) -> str:
+    n = str(name).lower()
+
+    # Mugs and cups
+    if any(k in n for k in ["mug", "cup", "demitasse", "espresso", "teacup", "soup mug"]):
+        return "Mugs and cups"
+
+    # Bowls
+    if any(k in n for k in ["bowl", "ramekin", "donburi", "noodle", "ramen", "pho", "custard", "trifle", "compote"]):
+        return "Bowls"
+
+    # Plates and platters
+    if any(k in n for k in ["plate", "platter", "tray", "sushi plate", "square plate", "oval platter", "rectangular platter"]):
+        return "Plates and platters"
+
+    # Drinkware and bar
+    if any(k in n for k in ["stein", "goblet", "tumbler", "highball", "lowball", "martini", "coupe", "shot", "wine"]):
+        return "Drinkware and bar"
+
+    # Bakeware and ovensafe
+    if any(k in n for k in ["pie", "tart", "bread pan", "loaf", "bundt", "baker", "baking", "casserole", "lasagna", "gratin", "soufflé", "tagine", "dutch oven", "roaster", "pizza stone", "cloche"]):
+        return "Bakeware and ovensafe"
+
+    # Serveware and table
+    if any(k in n for k in ["serving", "chip and dip", "chip", "dip", "relish", "divided dish", "butter dish", "salt pig", "salt cellar", "spice jar", "utensil crock", "ladle"]):
+        return "Serveware and table"
+
+    # Jars and canisters
+    if any(k in n for k in ["jar", "canister", "storage", "cookie jar", "urn"]):
+        return "Jars and canisters"
+
+    # Teaware and coffee
+    if any(k in n for k in ["teapot", "tea", "pour-over", "french press", "coffee server", "creamer", "sugar"]):
+        return "Teaware and coffee"
+
+    # Pitchers and ewers
+    if any(k in n for k in ["pitcher", "ewer", "cruet"]):
+        return "Pitchers and ewers"
+
+    # Cookware and kitchen
+    if any(k in n for k in ["colander", "mortar", "pestle", "strainer", "soup tureen", "sauce pot", "pan", "tagine", "tandoor", "kitchen utensil holder", "oil burner"]):
+        return "Cookware and kitchen"
+
+    # Lighting and decor
+    if any(k in n for k in ["candle", "candlestick", "lantern", "luminary", "lamp base", "clock", "mask", "votive"]):
+        return "Lighting and decor"
+
+    # Planters and garden
+    if any(k in n for k in ["planter", "garden", "bird", "wind chime", "wind bell", "stepping stone", "fountain", "birdbath", "bird bath"]):
+        return "Planters and garden"
+
+    # Tiles and fixtures
+    if any(k in n for k in ["tile", "trivet", "switch plate"]):
+        return "Tiles and fixtures"
+
+    # Sculpture and art
+    if any(k in n for k in ["sculpture", "bust", "relief", "totem", "column", "capital", "columbarium"]):
+        return "Sculpture and art"
+
+    return "Specialty and other"
+
+def sort_by_category_then_form(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    if "Category" not in df.columns:
+        df["Category"] = df["Form"].apply(infer_category)
+    order_map = {cat: i for i, cat in enumerate(CATEGORY_ORDER)}
+    df["__cat_rank"] = df["Category"].map(order_map).fillna(len(CATEGORY_ORDER)).astype(int)
+    df = df.sort_values(["__cat_rank", "Form"], kind="stable").drop(columns="__cat_rank")
+    return df
+
+
+# ------------ Material IDs ------------
+class MaterialCatalog:
+    """
+    The catalog resolved once into integer material IDs (its rows, last one
+    winning for a repeated name). ids() turns names into IDs: exact names in
+    any case or spacing first, then aliases (MATERIAL_ALIASES) on either side,
+    so a recipe's "Silica" finds the catalog's "Silica 325m". Names that match
+    nothing get -1, which prices() costs at zero; unresolved_materials lists them.
+    """
+
+    def __init__(self, catalog_df, aliases=MATERIAL_ALIASES):
+        cat = ensure_cols(catalog_df, {"Material": "", "Cost_per_lb": 0.0})
+        names = cat["Material"].tolist()
+        keys = [material_key(n) for n in names]
+        rows = sorted({k: i for i, k in enumerate(keys) if k}.values())
+        self.keys = pd.Index([keys[i] for i in rows], dtype=object)
+        self.names = pd.Index([names[i].strip() for i in rows], dtype=object)
+        self.rows = np.asarray(rows, dtype=np.intp)  # ID -> row of catalog_df
+        self.price_g = cat["Cost_per_lb"].to_numpy(dtype=float)[self.rows] / 453.592
+        # One slot past the end so ID -1 looks up as zero cost
+        self._price_pad = np.append(self.price_g, 0.0)
+        self._alias = {material_key(a): material_key(t) for a, t in (aliases or {}).items()}
+        self._exact = {k: i for i, k in enumerate(self.keys)}
+        # Canonical name -> ID; a catalog row spelled the canonical way beats one spelled as an alias
+        self._by_canon = {self._alias[k]: i for i, k in enumerate(self.keys) if k in self._alias}
+        self._by_canon.update((k, i) for i, k in enumerate(self.keys) if k not in self._alias)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def ids(self, names) -> np.ndarray:
+        """Catalog ID per name (-1 where it isn't in the catalog); string work is per distinct name."""
+        code, uniq = pd.factorize(np.asarray(names, dtype=object), use_na_sentinel=False)
+        found = [material_key(u) for u in uniq]
+        found = [self._exact.get(k, self._by_canon.get(self._alias.get(k, k), -1)) for k in found]
+        return np.asarray(found, dtype=np.intp)[code]
+
+    def prices(self, ids: np.ndarray) -> np.ndarray:
+        """$/g per ID, zero for -1."""
+        return self._price_pad[ids]
+
+def resolve_recipe(materials: MaterialCatalog, recipe_df) -> pd.DataFrame:
+    """Recipe lines (Material, Percent) with each material's catalog Id (-1 = not in the catalog)."""
+    rdf = ensure_cols(recipe_df, {"Material": "", "Percent": 0.0})
+    names = rdf["Material"].astype(str).str.strip()
+    return pd.DataFrame({"Material": names.to_numpy(), "Percent": rdf["Percent"].to_numpy(dtype=float),
+                         "Id": materials.ids(names)})
+
+def unresolved_materials(materials: MaterialCatalog, library_df) -> pd.DataFrame:
+    """
+    Library lines whose material isn't in the catalog, so they cost nothing, with
+    the damage per glaze: Share_pct of that glaze, Glaze_unpriced_pct (all its
+    unpriced lines together), Costed_per_kg (what the glaze costs as priced now)
+    and the closest catalog name as a Suggestion. Worst glazes first.
+    """
+    lib = ensure_cols(library_df, GLAZE_LIBRARY_SCHEMA)
+    glaze = lib["Glaze"].astype(str).str.strip()
+    name = lib["Material"].astype(str).str.strip()
+    pct = lib["Percent"].astype(float)
+    total = pct.groupby(glaze).transform("sum")
+    share = pct / total.where(total != 0, 100.0)
+    ids = materials.ids(name)
+    miss = (ids < 0) & (glaze != "").to_numpy() & (name != "").to_numpy()
+    out = pd.DataFrame({
+        "Glaze": glaze, "Material": name, "Percent": pct, "Share_pct": share * 100,
+        "Glaze_unpriced_pct": (share * miss).groupby(glaze).transform("sum") * 100,
+        "Costed_per_kg": (share * materials.prices(ids)).groupby(glaze).transform("sum") * 1000,
+    })[miss]
+    index = MaterialIndex(materials.names)
+    suggest = {n: next(iter(index.search(n, limit=1)), "") for n in out["Material"].unique()}
+    out["Suggestion"] = out["Material"].map(suggest)
+    return out.sort_values(["Glaze_unpriced_pct", "Glaze", "Share_pct"], ascending=[False, True, False]).reset_index(drop=True)
+
+
+# ------------ Glaze helpers ------------
+def glaze_cost_from_piece_table(df):
+    gdf = ensure_cols(df, {"Material": "", "Cost_per_lb": 0.0, "Grams_per_piece": 0.0}).copy()
+    gdf["Cost_per_g"] = gdf["Cost_per_lb"] / 453.592
+    gdf["Cost_per_piece"] = gdf["Cost_per_g"] * gdf["Grams_per_piece"]
+    return float(gdf["Cost_per_piece"].sum()), gdf
+
+def percent_recipe_table(catalog_df, recipe_df, batch_g, materials=None):
+    materials = MaterialCatalog(catalog_df) if materials is None else materials
+    rdf = resolve_recipe(materials, recipe_df)
+    pct = rdf["Percent"].to_numpy()
+    grams = batch_g * pct / (float(pct.sum()) or 100.0)
+    cost = grams * materials.prices(rdf["Id"].to_numpy())
+    out = pd.DataFrame({
+        "Material": rdf["Material"], "Percent": pct,
+        "Grams": grams.round(2),
+        "Ounces": (grams / 28.3495).round(2),
+        "Pounds": (grams / 453.592).round(3),
+        "Cost": cost,
+    })
+    batch_total = float(cost.sum())
+    cost_per_g = batch_total / batch_g if batch_g else 0.0
+    cost_per_oz = cost_per_g * 28.3495
+    cost_per_lb = cost_per_g * 453.592
+    return out, batch_total, cost_per_g, cost_per_oz, cost_per_lb
+
+def recipe_cost_per_piece(materials, resolved: pd.DataFrame, grams_per_piece):
+    """(table, cost per piece) for a recipe from resolve_recipe: array lookups only."""
+    pct = resolved["Percent"].to_numpy()
+    g = grams_per_piece * pct / (float(pct.sum()) or 100.0)
+    cost_pp = g * materials.prices(resolved["Id"].to_numpy())
+    df = pd.DataFrame({
+        "Material": resolved["Material"],
+        "Percent": pct.round(2),
+        "Grams_per_piece": g.round(3),
+        "Ounces_per_piece": (g / 28.3495).round(3),
+        "Pounds_per_piece": (g / 453.592).round(4),
+        "Cost_per_piece": cost_pp,
+    })
+    return df, float(cost_pp.sum())
+
+def glaze_per_piece_from_recipe(catalog_df, recipe_df, grams_per_piece, materials=None):
+    materials = MaterialCatalog(catalog_df) if materials is None else materials
+    return recipe_cost_per_piece(materials, resolve_recipe(materials, recipe_df), grams_per_piece)
+
+# ------------ Glaze library ------------
+def glaze_library_names(library_df) -> list:
+    names = ensure_cols(library_df, GLAZE_LIBRARY_SCHEMA)["Glaze"].astype(str).str.strip()
+    return [n for n in dict.fromkeys(names) if n]
+
+def glaze_library_recipe(library_df, name: str) -> pd.DataFrame:
+    lib = ensure_cols(library_df, GLAZE_LIBRARY_SCHEMA)
+    rows = lib[lib["Glaze"].astype(str).str.strip() == name.strip()]
+    return rows[["Material", "Percent"]].reset_index(drop=True)
+
+def save_glaze_recipe(library_df, name: str, recipe_df) -> pd.DataFrame:
+    """Library with `name` set to this recipe (replacing any earlier version of it)."""
+    lib = ensure_cols(library_df, GLAZE_LIBRARY_SCHEMA)
+    lib = lib[lib["Glaze"].astype(str).str.strip() != name.strip()]
+    recipe = ensure_cols(recipe_df, {"Material": "", "Percent": 0.0})
+    recipe = recipe[recipe["Material"].astype(str).str.strip() != ""]
+    new = pd.DataFrame({"Glaze": name.strip(), "Material": recipe["Material"].to_numpy(), "Percent": recipe["Percent"].to_numpy()})
+    return ensure_cols(pd.concat([lib, new], ignore_index=True), GLAZE_LIBRARY_SCHEMA)
+
+def glaze_costs_per_gram(catalog_df, library_df, materials=None) -> pd.Series:
+    """
+    Cost per gram of every library glaze in one vectorized pass (Glaze -> $/g).
+    Same rules as glaze_per_piece_from_recipe: names resolve through
+    MaterialCatalog, percents are normalized to their total, unknown materials
+    cost nothing (unresolved_materials lists them).
+    """
+    materials = MaterialCatalog(catalog_df) if materials is None else materials
+    lib = ensure_cols(library_df, GLAZE_LIBRARY_SCHEMA)
+    glaze = lib["Glaze"].astype(str).str.strip()
+    pct = lib["Percent"].astype(float)
+    total = pct.groupby(glaze).transform("sum")
+    share = pct / total.where(total != 0, 100.0)
+    per_g = materials.prices(materials.ids(lib["Material"]))
+    costs = (share * per_g).groupby(glaze, sort=False).sum()
+    return costs[costs.index != ""]
+
+def form_glaze_costs(form_glazes_df, glaze_costs: pd.Series) -> pd.Series:
+    """Glaze cost per piece for each form that has glazes assigned (Form -> $)."""
+    m = ensure_cols(form_glazes_df, FORM_GLAZE_SCHEMA)
+    form = m["Form"].astype(str).str.strip()
+    cost = m["Grams"].astype(float) * m["Glaze"].astype(str).str.strip().map(glaze_costs).fillna(0.0)
+    per_form = cost.groupby(form, sort=False).sum()
+    return per_form[per_form.index != ""]
+
+# ------------ Glaze chemistry ------------
+# Typical supplier analyses (weight %), enough to compare recipes; a studio's own
+# rows in oxide_analysis_df replace these for the same material
+TYPICAL_OXIDE_ANALYSES = {
+    "Custer Feldspar": {"SiO2": 68.5, "Al2O3": 17.0, "K2O": 10.0, "Na2O": 3.0, "CaO": 0.3, "Fe2O3": 0.1, "LOI": 0.3},
+    "G-200 Feldspar": {"SiO2": 66.6, "Al2O3": 18.4, "K2O": 10.1, "Na2O": 3.2, "CaO": 0.7, "Fe2O3": 0.1, "LOI": 0.3},
+    "F-4 Feldspar": {"SiO2": 67.0, "Al2O3": 19.5, "Na2O": 6.9, "K2O": 4.8, "CaO": 1.8, "LOI": 0.2},
+    "Minspar 200": {"SiO2": 67.5, "Al2O3": 19.1, "Na2O": 6.9, "K2O": 4.0, "CaO": 2.0, "LOI": 0.2},
+    "Nepheline Syenite": {"SiO2": 60.4, "Al2O3": 23.6, "Na2O": 10.6, "K2O": 4.6, "CaO": 0.3, "LOI": 0.5},
+    "Cornwall Stone": {"SiO2": 73.0, "Al2O3": 16.0, "K2O": 4.2, "Na2O": 3.5, "CaO": 1.5, "LOI": 1.8},
+    "Flint (Silica)": {"SiO2": 99.7, "Al2O3": 0.1, "LOI": 0.2},
+    "Silica Sand": {"SiO2": 99.5, "Al2O3": 0.2, "LOI": 0.3},
+    "Quartz": {"SiO2": 100.0},
+    "EPK Kaolin": {"SiO2": 46.0, "Al2O3": 37.5, "Fe2O3": 0.8, "TiO2": 0.4, "K2O": 0.3, "CaO": 0.2, "MgO": 0.2, "LOI": 14.0},
+    "Grolleg Kaolin": {"SiO2": 47.5, "Al2O3": 37.0, "K2O": 1.9, "Fe2O3": 0.6, "MgO": 0.3, "LOI": 12.7},
+    "OM4 Ball Clay": {"SiO2": 51.7, "Al2O3": 31.1, "TiO2": 1.6, "Fe2O3": 1.0, "K2O": 0.8, "MgO": 0.3, "CaO": 0.2, "LOI": 13.3},
+    "Redart Clay": {"SiO2": 64.3, "Al2O3": 16.4, "Fe2O3": 7.0, "K2O": 4.2, "MgO": 1.6, "TiO2": 1.1, "CaO": 0.3, "LOI": 5.1},
+    "Gerstley Borate": {"SiO2": 14.8, "B2O3": 26.8, "CaO": 19.4, "Na2O": 4.0, "MgO": 3.4, "Al2O3": 1.0, "K2O": 0.4, "LOI": 30.2},
+    "Whiting (Calcium Carbonate)": {"CaO": 56.0, "LOI": 44.0},
+    "Wollastonite": {"CaO": 48.3, "SiO2": 51.7},
+    "Dolomite": {"CaO": 30.4, "MgO": 21.9, "LOI": 47.7},
+    "Talc": {"MgO": 31.7, "SiO2": 63.5, "LOI": 4.8},
+    "Magnesium Carbonate": {"MgO": 42.0, "LOI": 58.0},
+    "Barium Carbonate": {"BaO": 77.7, "LOI": 22.3},
+    "Strontium Carbonate": {"SrO": 70.2, "LOI": 29.8},
+    "Lithium Carbonate": {"Li2O": 40.4, "LOI": 59.6},
+    "Pearl Ash (Potassium Carbonate)": {"K2O": 68.2, "LOI": 31.8},
+    "Soda Ash (Sodium Carbonate)": {"Na2O": 58.5, "LOI": 41.5},
+    "Spodumene": {"SiO2": 64.5, "Al2O3": 25.0, "Li2O": 7.0, "Na2O": 0.5, "Fe2O3": 0.4, "LOI": 0.3},
+    "Petalite": {"SiO2": 77.5, "Al2O3": 16.5, "Li2O": 4.5, "Na2O": 0.3, "LOI": 0.8},
+    "Bone Ash": {"CaO": 55.8, "P2O5": 42.4, "LOI": 1.8},
+    "Frit 3134": {"SiO2": 46.5, "B2O3": 23.1, "CaO": 20.1, "Na2O": 10.3},
+    "Frit 3124": {"SiO2": 55.3, "B2O3": 13.6, "CaO": 14.1, "Al2O3": 10.0, "Na2O": 6.3, "K2O": 0.7},
+    "Frit 3195": {"SiO2": 48.1, "B2O3": 23.0, "Al2O3": 12.0, "CaO": 11.3, "Na2O": 5.6},
+    "Zinc Oxide": {"ZnO": 100.0},
+    "Zircopax (Zirconium Silicate)": {"ZrO2": 65.0, "SiO2": 33.0, "Al2O3": 1.5, "LOI": 0.5},
+    "Bentonite": {"SiO2": 64.0, "Al2O3": 21.0, "Fe2O3": 3.5, "MgO": 2.5, "Na2O": 2.5, "CaO": 0.7, "LOI": 5.8},
+    "Alumina Hydrate": {"Al2O3": 65.4, "LOI": 34.6},
+    "Calcined Alumina": {"Al2O3": 100.0},
+    "Red Iron Oxide": {"Fe2O3": 100.0},
+    "Rutile": {"TiO2": 90.0, "Fe2O3": 10.0},
+    "Titanium Dioxide": {"TiO2": 100.0},
+    "Tin Oxide": {"SnO2": 100.0},
+    "Cobalt Carbonate": {"CoO": 63.0, "LOI": 37.0},
+    "Cobalt Oxide": {"CoO": 100.0},
+    "Copper Carbonate": {"CuO": 72.0, "LOI": 28.0},
+    "Copper Oxide": {"CuO": 100.0},
+    "Chrome Oxide": {"Cr2O3": 100.0},
+    "Manganese Dioxide": {"MnO": 81.6, "LOI": 18.4},
+}
+
+def oxide_analyses(analysis_df=None) -> pd.DataFrame:
+    """The typical analyses with the studio's own rows after them (later rows win when names match)."""
+    typical = pd.DataFrame([dict(v, Material=k) for k, v in TYPICAL_OXIDE_ANALYSES.items()])
+    return ensure_cols(pd.concat([ensure_cols(typical, OXIDE_ANALYSIS_SCHEMA), ensure_cols(analysis_df, OXIDE_ANALYSIS_SCHEMA)],
+                                 ignore_index=True), OXIDE_ANALYSIS_SCHEMA)
+
+def material_oxides(analysis_df, names):
+    """
+    (W, found): W[j, k] is grams of oxide k per gram of raw material names[j]
+    (LOI burnt off), found marks the names that have an analysis. Names match
+    like catalog names (case, spacing, aliases).
+    """
+    table = oxide_analyses(analysis_df)
+    lookup = MaterialCatalog(table[["Material"]])
+    weights = table[list(OXIDES)].to_numpy(dtype=float)[lookup.rows] / 100.0
+    ids = lookup.ids(names)
+    return np.vstack([weights, np.zeros((1, len(OXIDES)))])[ids], ids >= 0
+
+def glaze_chemistry(library_df, analysis_df=None):
+    """
+    Chemistry of every library glaze in one matrix product: the recipes x
+    materials fractions times the materials x oxides analyses.
+    Returns (umf, oxide_pct, summary), each indexed by Glaze:
+      umf        oxides in unity formula (R2O + RO fluxes sum to 1)
+      oxide_pct  fired weight % of each oxide
+      summary    SiO2, Al2O3, B2O3, R2O, RO (UMF), Si_Al ratio, LOI_pct of the
+                 raw batch and Unanalyzed_pct, the share with no analysis
+    """
+    glazes, keys, names, R = recipe_matrix(library_df)
+    W, found = material_oxides(analysis_df, names)
+    wt = R @ W  # grams of each oxide per gram of raw glaze
+    mol = wt / np.array(list(OXIDES.values()))
+    cols = list(OXIDES)
+    fired = wt.sum(axis=1, keepdims=True)
+    flux = mol[:, [cols.index(o) for o in R2O_OXIDES + RO_OXIDES]].sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        umf = pd.DataFrame(np.where(flux > 0, mol / flux, np.nan), index=glazes, columns=cols)
+        oxide_pct = pd.DataFrame(np.where(fired > 0, wt / fired * 100, 0.0), index=glazes, columns=cols)
+        summary = pd.DataFrame({
+            "SiO2": umf["SiO2"], "Al2O3": umf["Al2O3"], "B2O3": umf["B2O3"],
+            "Si_Al": umf["SiO2"] / umf["Al2O3"].where(umf["Al2O3"] > 0),
+            "R2O": umf[list(R2O_OXIDES)].sum(axis=1, min_count=1), "RO": umf[list(RO_OXIDES)].sum(axis=1, min_count=1),
+            "LOI_pct": (R @ found.astype(float) - fired[:, 0]) * 100,
+            "Unanalyzed_pct": R @ (~found).astype(float) * 100,
+        }, index=glazes)
+    summary.index.name = umf.index.name = oxide_pct.index.name = "Glaze"
+    return umf, oxide_pct, summary
+
+
+def _lp_min(c, A_ub, A_eq, b_eq, max_iter: int = 5000):
+    """
+    min c.x  s.t.  A_ub x <= 0,  A_eq x = b_eq (b_eq >= 0),  x >= 0.
+    Two-phase revised simplex. The chemistry rows are all degenerate at zero,
+    so the basis is re-inverted every step rather than updated in a tableau
+    (which drifts over long runs of zero-length pivots), and pricing falls
+    back from steepest reduced cost to Bland's rule when it stalls, so it
+    can't cycle. x, or None when infeasible.
+    """
+    p, n = A_ub.shape
+    q = A_eq.shape[0]
+    A = np.block([[A_ub, np.eye(p), np.zeros((p, q))], [A_eq, np.zeros((q, p)), np.eye(q)]])
+    b = np.concatenate([np.zeros(p), b_eq])
+    artificial = np.arange(n + p + q) >= n + p
+    basis = np.arange(n, n + p + q)
+
+    def run(cost, allowed):
+        stalled = 0
+        for _ in range(max_iter):
+            B_inv = np.linalg.inv(A[:, basis])
+            x_b = B_inv @ b
+            reduced = np.where(allowed, cost - (cost[basis] @ B_inv) @ A, 0.0)
+            enter = np.flatnonzero(reduced < -1e-9)
+            if not len(enter):
+                return x_b
+            j = enter[0] if stalled > 20 else int(np.argmin(reduced))
+            d = B_inv @ A[:, j]
+            ok = d > 1e-9
+            if not ok.any():
+                return None
+            ratios = np.where(ok, np.maximum(x_b, 0.0) / np.where(ok, d, 1.0), np.inf)
+            ties = np.flatnonzero(ratios <= ratios.min() + 1e-12)
+            stalled = stalled + 1 if ratios.min() <= 1e-12 else 0
+            basis[ties[np.argmin(basis[ties])]] = j
+        return None
+
+    x_b = run(artificial.astype(float), np.ones(n + p + q, dtype=bool))
+    if x_b is None or x_b[artificial[basis]].sum() > 1e-7:
+        return None
+    # Swap artificials left in the basis (at zero) for real columns before phase two
+    for i in np.flatnonzero(artificial[basis]):
+        row = np.linalg.inv(A[:, basis])[i] @ A
+        cols = np.flatnonzero((np.abs(row) > 1e-9) & ~artificial & ~np.isin(np.arange(n + p + q), basis))
+        if len(cols):
+            basis[i] = cols[0]
+    x_b = run(np.concatenate([c, np.zeros(p + q)]), ~artificial)
+    if x_b is None:
+        return None
+    x = np.zeros(n + p + q)
+    x[basis] = x_b
+    return np.maximum(x[:n], 0.0)
+
+def cheapest_reformulation(catalog_df, library_df, analysis_df=None, tolerance_pct: float = 5.0,
+                           min_band: float = 0.01, tolerances: dict = None, grams_per_piece: float = 8.0):
+    """
+    Lowest-cost recipe for each library glaze that keeps its chemistry: every
+    oxide's UMF stays within tolerance_pct of the glaze's own (at least
+    min_band, or tolerances[oxide] in UMF units), choosing from the catalog
+    materials that have a price and an oxide analysis.
+
+    The constraint rows for the whole library are one broadcast over
+    (glazes x oxides x candidate materials); each glaze is then a small LP
+    over grams per 100 g of batch. Returns (recipes, summary):
+      recipes  long form (Glaze, Material, Percent) like the glaze library
+      summary  per glaze: cost per kg now and after, the saving per kg and per
+               piece at grams_per_piece (priced like glaze_per_piece_from_recipe),
+               and Status ("Cheaper", "Already cheapest", or why it was skipped)
+    """
+    materials = MaterialCatalog(catalog_df)
+    umf, _, chem = glaze_chemistry(library_df, analysis_df)
+    cost_now = glaze_costs_per_gram(None, library_df, materials).reindex(chem.index).fillna(0.0)
+    W, found = material_oxides(analysis_df, materials.names)
+    mol = W / np.array(list(OXIDES.values()))  # candidates x oxides, moles per gram
+    cols = list(OXIDES)
+    flux = mol[:, [cols.index(o) for o in R2O_OXIDES + RO_OXIDES]].sum(axis=1)
+
+    target = umf.fillna(0.0).to_numpy()
+    band = np.maximum(target * tolerance_pct / 100.0, min_band)
+    for oxide, tol in (tolerances or {}).items():
+        band[:, cols.index(oxide)] = tol
+    # mol_k - (t_k + band_k) * flux <= 0  and  (t_k - band_k) * flux - mol_k <= 0
+    upper = mol.T[None] - (target + band)[:, :, None] * flux[None, None, :]
+    lower = (target - band)[:, :, None] * flux[None, None, :] - mol.T[None]
+    has_lower = target - band > 0
+
+    lib = ensure_cols(library_df, GLAZE_LIBRARY_SCHEMA)
+    listed = lib["Material"].astype(str).str.strip() != ""
+    ids = materials.ids(lib["Material"][listed])
+    rows_of = pd.Series(ids).groupby(lib["Glaze"].astype(str).str.strip()[listed].to_numpy()).indices
+    priced = found & (materials.price_g > 0)
+    now = cost_now.to_numpy()
+    new = now.copy()
+    unanalyzed = chem["Unanalyzed_pct"].to_numpy()
+    status = np.full(len(chem), "Already cheapest", dtype=object)
+    parts = {"Glaze": [], "Material": [], "Percent": []}
+    for g, glaze in enumerate(chem.index):
+        mine = ids[rows_of.get(glaze, [])]
+        if unanalyzed[g] > 0:
+            status[g] = "Needs oxide analyses"
+            continue
+        if (mine < 0).any():
+            status[g] = "Has materials not in the catalog"
+            continue
+        # Materials the glaze already uses stay available even without a price
+        usable = priced.copy()
+        usable[mine] |= found[mine]
+        cand = np.flatnonzero(usable)
+        A_ub = np.vstack([upper[g][:, cand], lower[g][has_lower[g]][:, cand]])
+        scale = np.abs(A_ub).max(axis=1, keepdims=True)
+        x = _lp_min(materials.price_g[cand], A_ub / np.where(scale > 0, scale, 1.0), np.ones((1, len(cand))), np.array([100.0]))
+        if x is None:
+            status[g] = "No recipe within tolerance"
+        elif materials.price_g[cand] @ x / 100.0 < now[g] * (1 - 1e-6):
+            keep = x > 0.005
+            status[g], new[g] = "Cheaper", materials.price_g[cand] @ x / 100.0
+            parts["Glaze"] += [glaze] * int(keep.sum())
+            parts["Material"] += materials.names[cand[keep]].tolist()
+            parts["Percent"] += x[keep].round(2).tolist()
+    recipes = ensure_cols(pd.DataFrame(parts), GLAZE_LIBRARY_SCHEMA)
+    summary = pd.DataFrame({
+        "Glaze": chem.index,
+        "Cost_per_kg_now": now * 1000,
+        "Cost_per_kg_new": new * 1000,
+        "Saving_per_kg": (now - new) * 1000,
+        "Saving_per_piece": (now - new) * grams_per_piece,
+        "Status": status,
+    })
+    return recipes, summary.sort_values("Saving_per_kg", ascending=False, kind="stable").reset_index(drop=True)
+
+
+# ------------ Batch mixing planner ------------
+CURRENT_RECIPE_GLAZE = "Current recipe"  # stands in for forms with no library glazes assigned
+
+def schedule_glaze_grams(schedule_df, forms_df, form_glazes_df, extra_pct: float = 0.0) -> pd.DataFrame:
+    """
+    Grams of each glaze per schedule row (rows x glazes, indexed by the row's Due
+    text). Forms with library glazes assigned use those grams; the rest need their
+    Default_glaze_g of the current recipe. extra_pct covers bucket and dipping losses.
+    """
+    sched = ensure_cols(schedule_df, PRODUCTION_SCHEDULE_SCHEMA)
+    form = sched["Form"].astype(str).str.strip()
+    pieces = sched["Pieces"].astype(float)
+    keep = (form != "") & (pieces > 0)
+    form, pieces, due = form[keep], pieces[keep].to_numpy(), sched["Due"].astype(str).str.strip()[keep]
+
+    fg = ensure_cols(form_glazes_df, FORM_GLAZE_SCHEMA)
+    fg = pd.DataFrame({"Form": fg["Form"].astype(str).str.strip(), "Glaze": fg["Glaze"].astype(str).str.strip(), "Grams": fg["Grams"].astype(float)})
+    fg = fg[fg["Form"] != ""]
+    assigned = form.isin(fg["Form"]).to_numpy()
+    fg = fg[fg["Glaze"] != ""]
+    per_form = fg.groupby(["Form", "Glaze"], sort=False)["Grams"].sum().unstack(fill_value=0.0)
+    grams = pd.DataFrame(per_form.reindex(form.to_numpy()).fillna(0.0).to_numpy() * pieces[:, None], columns=per_form.columns.astype(str))
+
+    if not assigned.all():
+        forms = ensure_cols(forms_df, UNIFIED_FORM_SCHEMA)
+        default_g = forms.assign(Form=forms["Form"].astype(str).str.strip()).drop_duplicates("Form", keep="last").set_index("Form")["Default_glaze_g"]
+        current = np.where(assigned, 0.0, pieces * form.map(default_g).fillna(0.0).to_numpy(dtype=float))
+        if current.sum() > 0:
+            grams[CURRENT_RECIPE_GLAZE] = grams.get(CURRENT_RECIPE_GLAZE, 0.0) + current
+    grams.index = pd.Index(due.to_numpy(), name="Due")
+    return grams * (1.0 + extra_pct / 100.0)
+
+def glaze_grams_needed(schedule_df, forms_df, form_glazes_df, extra_pct: float = 0.0) -> pd.Series:
+    """Grams of each glaze a whole production schedule needs (Glaze -> g)."""
+    grams = schedule_glaze_grams(schedule_df, forms_df, form_glazes_df, extra_pct).sum(axis=0)
+    return grams[grams > 0]
+
+def recipe_matrix(library_df):
+    """
+    (glazes, material_keys, material_names, R) where R[i, j] is the fraction of
+    glaze i that is material j. Materials match case- and space-insensitively.
+    """
+    lib = ensure_cols(library_df, GLAZE_LIBRARY_SCHEMA)
+    glaze = lib["Glaze"].astype(str).str.strip()
+    name = lib["Material"].astype(str).str.strip()
+    lib = pd.DataFrame({"Glaze": glaze, "Key": material_keys(name), "Name": name, "Percent": lib["Percent"].astype(float)})
+    lib = lib[(lib["Glaze"] != "") & (lib["Key"] != "")]
+    glazes = pd.Index(pd.unique(lib["Glaze"]))
+    keys = pd.Index(pd.unique(lib["Key"]))
+    names = lib.drop_duplicates("Key").set_index("Key")["Name"].reindex(keys).tolist()
+    R = np.zeros((len(glazes), len(keys)))
+    np.add.at(R, (glazes.get_indexer(lib["Glaze"]), keys.get_indexer(lib["Key"])), lib["Percent"].to_numpy())
+    totals = R.sum(axis=1, keepdims=True)
+    R /= np.where(totals > 0, totals, 100.0)
+    return glazes, keys, names, R
+
+def batch_mixing_plan(catalog_df, library_df, grams_by_glaze: pd.Series, on_hand_df=None):
+    """
+    Scale every glaze batch at once and combine the material pulls.
+    Returns (mix_sheet, pull_list, glaze_totals):
+      mix_sheet    glazes x materials, grams to weigh out for each batch
+      pull_list    one row per material: needed, on hand, to buy and cost
+      glaze_totals one row per glaze: grams and batch cost
+    """
+    glazes, keys, names, R = recipe_matrix(library_df)
+    g = grams_by_glaze.reindex(glazes).fillna(0.0).to_numpy(dtype=float)
+    missing = [x for x in grams_by_glaze.index if x not in glazes]
+
+    materials = MaterialCatalog(catalog_df)
+    ids = materials.ids(names)
+    in_catalog = ids >= 0
+    # Show the catalog's spelling where the name is the same
+    exact = materials.keys.get_indexer(keys)
+    names = [materials.names[i] if i >= 0 else n for i, n in zip(exact, names)]
+    price_g = materials.prices(ids)
+
+    need = g @ R  # grams of each material over all batches
+    mix = g[:, None] * R
+    stock = ensure_cols(on_hand_df, MATERIAL_ON_HAND_SCHEMA)
+    stock = stock["On_hand_g"].astype(float).groupby(material_keys(stock["Material"])).sum()
+    have = stock.reindex(keys).fillna(0.0).to_numpy()
+    to_buy = np.maximum(need - have, 0.0)
+
+    mix_sheet = pd.DataFrame(mix.round(1), index=glazes, columns=names)
+    mix_sheet = mix_sheet.loc[g > 0, need > 0]
+    pull_list = pd.DataFrame({
+        "Material": names,
+        "Needed_g": need,
+        "On_hand_g": have,
+        "To_buy_g": to_buy,
+        "To_buy_lb": to_buy / 453.592,
+        "Cost_per_lb": price_g * 453.592,
+        "Cost": need * price_g,
+        "Buy_cost": to_buy * price_g,
+        "Used_in": (R > 0).sum(axis=0),
+        "In_catalog": in_catalog,
+    })
+    pull_list = pull_list[pull_list["Needed_g"] > 0].sort_values("Needed_g", ascending=False).reset_index(drop=True)
+    glaze_totals = pd.DataFrame({"Glaze": glazes, "Grams": g, "Cost": R @ price_g * g})
+    glaze_totals = glaze_totals[glaze_totals["Grams"] > 0].reset_index(drop=True)
+    if missing:
+        glaze_totals = pd.concat([glaze_totals, pd.DataFrame({"Glaze": missing, "Grams": grams_by_glaze[missing].to_numpy(), "Cost": np.nan})], ignore_index=True)
+    return mix_sheet, pull_list, glaze_totals
+
+# ------------ Inventory ledger ------------
+INVENTORY_KINDS = ("Receipt", "Use", "Adjust")
+INVENTORY_COSTING = ("FIFO", "Weighted average")
+
+def ledger_entries(material, grams, kind: str = "Receipt", cost=0.0, date: str = "", note: str = "") -> pd.DataFrame:
+    """New ledger rows; material / grams / cost may be scalars or equal-length lists."""
+    material = [material] if isinstance(material, str) else list(material)
+    n = len(material)
+    return pd.DataFrame({
+        "Date": [str(date)] * n, "Material": [str(m).strip() for m in material], "Kind": [kind] * n,
+        "Grams": np.broadcast_to(np.asarray(grams, dtype=float), (n,)).copy(),
+        "Cost": np.broadcast_to(np.asarray(cost, dtype=float), (n,)).copy(), "Note": [note] * n,
+    })
+
+def append_ledger(ledger_df, entries: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ledger with `entries` added at the end. Existing rows keep their positions
+    (so the studio database only inserts), and frames already in ledger shape
+    are concatenated as they are rather than re-checked row by row.
+    """
+    def shaped(df):
+        return df if df is not None and list(df.columns) == list(INVENTORY_LEDGER_SCHEMA) else ensure_cols(df, INVENTORY_LEDGER_SCHEMA)
+    ledger = shaped(ledger_df)
+    if entries is None or entries.empty:
+        return ledger
+    return pd.concat([ledger, shaped(entries)], ignore_index=True)
+
+def _ledger_moves(ledger_df):
+    """
+    (moves, materials): signed stock moves (Code, When, Delta, Cost) sorted per
+    material in the order they happened, and the materials (Key -> Material)
+    the codes index. Undated rows count as opening stock. Names, kinds and dates
+    are factorized so the string work is per distinct value, not per row.
+    """
+    led = ensure_cols(ledger_df, INVENTORY_LEDGER_SCHEMA)
+    code, names = pd.factorize(led["Material"].astype(str), use_na_sentinel=False)
+    names = pd.Index(names).str.strip()
+    key_code, keys = pd.factorize(material_keys(names))
+    code = key_code[code]
+    kind_code, kinds = pd.factorize(led["Kind"].astype(str), use_na_sentinel=False)
+    sign = pd.Index(kinds).str.strip().str.lower().map({"receipt": 1.0, "use": -1.0}).to_numpy(dtype=float, na_value=0.0)[kind_code]
+    grams = led["Grams"].astype(float).to_numpy()
+    delta = np.where(sign == 0, grams, sign * np.abs(grams))
+    date_code, dates = pd.factorize(led["Date"].astype(str), use_na_sentinel=False)
+    when = pd.to_datetime(pd.Index(dates).str.strip(), format="ISO8601", errors="coerce").to_numpy()[date_code]
+
+    keep = (keys[code] != "") & (delta != 0)
+    idx = np.flatnonzero(keep)
+    # NaT sorts as the smallest datetime, so undated rows come first
+    order = idx[np.lexsort((idx, when[idx].view("i8"), code[idx]))]
+    moves = pd.DataFrame({
+        "Code": code[order], "When": when[order], "Delta": delta[order],
+        "Cost": np.where(delta[order] > 0, led["Cost"].astype(float).to_numpy()[order], 0.0),
+    })
+    materials = pd.Series(names.to_numpy(), index=keys[key_code]).groupby(level=0, sort=False).first().reindex(keys)
+    materials.index.name = "Key"
+    return moves, materials
+
+def inventory_positions(ledger_df, method: str = "FIFO") -> pd.DataFrame:
+    """
+    Stock and value of every material in the ledger, indexed by lower-case name:
+    Material, On_hand_g, Value, Cost_per_lb (of what's on hand) and Last_cost_per_lb.
+
+    FIFO: uses draw down the oldest receipts first, so what's left is the tail of
+    each material's receipts past its total use. Weighted average: a receipt
+    re-averages the stock and a use keeps the average, i.e. the value scales by
+    on_hand_after / on_hand_before; those ratios are summed as logs per material
+    and only moves since the material last ran out count. Both are grouped array
+    passes, so tens of thousands of entries stay quick.
+    """
+    m, materials = _ledger_moves(ledger_df)
+    code = m["Code"].to_numpy()
+    delta = m["Delta"].to_numpy()
+    cost = m["Cost"].to_numpy()
+    n = len(materials)
+    received = delta > 0
+    qty_in = np.where(received, delta, 0.0)
+    on_hand = np.bincount(code, weights=delta, minlength=n)
+
+    if method == "FIFO":
+        used = np.bincount(code, weights=qty_in - delta, minlength=n)
+        received_to_date = pd.Series(qty_in).groupby(code).cumsum().to_numpy()
+        left = np.clip(received_to_date - used[code], 0.0, qty_in)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = np.where(received, left * cost / qty_in, 0.0)
+    else:
+        stock = pd.Series(delta).groupby(code).cumsum().to_numpy()
+        ran_out = stock <= 1e-9
+        period = pd.Series(ran_out).groupby(code).cumsum().to_numpy()
+        live = (period == np.bincount(code, weights=ran_out, minlength=n)[code]) & ~ran_out
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_kept = np.where(live & ~received, np.log(stock / (stock - delta)), 0.0)
+        kept_to_date = pd.Series(log_kept).groupby(code).cumsum().to_numpy()
+        kept_after = np.bincount(code, weights=log_kept, minlength=n)[code] - kept_to_date
+        value = np.where(live & received, cost * np.exp(kept_after), 0.0)
+
+    value = np.where(on_hand > 0, np.bincount(code, weights=value, minlength=n), 0.0)
+    priced = received & (cost > 0)
+    last_cost = np.zeros(n)
+    last = pd.Series(cost[priced] / qty_in[priced]).groupby(code[priced]).last()
+    last_cost[last.index.to_numpy()] = last.to_numpy() * 453.592
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_lb = np.where(on_hand > 0, value / on_hand * 453.592, last_cost)
+    out = pd.DataFrame({
+        "Material": materials.to_numpy(), "On_hand_g": on_hand, "Value": value,
+        "Cost_per_lb": per_lb, "Last_cost_per_lb": last_cost,
+    }, index=materials.index)
+    return out[np.bincount(code, minlength=n) > 0]
+
+def catalog_with_inventory_costs(catalog_df, positions: pd.DataFrame):
+    """(catalog, updated) with Cost_per_lb / Cost_per_kg taken from the ledger's costing for materials that have one."""
+    cat = ensure_cols(catalog_df, SETTINGS_TABLE_SCHEMAS["catalog_df"]).copy()
+    per_lb = positions["Cost_per_lb"][positions["Cost_per_lb"] > 0]
+    new = material_keys(cat["Material"]).map(per_lb)
+    hit = new.notna()
+    cat.loc[hit, "Cost_per_lb"] = new[hit].round(4)
+    cat.loc[hit, "Cost_per_kg"] = (new[hit] * 2.20462).round(4)
+    return cat, int(hit.sum())
+
+def opening_balances(on_hand_df, catalog_df) -> pd.DataFrame:
+    """Ledger receipts for a plain on-hand list, valued at catalog prices (for settings saved before the ledger)."""
+    stock = ensure_cols(on_hand_df, MATERIAL_ON_HAND_SCHEMA)
+    stock = stock[(stock["Material"].astype(str).str.strip() != "") & (stock["On_hand_g"].astype(float) > 0)]
+    cat = ensure_cols(catalog_df, {"Material": "", "Cost_per_lb": 0.0})
+    price_lb = pd.Series(cat["Cost_per_lb"].to_numpy(dtype=float), index=material_keys(cat["Material"]))
+    price_lb = price_lb[~price_lb.index.duplicated(keep="last")]
+    grams = stock["On_hand_g"].astype(float)
+    cost = grams * material_keys(stock["Material"]).map(price_lb).fillna(0.0) / 453.592
+    return ledger_entries(stock["Material"].astype(str).str.strip().tolist(), grams.tolist(), "Receipt", cost.tolist(), note="Opening balance")
+
+def schedule_material_needs(glaze_grams: pd.DataFrame, library_df):
+    """(needs, names): grams of each material per schedule row (rows x material keys) from schedule_glaze_grams."""
+    glazes, keys, names, R = recipe_matrix(library_df)
+    G = glaze_grams.reindex(columns=glazes, fill_value=0.0).to_numpy(dtype=float)
+    return pd.DataFrame(G @ R, index=glaze_grams.index, columns=keys), pd.Series(names, index=keys)
+
+def stockout_forecast(positions: pd.DataFrame, ledger_df, needs: pd.DataFrame = None, names: pd.Series = None,
+                      today=None, window_days: int = 90) -> pd.DataFrame:
+    """
+    How long each material lasts: at the rate it was used over the last
+    window_days (Days_left), and against the production schedule (the first due
+    date whose cumulative need is more than is on hand). Rows without a due date
+    count as due today.
+    """
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    m, materials = _ledger_moves(ledger_df)
+    recent = m[(m["Delta"] < 0) & (m["When"] > today - pd.Timedelta(days=window_days))]
+    per_day = pd.Series(np.bincount(recent["Code"], weights=-recent["Delta"], minlength=len(materials)) / window_days, index=materials.index)
+
+    needs = pd.DataFrame() if needs is None else needs
+    keys = positions.index.union(needs.columns, sort=False)
+    out = pd.DataFrame(index=keys)
+    out["Material"] = positions["Material"].reindex(keys)
+    if names is not None:
+        out["Material"] = out["Material"].fillna(names.reindex(keys))
+    out["On_hand_g"] = positions["On_hand_g"].reindex(keys).fillna(0.0)
+    out["Use_per_day_g"] = per_day.reindex(keys).fillna(0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out["Days_left"] = np.where(out["Use_per_day_g"] > 0, out["On_hand_g"].clip(lower=0) / out["Use_per_day_g"], np.nan)
+    out["Scheduled_g"] = 0.0
+    out["Runs_out_by"] = ""
+
+    if len(needs):
+        due = pd.to_datetime(pd.Series(needs.index.astype(str)), format="ISO8601", errors="coerce").fillna(today).to_numpy()
+        order = np.argsort(due, kind="stable")
+        cum = needs.to_numpy()[order].cumsum(axis=0)
+        have = out["On_hand_g"].reindex(needs.columns).to_numpy()
+        short = cum > have[None, :] + 1e-6
+        first = short.argmax(axis=0)
+        runs_out = pd.Series(pd.DatetimeIndex(due[order][first]).strftime("%Y-%m-%d"), index=needs.columns).where(short.any(axis=0), "")
+        out.loc[needs.columns, "Scheduled_g"] = cum[-1]
+        out.loc[needs.columns, "Runs_out_by"] = runs_out
+    out.index.name = "Key"
+    return out
+
+# ------------ Energy and totals ------------
+def calc_energy(ip):
+    e_cost = (ip.get("kwh_bisque", 0.0) + ip.get("kwh_glaze", 0.0) + ip.get("kwh_third", 0.0)) * ip.get("kwh_rate", 0.0)
+    e_pp = e_cost / max(1, int(ip.get("pieces_per_electric_firing", 40)))
+
+    fuel = str(ip.get("fuel_gas", "None")).strip()
+    fuel_pp = 0.0
+
+    if fuel == "Propane":
+        gas_cost = ip.get("lp_price_per_gal", 0.0) * (ip.get("lp_gal_bisque", 0.0) + ip.get("lp_gal_glaze", 0.0))
+        fuel_pp = gas_cost / max(1, int(ip.get("pieces_per_gas_firing", 40)))
+
+    elif fuel == "Natural Gas":
+        gas_cost = ip.get("ng_price_per_therm", 0.0) * (ip.get("ng_therms_bisque", 0.0) + ip.get("ng_therms_glaze", 0.0))
+        fuel_pp = gas_cost / max(1, int(ip.get("pieces_per_gas_firing", 40)))
+
+    elif fuel == "Wood":
+        wood_cost = (
+            ip.get("wood_price_per_cord", 0.0) * (ip.get("wood_cords_bisque", 0.0) + ip.get("wood_cords_glaze", 0.0) + ip.get("wood_cords_third", 0.0))
+            + ip.get("wood_price_per_facecord", 0.0) * (ip.get("wood_facecords_bisque", 0.0) + ip.get("wood_facecords_glaze", 0.0) + ip.get("wood_facecords_third", 0.0))
+        )
+        fuel_pp = wood_cost / max(1, int(ip.get("pieces_per_wood_firing", 40)))
+
+    return e_pp + fuel_pp
+
+def _is_array(value) -> bool:
+    # np.ndim costs ~1µs on a plain float, which adds up on the single-piece path run on every rerun
+    return isinstance(value, (np.ndarray, pd.Series))
+
+def clay_cost_per_lb(ip):
+    bag = ip["clay_bag_weight_lb"]
+    if _is_array(bag):
+        return np.divide(ip["clay_price_per_bag"], bag, out=np.zeros(np.shape(bag)), where=bag > 0)
+    return ip["clay_price_per_bag"] / bag if bag else 0.0
+
+def calc_clay_pp(ip, cost_per_lb=None):
+    """
+    Clay cost per finished piece. You buy wet weight / yield; of the clay that
+    doesn't end up in the piece, clay_reclaim_pct is recycled and credited back
+    at its price less clay_reclaim_cost_per_lb. Works on scalars or per-form arrays.
+    """
+    cost_per_lb = clay_cost_per_lb(ip) if cost_per_lb is None else cost_per_lb
+    wet, clay_yield = ip["clay_weight_per_piece_lb"], ip["clay_yield"]
+    reclaim_cost = ip.get("clay_reclaim_cost_per_lb", 0.0)
+    floor = np.maximum if any(map(_is_array, (wet, clay_yield, cost_per_lb, reclaim_cost))) else max
+    bought = wet / floor(clay_yield, 1e-9)
+    reclaimed = floor(bought - wet, 0.0) * ip.get("clay_reclaim_pct", 0.0) / 100.0
+    return bought * cost_per_lb - reclaimed * floor(cost_per_lb - reclaim_cost, 0.0)
+
+# ------------ Kiln load planner ------------
+KILN_SHELF_CAPACITY = 12  # pieces on a new shelf
+KILN_FIRING_HOURS = {"Bisque": 8 + 12, "Glaze": 8 + 24}  # fire + cool
+
+def kiln_shelf_columns(n: int) -> list:
+    return [f"Shelf {i + 1}" for i in range(n)]
+
+class KilnLoad:
+    """
+    One kiln load as arrays: capacity[s] pieces fit on shelf s and
+    qty[f, s] pieces of forms[f] sit on it. The planner edits it as two
+    tables (capacities, and forms x shelves) and reads everything else off
+    the arrays.
+    """
+
+    def __init__(self, forms=(), capacity=(), qty=None):
+        self.forms = list(forms)
+        self.capacity = np.asarray(capacity, dtype=int)
+        self.qty = np.zeros((len(self.forms), len(self.capacity)), dtype=int) if qty is None else np.asarray(qty, dtype=int)
+
+    @classmethod
+    def empty(cls, shelves: int = 4):
+        return cls(capacity=[KILN_SHELF_CAPACITY] * shelves)
+
+    @classmethod
+    def from_tables(cls, capacity_df: pd.DataFrame, load_df: pd.DataFrame, shelves: int = None):
+        """
+        Read the planner's two tables back. Blank forms are dropped and a form
+        listed twice is summed; shelves added by `shelves` start at
+        KILN_SHELF_CAPACITY, shelves taken away take their pieces with them.
+        """
+        old = [c for c in capacity_df.columns if c.startswith("Shelf ")]
+        n = len(old) if shelves is None else int(shelves)
+        cols = kiln_shelf_columns(n)
+        row = capacity_df.reindex(columns=cols).iloc[0] if len(capacity_df) else pd.Series(np.nan, index=cols)
+        capacity = pd.to_numeric(row, errors="coerce").fillna(KILN_SHELF_CAPACITY).clip(lower=1).to_numpy(dtype=int)
+        form = load_df["Form"].fillna("").astype(str).str.strip() if "Form" in load_df else pd.Series(dtype=str)
+        counts = load_df.reindex(columns=cols).apply(pd.to_numeric, errors="coerce").fillna(0).clip(lower=0).to_numpy(dtype=int)
+        keep = (form != "").to_numpy()
+        form, counts = form[keep], counts[keep]
+        forms = pd.Index(pd.unique(form))
+        qty = np.zeros((len(forms), n), dtype=int)
+        np.add.at(qty, forms.get_indexer(form), counts)
+        return cls(forms, capacity, qty)
+
+    def capacity_table(self) -> pd.DataFrame:
+        return pd.DataFrame([self.capacity], columns=kiln_shelf_columns(len(self.capacity)), index=["Max pieces"])
+
+    def load_table(self) -> pd.DataFrame:
+        table = pd.DataFrame(self.qty, columns=kiln_shelf_columns(len(self.capacity)))
+        table.insert(0, "Form", pd.Series(self.forms, dtype=str))
+        return table
+
+    @property
+    def pieces(self) -> int:
+        return int(self.qty.sum())
+
+def kiln_firing_cost(ip: dict, firing_type: str) -> float:
+    """Fuel cost of one bisque or glaze firing (electric or propane; other fuels use a flat estimate)."""
+    firing = "bisque" if firing_type.lower() == "bisque" else "glaze"
+    fuel = ip.get("fuel_gas", "Electric")
+    if fuel == "Electric":
+        return ip.get(f"kwh_{firing}", 30.0 if firing == "bisque" else 35.0) * ip.get("kwh_rate", 0.24)
+    if fuel == "Propane":
+        return ip.get(f"lp_gal_{firing}", 4.7 if firing == "bisque" else 9.4) * ip.get("lp_price_per_gal", 3.50)
+    return 25.0
+
+ENERGY_ALLOCATIONS = ("Per piece", "Clay weight", "Shelf space")
+
+def energy_weights(forms: pd.DataFrame, ip: dict) -> np.ndarray:
+    """
+    Each form's share of a firing relative to the typical piece calc_energy
+    prices (weight 1), by ip["energy_allocation"]: "Clay weight" compares
+    Clay_lb_wet with typical_piece_lb (the kiln heats every pound of ware),
+    "Shelf space" compares typical_pieces_per_shelf with the form's
+    Pieces_per_shelf. Forms without the measure count as typical.
+    """
+    method = ip.get("energy_allocation", "Per piece")
+    if method == "Clay weight":
+        measure = pd.to_numeric(forms["Clay_lb_wet"], errors="coerce").to_numpy(dtype=float)
+        typical = float(ip.get("typical_piece_lb", 1.0))
+        weights = measure / typical if typical > 0 else np.full(len(forms), np.nan)
+    elif method == "Shelf space":
+        per_shelf = pd.to_numeric(forms["Pieces_per_shelf"], errors="coerce").to_numpy(dtype=float)
+        with np.errstate(divide="ignore"):
+            weights = float(ip.get("typical_pieces_per_shelf", KILN_SHELF_CAPACITY)) / per_shelf
+    else:
+        return np.ones(len(forms))
+    return np.where(np.isfinite(weights) & (weights > 0), weights, 1.0)
+
+def piece_energy_weight(ip: dict) -> float:
+    """energy_weights for the single piece in ip (clay_weight_per_piece_lb, pieces_per_shelf)."""
+    method = ip.get("energy_allocation", "Per piece")
+    if method == "Clay weight":
+        measure, typical = ip.get("clay_weight_per_piece_lb"), ip.get("typical_piece_lb", 1.0)
+    elif method == "Shelf space":
+        measure, typical = ip.get("typical_pieces_per_shelf", KILN_SHELF_CAPACITY), ip.get("pieces_per_shelf")
+    else:
+        return 1.0
+    try:
+        weight = float(measure) / float(typical)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return 1.0
+    return weight if np.isfinite(weight) and weight > 0 else 1.0
+
+def kiln_energy_weights(load: KilnLoad, forms_df, ip: dict) -> np.ndarray:
+    """energy_weights for the forms in a load, looked up by name in the forms table."""
+    forms = ensure_cols(forms_df, UNIFIED_FORM_SCHEMA)
+    forms = forms.assign(Form=forms["Form"].astype(str).str.strip()).drop_duplicates("Form", keep="last").set_index("Form")
+    return energy_weights(forms.reindex(pd.Index(load.forms, name="Form")), ip)
+
+def kiln_load_summary(load: KilnLoad, firing_cost: float, weights=None):
+    """
+    (shelves, forms, totals) for a load. Shelves: pieces and utilization per
+    shelf. Forms: pieces per form and its share of the firing cost, split by
+    pieces x weights (from kiln_energy_weights; evenly per piece without).
+    """
+    per_shelf = load.qty.sum(axis=0)
+    used = per_shelf > 0
+    utilization = per_shelf / np.maximum(load.capacity, 1) * 100.0
+    shelves = pd.DataFrame({
+        "Shelf": kiln_shelf_columns(len(load.capacity)),
+        "Max_pieces": load.capacity,
+        "Pieces": per_shelf,
+        "Utilization_pct": utilization,
+        "Over_capacity": per_shelf > load.capacity,
+    })
+    per_form = load.qty.sum(axis=1)
+    pieces = int(per_form.sum())
+    per_piece = firing_cost / max(1, pieces)
+    weights = np.ones(len(load.forms)) if weights is None else np.asarray(weights, dtype=float)
+    units = per_form * weights
+    energy = firing_cost * units / units.sum() if units.sum() > 0 else np.zeros(len(units))
+    forms = pd.DataFrame({
+        "Form": load.forms,
+        "Pieces": per_form,
+        "Weight": weights,
+        "Energy_cost": energy,
+        "Energy_per_piece": energy / np.maximum(per_form, 1),
+    })
+    forms = forms[forms["Pieces"] > 0].reset_index(drop=True)
+    totals = {
+        "pieces": pieces,
+        "shelves_used": int(used.sum()),
+        "avg_utilization_pct": float(utilization[used].mean()) if used.any() else 0.0,
+        "firing_cost": firing_cost,
+        "energy_per_piece": per_piece,
+    }
+    return shelves, forms, totals
+
+# ------------ Firing logs ------------
+# Column -> header names controller exports use for it (compared lowercased, spaces as _)
+FIRING_LOG_COLUMNS = {
+    "Kiln": ("kiln", "kiln_name", "kiln_id", "controller"),
+    "Firing": ("firing", "firing_id", "run", "run_id"),
+    "Time": ("time", "timestamp", "datetime", "date_time"),
+    "Temp_F": ("temp", "temp_f", "temperature", "temperature_f"),
+    "Temp_C": ("temp_c", "temperature_c"),
+    "kWh": ("kwh", "energy_kwh", "kwh_total", "meter_kwh"),
+    "Gas": ("gas", "gas_meter", "gallons", "therms"),
+    "Cone": ("cone", "target_cone"),
+    "Load_lb": ("load_lb", "load", "ware_lb"),
+    "Firing_type": ("firing_type", "type"),
+}
+FIRING_LOG_TEXT = ("Kiln", "Firing", "Cone", "Firing_type")
+FIRING_LOG_CHUNK_ROWS = 250_000
+FIRING_GAP_HOURS = 3.0  # without a Firing column, readings further apart than this start a new firing
+# Approximate Orton self-supporting cones at 108 F/hour: cone (06 -> -6) and end point in F
+ORTON_CONES = np.array([-10, -9, -8, -7, -6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+ORTON_CONE_F = np.array([1657, 1688, 1728, 1789, 1828, 1888, 1945, 1987, 2016, 2046,
+                         2079, 2088, 2106, 2124, 2167, 2232, 2262, 2280, 2300, 2345])
+# Inputs on the Energy tab a firing model can fill, by meter and firing type
+FIRING_LOG_INPUTS = {
+    ("kWh", "Bisque"): "kwh_bisque", ("kWh", "Glaze"): "kwh_glaze",
+    ("Gas", "Bisque", "Propane"): "lp_gal_bisque", ("Gas", "Glaze", "Propane"): "lp_gal_glaze",
+    ("Gas", "Bisque", "Natural Gas"): "ng_therms_bisque", ("Gas", "Glaze", "Natural Gas"): "ng_therms_glaze",
+}
+
+def parse_cones(values) -> np.ndarray:
+    """Cone labels as numbers: "6" -> 6, "06" or "cone 06" -> -6; anything else NaN."""
+    digits = pd.Series(values, dtype=object).astype(str).str.extract(r"(\d+)", expand=False)
+    number = pd.to_numeric(digits, errors="coerce").to_numpy(dtype=float)
+    cold = (digits.str.len() > 1) & digits.str.startswith("0")
+    return np.where(cold.fillna(False).to_numpy(dtype=bool), -number, number)
+
+def cone_for_peak(peak_f) -> np.ndarray:
+    """The hottest cone a peak temperature (F) reaches; NaN below cone 010."""
+    pos = np.searchsorted(ORTON_CONE_F, np.nan_to_num(np.asarray(peak_f, dtype=float), nan=-1.0), side="right") - 1
+    return np.where(pos >= 0, ORTON_CONES[np.maximum(pos, 0)], np.nan)
+
+def _firing_log_header(fh) -> dict:
+    """Header in the file -> firing log column, for the columns it has."""
+    start = fh.tell()
+    line = fh.readline()
+    fh.seek(start)
+    if isinstance(line, bytes):
+        line = line.decode("utf-8-sig", errors="replace")
+    lookup = {alias: col for col, aliases in FIRING_LOG_COLUMNS.items() for alias in aliases}
+    found = {}
+    for name in next(csv.reader([line]), []):
+        col = lookup.get(name.strip().lower().replace(" ", "_"))
+        if col and col not in found.values():
+            found[name] = col
+    return found
+
+def _firing_log_arrow_chunks(fh, header: dict):
+    """
+    Typed reading chunks with the firing log's column names, parsed by Arrow.
+    Raises pa.ArrowInvalid at the first block it can't parse, which may come
+    after earlier chunks were already yielded.
+    """
+    types = {name: pa.string() if col in FIRING_LOG_TEXT else pa.timestamp("s") if col == "Time" else pa.float64()
+             for name, col in header.items()}
+    reader = pa_csv.open_csv(
+        fh,
+        read_options=pa_csv.ReadOptions(block_size=1 << 23),
+        convert_options=pa_csv.ConvertOptions(column_types=types, include_columns=list(header)),
+    )
+    for batch in reader:
+        yield batch.to_pandas().rename(columns=header)
+
+def _firing_log_text_chunks(fh, header: dict, chunk_rows: int):
+    """The same chunks read as text, then coerced per cell (odd date formats, stray text in numbers)."""
+    for raw in pd.read_csv(fh, dtype=str, usecols=list(header), keep_default_na=False, chunksize=chunk_rows):
+        raw = raw.rename(columns=header)
+        for col in raw.columns:
+            if col == "Time":
+                raw[col] = pd.to_datetime(raw[col], errors="coerce", format="mixed")
+            elif col not in FIRING_LOG_TEXT:
+                raw[col] = pd.to_numeric(raw[col], errors="coerce")
+        yield raw
+
+def _firing_chunk_totals(df: pd.DataFrame, meter: str, carry: dict, gap_s: float) -> pd.DataFrame:
+    """
+    Per-firing totals for one chunk of readings. carry holds each kiln's last
+    reading and firing number from the chunks before, and is updated in place.
+    """
+    kiln = (df["Kiln"].fillna("").astype(str).str.strip() if "Kiln" in df else pd.Series("", index=df.index)).replace("", "Kiln")
+    t = df["Time"].to_numpy(dtype="datetime64[s]").astype(np.int64).astype(float)
+    t[pd.isna(df["Time"]).to_numpy()] = np.nan
+    ok = ~np.isnan(t)
+    df, kiln, t = df[ok], kiln[ok], t[ok]
+    order = np.argsort(kiln.to_numpy(dtype=object).astype(str), kind="stable")  # time order kept within a kiln
+    df, t = df.iloc[order], t[order]
+    kiln = kiln.to_numpy(dtype=object)[order]
+    m = df[meter].to_numpy(dtype=float, na_value=np.nan)
+    label = df["Firing"].fillna("").astype(str).str.strip().to_numpy(dtype=object) if "Firing" in df else None
+
+    first = np.ones(len(kiln), dtype=bool)
+    first[1:] = kiln[1:] != kiln[:-1]
+    prev_t = np.r_[np.nan, t[:-1]]
+    carried_m = np.full(len(kiln), np.nan)
+    prev_label = np.r_[[None], label[:-1]] if label is not None else None
+    base_seq = np.zeros(len(kiln))
+    for i in np.flatnonzero(first):
+        last = carry.get(kiln[i])
+        prev_t[i], carried_m[i] = (last["t"], last["m"]) if last else (np.nan, np.nan)
+        base_seq[i] = last["seq"] if last else 0
+        if prev_label is not None:
+            prev_label[i] = last["label"] if last else None
+    new = np.isnan(prev_t) | (t - prev_t > gap_s)
+    if label is not None:
+        new |= label != prev_label
+    groups = np.cumsum(first) - 1
+    seq = pd.Series(new.astype(int)).groupby(groups).cumsum().to_numpy() + pd.Series(base_seq).groupby(groups).transform("first").to_numpy()
+    # A missing reading takes the last one of its firing (from the previous chunk too), so the
+    # next reading's step covers both intervals instead of neither
+    m = np.where(first & ~new & np.isnan(m), carried_m, m)
+    m = pd.Series(m).groupby([groups, seq]).ffill().to_numpy()
+    prev_m = np.r_[np.nan, m[:-1]]
+    prev_m[first] = carried_m[first]
+    step = m - prev_m
+    step = np.where(~new & (step > 0), step, 0.0)  # meter resets and gaps add nothing
+
+    readings = pd.DataFrame({"Kiln": kiln, "Seq": seq, "Start": t, "End": t, "Energy": step, "Readings": 1})
+    if "Temp_F" in df or "Temp_C" in df:
+        readings["Peak_F"] = df["Temp_F"].to_numpy(dtype=float) if "Temp_F" in df else df["Temp_C"].to_numpy(dtype=float) * 9 / 5 + 32
+    for col in ("Firing", "Cone", "Load_lb", "Firing_type"):
+        if col in df:
+            readings[col] = df[col].to_numpy()
+    last = np.flatnonzero(np.r_[first[1:], True])
+    for i in last:
+        carry[kiln[i]] = {"t": t[i], "m": m[i] if not np.isnan(m[i]) else carry.get(kiln[i], {}).get("m", np.nan),
+                          "seq": seq[i], "label": label[i] if label is not None else None}
+    return _combine_firing_totals(readings)
+
+def _combine_firing_totals(parts: pd.DataFrame) -> pd.DataFrame:
+    how = {"Start": "min", "End": "max", "Energy": "sum", "Readings": "sum"}
+    how.update({c: "max" if c == "Peak_F" else "first" for c in ("Peak_F", "Firing", "Cone", "Load_lb", "Firing_type") if c in parts})
+    return parts.groupby(["Kiln", "Seq"], sort=False).agg(how).reset_index()
+
+def read_firing_log(fh, gap_hours: float = FIRING_GAP_HOURS, chunk_rows: int = FIRING_LOG_CHUNK_ROWS):
+    """
+    One row per firing from a kiln controller's CSV log of readings (time,
+    temperature, and a kWh or gas meter that counts up). Reads in chunks and
+    keeps only running totals per firing, so multi-year logs stay small.
+    Readings for a kiln must be in time order; several kilns can share a file.
+    Firings are split by a Firing column, else by gaps over gap_hours. Cone
+    comes from a Cone column or the peak temperature; Firing_type from its
+    column or the cone (04 and cooler counts as bisque).
+    Returns (firings, meter) with meter "kWh" or "Gas".
+    """
+    header = _firing_log_header(fh)
+    found = set(header.values())
+    meter = "kWh" if "kWh" in found else "Gas" if "Gas" in found else None
+    if "Time" not in found or meter is None:
+        raise ValueError("a firing log needs a time column and a kWh or gas meter column")
+    if "Temp_F" in found and "Temp_C" in found:
+        header = {k: v for k, v in header.items() if v != "Temp_C"}
+    start, gap_s = fh.tell(), gap_hours * 3600.0
+    carry, parts = {}, []
+    try:
+        for chunk in _firing_log_arrow_chunks(fh, header):
+            if len(chunk):
+                parts.append(_firing_chunk_totals(chunk, meter, carry, gap_s))
+    except pa.ArrowInvalid:
+        # Checked path from the top: what the fast path counted before the bad block goes
+        fh.seek(start)
+        carry, parts = {}, []
+        for chunk in _firing_log_text_chunks(fh, header, chunk_rows):
+            if len(chunk):
+                parts.append(_firing_chunk_totals(chunk, meter, carry, gap_s))
+    if not parts:
+        return pd.DataFrame(columns=["Kiln", "Firing", "Start", "Hours", "Energy", "Peak_F", "Cone", "Load_lb", "Firing_type", "Readings"]), meter
+    totals = _combine_firing_totals(pd.concat(parts, ignore_index=True))
+    peak = totals["Peak_F"].to_numpy(dtype=float) if "Peak_F" in totals else np.full(len(totals), np.nan)
+    cone = parse_cones(totals["Cone"]) if "Cone" in totals else np.full(len(totals), np.nan)
+    cone = np.where(np.isnan(cone), cone_for_peak(peak), cone)
+    kind = totals["Firing_type"].fillna("").astype(str).str.strip().str.title() if "Firing_type" in totals else pd.Series("", index=totals.index)
+    kind = kind.where(kind.isin(["Bisque", "Glaze"]), np.where(np.isnan(cone), "", np.where(cone <= -4, "Bisque", "Glaze")))
+    firings = pd.DataFrame({
+        "Kiln": totals["Kiln"],
+        "Firing": totals["Firing"] if "Firing" in totals else totals["Seq"].astype(int).astype(str),
+        "Start": pd.to_datetime(totals["Start"], unit="s"),
+        "Hours": (totals["End"] - totals["Start"]) / 3600.0,
+        "Energy": totals["Energy"],
+        "Peak_F": peak,
+        "Cone": cone,
+        "Load_lb": pd.to_numeric(totals["Load_lb"], errors="coerce") if "Load_lb" in totals else np.nan,
+        "Firing_type": kind,
+        "Readings": totals["Readings"].astype(int),
+    })
+    return firings.sort_values(["Kiln", "Start"], kind="stable").reset_index(drop=True), meter
+
+# Terms of the per-kiln energy model, dropped from the end while there are too few firings to fit them
+FIRING_MODEL_TERMS = ("Per_cone", "Per_lb", "Season_cos", "Season_sin")
+FIRING_MODEL_BLOCKS = (("Per_cone",), ("Per_lb",), ("Season_cos", "Season_sin"))  # kept or dropped together
+
+def _firing_design(firings: pd.DataFrame) -> pd.DataFrame:
+    day = 2 * np.pi * firings["Start"].dt.dayofyear.to_numpy(dtype=float) / 365.25
+    return pd.DataFrame({
+        "Intercept": 1.0,
+        "Per_cone": firings["Cone"].to_numpy(dtype=float),
+        "Per_lb": firings["Load_lb"].to_numpy(dtype=float),
+        "Season_cos": np.cos(day),
+        "Season_sin": np.sin(day),
+    }, index=firings.index)
+
+def fit_kiln_energy(firings: pd.DataFrame) -> pd.DataFrame:
+    """
+    Energy per firing as a linear model of cone, load and time of year, fitted
+    by least squares for each kiln: Energy ~ Intercept + Per_cone * cone +
+    Per_lb * load + Season_cos/sin (a yearly cycle). Terms a kiln's log can't
+    support (no loads recorded, too few firings, under a year of them) are
+    left out (NaN): the one missing from the most firings first, and the two
+    season terms only together.
+    """
+    rows = []
+    for kiln, group in firings[firings["Energy"] > 0].groupby("Kiln", sort=True):
+        X = _firing_design(group)
+        blocks = [b for b in FIRING_MODEL_BLOCKS[:2] if X[b[0]].notna().sum() >= 2 and X[b[0]].nunique() > 1]
+        if group["Start"].max() - group["Start"].min() >= pd.Timedelta(days=365):
+            blocks.append(FIRING_MODEL_BLOCKS[2])  # a season needs a year of firings
+        while True:
+            terms = ["Intercept"] + [t for b in blocks for t in b]
+            use = X[terms].notna().all(axis=1).to_numpy()
+            if use.sum() >= len(terms) + 2 or not blocks:
+                break
+            # drop the term missing from the most firings (it costs the most rows); on a tie, the later one
+            missing = [int(X[list(b)].isna().any(axis=1).sum()) for b in blocks]
+            blocks.pop(max(range(len(blocks)), key=lambda i: (missing[i], i)))
+        A, y = X.loc[use, terms].to_numpy(dtype=float), group["Energy"].to_numpy(dtype=float)[use]
+        if not len(y):
+            continue
+        coef, _, _, _ = np.linalg.lstsq(A, y, rcond=None)
+        resid = y - A @ coef
+        spread = ((y - y.mean()) ** 2).sum()
+        row = {"Kiln": kiln, "Firings": int(use.sum()), "Intercept": np.nan}
+        row.update({t: np.nan for t in FIRING_MODEL_TERMS})
+        row.update(zip(terms, coef))
+        row["R2"] = 1.0 - (resid ** 2).sum() / spread if spread > 0 else np.nan
+        row["RMSE"] = float(np.sqrt((resid ** 2).mean()))
+        rows.append(row)
+    return pd.DataFrame(rows, columns=["Kiln", "Firings", "Intercept", *FIRING_MODEL_TERMS, "R2", "RMSE"])
+
+def suggest_energy_inputs(firings: pd.DataFrame, models: pd.DataFrame, meter: str, fuel: str = "Electric") -> pd.DataFrame:
+    """
+    Energy tab values from the fitted models: each kiln's predicted energy for
+    a bisque and a glaze firing at its usual cone and load over the year, next
+    to the median the log actually shows.
+    """
+    rows = []
+    for m in models.itertuples(index=False):
+        for kind in ("Bisque", "Glaze"):
+            key = FIRING_LOG_INPUTS.get((meter, kind)) or FIRING_LOG_INPUTS.get((meter, kind, fuel))
+            seen = firings[(firings["Kiln"] == m.Kiln) & (firings["Firing_type"] == kind) & (firings["Energy"] > 0)]
+            if key is None or seen.empty:
+                continue
+            cone, load = seen["Cone"].median(), seen["Load_lb"].median()
+            coef = np.nan_to_num(np.array([m.Intercept, m.Per_cone, m.Per_lb], dtype=float))
+            x = np.nan_to_num(np.array([1.0, cone, load], dtype=float))
+            rows.append({
+                "Kiln": m.Kiln, "Firing_type": kind, "Input": key, "Cone": cone, "Load_lb": load,
+                "Suggested": max(float(coef @ x), 0.0), "Median_logged": float(seen["Energy"].median()), "Firings": len(seen),
+            })
+    return pd.DataFrame(rows, columns=["Kiln", "Firing_type", "Input", "Cone", "Load_lb", "Suggested", "Median_logged", "Firings"])
+
+# ------------ Clay bodies ------------
+# clay bodies column -> the single-clay input it stands in for
+CLAY_BODY_INPUTS = {
+    "Price_per_bag": "clay_price_per_bag", "Bag_lb": "clay_bag_weight_lb", "Yield": "clay_yield",
+    "Reclaim_pct": "clay_reclaim_pct", "Reclaim_cost_per_lb": "clay_reclaim_cost_per_lb",
+}
+
+def _clay_bodies(bodies_df) -> pd.DataFrame:
+    bodies = ensure_cols(bodies_df, CLAY_BODY_SCHEMA)
+    bodies = bodies.assign(Clay_body=bodies["Clay_body"].str.strip())
+    return bodies[bodies["Clay_body"] != ""].drop_duplicates("Clay_body", keep="last").set_index("Clay_body")
+
+def clay_body_names(bodies_df) -> list:
+    return _clay_bodies(bodies_df).index.tolist()
+
+def clay_body_inputs(ip: dict, bodies_df, name: str = None) -> dict:
+    """ip with the clay inputs of body `name` (default ip["clay_body"]); unchanged when that body isn't in the table."""
+    name = str(ip.get("clay_body", "") if name is None else name).strip()
+    bodies = _clay_bodies(bodies_df)
+    if name not in bodies.index:
+        return ip
+    row = bodies.loc[name]
+    return dict(ip, **{key: float(row[col]) for col, key in CLAY_BODY_INPUTS.items()})
+
+def form_clay_inputs(forms: pd.DataFrame, ip: dict, bodies_df) -> dict:
+    """
+    Per-form arrays of the clay inputs: each form's Clay_body joined against the
+    table in one indexer lookup; blank or unknown bodies keep the global inputs.
+    """
+    bodies = _clay_bodies(bodies_df)
+    pos = bodies.index.get_indexer(forms["Clay_body"].astype(str).str.strip()) if len(bodies) else np.full(len(forms), -1)
+    hit = pos >= 0
+    out = {}
+    for col, key in CLAY_BODY_INPUTS.items():
+        table = bodies[col].to_numpy(dtype=float)
+        out[key] = np.where(hit, table[np.where(hit, pos, 0)] if len(table) else 0.0, float(ip.get(key, DEFAULT_INPUTS[key])))
+    return out
+
+def calc_totals(ip, glaze_per_piece_cost, other_pp: float = 0.0, energy_pp=None, clay_pp=None):
+    """
+    Per-piece costs and prices. energy_pp / clay_pp skip recomputing those when
+    the caller already has them; otherwise energy is the typical piece's scaled
+    by piece_energy_weight, as price_sheet does per form.
+    """
+    clay_pp = calc_clay_pp(ip) if clay_pp is None else clay_pp
+    energy_pp = calc_energy(ip) * piece_energy_weight(ip) if energy_pp is None else energy_pp
+    labor_pp = ip["labor_rate"] * ip["hours_per_piece"]
+    overhead_pp = ip["overhead_per_month"] / max(1, int(ip["pieces_per_month"]))
+
+    material_pp = clay_pp + glaze_per_piece_cost + ip["packaging_per_piece"] + other_pp
+    total_pp = material_pp + energy_pp + labor_pp + overhead_pp
+
+    if ip["use_2x2x2"]:
+        wholesale = total_pp * 2.0
+        retail = wholesale * 2.0
+        distributor = retail * 2.0
+    else:
+        margin = ip["wholesale_margin_pct"] / 100.0
+        wholesale = total_pp / max(1e-9, 1.0 - margin) if margin < 1 else float("inf")
+        retail = wholesale * ip["retail_multiplier"]
+        distributor = None
+
+    return dict(
+        clay_pp=clay_pp, glaze_pp=glaze_per_piece_cost, pack_pp=ip["packaging_per_piece"],
+        other_pp=other_pp, energy_pp=energy_pp, labor_pp=labor_pp, oh_pp=overhead_pp,
+        total_pp=total_pp, wholesale=wholesale, retail=retail, distributor=distributor
+    )
+
+def form_hours_per_piece(forms: pd.DataFrame, default_hours: float):
+    """Hands-on hours from a form's timing columns, or the default when it has none."""
+    minutes = forms[["Throwing_min", "Trimming_min", "Handling_min", "Glazing_min"]].sum(axis=1).to_numpy(dtype=float)
+    return np.where(minutes > 0, minutes / 60.0, float(default_hours))
+
+def price_sheet(forms: pd.DataFrame, ip: dict, catalog_df, recipe_df, other_pp: float = 0.0,
+                glaze_cost_per_g: float = None, form_glazes=None, glaze_costs: pd.Series = None,
+                clay_bodies=None) -> pd.DataFrame:
+    """
+    Costs and prices for every form at once. Same math as calc_totals, fed with
+    arrays: each form's clay weight, glaze grams and timing replace the single-piece inputs.
+    Forms listed in form_glazes are costed from their assigned library glazes
+    (glaze_costs from glaze_costs_per_gram); the rest use Default_glaze_g of the
+    current recipe. Forms whose Clay_body is in clay_bodies use that body's price,
+    bag, yield and reclaim. Energy is the typical piece's scaled by energy_weights. Pass glaze_cost_per_g when pricing many small batches against the same recipe.
+    """
+    forms = ensure_cols(forms, UNIFIED_FORM_SCHEMA)
+    if glaze_cost_per_g is None:
+        _, glaze_cost_per_g = glaze_per_piece_from_recipe(catalog_df, recipe_df, 1.0)
+    glaze_pp = glaze_cost_per_g * forms["Default_glaze_g"].to_numpy(dtype=float)
+    if form_glazes is not None and len(form_glazes) and glaze_costs is not None:
+        assigned = forms["Form"].astype(str).str.strip().map(form_glaze_costs(form_glazes, glaze_costs))
+        glaze_pp = np.where(assigned.notna().to_numpy(), assigned.to_numpy(dtype=float, na_value=0.0), glaze_pp)
+    ip_forms = dict(
+        ip,
+        clay_weight_per_piece_lb=forms["Clay_lb_wet"].to_numpy(dtype=float),
+        hours_per_piece=form_hours_per_piece(forms, ip.get("hours_per_piece", 0.0)),
+    )
+    if clay_bodies is not None and len(clay_bodies):
+        ip_forms.update(form_clay_inputs(forms, ip, clay_bodies))
+    energy_pp = calc_energy(ip) * energy_weights(forms, ip)
+    t = calc_totals(ip_forms, glaze_pp, other_pp, energy_pp=energy_pp)
+    sheet = pd.DataFrame({
+        "Form": forms["Form"].to_numpy(),
+        "Clay": t["clay_pp"],
+        "Glaze": t["glaze_pp"],
+        "Energy": t["energy_pp"],
+        "Labor": t["labor_pp"],
+        "Overhead": t["oh_pp"],
+        "Other": t["pack_pp"] + t["other_pp"],
+        "Total_cost": t["total_pp"],
+        "Wholesale": t["wholesale"],
+        "Retail": t["retail"],
+    })
+    if t["distributor"] is not None:
+        sheet["Distributor"] = t["distributor"]
+    return sheet
+
+def update_price_sheet(sheet: pd.DataFrame, forms: pd.DataFrame, changes: dict, ip: dict, other_pp: float,
+                       glaze_cost_per_g: float, form_glazes=None, glaze_costs: pd.Series = None,
+                       clay_bodies=None) -> pd.DataFrame:
+    """
+    A price sheet for the forms before a change set, brought up to date for
+    `forms` (the table after it) by pricing only the edited and added rows.
+    Same result as price_sheet(forms, ...) when nothing else changed.
+    """
+    keep = np.ones(len(sheet), dtype=bool)
+    keep[changes["deleted"]] = False
+    sheet = sheet[keep].reset_index(drop=True)
+    after = np.cumsum(keep) - 1  # old position -> position after the deletes
+    rows = sorted(int(after[p]) for p in changes["edited"]) + list(range(len(sheet), len(forms)))
+    if not rows:
+        return sheet
+    priced = price_sheet(forms.iloc[rows], ip, None, None, other_pp, glaze_cost_per_g,
+                         form_glazes=form_glazes, glaze_costs=glaze_costs, clay_bodies=clay_bodies)
+    n_edited = len(changes["edited"])
+    if n_edited:
+        # Column by column: a 2-D .iloc write would copy every column of the sheet
+        edited, priced_rows = rows[:n_edited], priced.iloc[:n_edited]
+        sheet = sheet.copy(deep=False)
+        for col in sheet.columns[1:]:
+            values = sheet[col].to_numpy(copy=True)
+            values[edited] = priced_rows[col].to_numpy()
+            sheet[col] = values
+        if any("Form" in cells for cells in changes["edited"].values()):
+            form = sheet["Form"].copy()
+            form.iloc[edited] = priced_rows["Form"].to_numpy()
+            sheet["Form"] = form
+    return pd.concat([sheet, priced.iloc[n_edited:]], ignore_index=True) if len(rows) > n_edited else sheet
+
+
+# ------------ Derived-cost graph ------------
+ENERGY_INPUT_KEYS = (
+    "kwh_bisque", "kwh_glaze", "kwh_third", "kwh_rate", "pieces_per_electric_firing", "fuel_gas",
+    "lp_price_per_gal", "lp_gal_bisque", "lp_gal_glaze",
+    "ng_price_per_therm", "ng_therms_bisque", "ng_therms_glaze", "pieces_per_gas_firing",
+    "wood_price_per_cord", "wood_cords_bisque", "wood_cords_glaze", "wood_cords_third",
+    "wood_price_per_facecord", "wood_facecords_bisque", "wood_facecords_glaze", "wood_facecords_third",
+    "pieces_per_wood_firing",
+)
+ENERGY_WEIGHT_KEYS = ("energy_allocation", "typical_piece_lb", "typical_pieces_per_shelf", "clay_weight_per_piece_lb", "pieces_per_shelf")
+PRICING_INPUT_KEYS = (
+    "labor_rate", "hours_per_piece", "overhead_per_month", "pieces_per_month", "packaging_per_piece",
+    "use_2x2x2", "wholesale_margin_pct", "retail_multiplier",
+)
+
+def _fingerprint(value):
+    """
+    Cheap identity for a node input: scalars as-is, tables by column names,
+    dtypes and a digest of the row hashes in order (so reordered rows differ).
+    """
+    if isinstance(value, pd.DataFrame):
+        rows = pd.util.hash_pandas_object(value, index=False).to_numpy()
+        return ("df", tuple(value.columns), tuple(map(str, value.dtypes)), len(value),
+                hashlib.blake2b(rows.tobytes(), digest_size=16).hexdigest())
+    if isinstance(value, np.ndarray):
+        return ("nd", value.shape, str(value.dtype), hashlib.sha1(np.ascontiguousarray(value).view(np.uint8)).hexdigest())
+    return value
+
+class CostGraph:
+    """
+    Derived per-piece costs as a small dependency graph. Each node names the
+    inputs, tables or other nodes it reads; evaluate() reruns a node only when
+    one of those changed since its last run and otherwise hands back the
+    memoized value. stats() counts recomputes vs reuses per node.
+    """
+
+    MEMO_PER_NODE = 4  # tabs may ask for a few variants of a node (e.g. a different glaze source)
+
+    def __init__(self):
+        self.nodes = {}    # name -> (deps, fn)
+        self._memo = {}    # name -> {fingerprint: (generation, value)}, oldest first
+        self._counts = {}  # name -> [recomputed, reused]
+        self._generation = 0
+
+    def add(self, name: str, deps, fn):
+        self.nodes[name] = (tuple(deps), fn)
+        self._memo[name] = {}
+        self._counts[name] = [0, 0]
+        return self
+
+    def _eval(self, name, values, seen):
+        deps, fn = self.nodes[name]
+        args, key = {}, []
+        for dep in deps:
+            if dep in self.nodes:
+                if dep not in seen:
+                    seen[dep] = self._eval(dep, values, seen)
+                args[dep], generation = seen[dep]
+                key.append(("node", generation))
+            else:
+                args[dep] = values.get(dep)
+                key.append(_fingerprint(args[dep]))
+        key = tuple(key)
+        memo = self._memo[name]
+        hit = memo.pop(key, None)
+        if hit is not None:
+            memo[key] = hit  # most recently used goes last
+            self._counts[name][1] += 1
+            return hit[1], hit[0]
+        value = fn(**args)
+        self._generation += 1
+        memo[key] = (self._generation, value)
+        if len(memo) > self.MEMO_PER_NODE:
+            del memo[next(iter(memo))]
+        self._counts[name][0] += 1
+        return value, self._generation
+
+    def evaluate(self, name: str, values: dict):
+        """Value of one node for these source values (inputs and tables by name)."""
+        return self._eval(name, values, {})[0]
+
+    def stats(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [{"Node": n, "Recomputed": c[0], "Reused": c[1]} for n, c in self._counts.items()],
+            columns=["Node", "Recomputed", "Reused"],
+        )
+
+def _present(values: dict) -> dict:
+    return {k: v for k, v in values.items() if v is not None}
+
+def cost_graph() -> CostGraph:
+    """The per-piece cost chain that calc_totals computes in one go, split into memoized nodes."""
+    g = CostGraph()
+    g.add("clay_cost_per_lb", ("clay_price_per_bag", "clay_bag_weight_lb"),
+          lambda **v: clay_cost_per_lb(v))
+    g.add("clay_pp", ("clay_cost_per_lb", "clay_weight_per_piece_lb", "clay_yield", "clay_reclaim_pct", "clay_reclaim_cost_per_lb"),
+          lambda clay_cost_per_lb, **v: calc_clay_pp(_present(v), clay_cost_per_lb))
+    # Names resolve to catalog IDs when the catalog or recipe changes, not on every grams change
+    g.add("material_catalog", ("catalog_df",),
+          lambda catalog_df: MaterialCatalog(catalog_df))
+    g.add("recipe_ids", ("material_catalog", "recipe_df"),
+          lambda material_catalog, recipe_df: resolve_recipe(material_catalog, recipe_df))
+    g.add("glaze_recipe", ("material_catalog", "recipe_ids", "grams_per_piece"),
+          lambda material_catalog, recipe_ids, grams_per_piece: recipe_cost_per_piece(material_catalog, recipe_ids, grams_per_piece))
+    g.add("glaze_library_costs", ("material_catalog", "glaze_library_df"),
+          lambda material_catalog, glaze_library_df: glaze_costs_per_gram(None, glaze_library_df, material_catalog))
+    g.add("glaze_chemistry", ("glaze_library_df", "oxide_analysis_df"),
+          lambda glaze_library_df, oxide_analysis_df: glaze_chemistry(glaze_library_df, oxide_analysis_df))
+    g.add("cheapest_reformulation", ("catalog_df", "glaze_library_df", "oxide_analysis_df", "reformulation_tolerance_pct", "grams_per_piece"),
+          lambda catalog_df, glaze_library_df, oxide_analysis_df, reformulation_tolerance_pct, grams_per_piece:
+          cheapest_reformulation(catalog_df, glaze_library_df, oxide_analysis_df, reformulation_tolerance_pct or 5.0,
+                                 grams_per_piece=grams_per_piece or 8.0))
+    g.add("form_glaze_costs", ("form_glazes_df", "glaze_library_costs"),
+          lambda form_glazes_df, glaze_library_costs: form_glaze_costs(form_glazes_df, glaze_library_costs))
+    g.add("glaze_table", ("glaze_piece_df",),
+          lambda glaze_piece_df: glaze_cost_from_piece_table(glaze_piece_df))
+    g.add("energy_pp", ENERGY_INPUT_KEYS,
+          lambda **v: calc_energy(_present(v)))
+    # The typical piece's energy scaled to the piece being costed (see energy_weights)
+    g.add("piece_energy_pp", ("energy_pp",) + ENERGY_WEIGHT_KEYS,
+          lambda energy_pp, **v: energy_pp * piece_energy_weight(_present(v)))
+    g.add("other_materials", ("other_mat_df", "units_made"),
+          lambda other_mat_df, units_made: other_materials_pp(other_mat_df, int(units_made or 1)))
+    g.add("inventory_positions", ("inventory_ledger_df", "inventory_costing"),
+          lambda inventory_ledger_df, inventory_costing: inventory_positions(inventory_ledger_df, inventory_costing or "FIFO"))
+    # glaze_pp and other_pp are given by the caller: which glaze source and which
+    # materials table apply differs between tabs
+    g.add("totals", ("clay_pp", "piece_energy_pp", "glaze_pp", "other_pp") + PRICING_INPUT_KEYS,
+          lambda clay_pp, piece_energy_pp, glaze_pp, other_pp, **v: calc_totals(v, glaze_pp, other_pp, piece_energy_pp, clay_pp))
+    return g
@@ -0,0 +1,218 @@
+"""
+Batch price sheets from a saved settings file, without opening the app.
+
+    python pottery_pricer.py pottery_pricing_settings.json -o line_sheet.csv
+    python pottery_pricer.py settings.zip -o line_sheet.html --set labor_rate=22 --set wholesale_margin_pct=55
+    python pottery_pricer.py settings.json --format json -o - --workers 4 > sheet.json
+
+Reads the JSON or compact archive that Save and Load produces, applies any
+--set / --overrides changes to the inputs, prices every unified form and
+writes CSV, JSON or HTML. Rows are written chunk by chunk as they are priced;
+--workers spreads the chunks over several processes for very large catalogs.
+
+Exit status: 0 when every form prices above cost, 1 when any wholesale or
+retail price is below its cost (listed on stderr), 2 when the settings or
+arguments can't be used.
+"""
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import sys
+
+import pandas as pd
+
+from pottery_core import (
+    DEFAULT_INPUTS, UNIFIED_FORM_SCHEMA, ensure_cols, migrate_to_unified_forms,
+    stream_settings_import, other_materials_pp, glaze_costs_per_gram, price_sheet, clay_body_inputs,
+    CURRENT_RECIPE_GLAZE, MaterialCatalog, save_glaze_recipe, unresolved_materials, coerce_inputs,
+)
+
+PRICER_CHUNK_ROWS = 50_000
+PRICER_FORMATS = ("csv", "json", "html")
+MONEY_DECIMALS = 2
+
+
+# ------------ Settings ------------
+def parse_override(text: str):
+    """'key=value' -> (key, value); the value is read as JSON when it can be (numbers, true/false)."""
+    key, sep, raw = text.partition("=")
+    if not sep or not key.strip():
+        raise ValueError(f"expected key=value, got {text!r}")
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw
+    return key.strip(), value
+
+def load_pricing_inputs(path: str, overrides: dict):
+    """
+    (inputs, forms, catalog_df, recipe_df, other_pp, form_glazes, glaze_costs, clay_bodies)
+    from a saved settings file; form_glazes and glaze_costs are None when no form has
+    library glazes assigned. The inputs carry the studio's clay body when one is picked.
+    """
+    with open(path, "rb") as fh:
+        data, report = stream_settings_import(fh)
+    for err in report["errors"][:10]:
+        print(f"warning: {err['Table']} row {err['Row']}: {err['Problem']}", file=sys.stderr)
+    ip = dict(DEFAULT_INPUTS, **data.get("inputs", {}))
+    ip.update(coerce_inputs(overrides, ip))
+    clay_bodies = data.get("clay_bodies_df")
+    ip = clay_body_inputs(ip, clay_bodies)
+
+    if "unified_forms" in data:
+        forms = data["unified_forms"]
+    else:
+        # Files saved before the unified form table
+        legacy = {k: pd.DataFrame(data[k]) if isinstance(data.get(k), dict) and data[k] else None
+                  for k in ("form_presets_df", "production_forms", "custom_forms")}
+        forms = migrate_to_unified_forms(legacy["form_presets_df"], legacy["production_forms"], legacy["custom_forms"])
+    forms = ensure_cols(forms, UNIFIED_FORM_SCHEMA)
+    other_pp, _, _ = other_materials_pp(data.get("other_mat_df"), int(ip.get("units_made", 1)))
+    materials = MaterialCatalog(data.get("catalog_df"))
+    unpriced = unresolved_materials(materials, save_glaze_recipe(data.get("glaze_library_df"), CURRENT_RECIPE_GLAZE, data.get("recipe_df")))
+    for row in unpriced.head(10).itertuples():
+        print(f"warning: {row.Glaze}: {row.Material} is not in the catalog and costs nothing "
+              f"({row.Share_pct:.1f}% of the glaze)", file=sys.stderr)
+    form_glazes, glaze_costs = data.get("form_glazes_df"), None
+    if form_glazes is not None and len(form_glazes):
+        glaze_costs = glaze_costs_per_gram(None, data.get("glaze_library_df"), materials)
+    else:
+        form_glazes = None
+    return ip, forms, data.get("catalog_df"), data.get("recipe_df"), other_pp, form_glazes, glaze_costs, clay_bodies
+
+
+# ------------ Pricing (in this process or in workers) ------------
+_worker_args = None
+
+def _init_worker(*args):
+    global _worker_args
+    _worker_args = args
+
+def _price_chunk(forms: pd.DataFrame) -> pd.DataFrame:
+    ip, catalog_df, recipe_df, other_pp, form_glazes, glaze_costs, clay_bodies = _worker_args
+    return price_sheet(forms, ip, catalog_df, recipe_df, other_pp, form_glazes=form_glazes, glaze_costs=glaze_costs,
+                       clay_bodies=clay_bodies)
+
+def priced_chunks(forms, ip, catalog_df, recipe_df, other_pp, form_glazes=None, glaze_costs=None, clay_bodies=None,
+                  workers: int = 1, chunk_rows: int = PRICER_CHUNK_ROWS):
+    """Yield price-sheet chunks in form order."""
+    chunks = [forms.iloc[i:i + chunk_rows] for i in range(0, len(forms), chunk_rows)] or [forms]
+    args = (ip, catalog_df, recipe_df, other_pp, form_glazes, glaze_costs, clay_bodies)
+    if workers <= 1 or len(chunks) == 1:
+        _init_worker(*args)
+        for chunk in chunks:
+            yield _price_chunk(chunk)
+        return
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=args) as pool:
+        yield from pool.imap(_price_chunk, chunks)
+
+
+# ------------ Writers ------------
+def _rounded(sheet: pd.DataFrame) -> pd.DataFrame:
+    money_cols = [c for c in sheet.columns if c != "Form"]
+    return sheet.assign(**{c: sheet[c].round(MONEY_DECIMALS) for c in money_cols})
+
+class SheetWriter:
+    """Writes price-sheet chunks to an open text stream in one of PRICER_FORMATS."""
+
+    def __init__(self, out, fmt: str, title: str = "Price sheet"):
+        self.out, self.fmt, self.title = out, fmt, title
+        self.rows = 0
+
+    def write(self, sheet: pd.DataFrame):
+        sheet = _rounded(sheet)
+        first = self.rows == 0
+        if self.fmt == "csv":
+            sheet.to_csv(self.out, index=False, header=first, lineterminator="\n")
+        elif self.fmt == "json":
+            self.out.write("[\n" if first else ",\n")
+            # to_json writes NaN/inf as null, which json.dumps would not
+            self.out.write(sheet.to_json(orient="records", lines=True).strip().replace("\n", ",\n"))
+        else:
+            if first:
+                self.out.write(
+                    f"<!doctype html>\n<html><head><meta charset='utf-8'><title>{html.escape(self.title)}</title>\n"
+                    "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+                    "td,th{border:1px solid #ccc;padding:4px 8px}td{text-align:right}td:first-child{text-align:left}</style>\n"
+                    f"</head><body>\n<h1>{html.escape(self.title)}</h1>\n<table>\n<tr>"
+                    + "".join(f"<th>{html.escape(c)}</th>" for c in sheet.columns) + "</tr>\n"
+                )
+            for row in sheet.itertuples(index=False):
+                cells = [html.escape(str(row[0]))] + [f"{v:,.2f}" for v in row[1:]]
+                self.out.write("<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>\n")
+        self.rows += len(sheet)
+        self.out.flush()
+
+    def close(self):
+        if self.fmt == "json":
+            self.out.write("[]\n" if self.rows == 0 else "\n]\n")
+        elif self.fmt == "html":
+            if self.rows == 0:
+                self.out.write("<!doctype html>\n<html><body><p>No forms.</p>\n")
+            else:
+                self.out.write("</table>\n")
+            self.out.write("</body></html>\n")
+        self.out.flush()
+
+
+# ------------ CLI ------------
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("settings", help="settings JSON or compact archive from Save and Load")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    parser.add_argument("--format", choices=PRICER_FORMATS, help="default: from the output file extension, else csv")
+    parser.add_argument("--set", dest="sets", action="append", default=[], metavar="KEY=VALUE", help="override one input (repeatable)")
+    parser.add_argument("--overrides", help="JSON file of input overrides")
+    parser.add_argument("--workers", type=int, default=1, help="processes to price with (0 = all cores)")
+    parser.add_argument("--chunk-rows", type=int, default=PRICER_CHUNK_ROWS)
+    parser.add_argument("--title", default="Price sheet")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if fmt not in PRICER_FORMATS:
+        fmt = "csv"
+    try:
+        overrides = {}
+        if args.overrides:
+            with open(args.overrides, encoding="utf-8") as f:
+                overrides.update(json.load(f))
+        overrides.update(parse_override(s) for s in args.sets)
+        ip, forms, catalog_df, recipe_df, other_pp, form_glazes, glaze_costs, clay_bodies = load_pricing_inputs(args.settings, overrides)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    workers = args.workers or os.cpu_count() or 1
+    below_cost = []
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        writer = SheetWriter(out, fmt, args.title)
+        chunks = priced_chunks(forms, ip, catalog_df, recipe_df, other_pp, form_glazes, glaze_costs, clay_bodies,
+                               workers, max(1, args.chunk_rows))
+        for sheet in chunks:
+            writer.write(sheet)
+            low = sheet[(sheet["Wholesale"] < sheet["Total_cost"]) | (sheet["Retail"] < sheet["Total_cost"])]
+            below_cost.extend(low["Form"].tolist())
+        writer.close()
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); don't traceback on exit
+        sys.stdout = open(os.devnull, "w")
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.output != "-":
+        print(f"Priced {writer.rows} form(s) -> {args.output}", file=sys.stderr)
+    if below_cost:
+        print(f"{len(below_cost)} form(s) price below cost:", file=sys.stderr)
+        for name in below_cost[:20]:
+            print(f"  {name}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,213 +1,297 @@
 
 import streamlit as st
 import pandas as pd
-import json
+import os
+import sys
+import threading
+import time
+import functools
+from contextlib import contextmanager
 import datetime as _dt
 
+from pottery_core import (
+    DEFAULT_INPUTS,
+    UNIFIED_FORM_SCHEMA, SETTINGS_TABLE_SCHEMAS, SETTINGS_MAX_REPORTED_ERRORS, STUDIO_DB_TABLES,
+    migrate_to_unified_forms,
+    ensure_cols, money, to_json_bytes, to_archive_bytes, stream_settings_import,
+    read_unified_forms_csv, upsert_unified_forms, compact_forms, frame_bytes, shares_buffers,
+    table_row_hashes, diff_against_hashes,
+    studio_db_connect, studio_db_path, studio_data_dir, _studio_db_frame, studio_db_read_table, studio_db_write_changes,
+    studio_db_read_values, studio_db_write_values,
+    create_snapshot, checkout_snapshot, list_snapshots, snapshot_price_diff,
+    percent_recipe_table, cost_graph, price_sheet, CATEGORY_ORDER,
+    GLAZE_LIBRARY_SCHEMA, FORM_GLAZE_SCHEMA, glaze_library_names, glaze_library_recipe, save_glaze_recipe,
+    PRODUCTION_SCHEDULE_SCHEMA, MATERIAL_ON_HAND_SCHEMA, CURRENT_RECIPE_GLAZE, glaze_grams_needed, batch_mixing_plan,
+    INVENTORY_LEDGER_SCHEMA, INVENTORY_KINDS, INVENTORY_COSTING, ledger_entries, append_ledger, opening_balances,
+    catalog_with_inventory_costs, schedule_glaze_grams, schedule_material_needs, stockout_forecast,
+    CLAY_BODY_SCHEMA, clay_body_names, clay_body_inputs,
+    KilnLoad, KILN_FIRING_HOURS, kiln_shelf_columns, kiln_firing_cost, kiln_load_summary,
+    ENERGY_ALLOCATIONS, kiln_energy_weights, read_firing_log, fit_kiln_energy, suggest_energy_inputs,
+    MATERIAL_ALIASES, MaterialIndex, material_key, material_keys, unresolved_materials,
+    OXIDE_ANALYSIS_SCHEMA, R2O_OXIDES, RO_OXIDES, MaterialCatalog, oxide_analyses, glaze_chemistry, glaze_per_piece_from_recipe,
+    editor_change_set, change_set_empty, apply_change_set, change_events, update_price_sheet, _fingerprint, RecipeState,
+)
+from pottery_shared import starter_forms, preset_library, shipping_rate_card, common_material_index
+
 
 st.set_page_config(page_title="Pottery Cost Analysis App", layout="wide")
 ss = st.session_state
 
+# Hosting for several studios on one server (POTTERY_SERVER_MODE=1): shared data is
+# loaded once per process as usual, and nothing is written to the server's disk
+SERVER_MODE = os.environ.get("POTTERY_SERVER_MODE", "").strip().lower() in ("1", "true", "yes")
 
 
-# ------------ Helpers ------------
-def ensure_cols(df, schema: dict):
-    if df is None or df.empty:
-        return pd.DataFrame(columns=list(schema.keys()))
-    
-    df = df.copy()
-    
-    # Add missing columns
-    for col, default in schema.items():
-        if col not in df.columns:
-            df[col] = default
-    
-    # Keep only schema columns in correct order
-    df = df[list(schema.keys())]
-    
-    return df
+# ------------ Profiler (sidebar toggle) ------------
+PERF_HISTORY_MAX = 200
+
+def _perf_install_copy_counter():
+    """
+    Count DataFrame.copy() calls made by the rerun running on this thread.
+    Installed once per process; the script re-runs reuse the same thread-local.
+    """
+    original = pd.DataFrame.copy
+    if getattr(original, "_perf_local", None) is not None:
+        return original._perf_local
+    local = threading.local()
+
+    @functools.wraps(original)
+    def copy(self, *args, **kwargs):
+        stats = getattr(local, "stats", None)
+        if stats is not None:
+            stats["copies"] += 1
+        return original(self, *args, **kwargs)
+
+    copy._perf_local = local
+    pd.DataFrame.copy = copy
+    return local
+
+_perf_local = _perf_install_copy_counter()
+
+def perf_begin():
+    _perf_local.stats = {"start": time.perf_counter(), "copies": 0, "sections": {}} if ss.get("perf_enabled") else None
+
+@contextmanager
+def perf_section(name: str):
+    """Time a block for the profiler (no-op when it is off). Times are inclusive of nested sections."""
+    stats = getattr(_perf_local, "stats", None)
+    if stats is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = stats["sections"].setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += time.perf_counter() - t0
+
+def profiled(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if getattr(_perf_local, "stats", None) is None:
+            return fn(*args, **kwargs)
+        with perf_section(f"{fn.__name__}()"):
+            return fn(*args, **kwargs)
+    return wrapper
+
+def data_editor(data, **kwargs):
+    """st.data_editor, timed per editor key when the profiler is on."""
+    with perf_section(f"editor: {kwargs.get('key', '')}"):
+        return st.data_editor(data, **kwargs)
+
+def _value_bytes(value) -> int:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(deep=True).sum()) if isinstance(value, pd.DataFrame) else int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_value_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_value_bytes(v) for v in value)
+    return sys.getsizeof(value)
+
+def session_memory() -> pd.DataFrame:
+    """
+    Bytes this session holds, per state key. Form tables still sharing the
+    process-wide starter set or preset library count as zero.
+    """
+    shared = [starter_forms(), preset_library()]
+    rows = []
+    for key in list(ss.keys()):
+        value = ss[key]
+        is_shared = isinstance(value, pd.DataFrame) and any(shares_buffers(value, df) for df in shared)
+        rows.append({"Key": str(key), "Bytes": 0 if is_shared else _value_bytes(value), "Shared": is_shared})
+    return pd.DataFrame(rows, columns=["Key", "Bytes", "Shared"]).sort_values("Bytes", ascending=False)
+
+def shared_forms_bytes() -> int:
+    return frame_bytes(starter_forms()) + frame_bytes(preset_library())
+
+def perf_end():
+    """Close out this rerun: append to the rolling history and return the per-section breakdown."""
+    stats = getattr(_perf_local, "stats", None)
+    if stats is None:
+        return None
+    _perf_local.stats = None
+    row = {
+        "Time": _dt.datetime.now().strftime("%H:%M:%S"),
+        "Rerun_ms": round((time.perf_counter() - stats["start"]) * 1000, 1),
+        "DataFrame_copies": stats["copies"],
+        "Session_MB": round(session_memory()["Bytes"].sum() / 1e6, 3),
+    }
+    row.update({f"{name} ms": round(t * 1000, 2) for name, (_, t) in stats["sections"].items()})
+    history = ss.setdefault("_perf_history", [])
+    history.append(row)
+    del history[:-PERF_HISTORY_MAX]
+    breakdown = pd.DataFrame(
+        [{"Section": name, "Calls": n, "Total_ms": t * 1000, "Mean_ms": t * 1000 / n} for name, (n, t) in stats["sections"].items()],
+        columns=["Section", "Calls", "Total_ms", "Mean_ms"],
+    )
+    return breakdown.sort_values("Total_ms", ascending=False)
+
+perf_begin()
+
+# Engine helpers the tabs call directly (calls made inside the engine count toward their caller)
+migrate_to_unified_forms = profiled(migrate_to_unified_forms)
+ensure_cols = profiled(ensure_cols)
+percent_recipe_table = profiled(percent_recipe_table)
+price_sheet = profiled(price_sheet)
+
+# Derived per-piece costs, memoized per session: a node reruns only when its inputs changed
+if "cost_graph" not in ss:
+    ss.cost_graph = cost_graph()
+
+def with_clay_body(ip: dict = None) -> dict:
+    """
+    ip (default this session's inputs) as priced: a picked clay body's price, bag,
+    yield and reclaim stand in for the single-clay inputs. ss.inputs itself keeps
+    what the user entered, so clearing the body brings their own clay back.
+    """
+    ip = ss.inputs if ip is None else ip
+    return clay_body_inputs(ip, ss.clay_bodies_df) if str(ip.get("clay_body", "")).strip() else ip
+
+def derived(name: str, ip: dict = None, **sources):
+    """One cost-graph node from this session's inputs (with_clay_body) and tables; per-tab sources (glaze_pp, other_pp, ...) by keyword."""
+    values = dict(
+        with_clay_body(ip),
+        catalog_df=ss.catalog_df, recipe_df=ss.recipe_df,
+        glaze_piece_df=ss.glaze_piece_df, other_mat_df=ss.other_mat_df,
+        glaze_library_df=ss.glaze_library_df, form_glazes_df=ss.form_glazes_df,
+        inventory_ledger_df=ss.inventory_ledger_df, oxide_analysis_df=ss.oxide_analysis_df,
+        grams_per_piece=float(ss.get("recipe_grams_per_piece", 8.0)),
+    )
+    values.update(sources)
+    with perf_section(f"derived: {name}"):
+        return ss.cost_graph.evaluate(name, values)
+
+def catalog_material_index() -> MaterialIndex:
+    """Search index over this session's catalog (and aliases of it), rebuilt only when the names change."""
+    names = tuple(ss.catalog_df["Material"].astype(str)) if not ss.catalog_df.empty else ()
+    if ss.get("_catalog_index_names") != names:
+        ss._catalog_index = MaterialIndex(names, MATERIAL_ALIASES)
+        ss._catalog_index_names = names
+    return ss._catalog_index
+
+
+# ------------ Editor change sets ------------
+TABLE_CHANGES_KEPT = 4     # change sets remembered per table for incremental consumers
+CHANGE_EVENTS_KEPT = 200
+
+def record_changes(name: str, changes: dict):
+    """Apply a change set to ss[name], bump the table's revision and log one event per row."""
+    before = ss[name]
+    events = change_events(name, before, changes, STUDIO_DB_TABLES.get(name, (None, None))[1])
+    ss[name] = apply_change_set(before, changes)
+    revision = ss.table_revisions.get(name, 0) + 1
+    ss.table_revisions[name] = revision
+    kept = ss.table_changes.get(name, [])[-(TABLE_CHANGES_KEPT - 1):]
+    ss.table_changes[name] = kept + [(revision, changes, before, ss[name])]
+    ss.change_events = (ss.change_events + [dict(e, Revision=revision) for e in events])[-CHANGE_EVENTS_KEPT:]
+
+def conform_table(name: str):
+    """ss[name] in its schema's columns with float measures, so edits can be written in place (copies only if needed)."""
+    schema, df = SETTINGS_TABLE_SCHEMAS[name], ss[name]
+    if list(df.columns) != list(schema) or any(df[c].dtype.kind != "f" for c, d in schema.items() if not isinstance(d, str)):
+        ss[name] = ensure_cols(df, schema)
+
+def edit_table(name: str, data: pd.DataFrame, key: str, derive=None, **kwargs) -> dict:
+    """
+    data_editor over ss[name], with data its rows as shown (position for
+    position). Edits come back as a row-level change set applied to ss[name]
+    rather than a whole new table; derive(changes) can fill computed columns
+    first. Returns the change set.
+    """
+    data_editor(data, key=key, **kwargs)
+    changes = editor_change_set(ss.get(key), SETTINGS_TABLE_SCHEMAS[name])
+    if not change_set_empty(changes):
+        record_changes(name, derive(changes) if derive else changes)
+    return changes
+
+def priced_forms(ip: dict, other_pp: float, glaze_cost_per_g: float, glaze_costs: pd.Series) -> pd.DataFrame:
+    """
+    price_sheet for every unified form, kept between reruns. After edits in the
+    forms table only the edited and added forms are repriced; anything else
+    (inputs, glazes, clay bodies, a loaded or imported table) prices them all.
+    """
+    forms = ss.unified_forms
+    ip = with_clay_body(ip)
+    context = (
+        tuple(sorted(ip.items())), other_pp, glaze_cost_per_g, _fingerprint(glaze_costs.to_frame()),
+        _fingerprint(ss.form_glazes_df), _fingerprint(ss.clay_bodies_df),
+    )
+    pricing = dict(ip=ip, other_pp=other_pp, glaze_cost_per_g=glaze_cost_per_g, form_glazes=ss.form_glazes_df,
+                   glaze_costs=glaze_costs, clay_bodies=ss.clay_bodies_df)
+    cache = ss.get("_price_sheet_cache")
+    revision = ss.table_revisions.get("unified_forms", 0)
+    if cache is not None and cache["context"] == context:
+        if cache["forms"] is forms and cache["revision"] == revision:
+            return cache["sheet"]
+        pending = [c for c in ss.table_changes.get("unified_forms", []) if c[0] > cache["revision"]]
+        if pending and pending[0][0] == cache["revision"] + 1 and pending[0][2] is cache["forms"] and pending[-1][3] is forms:
+            sheet = cache["sheet"]
+            for _, changes, _, after in pending:
+                sheet = update_price_sheet(sheet, after, changes, **pricing)
+            ss._price_sheet_cache = dict(context=context, forms=forms, revision=revision, sheet=sheet)
+            return sheet
+    sheet = price_sheet(forms, catalog_df=None, recipe_df=None, **pricing)
+    ss._price_sheet_cache = dict(context=context, forms=forms, revision=revision, sheet=sheet)
+    return sheet
+
+
+def sync_recipe_editor():
+    """
+    Fold the recipe editor's edits into ss.recipe_df before any tab reads it.
+    A recipe replaced elsewhere (library, load, rename) rebases the editor instead.
+    """
+    recipe = ss.recipe_state
+    if ss.recipe_df is not recipe.recipe:
+        recipe.rebase(ss.recipe_df)
+    else:
+        events = recipe.sync(ss.get("recipe_editor"))
+        if events:
+            ss.change_events = (ss.change_events + [dict(e, Revision=recipe.revision) for e in events])[-CHANGE_EVENTS_KEPT:]
+    ss.recipe_df = recipe.recipe
+    ss.table_revisions["recipe_df"] = recipe.revision
+
+def with_current_recipe(name: str, **sources):
+    """
+    A glaze-library node for the library and for the recipe being edited,
+    evaluated apart so an edit to the recipe reruns it for that glaze only.
+    """
+    lib = ss.glaze_library_df
+    library = derived(name, glaze_library_df=lib[lib["Glaze"].astype(str).str.strip() != CURRENT_RECIPE_GLAZE], **sources)
+    current = derived(name, glaze_library_df=save_glaze_recipe(None, CURRENT_RECIPE_GLAZE, ss.recipe_df), **sources)
+    return tuple(pd.concat([a, b]) for a, b in zip(library, current))
 
-# ------------ Unified Form Management System ------------
-UNIFIED_FORM_SCHEMA = {
-    "Form": "",
-    "Clay_lb_wet": 0.0,
-    "Default_glaze_g": 0.0,
-    "Throwing_min": 0.0,
-    "Trimming_min": 0.0,
-    "Handling_min": 0.0,
-    "Glazing_min": 0.0,
-    "Pieces_per_shelf": 0,
-    "Notes": ""
-}
-
-def migrate_to_unified_forms():
-    """Migrate from 3 separate form databases to 1 unified one"""
-    unified = pd.DataFrame(columns=list(UNIFIED_FORM_SCHEMA.keys()))
-    
-    # Migrate from form_presets_df (clay + glaze data)
-    if "form_presets_df" in ss and not ss.form_presets_df.empty:
-        for _, row in ss.form_presets_df.iterrows():
-            new_row = {
-                "Form": str(row.get("Form", "")).strip(),
-                "Clay_lb_wet": float(row.get("Clay_lb_wet", 0.0)),
-                "Default_glaze_g": float(row.get("Default_glaze_g", 0.0)),
-                "Throwing_min": 0.0,  # defaults
-                "Trimming_min": 0.0,
-                "Handling_min": 0.0,
-                "Glazing_min": 0.0,
-                "Pieces_per_shelf": 0,
-                "Notes": str(row.get("Notes", "")).strip()
-            }
-            unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
-    
-    # Migrate from production_forms (timing data)
-    if "production_forms" in ss and not ss.production_forms.empty:
-        for _, row in ss.production_forms.iterrows():
-            form_name = str(row.get("Form", "")).strip()
-            if not form_name:
-                continue
-                
-            # Check if this form already exists from presets
-            existing_idx = unified[unified["Form"] == form_name].index
-            if len(existing_idx) > 0:
-                # Update existing row with timing data
-                idx = existing_idx[0]
-                unified.at[idx, "Throwing_min"] = float(row.get("Throwing_min", 0.0))
-                unified.at[idx, "Trimming_min"] = float(row.get("Trimming_min", 0.0))
-                unified.at[idx, "Handling_min"] = float(row.get("Handling_min", 0.0))
-                unified.at[idx, "Glazing_min"] = float(row.get("Glazing_min", 0.0))
-                unified.at[idx, "Pieces_per_shelf"] = int(row.get("Pieces_per_shelf", 0))
-                # Merge notes
-                existing_notes = str(unified.at[idx, "Notes"]).strip()
-                new_notes = str(row.get("Notes", "")).strip()
-                if existing_notes and new_notes and existing_notes != new_notes:
-                    unified.at[idx, "Notes"] = f"{existing_notes} | {new_notes}"
-                elif new_notes:
-                    unified.at[idx, "Notes"] = new_notes
-            else:
-                # Add new row with timing data
-                new_row = {
-                    "Form": form_name,
-                    "Clay_lb_wet": 0.0,  # defaults
-                    "Default_glaze_g": 0.0,
-                    "Throwing_min": float(row.get("Throwing_min", 0.0)),
-                    "Trimming_min": float(row.get("Trimming_min", 0.0)),
-                    "Handling_min": float(row.get("Handling_min", 0.0)),
-                    "Glazing_min": float(row.get("Glazing_min", 0.0)),
-                    "Pieces_per_shelf": int(row.get("Pieces_per_shelf", 0)),
-                    "Notes": str(row.get("Notes", "")).strip()
-                }
-                unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
-    
-    # Migrate from custom_forms (user timing data)
-    if "custom_forms" in ss and not ss.custom_forms.empty:
-        for _, row in ss.custom_forms.iterrows():
-            form_name = str(row.get("Form", "")).strip()
-            if not form_name:
-                continue
-                
-            # Check if this form already exists
-            existing_idx = unified[unified["Form"] == form_name].index
-            if len(existing_idx) > 0:
-                # Update existing row
-                idx = existing_idx[0]
-                unified.at[idx, "Throwing_min"] = float(row.get("Throwing_min", 0.0))
-                unified.at[idx, "Trimming_min"] = float(row.get("Trimming_min", 0.0))
-                unified.at[idx, "Handling_min"] = float(row.get("Handling_min", 0.0))
-                unified.at[idx, "Glazing_min"] = float(row.get("Glazing_min", 0.0))
-                unified.at[idx, "Pieces_per_shelf"] = int(row.get("Pieces_per_shelf", 0))
-                # Merge notes
-                existing_notes = str(unified.at[idx, "Notes"]).strip()
-                new_notes = str(row.get("Notes", "")).strip()
-                if existing_notes and new_notes and existing_notes != new_notes:
-                    unified.at[idx, "Notes"] = f"{existing_notes} | {new_notes}"
-                elif new_notes:
-                    unified.at[idx, "Notes"] = new_notes
-            else:
-                # Add new row
-                new_row = {
-                    "Form": form_name,
-                    "Clay_lb_wet": 0.0,  # defaults
-                    "Default_glaze_g": 0.0,
-                    "Throwing_min": float(row.get("Throwing_min", 0.0)),
-                    "Trimming_min": float(row.get("Trimming_min", 0.0)),
-                    "Handling_min": float(row.get("Handling_min", 0.0)),
-                    "Glazing_min": float(row.get("Glazing_min", 0.0)),
-                    "Pieces_per_shelf": int(row.get("Pieces_per_shelf", 0)),
-                    "Notes": str(row.get("Notes", "")).strip()
-                }
-                unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
-    
-    # Remove duplicates and clean up
-    unified = unified.drop_duplicates(subset=["Form"], keep="last").reset_index(drop=True)
-    
-    # Ensure proper data types
-    for col, default_val in UNIFIED_FORM_SCHEMA.items():
-        if col not in unified.columns:
-            unified[col] = default_val
-        if isinstance(default_val, str):
-            unified[col] = unified[col].astype(str).str.strip()
-        elif isinstance(default_val, float):
-            unified[col] = pd.to_numeric(unified[col], errors="coerce").fillna(default_val).astype(float)
-        elif isinstance(default_val, int):
-            unified[col] = pd.to_numeric(unified[col], errors="coerce").fillna(default_val).astype(int)
-    
-    return unified[list(UNIFIED_FORM_SCHEMA.keys())]
 
+# ------------ Unified Form Management System ------------
 def init_unified_forms():
-    """Initialize unified form system, migrating from old system if needed"""
+    """Initialize unified form system (old settings files are migrated on load)"""
     if "unified_forms" not in ss:
-        # First time - migrate from old system
-        ss.unified_forms = migrate_to_unified_forms()
-        
-        # If migration resulted in empty dataframe, load defaults
-        if ss.unified_forms.empty:
-            ss.unified_forms = load_default_presets_unified()
-        
-        # Mark migration as complete
+        # Deep copy: edits are written into the table in place, and the starter rows are shared by every session
+        ss.unified_forms = starter_forms().copy()
         ss._forms_migrated = True
     
-    # Ensure dataframe has correct structure
-    ss.unified_forms = ensure_cols(ss.unified_forms, UNIFIED_FORM_SCHEMA)
-
-def load_default_presets_unified() -> pd.DataFrame:
-    """Load default presets in unified format"""
-    # Built-in fallback data (Sharon's starter list)
-    fallback_data = [
-        {"Form": "Mug (12 oz)", "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "straight"},
-        {"Form": "Mug (14 oz)", "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-        {"Form": "Creamer (small)", "Clay_lb_wet": 0.75, "Default_glaze_g": 93, "Notes": ""},
-        {"Form": "Pitcher (medium)", "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-        {"Form": "Bowl (cereal)", "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "≈6\""},
-        {"Form": "Bowl (small)", "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-        {"Form": "Bowl (medium)", "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-        {"Form": "Bowl (large)", "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-        {"Form": "Plate (10 in dinner)", "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-        {"Form": "Pie plate", "Clay_lb_wet": 3.25, "Default_glaze_g": 403, "Notes": "3¼–3½ lb"},
-        {"Form": "Sugar jar", "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-        {"Form": "Honey jar", "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-        {"Form": "Crock (small)", "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
-        {"Form": "Crock (medium)", "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-        {"Form": "Crock (large)", "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-    ]
-    
-    unified = pd.DataFrame(columns=list(UNIFIED_FORM_SCHEMA.keys()))
-    
-    for preset in fallback_data:
-        new_row = {
-            "Form": str(preset.get("Form", "")).strip(),
-            "Clay_lb_wet": float(preset.get("Clay_lb_wet", 0.0)),
-            "Default_glaze_g": float(preset.get("Default_glaze_g", 0.0)),
-            "Throwing_min": 0.0,  # Default timing - users can customize
-            "Trimming_min": 0.0,
-            "Handling_min": 0.0,
-            "Glazing_min": 6.0,  # Default 6 min glazing
-            "Pieces_per_shelf": 12,  # Default shelf capacity
-            "Notes": str(preset.get("Notes", "")).strip()
-        }
-        unified = pd.concat([unified, pd.DataFrame([new_row])], ignore_index=True)
-    
-    return ensure_cols(unified, UNIFIED_FORM_SCHEMA)
+    # Ensure dataframe has correct structure (no copy when it already has)
+    ss.unified_forms = compact_forms(ss.unified_forms)
 
 # Initialize unified form system
 init_unified_forms()
@@ -241,711 +325,61 @@ def apply_quick_defaults():
         if key not in ss.inputs:
             ss.inputs[key] = default_val
 
-def get_common_materials_list():
-    """Returns a list of common ceramic materials for searchable dropdown"""
-    return [
-        # Feldspars
-        "Custer Feldspar", "F-4 Feldspar", "G-200 Feldspar", "Minspar 200", "NC-4 Feldspar",
-        "K-200 Feldspar", "Kingman Feldspar", "Cornwall Stone", "Nepheline Syenite",
-        
-        # Silica sources
-        "Flint (Silica)", "Silica Sand", "Quartz", "Cristobalite",
-        
-        # Clays and Kaolins
-        "EPK Kaolin", "Grolleg Kaolin", "OM4 Ball Clay", "Kentucky Ball Clay", "Redart Clay",
-        "Fire Clay", "Albany Slip Clay", "Goldart Stoneware Clay", "Hawthorne Bond Clay",
-        
-        # Fluxes
-        "Gerstley Borate", "Whiting (Calcium Carbonate)", "Wollastonite", "Dolomite",
-        "Magnesium Carbonate", "Barium Carbonate", "Strontium Carbonate", "Lithium Carbonate",
-        "Pearl Ash (Potassium Carbonate)", "Soda Ash (Sodium Carbonate)", "Borax",
-        
-        # Frits
-        "Frit 3124", "Frit 3134", "Frit 3195", "Frit 3249", "Frit 3269", "Frit 3278",
-        "Frit 90", "Frit 25", "Frit 169", "Pemco P-54", "Pemco P-311",
-        
-        # Colorants (Oxides)
-        "Red Iron Oxide", "Black Iron Oxide", "Yellow Iron Oxide", "Cobalt Oxide",
-        "Cobalt Carbonate", "Copper Oxide", "Copper Carbonate", "Chrome Oxide",
-        "Chromium Oxide", "Tin Oxide", "Titanium Dioxide", "Rutile", "Ilmenite",
-        "Manganese Dioxide", "Manganese Carbonate", "Nickel Oxide", "Vanadium Pentoxide",
-        
-        # Colorants (Stains)
-        "Mason 6020 Black", "Mason 6006 Blue", "Mason 6021 Brown", "Mason 6304 Coral",
-        "Mason 6242 Crimson", "Mason 6226 Golden Yellow", "Mason 6120 Green",
-        
-        # Specialty materials
-        "Bentonite", "Zircopax (Zirconium Silicate)", "Superpax", "Zinc Oxide",
-        "Talc", "Pyrophyllite", "Spodumene", "Petalite", "Bone Ash", "Wood Ash",
-        "Alumina Hydrate", "Calcined Alumina", "CMC (Carboxymethyl Cellulose)", "Veegum T"
-    ]
-
-def ensure_cols(df, schema: dict):
-    if df is None:
-        df = pd.DataFrame()
-    else:
-        df = df.copy()
-    for col, default in schema.items():
-        if col not in df.columns:
-            df[col] = default
-    df = df[list(schema.keys())]
-    for col, default in schema.items():
-        if isinstance(default, str):
-            df[col] = df[col].astype(str)
-        else:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(default).astype(float)
-    return df
 
-def money(n):
-    try:
-        return f"${n:,.2f}"
-    except Exception:
-        return "$0.00"
-
-def to_json_bytes(obj):
-    return json.dumps(obj, indent=2).encode("utf-8")
-
-def from_json_bytes(b):
-    return json.loads(b.decode("utf-8"))
-
-def other_materials_pp(df, pieces_in_project: int):
-    df2 = ensure_cols(df, {
-        "Item":"", "Unit":"", "Cost_per_unit":0.0, "Quantity_for_project":0.0
-    }).copy()
-    df2["Line_total"] = df2["Cost_per_unit"] * df2["Quantity_for_project"]
-    project_total = float(df2["Line_total"].sum())
-    per_piece = project_total / max(1, int(pieces_in_project))
-    df2["Cost_per_piece"] = df2["Line_total"] / max(1, int(pieces_in_project))
-    return per_piece, project_total, df2
-# ---- Tariff rates loader (local JSON or URL) ----
-@st.cache_data
-def load_tariff_table(local_path: str = "tariff_rates.json", url: str = "") -> pd.DataFrame:
-    df = pd.DataFrame(columns=["HS_code", "Description", "Country", "Duty_rate", "VAT_rate"])
-    # try local first
-    try:
-        df = pd.read_json(local_path)
-    except Exception:
-        pass
-    # optional URL override
-    if url:
-        try:
-            df = pd.read_json(url)
-        except Exception:
-            pass
-    # normalize columns
-    for col in ["HS_code", "Description", "Country"]:
-        if col not in df.columns:
-            df[col] = ""
-    for col in ["Duty_rate", "VAT_rate"]:
-        if col not in df.columns:
-            df[col] = 0.0
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
-    # clean
-    df["HS_code"] = df["HS_code"].astype(str).str.strip()
-    df["Country"] = df["Country"].astype(str).str.strip()
-    return df[["HS_code", "Description", "Country", "Duty_rate", "VAT_rate"]]
-
-
-# --- Form presets: loader + initializer --------------------------------------
-@st.cache_data(show_spinner=False)
-def load_default_presets() -> pd.DataFrame:
+def detach_studio_db():
+    """Stop saving to the studio database and close this session's connection."""
+    conn = ss.get("_studio_db_conn")
+    if conn is not None:
+        conn.close()
+    ss._studio_db_conn = None
+    ss._studio_db_path = None
+
+def attach_studio_db(path: str):
     """
-    Loads presets from your GitHub RAW CSV.
-    Falls back to a built-in 'Sharon set' if the CSV can't be read.
-    Columns: Form, Clay_lb_wet, Default_glaze_g, Notes
+    Point this session at a studio database. Loads saved data if the file has any,
+    otherwise seeds it from the current session. The connection (and the schema
+    check) is made once per session and file; later reruns return straight away.
     """
-    cols = {"Form": "", "Clay_lb_wet": 0.0, "Default_glaze_g": 0.0, "Notes": ""}
-
-    # Try your repo first (RAW URL)
-    url = "https://raw.githubusercontent.com/creekroadpottery/pottery-pricing-app/main/form_presets.csv"
-    try:
-        df = pd.read_csv(url)
-        for c, d in cols.items():
-            if c not in df.columns:
-                df[c] = d
-        return df[list(cols.keys())]
-    except Exception:
-        pass
-
-    # Fallback: Sharon’s starter list (edit/expand anytime)
-    fallback = pd.DataFrame(
-        [
-            {"Form": "Mug (12 oz)",              "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "straight"},
-            {"Form": "Mug (14 oz)",              "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Creamer (small)",          "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Pitcher (medium)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Bowl (cereal)",            "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "≈6\""},
-            {"Form": "Bowl (small)",             "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Bowl (medium)",            "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Bowl (large)",             "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Plate (10 in dinner)",     "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Pie plate",                "Clay_lb_wet": 3.25, "Default_glaze_g": 403, "Notes": "3¼–3½ lb"},
-            {"Form": "Sugar jar",                "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Honey jar",                "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Crock (small)",            "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
-            {"Form": "Crock (medium)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Crock (large)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Small cup",                       "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": "8 oz"},
-            {"Form": "Tumbler",                         "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "12 oz"},
-            {"Form": "Beer mug",                        "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "20 oz"},
-            {"Form": "Travel mug",                      "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "with handle"},
-            {"Form": "Soup bowl",                       "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "shallow"},
-            {"Form": "Ramen bowl",                      "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "deep"},
-            {"Form": "Mixing bowl (small)",             "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "≈8 in"},
-            {"Form": "Mixing bowl (medium)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "≈10 in"},
-            {"Form": "Mixing bowl (large)",             "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "≈12 in"},
-            {"Form": "Salad bowl (family)",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "≈14 in wide"},
-            {"Form": "Small plate (6 in)",              "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Dessert plate (8 in)",            "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Dinner plate (10 in)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Charger plate (12 in)",           "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Serving platter (small oval)",    "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "oval"},
-            {"Form": "Serving platter (medium 14 in)",  "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "round"},
-            {"Form": "Serving platter (large 16 in)",   "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": "round"},
-            {"Form": "Pasta bowl (wide rim)",           "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Pie dish (9 in)",                 "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Casserole (small, with lid)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Casserole (medium, with lid)",    "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Casserole (large, with lid)",     "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Covered jar (small)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "lidded"},
-            {"Form": "Covered jar (medium)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "lidded"},
-            {"Form": "Covered jar (large)",             "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "lidded"},
-            {"Form": "Pitcher (small)",                 "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Pitcher (medium)",                "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Pitcher (large)",                 "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Teapot (2-cup)",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "with lid"},
-            {"Form": "Teapot (4-cup)",                  "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with lid"},
-            {"Form": "Teapot (6-cup)",                  "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with lid"},
-            {"Form": "Teapot (8-cup)",                  "Clay_lb_wet": 6.50, "Default_glaze_g": 806, "Notes": "with lid"},
-            {"Form": "Sugar jar",                       "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Creamer",                         "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "spout"},
-            {"Form": "Butter dish (with lid)",          "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Salt cellar",                     "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Sponge holder",                   "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "cutouts"},
-            {"Form": "Utensil crock (small)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "tall"},
-            {"Form": "Utensil crock (large)",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "tall"},
-            {"Form": "Planter (4 in)",                  "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "drainage"},
-            {"Form": "Planter (6 in)",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "drainage"},
-            {"Form": "Planter (8 in)",                  "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "drainage"},
-            {"Form": "Planter (10 in)",                 "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "drainage"},
-            {"Form": "Vase (bud, 5 in)",                "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Vase (medium, 8 in)",             "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Vase (tall, 12 in)",              "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Luminary (small)",                "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "cutouts"},
-            {"Form": "Luminary (large)",                "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "cutouts"},
-            {"Form": "Baking dish (small rectangular)", "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Baking dish (large rectangular)", "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Loaf pan (small)",               "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Loaf pan (large)",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Batter bowl (with handle)",      "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "pour spout"},
-            {"Form": "Serving dish (oval, small)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Serving dish (oval, medium)",    "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Serving dish (oval, large)",     "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Chip & dip platter",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with center bowl"},
-            {"Form": "Cake stand (small)",             "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "6–8 in top"},
-            {"Form": "Cake stand (large)",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "10–12 in top"},
-            {"Form": "Covered butter keeper",          "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "French style"},
-            {"Form": "Egg baker",                      "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Soup tureen (small)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "with lid"},
-            {"Form": "Soup tureen (large)",            "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "with lid"},
-            {"Form": "Gravy boat",                     "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "with saucer"},
-            {"Form": "Serving spoon rest",             "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Oil cruet",                      "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pour spout"},
-            {"Form": "Honey pot",                      "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "with lid & dipper"},
-            {"Form": "Garlic keeper",                  "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pierced"},
-            {"Form": "Salsa bowl",                     "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Dip bowl (small)",               "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Dip bowl (medium)",              "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Dip bowl (large)",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Fruit bowl (small)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Fruit bowl (large)",             "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Berry bowl (pierced)",           "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "strainer style"},
-            {"Form": "Colander (small)",               "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with handles"},
-            {"Form": "Colander (large)",               "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with handles"},
-            {"Form": "Pasta bowl (individual)",        "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
-            {"Form": "Serving bowl (extra large)",     "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
-            {"Form": "Ice cream bowl",                 "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Candle holder (taper)",          "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Candle holder (pillar)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Lantern (pierced)",              "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Incense burner (cone)",          "Clay_lb_wet": 0.50, "Default_glaze_g": 62,  "Notes": ""},
-            {"Form": "Incense burner (stick)",         "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Wall pocket vase",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Wall planter",                   "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "flat back"},
-            {"Form": "Hanging planter (small)",        "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with holes"},
-            {"Form": "Hanging planter (large)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with holes"},
-            {"Form": "Orchid pot (pierced)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Succulent planter (tiny)",       "Clay_lb_wet": 0.50, "Default_glaze_g": 62,  "Notes": "2–3 in"},
-            {"Form": "Succulent planter (medium)",     "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "4–5 in"},
-            {"Form": "Succulent planter (large)",      "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "6–7 in"},
-            {"Form": "Mortar & pestle (small)",        "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with pestle"},
-            {"Form": "Mortar & pestle (large)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with pestle"},
-            {"Form": "Soup mug (with handle)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Handled bowl (breakfast)",       "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
-            {"Form": "Pet bowl (small)",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Pet bowl (large)",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Water dish (animal trough)",     "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "sturdy"},
-            {"Form": "Wine goblet (small)",         "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "stemmed"},
-            {"Form": "Wine goblet (large)",         "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "stemmed"},
-            {"Form": "Beer stein (straight)",       "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "20 oz"},
-            {"Form": "Beer stein (tapered)",        "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": "24 oz"},
-            {"Form": "Tankard",                     "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "handle"},
-            {"Form": "Shot glass",                  "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": "single"},
-            {"Form": "Whiskey tumbler",             "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "lowball"},
-            {"Form": "Highball glass",              "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "tall"},
-            {"Form": "Cocktail coupe",              "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Martini glass",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Pitcher (extra large)",       "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": "gallon size"},
-            {"Form": "Serving bowl (pasta)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "wide"},
-            {"Form": "Serving bowl (salad)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": "extra large"},
-            {"Form": "Mixing bowl (small)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Mixing bowl (medium)",        "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Mixing bowl (large)",         "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Mortar bowl",                 "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with pestle"},
-            {"Form": "Colander (small)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with holes"},
-            {"Form": "Colander (large)",            "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with holes"},
-            {"Form": "Fruit bowl (small)",          "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Fruit bowl (large)",          "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Chip and dip platter",        "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "center dip"},
-            {"Form": "Deviled egg platter",         "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "indents"},
-            {"Form": "Butter dish",                 "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": "with lid"},
-            {"Form": "Cheese dome",                 "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "with plate"},
-            {"Form": "Cake stand",                  "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": "pedestal"},
-            {"Form": "Cupcake stand",               "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "tiered"},
-            {"Form": "Serving spoon rest",          "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Chopstick rest",              "Clay_lb_wet": 0.25, "Default_glaze_g": 31,  "Notes": ""},
-            {"Form": "Sushi plate (small)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Sushi plate (large)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Soy sauce dish",              "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
-            {"Form": "Rice bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Donburi bowl",                "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "Japanese large rice bowl"},
-            {"Form": "Noodle bowl",                 "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "ramen"},
-            {"Form": "Soup tureen",                 "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": "with lid"},
-            {"Form": "Handled soup bowl",           "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "with handle"},
-            {"Form": "Handled casserole",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "with lid"},
-            {"Form": "Bread pan",                   "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Loaf pan",                    "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
-            {"Form": "Bundt pan",                   "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Muffin pan (6 cup)",          "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Muffin pan (12 cup)",         "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Tart pan (small)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Tart pan (large)",            "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Candle holder (small)",       "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": "votive"},
-            {"Form": "Candle holder (taper)",       "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Candle holder (pillar)",      "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Lamp base (small)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Lamp base (large)",           "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Vase (bud)",                  "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Vase (small)",                "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Vase (medium)",               "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Vase (large)",                "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Vase (floor)",                "Clay_lb_wet": 12.0, "Default_glaze_g": 1488,"Notes": "tall"},
-            {"Form": "Urn (small)",                 "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Urn (medium)",                "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Urn (large)",                 "Clay_lb_wet": 10.0, "Default_glaze_g": 1240,"Notes": ""},
-            {"Form": "Planter (small)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Planter (medium)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Planter (large)",             "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Hanging planter",             "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with holes"},
-            {"Form": "Wall planter",                "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "flat back"},
-            {"Form": "Teapot (1 cup)",              "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "body only"},
-            {"Form": "Teapot (2 cup)",              "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Teapot (4 cup)",              "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Teapot (6 cup)",              "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
-            {"Form": "Teapot lid (small)",          "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
-            {"Form": "Teapot lid (medium)",         "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
-            {"Form": "Teapot lid (large)",          "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
-            {"Form": "Jar (1 pint)",                "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Jar (1 quart)",               "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Jar (half gallon)",           "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Jar (1 gallon)",              "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Cookie jar",                  "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "with lid"},
-            {"Form": "Canister (small)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with lid"},
-            {"Form": "Canister (medium)",           "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Canister (large)",            "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Storage jar (extra large)",   "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Pitcher (small)",             "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Pitcher (medium)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Pitcher (large)",             "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Tankard pitcher",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "sturdy"},
-            {"Form": "Ewer (decorative pitcher)",   "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Oil cruet",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pouring spout"},
-            {"Form": "Vinegar cruet",               "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pouring spout"},
-            {"Form": "Salt cellar",                 "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": "with lid"},
-            {"Form": "Pepper cellar",               "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
-            {"Form": "Spice jar",                   "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
-            {"Form": "Honey pot",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "with lid and dipper"},
-            {"Form": "Garlic keeper",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "vent holes"},
-            {"Form": "Olive dish",                  "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "elongated"},
-            {"Form": "Relish tray",                 "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "compartments"},
-            {"Form": "Serving tray (small)",        "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Serving tray (medium)",       "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Serving tray (large)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Serving tray (extra large)",  "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Oval platter",                "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Rectangular platter",         "Clay_lb_wet": 6.50, "Default_glaze_g": 806, "Notes": ""},
-            {"Form": "Square platter",              "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Chip and dip tray",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "attached bowl"},
-            {"Form": "Deviled egg tray",            "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "12 wells"},
-            {"Form": "Cake plate (8 in)",           "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "footed"},
-            {"Form": "Cake plate (10 in)",          "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Cake plate (12 in)",          "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Cake stand (small)",          "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Cake stand (large)",          "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
-            {"Form": "Pie plate (8 in)",            "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Pie plate (9 in)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Pie plate (10 in)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Tart pan (8 in)",             "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": "fluted"},
-            {"Form": "Tart pan (10 in)",            "Clay_lb_wet": 2.75, "Default_glaze_g": 341, "Notes": ""},
-            {"Form": "Tart pan (12 in)",            "Clay_lb_wet": 3.25, "Default_glaze_g": 403, "Notes": ""},
-            {"Form": "Bread pan (standard)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Bread pan (large)",          "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Lasagna pan (small)",        "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Lasagna pan (large)",        "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Casserole (1 qt)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with lid"},
-            {"Form": "Casserole (2 qt)",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "with lid"},
-            {"Form": "Casserole (3 qt)",           "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Casserole (4 qt)",           "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
-            {"Form": "Covered casserole (small)",  "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Covered casserole (large)",  "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
-            {"Form": "Dutch oven (small)",         "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Dutch oven (large)",         "Clay_lb_wet": 9.00, "Default_glaze_g": 1116,"Notes": ""},
-            {"Form": "Soup tureen (small)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
-            {"Form": "Soup tureen (large)",        "Clay_lb_wet": 10.0, "Default_glaze_g": 1240,"Notes": ""},
-            {"Form": "Stew pot",                   "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Bean pot",                   "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "with lid"},
-            {"Form": "Sauce pot (small)",          "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Sauce pot (medium)",         "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Sauce pot (large)",          "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
-            {"Form": "Baker (small)",              "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Baker (medium)",             "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Baker (large)",              "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Baker (rectangular)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Pizza stone (12 in)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Pizza stone (14 in)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
-            {"Form": "Pizza stone (16 in)",        "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Pizza pan (12 in)",          "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Pizza pan (14 in)",          "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Pizza pan (16 in)",          "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Tagine (small)",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with lid"},
-            {"Form": "Tagine (large)",             "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
-            {"Form": "Gratin dish (small)",        "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Gratin dish (medium)",       "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Gratin dish (large)",        "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Soufflé dish (small)",       "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Soufflé dish (medium)",      "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Soufflé dish (large)",       "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Mixing bowl (1 qt)",         "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Mixing bowl (2 qt)",         "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Mixing bowl (3 qt)",         "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Mixing bowl (4 qt)",         "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Mixing bowl (5 qt)",         "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
-            {"Form": "Colander (small)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "pierced"},
-            {"Form": "Colander (large)",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Berry bowl",                 "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "holes, drip plate"},
-            {"Form": "Strainer bowl",              "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Salad bowl (8 in)",          "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Salad bowl (10 in)",         "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Salad bowl (12 in)",         "Clay_lb_wet": 6.50, "Default_glaze_g": 806, "Notes": ""},
-            {"Form": "Punch bowl (large)",         "Clay_lb_wet": 10.0, "Default_glaze_g": 1240,"Notes": ""},
-            {"Form": "Serving bowl (small)",       "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Serving bowl (medium)",      "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Serving bowl (large)",       "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Serving bowl (XL)",          "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Serving platter (oval)",     "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Serving platter (rect)",     "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
-            {"Form": "Serving platter (round)",    "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
-            {"Form": "Serving tray (handles)",     "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Chip bowl",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Dip bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Chip-and-dip set",           "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "combined"},
-            {"Form": "Soup bowl (shallow)",        "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Soup bowl (deep)",           "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": ""},
-            {"Form": "Stew bowl",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "French onion soup crock",    "Clay_lb_wet": 2.75, "Default_glaze_g": 341, "Notes": "with handles"},
-            {"Form": "Soup mug",                   "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Ramen bowl",                 "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "deep, wide"},
-            {"Form": "Pho bowl",                   "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Pasta bowl (wide)",          "Clay_lb_wet": 2.75, "Default_glaze_g": 341, "Notes": ""},
-            {"Form": "Pasta bowl (deep)",          "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Ice cream bowl",             "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Dessert bowl",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Custard cup",                "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Ramekin (small)",            "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
-            {"Form": "Ramekin (large)",            "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": ""},
-            {"Form": "Pudding bowl",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Trifle bowl",                "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Compote dish (small)",       "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "stemmed"},
-            {"Form": "Compote dish (large)",       "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": ""},
-            {"Form": "Candy dish",                 "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Nut bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Relish tray (3-part)",       "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Relish tray (5-part)",       "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Divided dish",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Butter dish (tray)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Butter dish (covered)",      "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "with lid"},
-            {"Form": "Mug (12 oz)",                 "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "straight"},
-            {"Form": "Mug (14 oz)",                 "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Creamer (small)",             "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
-            {"Form": "Pitcher (medium)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Bowl (cereal)",               "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "≈6\""},
-            {"Form": "Bowl (small)",                "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Bowl (medium)",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Bowl (large)",                "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
-            {"Form": "Plate (10 in dinner)",        "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Pie plate",                   "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "3¼–3½ lb"},
-            {"Form": "Sugar jar",                   "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Honey jar",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Crock (small)",               "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": ""},
-            {"Form": "Crock (medium)",              "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Crock (large)",               "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Small cup",                   "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": "8 oz"},
-            {"Form": "Tumbler",                     "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "12 oz"},
-            {"Form": "Beer mug",                    "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "20 oz"},
-            {"Form": "Travel mug",                  "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "with handle"},
-            {"Form": "Soup bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "shallow"},
-            {"Form": "Ramen bowl",                  "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "deep"},
-            {"Form": "Mixing bowl (small)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "≈8 in"},
-            {"Form": "Mixing bowl (medium)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "≈10 in"},
-            {"Form": "Mixing bowl (large)",         "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": "≈12 in"},
-            {"Form": "Pasta bowl (wide)",           "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
-            {"Form": "Serving bowl (small)",        "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
-            {"Form": "Serving bowl (medium)",       "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
-            {"Form": "Serving bowl (large)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
-            {"Form": "Salad bowl (medium)",         "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": ""},
-            {"Form": "Salad bowl (large)",          "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Batter bowl (small)",         "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": "with spout"},
-            {"Form": "Batter bowl (large)",         "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": "with handle"},
-            {"Form": "Casserole (1 qt, covered)",   "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": ""},
-            {"Form": "Casserole (2 qt, covered)",   "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": ""},
-            {"Form": "Baker (rect, small)",         "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Baker (rect, large)",         "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
-            {"Form": "Bread pan",                   "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Lasagna pan",                 "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Gratin dish (oval)",          "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
-            {"Form": "Tart pan (9 in)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
-            {"Form": "Quiche dish (9 in)",          "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
-            {"Form": "Custard cup",                 "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
-            {"Form": "Ramekin (large)",             "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": ""},
-            {"Form": "Pie bird",                    "Clay_lb_wet": 0.25, "Default_glaze_g": 32,  "Notes": ""},
-            {"Form": "Butter dish (covered)",       "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Cheese dome (small)",         "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": "with plate"},
-            {"Form": "Chip and dip set",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "2-piece"},
-            {"Form": "Relish tray (3-section)",     "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
-            {"Form": "Divided dish (oval)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Dinner plate (8 in)",         "Clay_lb_wet": 1.80, "Default_glaze_g": 224, "Notes": ""},
-            {"Form": "Dinner plate (9 in)",         "Clay_lb_wet": 2.10, "Default_glaze_g": 261, "Notes": ""},
-            {"Form": "Dinner plate (10 in)",        "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Dinner plate (11 in)",        "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Dinner plate (12 in)",        "Clay_lb_wet": 3.60, "Default_glaze_g": 447, "Notes": "charger"},
-            {"Form": "Salad plate (8 in)",          "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": ""},
-            {"Form": "Dessert plate (7 in)",        "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Bread plate (6 in)",          "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": ""},
-            {"Form": "Charger (13 in)",             "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": ""},
-            {"Form": "Sushi plate (rect small)",    "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": ""},
-            {"Form": "Sushi plate (rect large)",    "Clay_lb_wet": 2.20, "Default_glaze_g": 273, "Notes": ""},
-            {"Form": "Platter (oval small)",        "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
-            {"Form": "Platter (oval medium)",       "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
-            {"Form": "Platter (oval large)",        "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
-            {"Form": "Platter (rect small)",        "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
-            {"Form": "Platter (rect large)",        "Clay_lb_wet": 5.25, "Default_glaze_g": 651, "Notes": ""},
-            {"Form": "Sectional platter",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "party"},
-            {"Form": "Gobo cup (sake)",             "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
-            {"Form": "Tea cup (handle-less)",       "Clay_lb_wet": 0.70, "Default_glaze_g": 87,  "Notes": ""},
-            {"Form": "Goblet",                      "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
-            {"Form": "Wine goblet (large)",         "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": ""},
-            {"Form": "Beer stein (heavy)",          "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": ""},
-            {"Form": "Highball",                    "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Lowball",                     "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": ""},
-            {"Form": "Martini coupe",               "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": ""},
-            {"Form": "Shot cup",                    "Clay_lb_wet": 0.35, "Default_glaze_g": 44,  "Notes": ""},
-            {"Form": "Teapot (2-cup)",              "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": "w/ lid"},
-            {"Form": "Teapot (4-cup)",              "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "w/ lid"},
-            {"Form": "Creamer (medium)",            "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": ""},
-            {"Form": "Sugar jar (with lid)",        "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": ""},
-            {"Form": "Coffee server",               "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": "pour spout"},
-            {"Form": "Pour-over dripper",           "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "cone"},
-            {"Form": "Pitcher (small)",             "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
-            {"Form": "Pitcher (large)",             "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
-            {"Form": "Ewer (decorative)",           "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
-            {"Form": "Canister (small)",            "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "with lid"},
-            {"Form": "Canister (medium)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "with lid"},
-            {"Form": "Canister (large)",            "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with lid"},
-            {"Form": "Cookie jar",                  "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": "with lid"},
-            {"Form": "Utensil crock",               "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "tall"},
-            {"Form": "Salt pig",                    "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": ""},
-            {"Form": "Spice jar",                   "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
-            {"Form": "Butter keeper (water seal)",  "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": ""},
-            {"Form": "Olive dish",                  "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "narrow"},
-            {"Form": "Relish dish (long)",          "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": ""},
-            {"Form": "Tray w/ handles (small)",     "Clay_lb_wet": 1.80, "Default_glaze_g": 224, "Notes": ""},
-            {"Form": "Tray w/ handles (large)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
-            {"Form": "Deviled egg plate",           "Clay_lb_wet": 2.40, "Default_glaze_g": 298, "Notes": "12 wells"},
-            {"Form": "Mortar & pestle (small)",     "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": ""},
-            {"Form": "Mortar & pestle (large)",     "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
-            {"Form": "Colander (small)",            "Clay_lb_wet": 1.80, "Default_glaze_g": 224, "Notes": "pierced"},
-            {"Form": "Colander (large)",            "Clay_lb_wet": 2.80, "Default_glaze_g": 347, "Notes": "pierced"},
-            {"Form": "Oil cruet",                   "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "cork"},
-            {"Form": "Syrup pitcher",               "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
-            {"Form": "Soap dispenser bottle",       "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": "pump"},
-            {"Form": "Utensil holder (wide)",       "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
-            {"Form": "Lamp base (small)",           "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": "wired"},
-            {"Form": "Lamp base (large)",           "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": "wired"},
-            {"Form": "Candle holder (taper)",       "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
-            {"Form": "Votive/tea-light",            "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": "luminary"},
-            {"Form": "Lantern (pierced)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "cutouts"},
-            {"Form": "Planter (4 in)",              "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": "with hole"},
-            {"Form": "Planter (6 in)",              "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with hole"},
-            {"Form": "Planter (8 in)",              "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "with hole"},
-            {"Form": "Planter (10 in)",             "Clay_lb_wet": 4.75, "Default_glaze_g": 589, "Notes": "with hole"},
-            {"Form": "Hanging planter (small)",     "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "with holes"},
-            {"Form": "Hanging planter (large)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with holes"},
-            {"Form": "Self-watering planter",       "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "insert"},
-            {"Form": "Bird feeder",                 "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "hanging"},
-            {"Form": "Bird bath (bowl)",            "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "wide"},
-            {"Form": "Wind chime tubes (set)",      "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": "stringing"},
-            {"Form": "Wind bell",                   "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "clapper"},
-            {"Form": "Tile (4×4 in)",               "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
-            {"Form": "Tile (6×6 in)",               "Clay_lb_wet": 0.85, "Default_glaze_g": 106, "Notes": ""},
-            {"Form": "Trivet (round)",              "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": "feet"},
-            {"Form": "Switch plate (double)",       "Clay_lb_wet": 0.50, "Default_glaze_g": 62,  "Notes": ""},
-            {"Form": "Vase (bud)",                  "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
-            {"Form": "Vase (table)",                "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
-            {"Form": "Vase (floor)",                "Clay_lb_wet": 6.50, "Default_glaze_g": 807, "Notes": "tall"},
-            {"Form": "Urn (small)",                 "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": "lid"},
-            {"Form": "Urn (large)",                 "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "lid"},
-            {"Form": "Sculpture (small)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "figurine"},
-            {"Form": "Sculpture (bust)",            "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
-            {"Form": "Mask (wall)",                 "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": "hang loop"},
-            {"Form": "Clock face (pottery)",        "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": "fit movement"},
-            {"Form": "Sponge holder",               "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": "kitchen"},
-            {"Form": "Spoon rest",                  "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
-            {"Form": "Measuring cup (1 cup)",       "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": "spout"},
-            {"Form": "Measuring cup (2 cup)",       "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": "spout"},
-            {"Form": "Gravy boat",                  "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": "with saucer"},
-            {"Form": "Soup tureen (large)",         "Clay_lb_wet": 6.50, "Default_glaze_g": 807, "Notes": "with lid"},
-            {"Form": "Tagine (base+lid)",           "Clay_lb_wet": 6.25, "Default_glaze_g": 775, "Notes": "oven"},
-            {"Form": "Pizza stone (round)",         "Clay_lb_wet": 5.25, "Default_glaze_g": 651, "Notes": "unglazed surface"},
-            {"Form": "Baguette tray",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "vented"},
-            {"Form": "Roaster (oval)",              "Clay_lb_wet": 5.75, "Default_glaze_g": 713, "Notes": "handles"},
-            {"Form": "Dutch oven (covered)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": "heavy"},
-            {"Form": "Cloche (bread dome)",         "Clay_lb_wet": 5.75, "Default_glaze_g": 713, "Notes": "base+lid"},
-            {"Form": "Watering can (ceramic)",      "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "garden"},
-            {"Form": "Fountain bowl",               "Clay_lb_wet": 7.25, "Default_glaze_g": 899, "Notes": "outdoor"},
-            {"Form": "Wall pocket (planter)",       "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": "hang loop"},           
-            
-
-
-        ]
-    )
-    return fallback
-
-def init_form_presets_in_state():
-    """Ensure ss.form_presets_df exists and is normalized."""
-    if "form_presets_df" not in ss:
-        ss.form_presets_df = load_default_presets()
-
-    # Normalize + types
-    ss.form_presets_df = ss.form_presets_df.copy()
-    ss.form_presets_df["Form"] = ss.form_presets_df["Form"].astype(str).str.strip()
-    ss.form_presets_df["Clay_lb_wet"] = pd.to_numeric(ss.form_presets_df["Clay_lb_wet"], errors="coerce").fillna(0.0)
-    ss.form_presets_df["Default_glaze_g"] = pd.to_numeric(ss.form_presets_df["Default_glaze_g"], errors="coerce").fillna(0.0)
-    if "Notes" not in ss.form_presets_df.columns:
-        ss.form_presets_df["Notes"] = ""
-
-
-# ---------- Preset categorizer ----------
-CATEGORY_ORDER = [
-    "Mugs and cups",          # most common first
-    "Bowls",
-    "Plates and platters",
-    "Drinkware and bar",
-    "Bakeware and ovensafe",
-    "Serveware and table",
-    "Jars and canisters",
-    "Teaware and coffee",
-    "Pitchers and ewers",
-    "Cookware and kitchen",
-    "Lighting and decor",
-    "Planters and garden",
-    "Tiles and fixtures",
-    "Sculpture and art",
-    "Specialty and other",
-]
-
-def infer_category(name: str) -> str:
-    n = str(name).lower()
-
-    # Mugs and cups
-    if any(k in n for k in ["mug", "cup", "demitasse", "espresso", "teacup", "soup mug"]):
-        return "Mugs and cups"
-
-    # Bowls
-    if any(k in n for k in ["bowl", "ramekin", "donburi", "noodle", "ramen", "pho", "custard", "trifle", "compote"]):
-        return "Bowls"
-
-    # Plates and platters
-    if any(k in n for k in ["plate", "platter", "tray", "sushi plate", "square plate", "oval platter", "rectangular platter"]):
-        return "Plates and platters"
-
-    # Drinkware and bar
-    if any(k in n for k in ["stein", "goblet", "tumbler", "highball", "lowball", "martini", "coupe", "shot", "wine"]):
-        return "Drinkware and bar"
-
-    # Bakeware and ovensafe
-    if any(k in n for k in ["pie", "tart", "bread pan", "loaf", "bundt", "baker", "baking", "casserole", "lasagna", "gratin", "soufflé", "tagine", "dutch oven", "roaster", "pizza stone", "cloche"]):
-        return "Bakeware and ovensafe"
-
-    # Serveware and table
-    if any(k in n for k in ["serving", "chip and dip", "chip", "dip", "relish", "divided dish", "butter dish", "salt pig", "salt cellar", "spice jar", "utensil crock", "ladle"]):
-        return "Serveware and table"
-
-    # Jars and canisters
-    if any(k in n for k in ["jar", "canister", "storage", "cookie jar", "urn"]):
-        return "Jars and canisters"
-
-    # Teaware and coffee
-    if any(k in n for k in ["teapot", "tea", "pour-over", "french press", "coffee server", "creamer", "sugar"]):
-        return "Teaware and coffee"
-
-    # Pitchers and ewers
-    if any(k in n for k in ["pitcher", "ewer", "cruet"]):
-        return "Pitchers and ewers"
-
-    # Cookware and kitchen
-    if any(k in n for k in ["colander", "mortar", "pestle", "strainer", "soup tureen", "sauce pot", "pan", "tagine", "tandoor", "kitchen utensil holder", "oil burner"]):
-        return "Cookware and kitchen"
-
-    # Lighting and decor
-    if any(k in n for k in ["candle", "candlestick", "lantern", "luminary", "lamp base", "clock", "mask", "votive"]):
-        return "Lighting and decor"
-
-    # Planters and garden
-    if any(k in n for k in ["planter", "garden", "bird", "wind chime", "wind bell", "stepping stone", "fountain", "birdbath", "bird bath"]):
-        return "Planters and garden"
-
-    # Tiles and fixtures
-    if any(k in n for k in ["tile", "trivet", "switch plate"]):
-        return "Tiles and fixtures"
-
-    # Sculpture and art
-    if any(k in n for k in ["sculpture", "bust", "relief", "totem", "column", "capital", "columbarium"]):
-        return "Sculpture and art"
-
-    return "Specialty and other"
-
-def sort_by_category_then_form(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    if "Category" not in df.columns:
-        df["Category"] = df["Form"].apply(infer_category)
-    order_map = {cat: i for i, cat in enumerate(CATEGORY_ORDER)}
-    df["__cat_rank"] = df["Category"].map(order_map).fillna(len(CATEGORY_ORDER)).astype(int)
-    df = df.sort_values(["__cat_rank", "Form"], kind="stable").drop(columns="__cat_rank")
-    return df
-
-
-# Call init early in your script (after you define ss = st.session_state)
-init_form_presets_in_state()
+    if ss.get("_studio_db_path") == path and ss.get("_studio_db_conn") is not None:
+        return
+    detach_studio_db()
+    conn = studio_db_connect(path, check_same_thread=False)
+    saved_inputs = studio_db_read_values(conn, "inputs")
+    if saved_inputs:
+        ss.inputs.update(saved_inputs)
+        values = studio_db_read_values(conn, "studio_values")
+        ss.recipe_grams_per_piece = float(values.get("recipe_grams_per_piece", ss.recipe_grams_per_piece))
+        for name in STUDIO_DB_TABLES:
+            ss[name] = studio_db_read_table(conn, name)
+    ss._studio_db_conn = conn
+    ss._studio_db_path = path
+    # Nothing synced yet, so the first sync writes everything that differs
+    ss._studio_db_synced = {} if not saved_inputs else {
+        name: table_row_hashes(_studio_db_frame(name, ss[name]), key or "Position")
+        for name, (_, key) in STUDIO_DB_TABLES.items()
+    }
+    ss._studio_db_synced_inputs = dict(saved_inputs)
+
+def sync_studio_db():
+    """Write only what changed since the last sync (rows per table, keys of inputs)."""
+    conn = ss.get("_studio_db_conn")
+    if conn is None:
+        return 0
+    writes = 0
+    for name, (_, key) in STUDIO_DB_TABLES.items():
+        current = _studio_db_frame(name, ss[name])
+        added, changed, deleted = diff_against_hashes(ss._studio_db_synced.get(name), current, key or "Position")
+        if len(added) or len(changed) or deleted:
+            studio_db_write_changes(conn, name, added, changed, deleted)
+            writes += len(added) + len(changed) + len(deleted)
+        ss._studio_db_synced[name] = table_row_hashes(current, key or "Position")
+    changed_inputs = {k: v for k, v in ss.inputs.items() if ss._studio_db_synced_inputs.get(k, object()) != v}
+    if changed_inputs:
+        studio_db_write_values(conn, "inputs", changed_inputs)
+        ss._studio_db_synced_inputs.update(changed_inputs)
+        writes += len(changed_inputs)
+    studio_db_write_values(conn, "studio_values", {"recipe_grams_per_piece": ss.recipe_grams_per_piece})
+    return writes
 
 
 # ------------ Session defaults ------------
@@ -955,45 +389,7 @@ if "shrink_units" not in ss:
     ss.shrink_units = "in"
 
 if "inputs" not in ss:
-    ss.inputs = dict(
-        units_made=1,
-        clay_price_per_bag=50.0,
-        clay_bag_weight_lb=25.0,
-        clay_weight_per_piece_lb=1.0,
-        clay_yield=0.9,
-        packaging_per_piece=0.0,
-        kwh_rate=0.24,  # Al's actual rate
-        kwh_bisque=30.0,  # Keep electric defaults for those who use electric
-        kwh_glaze=35.0, 
-        kwh_third=0.0, 
-        pieces_per_electric_firing=40,
-        labor_rate=15.0, 
-        hours_per_piece=0.25,
-        overhead_per_month=500.0, 
-        pieces_per_month=200,
-        use_2x2x2=False, 
-        wholesale_margin_pct=50, 
-        retail_multiplier=2.0,
-        # Al's propane data
-        fuel_gas="Propane",  # Default to propane since that's what Al uses
-        lp_price_per_gal=3.50, 
-        lp_gal_bisque=4.7,  # Al's 1 tank = ~4.7 gallons
-        lp_gal_glaze=9.4,   # Al's 2 tanks = ~9.4 gallons
-        pieces_per_gas_firing=40,  # We can adjust this if Al tells us his typical load
-        ng_price_per_therm=1.20, 
-        ng_therms_bisque=0.0, 
-        ng_therms_glaze=0.0,
-        # wood firing defaults (keeping your originals)
-        wood_price_per_cord=300.0, 
-        wood_price_per_facecord=120.0,
-        wood_cords_bisque=0.0, 
-        wood_cords_glaze=0.0, 
-        wood_cords_third=0.0,
-        wood_facecords_bisque=0.0, 
-        wood_facecords_glaze=0.0, 
-        wood_facecords_third=0.0,
-        pieces_per_wood_firing=40,
-    )
+    ss.inputs = dict(DEFAULT_INPUTS)
 
 if "catalog_df" not in ss:
     ss.catalog_df = pd.DataFrame([
@@ -1019,6 +415,35 @@ if "glaze_piece_df" not in ss:
         {"Material":"Frit 3134","Cost_per_lb":0.00,"Grams_per_piece":0.0},
     ])
 
+if "glaze_library_df" not in ss:
+    ss.glaze_library_df = ensure_cols(None, GLAZE_LIBRARY_SCHEMA)
+
+if "form_glazes_df" not in ss:
+    ss.form_glazes_df = ensure_cols(None, FORM_GLAZE_SCHEMA)
+
+if "production_schedule_df" not in ss:
+    ss.production_schedule_df = ensure_cols(None, PRODUCTION_SCHEDULE_SCHEMA)
+
+if "inventory_ledger_df" not in ss:
+    ss.inventory_ledger_df = ensure_cols(None, INVENTORY_LEDGER_SCHEMA)
+
+if "clay_bodies_df" not in ss:
+    ss.clay_bodies_df = ensure_cols(None, CLAY_BODY_SCHEMA)
+
+# The studio's own oxide analyses; typical ones cover every other material
+if "oxide_analysis_df" not in ss:
+    ss.oxide_analysis_df = ensure_cols(None, OXIDE_ANALYSIS_SCHEMA)
+
+# Row-level edits from the table editors: revision per table, the last few change sets, recent events
+if "table_revisions" not in ss:
+    ss.table_revisions = {}
+    ss.table_changes = {}
+    ss.change_events = []
+
+if "recipe_state" not in ss:
+    ss.recipe_state = RecipeState(ss.recipe_df)
+    ss.recipe_df = ss.recipe_state.recipe
+
 # other materials default
 if "other_mat_df" not in ss:
     ss.other_mat_df = pd.DataFrame([
@@ -1028,116 +453,39 @@ if "other_mat_df" not in ss:
 # Initialize unified form system (replaces old separate form databases)
 init_unified_forms()
     
-# ------------ Glaze helpers ------------
-def glaze_cost_from_piece_table(df):
-    gdf = ensure_cols(df, {"Material": "", "Cost_per_lb": 0.0, "Grams_per_piece": 0.0}).copy()
-    gdf["Cost_per_g"] = gdf["Cost_per_lb"] / 453.592
-    gdf["Cost_per_piece"] = gdf["Cost_per_g"] * gdf["Grams_per_piece"]
-    return float(gdf["Cost_per_piece"].sum()), gdf
-
-def percent_recipe_table(catalog_df, recipe_df, batch_g):
-    price_map = {
-        str(r["Material"]).strip().lower(): float(r["Cost_per_lb"]) / 453.592
-        for _, r in ensure_cols(catalog_df, {"Material": "", "Cost_per_lb": 0.0}).iterrows()
-    }
-    rdf = ensure_cols(recipe_df, {"Material": "", "Percent": 0.0}).copy()
-    tot = float(rdf["Percent"].sum()) or 100.0
-    rows = []
-    for _, r in rdf.iterrows():
-        name = str(r["Material"]).strip()
-        pct = float(r["Percent"])
-        grams = batch_g * pct / tot
-        cost = grams * price_map.get(name.lower(), 0.0)
-        rows.append({
-            "Material": name, "Percent": pct,
-            "Grams": round(grams, 2),
-            "Ounces": round(grams / 28.3495, 2),
-            "Pounds": round(grams / 453.592, 3),
-            "Cost": cost
-        })
-    out = pd.DataFrame(rows)
-    batch_total = float(out["Cost"].sum()) if not out.empty else 0.0
-    cost_per_g = batch_total / batch_g if batch_g else 0.0
-    cost_per_oz = cost_per_g * 28.3495
-    cost_per_lb = cost_per_g * 453.592
-    return out, batch_total, cost_per_g, cost_per_oz, cost_per_lb
-
-def glaze_per_piece_from_recipe(catalog_df, recipe_df, grams_per_piece):
-    price_map = {
-        str(r["Material"]).strip().lower(): float(r["Cost_per_lb"]) / 453.592
-        for _, r in ensure_cols(catalog_df, {"Material": "", "Cost_per_lb": 0.0}).iterrows()
-    }
-    rdf = ensure_cols(recipe_df, {"Material": "", "Percent": 0.0}).copy()
-    tot = float(rdf["Percent"].sum()) or 100.0
-    rows = []
-    total_cost_pp = 0.0
-    for _, r in rdf.iterrows():
-        name = str(r["Material"]).strip()
-        pct = float(r["Percent"])
-        g = grams_per_piece * pct / tot
-        cost_pp = g * price_map.get(name.lower(), 0.0)
-        total_cost_pp += cost_pp
-        rows.append({
-            "Material": name,
-            "Percent": round(pct, 2),
-            "Grams_per_piece": round(g, 3),
-            "Ounces_per_piece": round(g / 28.3495, 3),
-            "Pounds_per_piece": round(g / 453.592, 4),
-            "Cost_per_piece": cost_pp
-        })
-    df = pd.DataFrame(rows)
-    return df, float(total_cost_pp)
-
-# ------------ Energy and totals ------------
-def calc_energy(ip):
-    e_cost = (ip.get("kwh_bisque", 0.0) + ip.get("kwh_glaze", 0.0) + ip.get("kwh_third", 0.0)) * ip.get("kwh_rate", 0.0)
-    e_pp = e_cost / max(1, int(ip.get("pieces_per_electric_firing", 40)))
-
-    fuel = str(ip.get("fuel_gas", "None")).strip()
-    fuel_pp = 0.0
-
-    if fuel == "Propane":
-        gas_cost = ip.get("lp_price_per_gal", 0.0) * (ip.get("lp_gal_bisque", 0.0) + ip.get("lp_gal_glaze", 0.0))
-        fuel_pp = gas_cost / max(1, int(ip.get("pieces_per_gas_firing", 40)))
-
-    elif fuel == "Natural Gas":
-        gas_cost = ip.get("ng_price_per_therm", 0.0) * (ip.get("ng_therms_bisque", 0.0) + ip.get("ng_therms_glaze", 0.0))
-        fuel_pp = gas_cost / max(1, int(ip.get("pieces_per_gas_firing", 40)))
-
-    elif fuel == "Wood":
-        wood_cost = (
-            ip.get("wood_price_per_cord", 0.0) * (ip.get("wood_cords_bisque", 0.0) + ip.get("wood_cords_glaze", 0.0) + ip.get("wood_cords_third", 0.0))
-            + ip.get("wood_price_per_facecord", 0.0) * (ip.get("wood_facecords_bisque", 0.0) + ip.get("wood_facecords_glaze", 0.0) + ip.get("wood_facecords_third", 0.0))
+# ------------ Studio database (optional) ------------
+with st.sidebar:
+    st.subheader("💾 Studio database")
+    use_studio_db = not SERVER_MODE and st.checkbox(
+        "Keep my data in a local database",
+        key="use_studio_db",
+        help="Saves forms, catalog, recipe, materials and inputs to one SQLite file on this computer as you work.",
+    )
+    if SERVER_MODE:
+        st.caption("This is a shared server, so nothing is stored here. Use **Save and Load** to keep your setup.")
+    else:
+        studio_db_name = st.text_input(
+            "Database name", value="studio.db", key="studio_db_name", disabled=not use_studio_db,
+            help=f"A file name only; it is kept in {studio_data_dir()}.",
         )
-        fuel_pp = wood_cost / max(1, int(ip.get("pieces_per_wood_firing", 40)))
-
-    return e_pp + fuel_pp
-
-def calc_totals(ip, glaze_per_piece_cost, other_pp: float = 0.0):
-    clay_cost_per_lb = ip["clay_price_per_bag"] / ip["clay_bag_weight_lb"] if ip["clay_bag_weight_lb"] else 0.0
-    clay_pp = (ip["clay_weight_per_piece_lb"] / max(ip["clay_yield"], 1e-9)) * clay_cost_per_lb
-    energy_pp = calc_energy(ip)
-    labor_pp = ip["labor_rate"] * ip["hours_per_piece"]
-    overhead_pp = ip["overhead_per_month"] / max(1, int(ip["pieces_per_month"]))
-
-    material_pp = clay_pp + glaze_per_piece_cost + ip["packaging_per_piece"] + other_pp
-    total_pp = material_pp + energy_pp + labor_pp + overhead_pp
-
-    if ip["use_2x2x2"]:
-        wholesale = total_pp * 2.0
-        retail = wholesale * 2.0
-        distributor = retail * 2.0
+    if use_studio_db:
+        try:
+            attach_studio_db(studio_db_path(studio_db_name))
+            st.caption(f"Changes are saved to `{ss._studio_db_path}` automatically.")
+        except Exception as e:
+            detach_studio_db()
+            st.error(f"Could not open studio database. {e}")
     else:
-        margin = ip["wholesale_margin_pct"] / 100.0
-        wholesale = total_pp / max(1e-9, 1.0 - margin) if margin < 1 else float("inf")
-        retail = wholesale * ip["retail_multiplier"]
-        distributor = None
-
-    return dict(
-        clay_pp=clay_pp, glaze_pp=glaze_per_piece_cost, pack_pp=ip["packaging_per_piece"],
-        other_pp=other_pp, energy_pp=energy_pp, labor_pp=labor_pp, oh_pp=overhead_pp,
-        total_pp=total_pp, wholesale=wholesale, retail=retail, distributor=distributor
+        detach_studio_db()
+    st.checkbox(
+        "⏱️ Show performance profiler",
+        key="perf_enabled",
+        help="Times each tab, the cost helpers and the data editors on every rerun.",
     )
+
+# After the database attach, which can replace the recipe
+sync_recipe_editor()
+
 st.title("Pottery Cost Analysis App")
 
 # Initialize unified form system (replaces old separate form databases)
@@ -1167,7 +515,7 @@ tab_titles = [
 tabs = st.tabs(tab_titles)
 
 # ------------- Quick Start Tab (POLISHED) -------------
-with tabs[0]:
+with tabs[0], perf_section("tab: Quick Start"):
     st.header("🎯 Quick Start")
     st.markdown("**Get pricing for your pottery in under 2 minutes**")
     
@@ -1186,7 +534,7 @@ with tabs[0]:
         
         # Form selector using unified form database
         init_unified_forms()  # Ensure unified forms are loaded
-        unified_forms = ss.unified_forms.copy()
+        unified_forms = ss.unified_forms
         
         # Get popular forms (first 20 or so)
         popular_forms = unified_forms.head(20)["Form"].tolist() if not unified_forms.empty else []
@@ -1215,6 +563,7 @@ with tabs[0]:
             
             # Auto-apply to session state
             ss.inputs["clay_weight_per_piece_lb"] = preset_clay_lb
+            ss.inputs["pieces_per_shelf"] = int(preset_row.get("Pieces_per_shelf", 0)) or DEFAULT_INPUTS["pieces_per_shelf"]
             ss.recipe_grams_per_piece = preset_glaze_g
             clay_weight = preset_clay_lb
             glaze_amount = preset_glaze_g
@@ -1237,14 +586,30 @@ with tabs[0]:
         col_a, col_b = st.columns(2)
         with col_a:
             # Clay cost - simplified with validation
-            clay_method = st.radio("Clay cost:", ["Per bag", "Per pound"], horizontal=True)
-            
-            if clay_method == "Per bag":
+            qs_bodies = clay_body_names(ss.clay_bodies_df)
+            clay_options = ["Per bag", "Per pound"] + (["Clay body"] if qs_bodies else [])
+            clay_method = st.radio(
+                "Clay cost:", clay_options, horizontal=True,
+                index=2 if qs_bodies and ss.inputs.get("clay_body") in qs_bodies else 0,
+            )
+            if clay_method != "Clay body":
+                ss.inputs["clay_body"] = ""
+
+            if clay_method == "Clay body":
+                qs_body = st.selectbox(
+                    "Clay body:", qs_bodies,
+                    index=qs_bodies.index(ss.inputs["clay_body"]) if ss.inputs.get("clay_body") in qs_bodies else 0,
+                )
+                ss.inputs["clay_body"] = qs_body
+                clay_per_lb = derived("clay_cost_per_lb")
+                st.caption(f"= {money(clay_per_lb)} per pound ({with_clay_body()['clay_bag_weight_lb']:g} lb bags). Edit bodies on the Per Unit tab.")
+                confidence_factors["clay"] = clay_per_lb > 0
+            elif clay_method == "Per bag":
                 bag_cost = st.number_input(
                     "Cost per bag:", 
                     min_value=0.0, 
                     max_value=200.0,
-                    value=50.0, 
+                    value=min(200.0, float(ss.inputs.get("clay_price_per_bag", 50.0))), 
                     step=1.0,
                     help="💡 Typical range: $25-80 per bag for stoneware"
                 )
@@ -1252,7 +617,7 @@ with tabs[0]:
                     "Bag weight (lb):", 
                     min_value=1.0, 
                     max_value=100.0,
-                    value=25.0, 
+                    value=min(100.0, max(1.0, float(ss.inputs.get("clay_bag_weight_lb", 25.0)))),
                     step=1.0,
                     help="💡 Most common: 25 or 50 lb bags"
                 )
@@ -1272,7 +637,7 @@ with tabs[0]:
                     "Cost per pound:", 
                     min_value=0.0, 
                     max_value=10.0,
-                    value=2.00, 
+                    value=min(10.0, float(derived("clay_cost_per_lb"))),
                     step=0.05,
                     help="💡 Typical range: $1-4 per pound"
                 )
@@ -1280,8 +645,10 @@ with tabs[0]:
                     st.warning("⚠️ Please enter a positive clay cost")
                     confidence_factors["clay"] = False
                 else:
-                    ss.inputs["clay_price_per_bag"] = clay_per_lb * 25  # Assume 25lb bags
-                    ss.inputs["clay_bag_weight_lb"] = 25.0
+                    # Keep the bag size already set; only the price per pound is known here
+                    bag_lb = float(ss.inputs.get("clay_bag_weight_lb") or 0.0) or DEFAULT_INPUTS["clay_bag_weight_lb"]
+                    ss.inputs["clay_price_per_bag"] = clay_per_lb * bag_lb
+                    ss.inputs["clay_bag_weight_lb"] = bag_lb
                     confidence_factors["clay"] = True
         
         with col_b:
@@ -1393,17 +760,23 @@ with tabs[0]:
         
         # Calculate costs using existing functions
         grams_pp = float(ss.get("recipe_grams_per_piece", glaze_amount))
-        _, glaze_pp_cost = glaze_per_piece_from_recipe(ss.catalog_df, ss.recipe_df, grams_pp)
+        _, glaze_pp_cost = derived("glaze_recipe", grams_per_piece=grams_pp)
+        
+        recipe_ids = derived("recipe_ids")
+        unpriced = recipe_ids.loc[(recipe_ids["Id"] < 0) & (recipe_ids["Material"] != ""), "Material"]
         
         # Use a simple glaze cost if recipe is empty
         if glaze_pp_cost <= 0:
             glaze_pp_cost = grams_pp * 0.01  # Rough estimate: 1 cent per gram
+            st.caption("Glaze estimated at 1¢ per gram: nothing in the recipe has a catalog price yet.")
+        elif len(unpriced):
+            st.caption(f"⚠️ Not in your catalog, so priced at $0: {', '.join(unpriced)} (see the Glaze Recipe tab).")
         
-        other_pp, _, _ = other_materials_pp(ss.other_mat_df, int(ss.inputs.get("units_made", 1)))
+        other_pp, _, _ = derived("other_materials")
         
         # Only calculate if we have valid inputs
         if confidence_factors.get("clay", False) and confidence_factors.get("labor", False):
-            totals = calc_totals(ss.inputs, glaze_pp_cost, other_pp)
+            totals = derived("totals", glaze_pp=glaze_pp_cost, other_pp=other_pp)
             
             # Display results prominently
             st.markdown("---")
@@ -1488,7 +861,7 @@ with tabs[0]:
 
 
 # ------------- Per unit -------------
-with tabs[1]:
+with tabs[1], perf_section("tab: Per Unit"):
     ip = ss.inputs
     left, right = st.columns(2)
 
@@ -1501,7 +874,7 @@ with tabs[1]:
         st.subheader("Form preset")
 
         # Use unified forms database
-        unified_forms = ss.unified_forms.copy()
+        unified_forms = ss.unified_forms
 
         # Dropdown of forms
         forms = list(unified_forms["Form"]) if not unified_forms.empty else []
@@ -1528,6 +901,7 @@ with tabs[1]:
 
             if st.button("Use this preset", key="apply_preset_btn"):
                 ip["clay_weight_per_piece_lb"] = preset_clay_lb
+                ip["pieces_per_shelf"] = int(row.get("Pieces_per_shelf", 0)) or DEFAULT_INPUTS["pieces_per_shelf"]
                 ss.recipe_grams_per_piece = preset_glaze_g
                 if preset_throwing_min > 0:
                     # Also update labor hours if timing data exists
@@ -1536,6 +910,19 @@ with tabs[1]:
                         ip["hours_per_piece"] = total_time_hours
                 st.success("Preset applied to clay weight, glaze amount, and labor time.")
 
+        # Pull more forms from the shared preset library
+        with st.expander("📚 Add forms from the preset library"):
+            library = preset_library()
+            lib_category = st.selectbox("Category", CATEGORY_ORDER, key="library_category")
+            have = set(ss.unified_forms["Form"].tolist())
+            lib_choices = [f for f in library.loc[library["Category"] == lib_category, "Form"].tolist() if f not in have]
+            lib_picked = st.multiselect("Forms", lib_choices, key="library_forms")
+            if st.button("Add to my forms", key="library_add_btn", disabled=not lib_picked):
+                picked_rows = library.loc[library["Form"].isin(lib_picked), list(UNIFIED_FORM_SCHEMA.keys())]
+                ss.unified_forms = compact_forms(pd.concat([ss.unified_forms, picked_rows], ignore_index=True))
+                st.success(f"Added {len(picked_rows)} form(s).")
+            st.caption(f"{len(library)} presets, shared by everyone using this app.")
+
         # Manage presets
         with st.expander("Manage unified forms (CSV import/export, inline edit)"):
             st.caption("Unified form database includes clay weight, glaze amount, timing data, and kiln info")
@@ -1562,38 +949,33 @@ with tabs[1]:
             with u2:
                 up = st.file_uploader("Upload unified forms CSV", type=["csv"], key="unified_csv_uploader")
 
-            if up is not None:
+            # Only import once per uploaded file, not on every rerun
+            up_id = (getattr(up, "file_id", None) or getattr(up, "name", None), upload_mode) if up is not None else None
+            if up is not None and ss.get("_unified_csv_import_id") != up_id:
                 try:
-                    new_df = pd.read_csv(up)
-                    # Ensure all required columns exist
-                    new_df = ensure_cols(new_df, UNIFIED_FORM_SCHEMA)
-                    
-                    # Clean and validate data
-                    for col, default_val in UNIFIED_FORM_SCHEMA.items():
-                        if isinstance(default_val, str):
-                            new_df[col] = new_df[col].astype(str).str.strip()
-                        elif isinstance(default_val, float):
-                            new_df[col] = pd.to_numeric(new_df[col], errors="coerce").fillna(default_val)
-                        elif isinstance(default_val, int):
-                            new_df[col] = pd.to_numeric(new_df[col], errors="coerce").fillna(default_val).astype(int)
-
-                    if upload_mode == "Replace":
-                        ss.unified_forms = new_df
-                    else:
-                        base = ss.unified_forms.copy()
-                        combo = pd.concat([base, new_df], ignore_index=True)
-                        ss.unified_forms = combo.drop_duplicates(subset=["Form"], keep="last").reset_index(drop=True)
-
-                    st.success(f"Loaded {len(new_df)} unified forms.")
+                    with st.spinner("Importing forms…"):
+                        chunks, csv_errors, csv_rejected = read_unified_forms_csv(up)
+                        base = ss.unified_forms if upload_mode == "Append" else pd.DataFrame(columns=list(UNIFIED_FORM_SCHEMA.keys()))
+                        merged, n_inserted, n_updated = upsert_unified_forms(base, chunks)
+                        ss.unified_forms = compact_forms(merged)
+                    ss._unified_csv_import_id = up_id
+                    st.success(f"Imported unified forms: {n_inserted} new, {n_updated} updated, {csv_rejected} rejected.")
+                    if csv_errors:
+                        with st.expander(f"⚠️ {len(csv_errors)} problem(s) in the CSV", expanded=False):
+                            st.dataframe(pd.DataFrame(csv_errors[:SETTINGS_MAX_REPORTED_ERRORS]), use_container_width=True)
                 except Exception as e:
                     st.error(f"Could not read CSV. {e}")
 
             st.caption("Edit rows below (add/delete allowed). All form data in one place!")
-            edited = st.data_editor(
-                ss.unified_forms,
+            edit_table(
+                "unified_forms", ss.unified_forms,
                 column_config={
                     "Form": st.column_config.TextColumn("Form"),
                     "Clay_lb_wet": st.column_config.NumberColumn("Clay (lb)", min_value=0.0, step=0.05),
+                    "Clay_body": st.column_config.SelectboxColumn(
+                        "Clay body", options=[""] + clay_body_names(ss.clay_bodies_df),
+                        help="Blank uses the clay set below. Bodies are listed under Clay bodies.",
+                    ),
                     "Default_glaze_g": st.column_config.NumberColumn("Glaze (g)", min_value=0.0, step=1.0),
                     "Throwing_min": st.column_config.NumberColumn("Throwing (min)", min_value=0.0, step=0.1),
                     "Trimming_min": st.column_config.NumberColumn("Trimming (min)", min_value=0.0, step=0.1),
@@ -1606,7 +988,6 @@ with tabs[1]:
                 use_container_width=True,
                 key="unified_forms_editor",
             )
-            ss.unified_forms = edited.copy()
             
 
         # ---------- Clay & packaging ----------
@@ -1616,11 +997,40 @@ with tabs[1]:
         ip["units_made"] = st.number_input(
             "Units in this batch", min_value=1, value=int(ip["units_made"]), step=1
         )
-        ip["clay_price_per_bag"] = st.number_input(
-            "Clay price per bag", min_value=0.0, value=float(ip["clay_price_per_bag"]), step=0.5
+        with st.expander("🧱 Clay bodies", expanded=False):
+            st.caption(
+                "Every clay you throw, with its bag price and size, yield, shrink and how much of the "
+                "trimmings and slurry you reclaim. Pick one per form in the forms table; forms left blank use the clay below."
+            )
+            ss.clay_bodies_df = data_editor(
+                ensure_cols(ss.clay_bodies_df, CLAY_BODY_SCHEMA),
+                column_config={
+                    "Clay_body": st.column_config.TextColumn("Clay body"),
+                    "Price_per_bag": st.column_config.NumberColumn("Price per bag", min_value=0.0, step=0.5, format="$%.2f"),
+                    "Bag_lb": st.column_config.NumberColumn("Bag (lb)", min_value=0.1, step=1.0),
+                    "Yield": st.column_config.NumberColumn("Yield", min_value=0.05, max_value=1.0, step=0.01),
+                    "Shrink_pct": st.column_config.NumberColumn("Shrink %", min_value=0.0, max_value=40.0, step=0.5),
+                    "Reclaim_pct": st.column_config.NumberColumn("Reclaimed %", min_value=0.0, max_value=100.0, step=5.0),
+                    "Reclaim_cost_per_lb": st.column_config.NumberColumn("Reclaim cost per lb", min_value=0.0, step=0.05, format="$%.2f"),
+                },
+                num_rows="dynamic", use_container_width=True, key="clay_bodies_editor",
+            )
+        body_options = [""] + clay_body_names(ss.clay_bodies_df)
+        ip["clay_body"] = st.selectbox(
+            "Clay body", body_options,
+            index=body_options.index(ip.get("clay_body", "")) if ip.get("clay_body", "") in body_options else 0,
+            format_func=lambda b: b or "None (enter the clay below)",
+        )
+        # The body's values are shown (greyed out) but never written into ip, so your own clay is kept
+        clay = with_clay_body(ip)
+        body_locked = clay is not ip
+        if body_locked:
+            st.caption(f"Clay below comes from {ip['clay_body']}; change it under Clay bodies.")
+        clay_price = st.number_input(
+            "Clay price per bag", min_value=0.0, value=float(clay["clay_price_per_bag"]), step=0.5, disabled=body_locked
         )
-        ip["clay_bag_weight_lb"] = st.number_input(
-            "Clay bag weight lb", min_value=0.1, value=float(ip["clay_bag_weight_lb"]), step=0.1
+        bag_lb = st.number_input(
+            "Clay bag weight lb", min_value=0.1, value=float(clay["clay_bag_weight_lb"]), step=0.1, disabled=body_locked
         )
         ip["clay_weight_per_piece_lb"] = st.number_input(
             "Clay weight per piece lb (wet)",
@@ -1628,19 +1038,37 @@ with tabs[1]:
             value=float(ip["clay_weight_per_piece_lb"]),
             step=0.1,
         )
-        ip["clay_yield"] = st.slider(
+        clay_yield = st.slider(
             "Clay yield after trimming and loss",
             min_value=0.5,
             max_value=1.0,
-            value=float(ip.get("clay_yield", 0.9)),
+            value=min(1.0, max(0.5, float(clay.get("clay_yield", 0.9)))),
             step=0.01,
             help="Fraction of the starting ball that ends up in the finished piece. 1.00 means no loss; 0.85 means 15% loss.",
+            disabled=body_locked,
+        )
+        rc1, rc2 = st.columns(2)
+        reclaim_pct = rc1.slider(
+            "Trimmings and slurry reclaimed (%)", min_value=0.0, max_value=100.0,
+            value=float(clay.get("clay_reclaim_pct", 0.0)), step=5.0, disabled=body_locked,
+            help="Share of the lost clay you recycle. It is credited back at the clay price less the reclaim cost.",
         )
+        reclaim_cost = rc2.number_input(
+            "Reclaim cost per lb", min_value=0.0, value=float(clay.get("clay_reclaim_cost_per_lb", 0.0)), step=0.05,
+            disabled=body_locked, help="Your time and pugmill running per pound reclaimed.",
+        )
+        if not body_locked:
+            ip.update(clay_price_per_bag=clay_price, clay_bag_weight_lb=bag_lb, clay_yield=clay_yield,
+                      clay_reclaim_pct=reclaim_pct, clay_reclaim_cost_per_lb=reclaim_cost)
+            clay = ip
         throw_weight = float(ip.get("clay_weight_per_piece_lb", 0.0))
-        yield_frac = float(ip.get("clay_yield", 1.0))
+        yield_frac = float(clay.get("clay_yield", 1.0))
         effective_lb = throw_weight / max(yield_frac, 1e-9)
         waste_pct = (1.0 - yield_frac) * 100.0
         st.caption(f"You pay for about {effective_lb:.2f} lb of clay per finished piece given {waste_pct:.0f}% loss.")
+        if clay["clay_reclaim_pct"] > 0:
+            gross_pp = effective_lb * derived("clay_cost_per_lb", ip)
+            st.caption(f"Reclaiming {clay['clay_reclaim_pct']:.0f}% of the scraps credits back {money(gross_pp - derived('clay_pp', ip))} per piece.")
 
         ip["packaging_per_piece"] = st.number_input(
             "Packaging per piece", min_value=0.0, value=float(ip["packaging_per_piece"]), step=0.1
@@ -1672,6 +1100,11 @@ with tabs[1]:
             if st.button("Use this shrink percent", key="btn_use_shrink_pct"):
                 ss.shrink_rate_pct = float(shrink_from_test)
                 st.toast("Shrink percent set", icon="✅")
+            if ip.get("clay_body") in clay_body_names(ss.clay_bodies_df):
+                body_shrink = float(ensure_cols(ss.clay_bodies_df, CLAY_BODY_SCHEMA).set_index("Clay_body")["Shrink_pct"].get(ip["clay_body"], 0.0))
+                if st.button(f"Use {ip['clay_body']} shrink ({body_shrink:g}%)", key="btn_use_body_shrink"):
+                    ss.shrink_rate_pct = body_shrink
+                    st.toast("Shrink percent set", icon="✅")
 
             # units (WIDGET controls session_state)
             st.markdown("**Units**")
@@ -1776,7 +1209,7 @@ with tabs[1]:
 
         if glaze_source == "Manual table":
             st.caption("Edit names, cost per lb, and grams per piece.")
-            ss.glaze_piece_df = st.data_editor(
+            ss.glaze_piece_df = data_editor(
                 ensure_cols(
                     ss.glaze_piece_df, {"Material": "", "Cost_per_lb": 0.0, "Grams_per_piece": 0.0}
                 ),
@@ -1789,10 +1222,9 @@ with tabs[1]:
                 use_container_width=True,
                 key="glaze_piece_editor_front",
             )
-            glaze_pp_cost, source_df = glaze_cost_from_piece_table(ss.glaze_piece_df)
+            glaze_pp_cost, source_df = derived("glaze_table", ip)
         else:
-            grams_pp = float(ss.get("recipe_grams_per_piece", 8.0))
-            source_df, glaze_pp_cost = glaze_per_piece_from_recipe(ss.catalog_df, ss.recipe_df, grams_pp)
+            source_df, glaze_pp_cost = derived("glaze_recipe", ip)
 
         st.subheader("Glaze per piece and cost")
         _show_df = source_df.copy()
@@ -1811,17 +1243,12 @@ with tabs[1]:
         st.caption("Add one-time items for this batch. The cost is divided by the number of pieces in the batch.")
 
         pieces = max(1, int(ip["units_made"]))
-        base = ensure_cols(
-            ss.other_mat_df,
-            {"Item": "", "Unit": "", "Cost_per_unit": 0.0, "Quantity_for_project": 0.0},
-        ).copy()
-        base["Cost_per_unit"] = pd.to_numeric(base["Cost_per_unit"], errors="coerce").fillna(0.0)
-        base["Quantity_for_project"] = pd.to_numeric(base["Quantity_for_project"], errors="coerce").fillna(0.0)
-        base["Line_total"] = base["Cost_per_unit"] * base["Quantity_for_project"]
-        base["Cost_per_piece"] = base["Line_total"] / pieces
-
-        ss.other_mat_df = st.data_editor(
-            base,
+        conform_table("other_mat_df")
+        line_total = ss.other_mat_df["Cost_per_unit"] * ss.other_mat_df["Quantity_for_project"]
+        base = ss.other_mat_df.assign(Line_total=line_total, Cost_per_piece=line_total / pieces)
+
+        edit_table(
+            "other_mat_df", base,
             column_config={
                 "Item": st.column_config.TextColumn("Item"),
                 "Unit": st.column_config.TextColumn("Unit"),
@@ -1835,7 +1262,7 @@ with tabs[1]:
             key="other_materials_editor_main",
         )
 
-        project_total = float(ss.other_mat_df["Line_total"].sum()) if "Line_total" in ss.other_mat_df else 0.0
+        project_total = float((ss.other_mat_df["Cost_per_unit"] * ss.other_mat_df["Quantity_for_project"]).sum())
         other_pp = project_total / pieces
         st.caption(f"Project total {money(project_total)} • Adds {money(other_pp)} per piece")
         
@@ -1843,7 +1270,7 @@ with tabs[1]:
         # Totals
         
         st.subheader("Per piece totals")
-        totals = calc_totals(ip, glaze_pp_cost, other_pp)
+        totals = derived("totals", ip, glaze_pp=glaze_pp_cost, other_pp=other_pp)
 
         c = st.columns(3)
         c[0].metric("Energy", money(totals["energy_pp"]))
@@ -1857,7 +1284,7 @@ with tabs[1]:
 
 
 # ------------ Glaze recipe ------------
-with tabs[2]:
+with tabs[2], perf_section("tab: Glaze Recipe"):
     if ss.get("guidance_type") == "glaze":
         st.success("✅ **Perfect!** Here you can create custom glaze recipes and track material costs.")
         st.markdown("💡 **Quick tip:** Your Quick Start used a simple estimate. Build your recipe below for precise glaze costing.")
@@ -1872,16 +1299,26 @@ with tabs[2]:
     with st.expander("➕ Add new materials to catalog", expanded=False):
         st.caption("Select from 50+ common materials or enter custom names")
         
-        # Get list of materials already in catalog
-        current_materials = list(ss.catalog_df["Material"].str.strip().str.lower()) if not ss.catalog_df.empty else []
-        common_materials = get_common_materials_list()
-        
-        # Filter out materials already in catalog
-        available_materials = [m for m in common_materials if m.lower() not in current_materials]
+        catalog_index = catalog_material_index()
+        common_index = common_material_index()
         
         add_col1, add_col2, add_col3 = st.columns([2, 1, 1])
         
+        # Catalog names as the common list spells them ("Silica 325m" is Flint (Silica))
+        in_catalog = [common_index.resolve(m) or m for m in catalog_index.names]
+        
         with add_col1:
+            material_query = st.text_input("Search materials:", key="material_search", placeholder="e.g. silica 325, custer, rio")
+            if material_query.strip():
+                # Ranked fuzzy matches, aliases included, leaving out what the catalog already has
+                available_materials = common_index.search(material_query, exclude=in_catalog)
+                already = catalog_index.search(material_query, limit=3)
+                if already:
+                    st.caption("Already in your catalog: " + ", ".join(f"**{m}**" for m in already))
+            else:
+                in_catalog = {material_key(m) for m in in_catalog}
+                available_materials = [m for m in common_index.names if material_key(m) not in in_catalog]
+            
             # Searchable dropdown with custom option
             material_options = ["-- Select Material --"] + available_materials + ["⌨️ Enter Custom Name"]
             selected_material = st.selectbox(
@@ -1892,8 +1329,8 @@ with tabs[2]:
             
             # Custom name input if needed
             if selected_material == "⌨️ Enter Custom Name":
-                custom_material = st.text_input("Enter custom material name:", key="custom_material_name")
-                final_material_name = custom_material.strip()
+                custom_material = st.text_input("Enter custom material name:", value=material_query.strip(), key="custom_material_name")
+                final_material_name = " ".join(custom_material.split())
             elif selected_material != "-- Select Material --":
                 final_material_name = selected_material
             else:
@@ -1923,36 +1360,36 @@ with tabs[2]:
                 
                 # Add to catalog
                 new_df = pd.concat([ss.catalog_df, pd.DataFrame([new_row])], ignore_index=True)
-                ss.catalog_df = new_df.drop_duplicates(subset=["Material"], keep="last").reset_index(drop=True)
+                # Same material in another case or spacing replaces the old row
+                ss.catalog_df = new_df[~material_keys(new_df["Material"]).duplicated(keep="last")].reset_index(drop=True)
                 
                 st.success(f"Added {final_material_name}!")
                 st.rerun()
 
     # REGULAR CATALOG EDITOR
-    if ss.catalog_unit == "lb":
-        edited = st.data_editor(
-            ensure_cols(ss.catalog_df, {"Material": "", "Cost_per_lb": 0.0}),
-            column_config={
-                "Material": st.column_config.TextColumn("Material"),
-                "Cost_per_lb": st.column_config.NumberColumn("Cost per lb", min_value=0.0, step=0.01),
-            },
-            num_rows="dynamic", use_container_width=True, key="catalog_editor_lb"
-        )
-        edited = ensure_cols(edited, {"Material": "", "Cost_per_lb": 0.0})
-        edited["Cost_per_kg"] = edited["Cost_per_lb"] * 2.20462
-        ss.catalog_df = edited[["Material", "Cost_per_lb", "Cost_per_kg"]]
-    else:
-        edited = st.data_editor(
-            ensure_cols(ss.catalog_df, {"Material": "", "Cost_per_kg": 0.0}),
-            column_config={
-                "Material": st.column_config.TextColumn("Material"),
-                "Cost_per_kg": st.column_config.NumberColumn("Cost per kg", min_value=0.0, step=0.01),
-            },
-            num_rows="dynamic", use_container_width=True, key="catalog_editor_kg"
-        )
-        edited = ensure_cols(edited, {"Material": "", "Cost_per_kg": 0.0})
-        edited["Cost_per_lb"] = edited["Cost_per_kg"] / 2.20462
-        ss.catalog_df = edited[["Material", "Cost_per_lb", "Cost_per_kg"]]
+    # Both units are stored; an edit in one fills in the other for just that row
+    if "Cost_per_kg" not in ss.catalog_df:
+        ss.catalog_df = ss.catalog_df.assign(Cost_per_kg=pd.to_numeric(ss.catalog_df.get("Cost_per_lb", 0.0)) * 2.20462)
+    elif "Cost_per_lb" not in ss.catalog_df:
+        ss.catalog_df = ss.catalog_df.assign(Cost_per_lb=pd.to_numeric(ss.catalog_df["Cost_per_kg"]) / 2.20462)
+    conform_table("catalog_df")
+    shown, other, factor = ("Cost_per_lb", "Cost_per_kg", 2.20462) if ss.catalog_unit == "lb" else ("Cost_per_kg", "Cost_per_lb", 1 / 2.20462)
+
+    def other_unit(changes):
+        for cells in changes["edited"].values():
+            if shown in cells:
+                cells[other] = cells[shown] * factor
+        changes["added"][other] = changes["added"][shown] * factor
+        return changes
+
+    edit_table(
+        "catalog_df", ss.catalog_df[["Material", shown]],
+        column_config={
+            "Material": st.column_config.TextColumn("Material"),
+            shown: st.column_config.NumberColumn(f"Cost per {ss.catalog_unit}", min_value=0.0, step=0.01),
+        },
+        num_rows="dynamic", use_container_width=True, key=f"catalog_editor_{ss.catalog_unit}", derive=other_unit,
+    )
 
     # RECIPE SECTION WITH SEARCHABLE MATERIALS
     st.subheader("Recipe in percent")
@@ -1960,20 +1397,27 @@ with tabs[2]:
     with st.expander("➕ Add materials to recipe", expanded=False):
         recipe_col1, recipe_col2, recipe_col3 = st.columns([2, 1, 1])
         
-        # Get materials from catalog for recipe dropdown
-        catalog_materials = list(ss.catalog_df["Material"].str.strip()) if not ss.catalog_df.empty else []
-        recipe_materials = list(ss.recipe_df["Material"].str.strip()) if not ss.recipe_df.empty else []
-        
-        # Available materials not yet in recipe
-        available_for_recipe = [m for m in catalog_materials if m not in recipe_materials]
+        catalog_index = catalog_material_index()
+        recipe_materials = list(ss.recipe_df["Material"].astype(str)) if not ss.recipe_df.empty else []
         
         with recipe_col1:
+            recipe_query = st.text_input("Search catalog:", key="recipe_material_search")
+            if recipe_query.strip():
+                available_for_recipe = catalog_index.search(recipe_query, exclude=recipe_materials)
+            else:
+                # Available materials not yet in recipe
+                in_recipe = {material_key(m) for m in recipe_materials}
+                available_for_recipe = [m for m in catalog_index.names if material_key(m) not in in_recipe]
+            
             recipe_options = ["-- Select from Catalog --"] + available_for_recipe + ["⌨️ Enter New Material"]
             selected_recipe_material = st.selectbox("Add material to recipe:", recipe_options, key="recipe_material_selector")
             
             if selected_recipe_material == "⌨️ Enter New Material":
-                custom_recipe_material = st.text_input("Material name:", key="custom_recipe_material")
-                final_recipe_material = custom_recipe_material.strip()
+                custom_recipe_material = st.text_input("Material name:", value=recipe_query.strip(), key="custom_recipe_material")
+                # Use the catalog's spelling when the name (or an alias) is already there, so it prices
+                final_recipe_material = catalog_index.resolve(custom_recipe_material) or " ".join(custom_recipe_material.split())
+                if final_recipe_material and material_key(final_recipe_material) != material_key(custom_recipe_material):
+                    st.caption(f"Matches **{final_recipe_material}** in your catalog.")
             elif selected_recipe_material != "-- Select from Catalog --":
                 final_recipe_material = selected_recipe_material
             else:
@@ -1984,33 +1428,33 @@ with tabs[2]:
         
         with recipe_col3:
             if st.button("Add to Recipe", key="add_recipe_btn") and final_recipe_material and recipe_percent >= 0:
-                # Create new row
-                new_recipe_row = {"Material": final_recipe_material, "Percent": recipe_percent}
-                
-                # Add to recipe dataframe
-                if ss.recipe_df.empty:
-                    ss.recipe_df = pd.DataFrame([new_recipe_row])
-                else:
-                    # Remove if already exists, then add (to avoid duplicates)
-                    ss.recipe_df = ss.recipe_df[ss.recipe_df["Material"] != final_recipe_material]
-                    new_recipe_df = pd.concat([ss.recipe_df, pd.DataFrame([new_recipe_row])], ignore_index=True)
-                    ss.recipe_df = new_recipe_df
-                
+                # Replaces a row of the same material; the editor below picks it up in this run
+                ss.recipe_state.add(final_recipe_material, recipe_percent)
+                ss.recipe_df = ss.recipe_state.recipe
+                ss.table_revisions["recipe_df"] = ss.recipe_state.revision
                 st.success(f"Added {final_recipe_material} at {recipe_percent}%!")
-                st.rerun()
-
-    # REGULAR RECIPE EDITOR (with dynamic key for refresh)
-    recipe_editor_key = f"recipe_editor_{len(ss.recipe_df)}"  # Key changes when length changes
 
-    ss.recipe_df = st.data_editor(
-        ensure_cols(ss.recipe_df, {"Material": "", "Percent": 0.0}),
+    # REGULAR RECIPE EDITOR
+    # One key for good: edits stay in the editor's own state on top of recipe_state.base
+    # (folded into ss.recipe_df at the top of the script); only add, move and loads remount it
+    if len(ss.recipe_df) > 1:
+        mv1, mv2, mv3 = st.columns([3, 1, 1])
+        move_labels = [f"{i + 1}. {m or '(blank)'}" for i, m in enumerate(ss.recipe_df["Material"].tolist())]
+        move_pick = mv1.selectbox("Move ingredient", move_labels, key="recipe_move_pick")
+        for col, label, offset in ((mv2, "⬆️ Up", -1), (mv3, "⬇️ Down", 1)):
+            if col.button(label, key=f"recipe_move_{'up' if offset < 0 else 'down'}_btn"):
+                ss.recipe_state.move(move_labels.index(move_pick), offset)
+                ss.recipe_df = ss.recipe_state.recipe
+                ss.table_revisions["recipe_df"] = ss.recipe_state.revision
+    data_editor(
+        ss.recipe_state.base,
         column_config={
             "Material": st.column_config.TextColumn("Material"),
             "Percent": st.column_config.NumberColumn("Percent", min_value=0.0, step=0.1),
         },
-        num_rows="dynamic", 
-        use_container_width=True, 
-        key=recipe_editor_key  # Dynamic key forces refresh when recipe changes
+        num_rows="dynamic",
+        use_container_width=True,
+        key="recipe_editor",
     )
 
     # BATCH CALCULATION SECTION
@@ -2034,7 +1478,7 @@ with tabs[2]:
     if batch_g <= 0:
         st.warning("Enter a positive batch size")
     else:
-        out, batch_total, cpg, cpo, cpl = percent_recipe_table(ss.catalog_df, ss.recipe_df, batch_g)
+        out, batch_total, cpg, cpo, cpl = percent_recipe_table(ss.catalog_df, ss.recipe_df, batch_g, derived("material_catalog"))
 
         st.caption(f"Batch size {batch_g:.0f} g  •  {batch_g/28.3495:.2f} oz  •  {batch_g/453.592:.3f} lb")
         show = out.copy()
@@ -2048,6 +1492,30 @@ with tabs[2]:
         col3.metric("Cost per ounce", money(cpo))
         st.metric("Cost per pound", money(cpl))
 
+    # Names the catalog doesn't know cost nothing; list them rather than under-price quietly
+    unpriced = unresolved_materials(derived("material_catalog"), save_glaze_recipe(ss.glaze_library_df, CURRENT_RECIPE_GLAZE, ss.recipe_df))
+    if not unpriced.empty:
+        with st.expander(f"⚠️ {unpriced['Material'].nunique()} material name(s) aren't in the catalog and cost $0", expanded=True):
+            st.caption("Add them to the catalog above, or rename them to the suggested catalog material. "
+                       "Unpriced % is how much of each glaze is costing nothing right now.")
+            st.dataframe(
+                unpriced,
+                column_config={
+                    "Share_pct": st.column_config.NumberColumn("Share of glaze", format="%.1f%%"),
+                    "Glaze_unpriced_pct": st.column_config.NumberColumn("Unpriced %", format="%.1f%%"),
+                    "Costed_per_kg": st.column_config.NumberColumn("Costed per kg", format="$%.2f"),
+                },
+                hide_index=True, use_container_width=True,
+            )
+            renames = unpriced.loc[unpriced["Suggestion"] != ""].drop_duplicates("Material")
+            if len(renames) and st.button(f"✏️ Rename {len(renames)} to the suggestions", key="unpriced_rename_btn"):
+                to = pd.Series(renames["Suggestion"].to_numpy(), index=material_keys(renames["Material"]).to_numpy())
+                for table in ("recipe_df", "glaze_library_df"):
+                    df = ss[table].copy()
+                    df["Material"] = material_keys(df["Material"]).map(to).fillna(df["Material"]).to_numpy()
+                    ss[table] = df
+                st.rerun()
+
     # PER PIECE CALCULATION SECTION
     st.subheader("Per piece cost")
     
@@ -2060,10 +1528,359 @@ with tabs[2]:
             st.caption("Enter a valid batch size above to see per-piece cost")
     except ValueError:
         st.warning("Please enter a number for grams per piece")
+
+    # GLAZE LIBRARY
+    st.subheader("Glaze library")
+    st.caption("Keep every glaze you run. All of them share the catalog above, so a material price change updates them all.")
+    lib_c1, lib_c2 = st.columns([3, 1])
+    library_name = lib_c1.text_input("Save the recipe above as", placeholder="e.g. Celadon liner", key="glaze_library_name")
+    if lib_c2.button("💾 Save to library", key="glaze_library_save_btn") and library_name.strip():
+        ss.glaze_library_df = save_glaze_recipe(ss.glaze_library_df, library_name, ss.recipe_df)
+        st.success(f"Saved {library_name.strip()} to the library.")
+
+    library_names = glaze_library_names(ss.glaze_library_df)
+    if library_names:
+        library_costs = derived("glaze_library_costs")
+        st.dataframe(
+            pd.DataFrame({"Glaze": library_costs.index, "Cost_per_g": library_costs.to_numpy(), "Cost_per_100g": library_costs.to_numpy() * 100}),
+            column_config={
+                "Cost_per_g": st.column_config.NumberColumn("Cost per g", format="$%.4f"),
+                "Cost_per_100g": st.column_config.NumberColumn("Cost per 100 g", format="$%.2f"),
+            },
+            hide_index=True, use_container_width=True,
+        )
+        pick_c1, pick_c2, pick_c3 = st.columns([3, 1, 1])
+        library_pick = pick_c1.selectbox("Library glaze", library_names, key="glaze_library_pick")
+        if pick_c2.button("✏️ Load into editor", key="glaze_library_load_btn"):
+            ss.recipe_df = glaze_library_recipe(ss.glaze_library_df, library_pick)
+            st.rerun()
+        if pick_c3.button("🗑️ Delete", key="glaze_library_delete_btn"):
+            lib = ss.glaze_library_df
+            ss.glaze_library_df = lib[lib["Glaze"].astype(str).str.strip() != library_pick].reset_index(drop=True)
+            st.rerun()
+    else:
+        st.caption("No saved glazes yet.")
+
+    # GLAZE CHEMISTRY
+    with st.expander("⚗️ Glaze chemistry (UMF)", expanded=False):
+        st.caption(
+            "Unity formula and fired oxide % for the recipe above and every library glaze, worked out from "
+            "the oxide analyses below (typical supplier numbers unless you enter your own). Check the "
+            "chemistry against the cost before swapping in a cheaper material."
+        )
+        chem_library = save_glaze_recipe(ss.glaze_library_df, CURRENT_RECIPE_GLAZE, ss.recipe_df)
+        umf, oxide_pct, chem_summary = with_current_recipe("glaze_chemistry")
+        if chem_summary.empty:
+            st.caption("Add materials to the recipe or save glazes to the library to see their chemistry.")
+        else:
+            chem_costs = derived("glaze_library_costs", glaze_library_df=chem_library)
+            chem_view = chem_summary.assign(Cost_per_kg=chem_costs.reindex(chem_summary.index).fillna(0.0).to_numpy() * 1000)
+            st.dataframe(
+                chem_view.reset_index(),
+                column_config={
+                    **{c: st.column_config.NumberColumn(c, format="%.3f") for c in ["SiO2", "Al2O3", "B2O3", "R2O", "RO"]},
+                    "Si_Al": st.column_config.NumberColumn("Si:Al", format="%.2f"),
+                    "LOI_pct": st.column_config.NumberColumn("LOI", format="%.1f%%"),
+                    "Unanalyzed_pct": st.column_config.NumberColumn("No analysis", format="%.1f%%"),
+                    "Cost_per_kg": st.column_config.NumberColumn("Cost per kg", format="$%.2f"),
+                },
+                hide_index=True, use_container_width=True,
+            )
+            if (chem_view["Unanalyzed_pct"] > 0).any():
+                st.caption("No analysis = share of the recipe with no oxide analysis; add those materials below.")
+            if len(chem_view) > 1:
+                st.scatter_chart(chem_view.reset_index(), x="Si_Al", y="Cost_per_kg")
+            chem_pick = st.selectbox("Unity formula for", chem_view.index.tolist(), key="chem_glaze_pick")
+            group = pd.Series("RO2 / other", index=umf.columns)
+            group[list(R2O_OXIDES)] = "R2O flux"
+            group[list(RO_OXIDES)] = "RO flux"
+            group[["Al2O3", "B2O3", "Fe2O3", "Cr2O3"]] = "R2O3"
+            formula = pd.DataFrame({"Group": group, "UMF": umf.loc[chem_pick], "Weight_pct": oxide_pct.loc[chem_pick]})
+            st.dataframe(
+                formula[formula["Weight_pct"] > 0].rename_axis("Oxide").reset_index(),
+                column_config={
+                    "UMF": st.column_config.NumberColumn("UMF", format="%.3f"),
+                    "Weight_pct": st.column_config.NumberColumn("Fired weight %", format="%.2f"),
+                },
+                hide_index=True, use_container_width=True,
+            )
+
+        st.markdown("**Your oxide analyses** (weight % of the raw material; rows here replace the typical ones)")
+        ss.oxide_analysis_df = data_editor(
+            ensure_cols(ss.oxide_analysis_df, OXIDE_ANALYSIS_SCHEMA),
+            column_config={"Material": st.column_config.TextColumn("Material")},
+            num_rows="dynamic", use_container_width=True, key="oxide_analysis_editor",
+        )
+        if st.button("📋 Copy typical analyses for my catalog", key="oxide_copy_typical_btn"):
+            typical = oxide_analyses()
+            lookup = MaterialCatalog(typical[["Material"]])
+            wanted = pd.concat([ss.catalog_df["Material"], ss.recipe_df["Material"]]).astype(str).str.strip()
+            wanted = wanted[(wanted != "") & ~material_keys(wanted).duplicated().to_numpy()]
+            ids = lookup.ids(wanted)
+            have = MaterialCatalog(ss.oxide_analysis_df).ids(wanted) >= 0
+            pick = (ids >= 0) & ~have
+            rows = typical.iloc[lookup.rows[ids[pick]]].assign(Material=wanted[pick].to_numpy())
+            ss.oxide_analysis_df = ensure_cols(pd.concat([ss.oxide_analysis_df, rows], ignore_index=True), OXIDE_ANALYSIS_SCHEMA)
+            st.success(f"Copied {len(rows)} analyses you can now edit.")
+            st.rerun()
+
+    # CHEAPER REFORMULATION
+    with st.expander("💸 Cheaper recipes with the same chemistry", expanded=False):
+        st.caption(
+            "For the recipe above and every library glaze, the lowest-cost mix of your priced catalog materials "
+            "that keeps each oxide's unity formula within the tolerance. Rerun it when a price jumps "
+            "(a frit or Gerstley Borate, say) to see what reformulating would save."
+        )
+        tolerance_pct = st.number_input(
+            "Tolerance on each oxide (% of its UMF)", min_value=0.5, max_value=25.0, value=5.0, step=0.5,
+            key="reformulation_tolerance_pct",
+        )
+        chem_library = save_glaze_recipe(ss.glaze_library_df, CURRENT_RECIPE_GLAZE, ss.recipe_df)
+        cheaper_recipes, cheaper = with_current_recipe("cheapest_reformulation", reformulation_tolerance_pct=float(tolerance_pct))
+        cheaper = cheaper.sort_values("Saving_per_kg", ascending=False, kind="stable").reset_index(drop=True)
+        if cheaper.empty:
+            st.caption("Add materials to the recipe or save glazes to the library first.")
+        else:
+            st.dataframe(
+                cheaper,
+                column_config={
+                    **{c: st.column_config.NumberColumn(c.replace("_", " "), format="$%.2f")
+                       for c in ["Cost_per_kg_now", "Cost_per_kg_new", "Saving_per_kg"]},
+                    "Saving_per_piece": st.column_config.NumberColumn(
+                        f"Saving per piece ({ss.recipe_grams_per_piece:g} g)", format="$%.3f"),
+                },
+                hide_index=True, use_container_width=True,
+            )
+            found = cheaper.loc[cheaper["Status"] == "Cheaper", "Glaze"].tolist()
+            if found:
+                swap_pick = st.selectbox("Compare", found, key="reformulation_pick")
+                materials = derived("material_catalog")
+                grams_pp = float(ss.recipe_grams_per_piece)
+                old_table, old_pp = glaze_per_piece_from_recipe(None, glaze_library_recipe(chem_library, swap_pick), grams_pp, materials)
+                new_recipe = glaze_library_recipe(cheaper_recipes, swap_pick)
+                new_table, new_pp = glaze_per_piece_from_recipe(None, new_recipe, grams_pp, materials)
+                sw1, sw2 = st.columns(2)
+                sw1.markdown("**Now**")
+                sw1.dataframe(old_table[["Material", "Percent", "Cost_per_piece"]], hide_index=True, use_container_width=True)
+                sw2.markdown("**Cheapest**")
+                sw2.dataframe(new_table[["Material", "Percent", "Cost_per_piece"]], hide_index=True, use_container_width=True)
+                st.metric("Glaze cost per piece", money(new_pp), delta=f"-{money(old_pp - new_pp)}", delta_color="inverse")
+                umf_now, _, _ = with_current_recipe("glaze_chemistry")
+                umf_new, _, _ = glaze_chemistry(new_recipe.assign(Glaze=swap_pick), ss.oxide_analysis_df)
+                umf_both = pd.DataFrame({"Now": umf_now.loc[swap_pick], "Cheapest": umf_new.loc[swap_pick]})
+                st.dataframe(
+                    umf_both[(umf_both > 0.0005).any(axis=1)].rename_axis("Oxide").reset_index(),
+                    column_config={c: st.column_config.NumberColumn(f"UMF {c.lower()}", format="%.3f") for c in ["Now", "Cheapest"]},
+                    hide_index=True, use_container_width=True,
+                )
+                sv1, sv2 = st.columns(2)
+                if sv1.button("✏️ Load into editor", key="reformulation_load_btn"):
+                    ss.recipe_df = new_recipe
+                    st.rerun()
+                save_as = f"{swap_pick} (cheaper)"
+                if sv2.button(f"💾 Save as {save_as}", key="reformulation_save_btn"):
+                    ss.glaze_library_df = save_glaze_recipe(ss.glaze_library_df, save_as, new_recipe)
+                    st.success(f"Saved {save_as} to the library.")
+            elif (cheaper["Status"] == "Already cheapest").any():
+                st.caption("No cheaper mix within the tolerance; try a wider one.")
+
+    # GLAZES PER FORM
+    st.subheader("Glazes per form")
+    st.caption(
+        "One row per glaze a form gets (liner, exterior, ...) with the grams it uses per piece. "
+        "Forms without rows here use their default glaze grams and the recipe above."
+    )
+    ss.form_glazes_df = data_editor(
+        ensure_cols(ss.form_glazes_df, FORM_GLAZE_SCHEMA),
+        column_config={
+            "Form": st.column_config.SelectboxColumn("Form", options=ss.unified_forms["Form"].tolist()),
+            "Glaze": st.column_config.SelectboxColumn("Glaze", options=library_names),
+            "Grams": st.column_config.NumberColumn("Grams per piece", min_value=0.0, step=1.0),
+        },
+        num_rows="dynamic", use_container_width=True, key="form_glazes_editor",
+    )
+    assigned_costs = derived("form_glaze_costs")
+    if not assigned_costs.empty:
+        st.caption(f"{len(assigned_costs)} form(s) costed from library glazes")
+        st.dataframe(
+            pd.DataFrame({"Form": assigned_costs.index, "Glaze_cost_per_piece": assigned_costs.to_numpy()}),
+            column_config={"Glaze_cost_per_piece": st.column_config.NumberColumn("Glaze cost per piece", format="$%.2f")},
+            hide_index=True, use_container_width=True,
+        )
+
+    # BATCH MIXING PLANNER
+    with st.expander("🧪 Batch mixing planner (production week)", expanded=False):
+        st.caption(
+            "List what you're making this week. Every glaze batch is sized from the glazes per form above "
+            "and the material pulls are combined into one list, checked against what's on the shelf "
+            "(stock comes from the inventory ledger below)."
+        )
+        ss.production_schedule_df = data_editor(
+            ensure_cols(ss.production_schedule_df, PRODUCTION_SCHEDULE_SCHEMA),
+            column_config={
+                "Form": st.column_config.SelectboxColumn("Form", options=ss.unified_forms["Form"].tolist()),
+                "Pieces": st.column_config.NumberColumn("Pieces", min_value=0, step=1),
+                "Due": st.column_config.TextColumn("Due (yyyy-mm-dd)"),
+            },
+            num_rows="dynamic", use_container_width=True, key="production_schedule_editor",
+        )
+        extra_pct = st.number_input("Extra for bucket and dipping losses (%)", min_value=0.0, max_value=200.0, value=10.0, step=5.0, key="mix_extra_pct")
+        stock_positions = derived("inventory_positions")
+
+        grams_by_glaze = glaze_grams_needed(ss.production_schedule_df, ss.unified_forms, ss.form_glazes_df, extra_pct)
+        if grams_by_glaze.empty:
+            st.caption("Add forms and piece counts to plan the week's glaze batches.")
+        else:
+            planner_library = save_glaze_recipe(ss.glaze_library_df, CURRENT_RECIPE_GLAZE, ss.recipe_df)
+            with perf_section("batch mixing plan"):
+                mix_sheet, pull_list, glaze_totals = batch_mixing_plan(ss.catalog_df, planner_library, grams_by_glaze, stock_positions)
+
+            plan_c = st.columns(3)
+            plan_c[0].metric("Glaze to mix", f"{glaze_totals['Grams'].sum() / 1000:,.1f} kg")
+            plan_c[1].metric("Material cost", money(pull_list["Cost"].sum()))
+            plan_c[2].metric("To buy", money(pull_list["Buy_cost"].sum()))
+            if glaze_totals["Cost"].isna().any():
+                st.warning("Not in the library: " + ", ".join(glaze_totals.loc[glaze_totals["Cost"].isna(), "Glaze"]))
+            if not pull_list["In_catalog"].all():
+                st.warning("Not in the catalog (costed at $0): " + ", ".join(pull_list.loc[~pull_list["In_catalog"], "Material"]))
+
+            st.markdown("**Batches**")
+            st.dataframe(
+                glaze_totals,
+                column_config={
+                    "Grams": st.column_config.NumberColumn("Grams", format="%.0f"),
+                    "Cost": st.column_config.NumberColumn("Batch cost", format="$%.2f"),
+                },
+                hide_index=True, use_container_width=True,
+            )
+            st.markdown("**Pull list**")
+            st.dataframe(
+                pull_list.drop(columns="In_catalog"),
+                column_config={
+                    "Needed_g": st.column_config.NumberColumn("Needed (g)", format="%.0f"),
+                    "On_hand_g": st.column_config.NumberColumn("On hand (g)", format="%.0f"),
+                    "To_buy_g": st.column_config.NumberColumn("To buy (g)", format="%.0f"),
+                    "To_buy_lb": st.column_config.NumberColumn("To buy (lb)", format="%.2f"),
+                    "Cost_per_lb": st.column_config.NumberColumn("Cost per lb", format="$%.2f"),
+                    "Cost": st.column_config.NumberColumn("Cost", format="$%.2f"),
+                    "Buy_cost": st.column_config.NumberColumn("Buy cost", format="$%.2f"),
+                    "Used_in": st.column_config.NumberColumn("Glazes using it"),
+                },
+                hide_index=True, use_container_width=True,
+            )
+            pull_c1, pull_c2 = st.columns(2)
+            pull_c1.download_button(
+                "Download pull list CSV", pull_list.round(2).to_csv(index=False).encode("utf-8"),
+                file_name="glaze_pull_list.csv", mime="text/csv", key="pull_list_download",
+            )
+            if pull_c2.button("📦 Record these pulls as used", key="pull_list_record_btn"):
+                ss.inventory_ledger_df = append_ledger(ss.inventory_ledger_df, ledger_entries(
+                    pull_list["Material"].tolist(), pull_list["Needed_g"].round(1).tolist(), "Use",
+                    date=_dt.date.today().isoformat(), note="Glaze batches",
+                ))
+                st.success(f"Logged {len(pull_list)} material use(s) in the inventory ledger.")
+            st.markdown("**Weigh-out sheet (grams per batch)**")
+            st.dataframe(mix_sheet, use_container_width=True)
+
+    # MATERIAL INVENTORY
+    with st.expander("📦 Material inventory and costing", expanded=False):
+        st.caption(
+            "Log material as it comes in and gets used. Stock on hand, what it cost and how long it "
+            "will last all come from this ledger."
+        )
+        inv_c1, inv_c2, inv_c3 = st.columns([2, 1, 1])
+        known_materials = list(dict.fromkeys(
+            [m for m in ss.catalog_df["Material"].astype(str).str.strip() if m] + derived("inventory_positions")["Material"].tolist()
+        ))
+        entry_material = inv_c1.selectbox("Material", known_materials, index=None, accept_new_options=True,
+                                          placeholder="Pick or type a material", key="inventory_entry_material")
+        entry_kind = inv_c2.radio("Entry", INVENTORY_KINDS, horizontal=True, key="inventory_entry_kind",
+                                  help="Adjust takes a signed amount, e.g. -200 for a spill or the difference after a stock count.")
+        entry_date = inv_c3.date_input("Date", value=_dt.date.today(), key="inventory_entry_date")
+        amt_c1, amt_c2, amt_c3, amt_c4 = st.columns([1, 1, 1, 2])
+        entry_amount = amt_c1.number_input("Amount", value=0.0, step=1.0, key="inventory_entry_amount")
+        entry_unit = amt_c2.selectbox("Unit", ["lb", "kg", "g"], key="inventory_entry_unit")
+        entry_cost = amt_c3.number_input("Total paid ($)", min_value=0.0, step=1.0, key="inventory_entry_cost",
+                                         disabled=entry_kind == "Use")
+        entry_note = amt_c4.text_input("Note", placeholder="supplier, invoice, batch...", key="inventory_entry_note")
+        if st.button("➕ Add to ledger", key="inventory_add_btn") and entry_material and entry_amount:
+            grams = entry_amount * {"lb": 453.592, "kg": 1000.0, "g": 1.0}[entry_unit]
+            ss.inventory_ledger_df = append_ledger(ss.inventory_ledger_df, ledger_entries(
+                entry_material, grams, entry_kind, 0.0 if entry_kind == "Use" else entry_cost, entry_date.isoformat(), entry_note,
+            ))
+            st.success(f"Logged {entry_kind.lower()} of {entry_amount:g} {entry_unit} {entry_material}.")
+
+        ss.inputs["inventory_costing"] = st.radio(
+            "Cost stock by", INVENTORY_COSTING, horizontal=True, key="inventory_costing_pick",
+            index=INVENTORY_COSTING.index(ss.inputs.get("inventory_costing", "FIFO")) if ss.inputs.get("inventory_costing") in INVENTORY_COSTING else 0,
+            help="FIFO: what's on the shelf is costed at the most recent purchases. Weighted average: every purchase is averaged into the stock.",
+        )
+        stock_positions = derived("inventory_positions")
+        if stock_positions.empty:
+            st.caption("No entries yet.")
+        else:
+            schedule_grams = schedule_glaze_grams(ss.production_schedule_df, ss.unified_forms, ss.form_glazes_df, ss.get("mix_extra_pct", 10.0))
+            with perf_section("stockout forecast"):
+                needs, need_names = schedule_material_needs(schedule_grams, save_glaze_recipe(ss.glaze_library_df, CURRENT_RECIPE_GLAZE, ss.recipe_df))
+                forecast = stockout_forecast(stock_positions, ss.inventory_ledger_df, needs, need_names)
+            cat = ensure_cols(ss.catalog_df, {"Material": "", "Cost_per_lb": 0.0})
+            cat_names = cat["Material"].astype(str).str.strip()
+            catalog_lb = pd.Series(cat["Cost_per_lb"].to_numpy(), index=material_keys(cat_names))
+            catalog_lb = catalog_lb[~catalog_lb.index.duplicated(keep="last")]
+            stock_view = forecast.join(stock_positions[["Value", "Cost_per_lb"]]).assign(
+                On_hand_lb=lambda d: d["On_hand_g"] / 453.592,
+                Catalog_per_lb=lambda d: catalog_lb.reindex(d.index).to_numpy(),
+            )
+            # Materials the schedule needs but the ledger has never seen: show the catalog's spelling
+            unseen = ~stock_view.index.isin(stock_positions.index)
+            spelling = pd.Series(cat_names.to_numpy(), index=material_keys(cat_names).to_numpy())
+            spelling = spelling[~spelling.index.duplicated(keep="last")]
+            stock_view.loc[unseen, "Material"] = spelling.reindex(stock_view.index[unseen]).fillna(stock_view.loc[unseen, "Material"]).to_numpy()
+            inv_m = st.columns(3)
+            inv_m[0].metric("Stock value", money(stock_positions["Value"].sum()))
+            inv_m[1].metric("Materials in stock", int((stock_positions["On_hand_g"] > 0).sum()))
+            inv_m[2].metric("Run out before the schedule is done", int((forecast["Runs_out_by"] != "").sum()))
+            st.dataframe(
+                stock_view[["Material", "On_hand_g", "On_hand_lb", "Value", "Cost_per_lb", "Catalog_per_lb",
+                            "Use_per_day_g", "Days_left", "Scheduled_g", "Runs_out_by"]],
+                column_config={
+                    "On_hand_g": st.column_config.NumberColumn("On hand (g)", format="%.0f"),
+                    "On_hand_lb": st.column_config.NumberColumn("On hand (lb)", format="%.2f"),
+                    "Value": st.column_config.NumberColumn("Value", format="$%.2f"),
+                    "Cost_per_lb": st.column_config.NumberColumn("Stock cost per lb", format="$%.2f"),
+                    "Catalog_per_lb": st.column_config.NumberColumn("Catalog per lb", format="$%.2f"),
+                    "Use_per_day_g": st.column_config.NumberColumn("Used per day (g, last 90 days)", format="%.1f"),
+                    "Days_left": st.column_config.NumberColumn("Days left at that rate", format="%.0f"),
+                    "Scheduled_g": st.column_config.NumberColumn("Schedule needs (g)", format="%.0f"),
+                    "Runs_out_by": st.column_config.TextColumn("Runs out by (schedule)"),
+                },
+                hide_index=True, use_container_width=True,
+            )
+            if st.button("💲 Use stock costs as catalog prices", key="inventory_to_catalog_btn",
+                         help="Sets each catalog material's price to what the stock on hand cost (or its last purchase)."):
+                ss.catalog_df, n_updated = catalog_with_inventory_costs(ss.catalog_df, stock_positions)
+                st.success(f"Updated {n_updated} catalog price(s).")
+                st.rerun()
+
+        st.markdown(f"**Ledger** ({len(ss.inventory_ledger_df):,} entries, newest first)")
+        st.dataframe(ss.inventory_ledger_df.tail(50).iloc[::-1], hide_index=True, use_container_width=True)
+        led_c1, led_c2, led_c3 = st.columns(3)
+        led_c1.download_button(
+            "Download ledger CSV", ss.inventory_ledger_df.to_csv(index=False).encode("utf-8"),
+            file_name="material_ledger.csv", mime="text/csv", key="ledger_download",
+        )
+        if led_c2.button("↩️ Undo last entry", key="ledger_undo_btn", disabled=ss.inventory_ledger_df.empty):
+            ss.inventory_ledger_df = ss.inventory_ledger_df.iloc[:-1]
+            st.rerun()
+        ledger_up = led_c3.file_uploader("Append entries from CSV", type=["csv"], key="ledger_csv_upload")
+        if ledger_up is not None and st.button("Append file to ledger", key="ledger_csv_append_btn"):
+            ss.inventory_ledger_df = append_ledger(ss.inventory_ledger_df, pd.read_csv(ledger_up, dtype={"Date": str, "Note": str}, keep_default_na=False))
+            st.success("Entries appended.")
+            st.rerun()
     
 
 # ------------ Energy ------------
-with tabs[3]:
+with tabs[3], perf_section("tab: Energy"):
     if ss.get("guidance_type") == "energy":
         st.success("✅ **Great choice!** Set up your exact kiln costs here.")
         st.markdown("💡 **Your Quick Start assumed basic costs.** Enter your specific rates and usage below for precision.")
@@ -2391,10 +2208,87 @@ with tabs[3]:
                 help="💡 Default 0 = no cost"
             )
     
+    # FIRING LOGS
+    with st.expander("📈 Fill these in from your kiln's firing logs", expanded=False):
+        st.caption(
+            "Upload a CSV export from your kiln controller: a time, a temperature and a kWh or gas meter reading per row, "
+            "plus kiln, firing, cone, load_lb or firing_type columns if it has them. Each kiln gets a fit of energy "
+            "against cone, load and time of year, and the fit suggests the firing values above."
+        )
+        log_up = st.file_uploader("Firing log CSV", type=["csv"], key="firing_log_upload")
+        # Only import once per uploaded file, not on every rerun
+        log_id = (getattr(log_up, "file_id", None) or getattr(log_up, "name", None)) if log_up is not None else None
+        if log_up is not None and ss.get("_firing_log_id") != log_id:
+            try:
+                with st.spinner("Reading firing log…"):
+                    ss.firing_log = read_firing_log(log_up)
+                ss._firing_log_id = log_id
+            except Exception as e:
+                st.error(f"Could not read firing log. {e}")
+        if ss.get("firing_log") is not None:
+            firings, meter = ss.firing_log
+            models = fit_kiln_energy(firings)
+            gas_fuel = "Natural Gas" if ip["fuel_gas"] == "Natural Gas" else "Propane"
+            suggestions = suggest_energy_inputs(firings, models, meter, gas_fuel)
+            st.write(f"{len(firings)} firing(s) on {firings['Kiln'].nunique()} kiln(s), "
+                     f"{firings['Start'].min():%b %Y} to {firings['Start'].max():%b %Y}, energy in {meter}.")
+            st.dataframe(
+                models,
+                column_config={c: st.column_config.NumberColumn(c, format="%.3f") for c in models.columns[2:]},
+                hide_index=True,
+                use_container_width=True,
+            )
+            if suggestions.empty:
+                st.info("No bisque or glaze firings with a cone to suggest values from.")
+            else:
+                kilns = suggestions["Kiln"].unique().tolist()
+                log_kiln = st.selectbox("Kiln", kilns, key="firing_log_kiln") if len(kilns) > 1 else kilns[0]
+                pick = suggestions[suggestions["Kiln"] == log_kiln]
+                st.dataframe(
+                    pick.assign(Current=[float(ip.get(k, 0.0)) for k in pick["Input"]]).drop(columns="Kiln"),
+                    column_config={
+                        "Suggested": st.column_config.NumberColumn("Suggested", format="%.2f"),
+                        "Median_logged": st.column_config.NumberColumn("Median logged", format="%.2f"),
+                        "Load_lb": st.column_config.NumberColumn("Load (lb)", format="%.0f"),
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                )
+                if st.button("Use these values", key="firing_log_apply_btn"):
+                    for row in pick.itertuples():
+                        ip[row.Input] = round(row.Suggested, 2)
+                    st.rerun()
+
+    # BIG AND SMALL PIECES
+    st.subheader("Big and small pieces")
+    allocation = str(ip.get("energy_allocation", "Per piece"))
+    ip["energy_allocation"] = st.radio(
+        "Share each firing by",
+        ENERGY_ALLOCATIONS,
+        index=ENERGY_ALLOCATIONS.index(allocation) if allocation in ENERGY_ALLOCATIONS else 0,
+        horizontal=True,
+        help="Clay weight: a 7 lb casserole carries 7x the energy of a 1 lb piece. "
+             "Shelf space: a form that fits 3 to a shelf carries 4x one that fits 12.",
+    )
+    if ip["energy_allocation"] == "Clay weight":
+        ip["typical_piece_lb"] = st.number_input(
+            "Typical piece (lb of clay)", min_value=0.1, value=float(ip.get("typical_piece_lb", 1.0)), step=0.1
+        )
+    elif ip["energy_allocation"] == "Shelf space":
+        ip["typical_pieces_per_shelf"] = st.number_input(
+            "Typical pieces per shelf", min_value=1, value=int(ip.get("typical_pieces_per_shelf", 12)), step=1
+        )
+
     # RESULTS SECTION
     st.subheader("Per piece energy cost")
-    energy_cost = calc_energy(ip)
+    energy_cost = derived("energy_pp", ip)
     st.metric("Energy per piece", money(energy_cost))
+    if ip["energy_allocation"] == "Clay weight":
+        st.caption(f"For a typical {ip['typical_piece_lb']:g} lb piece; each form's cost scales it by its clay weight "
+                   f"({money(derived('piece_energy_pp', ip))} for the {ip['clay_weight_per_piece_lb']:g} lb piece being costed).")
+    elif ip["energy_allocation"] == "Shelf space":
+        st.caption(f"For a piece that fits {ip['typical_pieces_per_shelf']} to a shelf; each form's cost scales it by its pieces per shelf "
+                   f"({money(derived('piece_energy_pp', ip))} for the piece being costed, {ip.get('pieces_per_shelf', 12)} to a shelf).")
     
     # Detailed breakdown
     if energy_cost > 0:
@@ -2422,7 +2316,7 @@ with tabs[3]:
     else:
         st.caption("💡 Set your firing costs above to see energy cost per piece")
 
-with tabs[4]:  # Production Planning tab
+with tabs[4], perf_section("tab: Production Planning"):  # Production Planning tab
     st.header("🏭 Production Planning")
     st.markdown("**Plan your pottery production with real studio workflow**")
     
@@ -2430,7 +2324,7 @@ with tabs[4]:  # Production Planning tab
     st.subheader("1. What are you making?")
     
     # Get all available forms from unified database
-    unified_forms = ss.unified_forms.copy()
+    unified_forms = ss.unified_forms
     available_forms = list(unified_forms["Form"]) if not unified_forms.empty else []
     
     selected_form = st.selectbox(
@@ -2606,8 +2500,9 @@ with tabs[4]:  # Production Planning tab
         cost_col3.metric("Total labor hours", f"{labor_hours_total:.1f} hrs")
         
         # Use current cost settings to estimate order cost
-        clay_cost_per_lb = ss.inputs["clay_price_per_bag"] / ss.inputs["clay_bag_weight_lb"] if ss.inputs["clay_bag_weight_lb"] else 0.0
-        total_clay_cost = (clay_weight_total / ss.inputs.get("clay_yield", 0.9)) * clay_cost_per_lb
+        order_body = str(form_data.get("Clay_body", "")).strip()
+        order_ip = dict(ss.inputs, clay_body=order_body) if order_body in clay_body_names(ss.clay_bodies_df) else ss.inputs
+        total_clay_cost = derived("clay_pp", dict(order_ip, clay_weight_per_piece_lb=clay_weight_total))
         total_labor_cost = labor_hours_total * ss.inputs.get("labor_rate", 15.0)
         
         st.write(f"**Estimated order costs:**")
@@ -2618,6 +2513,9 @@ with tabs[4]:  # Production Planning tab
         # QUICK APPLY TO COST CALCULATOR
         if st.button("📊 Use this form in cost calculator"):
             ss.inputs["clay_weight_per_piece_lb"] = form_data["Clay_lb_wet"]
+            ss.inputs["pieces_per_shelf"] = int(form_data.get("Pieces_per_shelf", 0)) or DEFAULT_INPUTS["pieces_per_shelf"]
+            if str(form_data.get("Clay_body", "")).strip():
+                ss.inputs["clay_body"] = str(form_data["Clay_body"]).strip()
             ss.recipe_grams_per_piece = form_data["Default_glaze_g"]
             total_time_hours = (form_data["Throwing_min"] + form_data["Trimming_min"] + 
                               form_data["Handling_min"] + form_data["Glazing_min"]) / 60.0
@@ -2633,13 +2531,13 @@ with tabs[4]:  # Production Planning tab
             st.markdown("**Step-by-step timeline:**")
             current_time = 0
             
-with tabs[5]:  # Kiln Load Planner
+with tabs[5], perf_section("tab: Kiln Load Planner"):  # Kiln Load Planner
     st.header("🔥 Kiln Load Planner")
     st.markdown("**Plan your kiln loads with cost calculations**")
     
     # Initialize session state for kiln planning
-    if "kiln_shelves" not in ss:
-        ss.kiln_shelves = []
+    if "kiln_load" not in ss:
+        ss.kiln_load = KilnLoad.empty()
     if "firing_type" not in ss:
         ss.firing_type = "Bisque"
     
@@ -2661,213 +2559,111 @@ with tabs[5]:  # Kiln Load Planner
             st.warning("💡 **Glaze firing:** Leave space between pieces, no touching, use stilts")
     
     st.markdown("---")
-    
-    # SHELF MANAGEMENT
-    shelf_col1, shelf_col2 = st.columns([2, 1])
-    
-    with shelf_col1:
-        st.subheader("📚 Kiln Shelves")
-        
-        if st.button("➕ Add Shelf", key="add_shelf_btn"):
-            new_shelf = {
-                "shelf_id": len(ss.kiln_shelves),
-                "capacity": 12,  # Default capacity
-                "items": []  # List of {form, quantity} dicts
-            }
-            ss.kiln_shelves.append(new_shelf)
-            st.rerun()
-    
-    with shelf_col2:
-        if len(ss.kiln_shelves) > 0:
-            st.metric("Total Shelves", len(ss.kiln_shelves))
-            
-            # Clear all shelves button
-            if st.button("🗑️ Clear All Shelves", key="clear_all_shelves"):
-                ss.kiln_shelves = []
-                st.rerun()
-    
-    # DISPLAY SHELVES
-    if not ss.kiln_shelves:
-        st.info("👆 Click 'Add Shelf' to start planning your kiln load")
+
+    # SHELVES AND CONTENTS
+    # One form: edits to shelves and pieces are applied together on submit, not a rerun per click
+    load = ss.kiln_load
+    st.subheader("📚 Kiln Shelves")
+    if load.pieces and st.button("🗑️ Clear All Shelves", key="clear_all_shelves"):
+        ss.kiln_load = load = KilnLoad(capacity=load.capacity)
+    with st.form("kiln_load_form"):
+        shelf_count = st.number_input("Shelves", min_value=1, max_value=20, value=max(1, len(load.capacity)), step=1,
+                                      key="kiln_shelf_count")
+        capacity_edit = data_editor(
+            load.capacity_table(),
+            column_config={c: st.column_config.NumberColumn(c, min_value=1, max_value=50, step=1) for c in load.capacity_table().columns},
+            use_container_width=True,
+            key="kiln_capacity_editor",
+        )
+        st.caption("Pieces of each form on each shelf (add a row per form):")
+        load_edit = data_editor(
+            load.load_table(),
+            column_config={
+                "Form": st.column_config.SelectboxColumn("Form", options=ss.unified_forms["Form"].tolist()),
+                **{c: st.column_config.NumberColumn(c, min_value=0, step=1) for c in kiln_shelf_columns(len(load.capacity))},
+            },
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            key="kiln_load_editor",
+        )
+        if st.form_submit_button("Update kiln load"):
+            ss.kiln_load = load = KilnLoad.from_tables(capacity_edit, load_edit, shelf_count)
+
+    firing_type = ss.firing_type.lower()
+    energy_per_firing = kiln_firing_cost(ss.inputs, ss.firing_type)
+    shelves, loaded_forms, kiln_totals = kiln_load_summary(
+        load, energy_per_firing, kiln_energy_weights(load, ss.unified_forms, ss.inputs)
+    )
+
+    # SHELF UTILIZATION
+    st.dataframe(
+        shelves[["Shelf", "Max_pieces", "Pieces", "Utilization_pct"]],
+        column_config={
+            "Max_pieces": st.column_config.NumberColumn("Max pieces"),
+            "Utilization_pct": st.column_config.ProgressColumn("Used", format="%.0f%%", min_value=0, max_value=100),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    over = shelves[shelves["Over_capacity"]]
+    if len(over):
+        st.error("Not enough space on " + ", ".join(f"{r.Shelf} ({r.Pieces}/{r.Max_pieces})" for r in over.itertuples()))
+
+    if not kiln_totals["pieces"]:
+        st.info("👆 Add forms to the shelves above to start planning your kiln load")
     else:
-        total_pieces = 0
-        all_items = []  # For cost calculation
-        
-        for i, shelf in enumerate(ss.kiln_shelves):
-            st.markdown(f"### Shelf {i+1}")
-            
-            shelf_setup_col, shelf_content_col, shelf_actions_col = st.columns([1, 2, 1])
-            
-            # SHELF CAPACITY
-            with shelf_setup_col:
-                shelf["capacity"] = st.number_input(
-                    f"Max pieces:",
-                    min_value=1,
-                    max_value=50,
-                    value=shelf["capacity"],
-                    step=1,
-                    key=f"shelf_{i}_capacity"
-                )
-                
-                # Remove shelf button
-                if st.button(f"🗑️ Remove", key=f"remove_shelf_{i}"):
-                    ss.kiln_shelves.pop(i)
-                    st.rerun()
-            
-            # ADD ITEMS TO SHELF
-            with shelf_content_col:
-                # Form selector - get available forms
-                unified_forms = ss.unified_forms.copy()
-                available_forms = list(unified_forms["Form"]) if not unified_forms.empty else []
-                
-                add_col1, add_col2, add_col3 = st.columns([2, 1, 1])
-                
-                with add_col1:
-                    selected_form = st.selectbox(
-                        "Add form:",
-                        ["Select form...", "➕ Custom Entry"] + available_forms,
-                        key=f"shelf_{i}_form_selector"
-                    )
-                
-                with add_col2:
-                    quantity = st.number_input(
-                        "Qty:",
-                        min_value=1,
-                        max_value=shelf["capacity"],
-                        value=1,
-                        key=f"shelf_{i}_quantity"
-                    )
-                
-                with add_col3:
-                    if st.button("Add", key=f"shelf_{i}_add_btn"):
-                        if selected_form not in ["Select form...", "➕ Custom Entry"]:
-                            # Check if there's room
-                            current_items = sum(item["quantity"] for item in shelf["items"])
-                            if current_items + quantity <= shelf["capacity"]:
-                                # Add to shelf
-                                shelf["items"].append({
-                                    "form": selected_form,
-                                    "quantity": quantity
-                                })
-                                st.rerun()
-                            else:
-                                st.error(f"Not enough space! Shelf capacity: {shelf['capacity']}, Current: {current_items}")
-                        elif selected_form == "➕ Custom Entry":
-                            # Handle custom entry
-                            st.info("💡 Enter custom form name in the selectbox above")
-                
-                # CURRENT SHELF CONTENTS
-                if shelf["items"]:
-                    st.markdown("**Current contents:**")
-                    shelf_total = 0
-                    for j, item in enumerate(shelf["items"]):
-                        item_col1, item_col2 = st.columns([3, 1])
-                        with item_col1:
-                            st.write(f"• {item['quantity']}× {item['form']}")
-                        with item_col2:
-                            if st.button("Remove", key=f"shelf_{i}_item_{j}_remove"):
-                                shelf["items"].pop(j)
-                                st.rerun()
-                        shelf_total += item["quantity"]
-                        total_pieces += item["quantity"]
-                        all_items.append(item)  # For cost calculation
-                else:
-                    st.caption("Empty shelf")
-                    shelf_total = 0
-            
-            # SHELF UTILIZATION
-            with shelf_actions_col:
-                utilization = (shelf_total / shelf["capacity"]) * 100 if shelf["capacity"] > 0 else 0
-                st.metric("Used", f"{shelf_total}/{shelf['capacity']}")
-                
-                # Visual utilization bar
-                if utilization > 90:
-                    st.progress(utilization/100, text=f"{utilization:.0f}% Full")
-                elif utilization > 70:
-                    st.progress(utilization/100, text=f"{utilization:.0f}% Good")
-                else:
-                    st.progress(utilization/100, text=f"{utilization:.0f}% Space")
-            
-            st.markdown("---")
-        
         # KILN LOAD SUMMARY
-        if total_pieces > 0:
-            st.subheader("📊 Kiln Load Summary")
-            
-            summary_col1, summary_col2, summary_col3 = st.columns(3)
-            
-            with summary_col1:
-                st.metric("Total Pieces", total_pieces)
-                st.metric("Shelves Used", len([s for s in ss.kiln_shelves if s["items"]]))
-            
-            with summary_col2:
-                # Energy cost calculation
-                firing_type = ss.firing_type.lower()
-                if ss.inputs.get("fuel_gas", "Electric") == "Electric":
-                    if firing_type == "bisque":
-                        energy_per_firing = ss.inputs.get("kwh_bisque", 30.0) * ss.inputs.get("kwh_rate", 0.24)
-                    else:  # glaze
-                        energy_per_firing = ss.inputs.get("kwh_glaze", 35.0) * ss.inputs.get("kwh_rate", 0.24)
-                elif ss.inputs.get("fuel_gas", "Electric") == "Propane":
-                    if firing_type == "bisque":
-                        energy_per_firing = ss.inputs.get("lp_gal_bisque", 4.7) * ss.inputs.get("lp_price_per_gal", 3.50)
-                    else:  # glaze
-                        energy_per_firing = ss.inputs.get("lp_gal_glaze", 9.4) * ss.inputs.get("lp_price_per_gal", 3.50)
-                else:
-                    energy_per_firing = 25.0  # Default estimate
-                
-                energy_per_piece = energy_per_firing / max(1, total_pieces)
-                
-                st.metric("Energy Cost", money(energy_per_firing))
-                st.metric("Per Piece", money(energy_per_piece))
-            
-            with summary_col3:
-                # Firing time estimate
-                if firing_type == "bisque":
-                    firing_hours = 8 + 12  # fire + cool
-                else:  # glaze
-                    firing_hours = 8 + 24  # fire + cool
-                
-                st.metric("Firing Time", f"{firing_hours}h")
-                
-                # Efficiency rating
-                avg_utilization = sum((sum(item["quantity"] for item in shelf["items"]) / shelf["capacity"]) * 100 
-                                    for shelf in ss.kiln_shelves if shelf["items"]) / max(1, len([s for s in ss.kiln_shelves if s["items"]]))
-                
-                if avg_utilization > 85:
-                    efficiency = "🟢 Excellent"
-                elif avg_utilization > 70:
-                    efficiency = "🟡 Good"
-                else:
-                    efficiency = "🔴 Consider adding more"
-                
-                st.metric("Load Efficiency", f"{avg_utilization:.0f}%")
-                st.caption(efficiency)
-            
-            # DETAILED BREAKDOWN
-            with st.expander("🔍 Detailed breakdown", expanded=False):
-                st.markdown("**Items by type:**")
-                
-                # Group items by form
-                item_summary = {}
-                for item in all_items:
-                    form = item["form"]
-                    if form in item_summary:
-                        item_summary[form] += item["quantity"]
-                    else:
-                        item_summary[form] = item["quantity"]
-                
-                for form, total_qty in item_summary.items():
-                    st.write(f"• {total_qty}× {form}")
-                
-                st.markdown("**Energy cost breakdown:**")
-                fuel_type = ss.inputs.get("fuel_gas", "Electric")
-                st.write(f"• Fuel: {fuel_type}")
-                st.write(f"• {firing_type.title()} firing cost: {money(energy_per_firing)}")
-                st.write(f"• Cost per piece: {money(energy_per_piece)}")
-                
+        st.subheader("📊 Kiln Load Summary")
+
+        summary_col1, summary_col2, summary_col3 = st.columns(3)
+
+        with summary_col1:
+            st.metric("Total Pieces", kiln_totals["pieces"])
+            st.metric("Shelves Used", kiln_totals["shelves_used"])
+
+        with summary_col2:
+            st.metric("Energy Cost", money(energy_per_firing))
+            st.metric("Per Piece", money(kiln_totals["energy_per_piece"]))
+
+        with summary_col3:
+            st.metric("Firing Time", f"{KILN_FIRING_HOURS[ss.firing_type]}h")
+
+            # Efficiency rating
+            avg_utilization = kiln_totals["avg_utilization_pct"]
+            if avg_utilization > 85:
+                efficiency = "🟢 Excellent"
+            elif avg_utilization > 70:
+                efficiency = "🟡 Good"
+            else:
+                efficiency = "🔴 Consider adding more"
+
+            st.metric("Load Efficiency", f"{avg_utilization:.0f}%")
+            st.caption(efficiency)
+
+        # DETAILED BREAKDOWN
+        with st.expander("🔍 Detailed breakdown", expanded=False):
+            st.markdown("**Items by type:**")
+            st.dataframe(
+                loaded_forms,
+                column_config={
+                    "Weight": st.column_config.NumberColumn("Energy weight", format="%.2f"),
+                    "Energy_cost": st.column_config.NumberColumn("Energy cost", format="$%.2f"),
+                    "Energy_per_piece": st.column_config.NumberColumn("Per piece", format="$%.2f"),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
+
+            st.markdown("**Energy cost breakdown:**")
+            fuel_type = ss.inputs.get("fuel_gas", "Electric")
+            st.write(f"• Fuel: {fuel_type}")
+            st.write(f"• {firing_type.title()} firing cost: {money(energy_per_firing)}")
+            st.write(f"• Cost per piece: {money(kiln_totals['energy_per_piece'])} on average, "
+                     f"shared by {ss.inputs.get('energy_allocation', 'Per piece').lower()} (set on the Energy tab)")
+
 # ------------ Labor and overhead ------------
-with tabs[6]:
+with tabs[6], perf_section("tab: Labor and Overhead"):
     ip = ss.inputs
    
     st.subheader("Labor")
@@ -2879,7 +2675,7 @@ with tabs[6]:
     ip["pieces_per_month"] = st.number_input("Pieces per month", min_value=1, value=int(ip["pieces_per_month"]), step=10)
     
 # ------------ Pricing ------------
-with tabs[7]:
+with tabs[7], perf_section("tab: Pricing"):
     ip = ss.inputs
     
 
@@ -2899,13 +2695,12 @@ with tabs[7]:
 
     mode = st.radio("Glaze cost source", ["Recipe tab", "Manual table"], horizontal=True)
     if mode == "Manual table":
-        glaze_pp_cost, _ = glaze_cost_from_piece_table(ss.glaze_piece_df)
+        glaze_pp_cost, _ = derived("glaze_table", ip)
     else:
-        grams_pp = float(ss.get("recipe_grams_per_piece", 8.0))
-        _, glaze_pp_cost = glaze_per_piece_from_recipe(ss.catalog_df, ss.recipe_df, grams_pp)
+        _, glaze_pp_cost = derived("glaze_recipe", ip)
 
-    other_pp, _, _ = other_materials_pp(ss.other_mat_df, int(ss.inputs["units_made"]))
-    totals = calc_totals(ip, glaze_pp_cost, other_pp)
+    other_pp, _, _ = derived("other_materials", ip)
+    totals = derived("totals", ip, glaze_pp=glaze_pp_cost, other_pp=other_pp)
 
     st.subheader("Results")
 
@@ -2928,12 +2723,29 @@ with tabs[7]:
     st.metric("Overhead", money(totals["oh_pp"]))
     st.metric("Total cost per piece", money(totals["total_pp"]))
 
+    with st.expander("📋 Price sheet for every form", expanded=False):
+        st.caption(
+            "Forms with glazes assigned on the Glaze Recipe tab use those glazes; the rest use their default grams of the current recipe. "
+            "Forms with a clay body use its price, yield and reclaim."
+        )
+        _, recipe_cost_per_g = derived("glaze_recipe", ip, grams_per_piece=1.0)
+        sheet = priced_forms(ip, other_pp, recipe_cost_per_g, derived("glaze_library_costs", ip))
+        st.dataframe(
+            sheet,
+            column_config={c: st.column_config.NumberColumn(c.replace("_", " "), format="$%.2f") for c in sheet.columns if c != "Form"},
+            hide_index=True, use_container_width=True,
+        )
+        st.download_button(
+            "Download price sheet CSV", sheet.round(2).to_csv(index=False).encode("utf-8"),
+            file_name="price_sheet.csv", mime="text/csv", key="price_sheet_download",
+        )
+
 
 
 # ---------------- Shipping & Tariffs (functionalized) ----------------
 with tabs[8]:
     ip = ss.inputs
-with tabs[tab_titles.index("Shipping & Tariffs")]:
+with tabs[tab_titles.index("Shipping & Tariffs")], perf_section("tab: Shipping & Tariffs"):
     import math
 
     # ---------- helpers ----------
@@ -2965,14 +2777,15 @@ with tabs[tab_titles.index("Shipping & Tariffs")]:
     def render_domestic(sum_cols):
         """Domestic shipping estimator and metric updater."""
         sum_c1, sum_c2, sum_c3, sum_c4 = sum_cols
+        rates = shipping_rate_card()
 
         st.subheader("Domestic shipping (U.S.)")
         c1, c2, c3 = st.columns(3)
         with c1:
             pkg_weight_lb = st.number_input("Actual weight (lb)", min_value=0.0, step=0.1, value=3.0, key="dom_w")
-            zone = st.selectbox("Zone", ["Local", "Zone 2–4", "Zone 5–8"], index=1, key="dom_zone")
+            zone = st.selectbox("Zone", list(rates["zone_factor"]), index=1, key="dom_zone")
         with c2:
-            speed = st.selectbox("Service speed", ["Ground", "2-Day", "Overnight"], index=0, key="dom_speed")
+            speed = st.selectbox("Service speed", list(rates["speed_factor"]), index=0, key="dom_speed")
             insurance = st.number_input("Insurance (declared value $)", min_value=0.0, step=10.0, value=0.0, key="dom_ins")
         with c3:
             handling = st.number_input("Packing/handling time (mins)", min_value=0, step=5, value=10, key="dom_handling")
@@ -2990,19 +2803,19 @@ with tabs[tab_titles.index("Shipping & Tariffs")]:
 
         billable_lb = max(pkg_weight_lb, dim_wt)
 
-        # very simple base rate model (tweak to your table)
-        zone_factor = {"Local": 0.9, "Zone 2–4": 1.0, "Zone 5–8": 1.25}[zone]
-        speed_factor = {"Ground": 1.0, "2-Day": 1.9, "Overnight": 3.2}[speed]
-        base = 8.00 + (billable_lb * 1.10)  # base + per-lb
+        # very simple base rate model (tweak shipping_rates.json to your table)
+        zone_factor = rates["zone_factor"][zone]
+        speed_factor = rates["speed_factor"][speed]
+        base = rates["base"] + (billable_lb * rates["per_lb"])  # base + per-lb
         ship_cost = base * zone_factor * speed_factor
 
         # insurance & surcharges
-        insurance_fee = 0.0 if insurance <= 0 else max(2.0, 0.01 * insurance)
-        fuel_surcharge = 0.09 * ship_cost
+        insurance_fee = 0.0 if insurance <= 0 else max(rates["insurance_min"], rates["insurance_pct"] / 100.0 * insurance)
+        fuel_surcharge = rates["fuel_surcharge_pct"] / 100.0 * ship_cost
         residential_fee = st.checkbox("Residential delivery", value=True, key="dom_res")
-        residential = 4.25 if residential_fee else 0.0
+        residential = rates["residential_fee"] if residential_fee else 0.0
         signature = st.checkbox("Signature required", value=False, key="dom_sig")
-        signature_fee = 3.75 if signature else 0.0
+        signature_fee = rates["signature_fee"] if signature else 0.0
 
         handling_cost = (handling / 60.0) * labor_rate
 
@@ -3107,30 +2920,46 @@ with tabs[tab_titles.index("Shipping & Tariffs")]:
 
 
 # ------------ Save and load ------------
-with tabs[8]:
+with tabs[8], perf_section("tab: Save and Load"):
     
     st.subheader("Save and load settings")
+    settings_tables = {name: ensure_cols(ss[name], schema) for name, schema in SETTINGS_TABLE_SCHEMAS.items()}
     state = dict(
         inputs=ss.inputs,
-        glaze_piece_df=ensure_cols(ss.glaze_piece_df, {"Material": "", "Cost_per_lb": 0.0, "Grams_per_piece": 0.0}).to_dict(orient="list"),
-        catalog_df=ensure_cols(ss.catalog_df, {"Material": "", "Cost_per_lb": 0.0, "Cost_per_kg": 0.0}).to_dict(orient="list"),
-        recipe_df=ensure_cols(ss.recipe_df, {"Material": "", "Percent": 0.0}).to_dict(orient="list"),
         recipe_grams_per_piece=ss.recipe_grams_per_piece,
-        other_mat_df=ensure_cols(ss.other_mat_df, {"Item":"", "Unit":"", "Cost_per_unit":0.0, "Quantity_for_project":0.0}).to_dict(orient="list"),
-        unified_forms=ensure_cols(ss.unified_forms, UNIFIED_FORM_SCHEMA).to_dict(orient="list"),
+        **{name: df.to_dict(orient="list") for name, df in settings_tables.items()},
     )
     st.download_button("Download settings JSON", to_json_bytes(state), file_name="pottery_pricing_settings.json")
+    st.download_button(
+        "Download compact archive (large setups)",
+        to_archive_bytes(dict(inputs=ss.inputs, recipe_grams_per_piece=ss.recipe_grams_per_piece, **settings_tables)),
+        file_name="pottery_pricing_settings.zip",
+        mime="application/zip",
+        help="Arrow tables in a zip. Smaller and much faster to load than JSON for thousands of forms.",
+    )
     
-    up = st.file_uploader("Upload settings JSON", type=["json"])
-    if up is not None:
+    up = st.file_uploader("Upload settings JSON or compact archive", type=["json", "zip"])
+
+    # Only import once per uploaded file, then rerun so every tab (the recipe editor
+    # included, which is already drawn by now) starts from the loaded tables
+    up_id = (getattr(up, "file_id", None) or getattr(up, "name", None)) if up is not None else None
+    if up is not None and ss.get("_settings_import_id") != up_id:
         try:
-            data = from_json_bytes(up.read())
+            migrated = False
+            import_bar = st.progress(0.0, text="Reading settings…")
+            data, import_report = stream_settings_import(
+                up, progress=lambda frac, msg: import_bar.progress(min(1.0, frac), text=msg)
+            )
+            import_bar.empty()
             ss.inputs.update(data.get("inputs", {}))
 
             def dict_to_df(d, cols):
-                if not isinstance(d, dict) or not d:
+                if isinstance(d, pd.DataFrame):
+                    df = d
+                elif not isinstance(d, dict) or not d:
                     return pd.DataFrame(columns=cols)
-                df = pd.DataFrame(d)
+                else:
+                    df = pd.DataFrame(d)
                 for c in cols:
                     if c not in df.columns:
                         df[c] = []
@@ -3140,36 +2969,110 @@ with tabs[8]:
             ss.catalog_df = dict_to_df(data.get("catalog_df", {}), ["Material", "Cost_per_lb", "Cost_per_kg"])
             ss.recipe_df = dict_to_df(data.get("recipe_df", {}), ["Material", "Percent"])
             ss.other_mat_df = dict_to_df(data.get("other_mat_df", {}), ["Item","Unit","Cost_per_unit","Quantity_for_project"])
+            ss.glaze_library_df = dict_to_df(data.get("glaze_library_df", {}), list(GLAZE_LIBRARY_SCHEMA))
+            ss.form_glazes_df = dict_to_df(data.get("form_glazes_df", {}), list(FORM_GLAZE_SCHEMA))
+            ss.production_schedule_df = dict_to_df(data.get("production_schedule_df", {}), list(PRODUCTION_SCHEDULE_SCHEMA))
+            ss.inventory_ledger_df = dict_to_df(data.get("inventory_ledger_df", {}), list(INVENTORY_LEDGER_SCHEMA))
+            ss.clay_bodies_df = dict_to_df(data.get("clay_bodies_df", {}), list(CLAY_BODY_SCHEMA))
+            ss.oxide_analysis_df = dict_to_df(data.get("oxide_analysis_df", {}), list(OXIDE_ANALYSIS_SCHEMA))
+            if "material_on_hand_df" in data and ss.inventory_ledger_df.empty:
+                # Files saved before the ledger kept a plain on-hand list
+                ss.inventory_ledger_df = opening_balances(dict_to_df(data["material_on_hand_df"], list(MATERIAL_ON_HAND_SCHEMA)), ss.catalog_df)
             
             # Handle unified forms
             if "unified_forms" in data:
-                ss.unified_forms = dict_to_df(data["unified_forms"], list(UNIFIED_FORM_SCHEMA.keys()))
-                ss.unified_forms = ensure_cols(ss.unified_forms, UNIFIED_FORM_SCHEMA)
+                ss.unified_forms = compact_forms(dict_to_df(data["unified_forms"], list(UNIFIED_FORM_SCHEMA.keys())))
             else:
                 # Backward compatibility - migrate from old format if present
                 if any(key in data for key in ["form_presets_df", "production_forms", "custom_forms"]):
-                    # Temporarily load old data to session state for migration
+                    # Old tables are only needed for the migration, so they are not kept in session state
                     old_presets = dict_to_df(data.get("form_presets_df", {}), ["Form", "Clay_lb_wet", "Default_glaze_g", "Notes"])
                     old_production = dict_to_df(data.get("production_forms", {}), ["Form", "Throwing_min", "Trimming_min", "Handling_min", "Glazing_min", "Pieces_per_shelf", "Notes"])
                     old_custom = dict_to_df(data.get("custom_forms", {}), ["Form", "Throwing_min", "Trimming_min", "Handling_min", "Glazing_min", "Pieces_per_shelf", "Notes"])
                     
-                    # Store temporarily
-                    ss.form_presets_df = old_presets
-                    ss.production_forms = old_production  
-                    ss.custom_forms = old_custom
-                    
                     # Migrate to unified
-                    ss.unified_forms = migrate_to_unified_forms()
-                    st.info("✨ Migrated your old form data to new unified system!")
+                    ss.unified_forms = compact_forms(migrate_to_unified_forms(old_presets, old_production, old_custom))
+                    migrated = True
                 else:
                     # No form data in file, keep current
                     pass
             
             ss.recipe_grams_per_piece = float(data.get("recipe_grams_per_piece", ss.recipe_grams_per_piece))
-            st.success("✅ Settings loaded successfully!")
-            
+            ss._settings_import_id = up_id
+            ss._settings_import_done = (import_report, migrated)
+            st.rerun()
         except Exception as e:
             st.error(f"Could not load settings. {e}")
+    if "_settings_import_done" in ss:
+        import_report, migrated = ss.pop("_settings_import_done")
+        if migrated:
+            st.info("✨ Migrated your old form data to new unified system!")
+        st.success("✅ Settings loaded successfully!")
+        if import_report["error_count"]:
+            skipped = sum(import_report["rejected"].values())
+            st.warning(
+                f"⚠️ {import_report['error_count']} problem(s) found while importing"
+                + (f", {skipped} row(s) skipped" if skipped else "")
+                + ". Bad numbers were replaced with defaults."
+            )
+            with st.expander("Import problems", expanded=False):
+                st.dataframe(pd.DataFrame(import_report["errors"]), use_container_width=True)
+
+    # Versioned snapshots (stored in the studio database)
+    with st.expander("🕒 Snapshots and price history", expanded=False):
+        if SERVER_MODE:
+            st.info("Snapshots need the local studio database, which is off on this shared server.")
+        elif not ss.get("_studio_db_path"):
+            st.info("Turn on **Keep my data in a local database** in the sidebar to keep snapshots between sessions.")
+        else:
+            snap_conn = ss._studio_db_conn
+            snap_c1, snap_c2 = st.columns([3, 1])
+            snap_label = snap_c1.text_input("Snapshot label", placeholder="e.g. Before clay price increase", key="snapshot_label")
+            if snap_c2.button("📸 Take snapshot", key="take_snapshot_btn"):
+                snap_frames = {name: _studio_db_frame(name, ss[name]) for name in STUDIO_DB_TABLES}
+                sid, n_changed = create_snapshot(
+                    snap_conn, snap_frames, ss.inputs,
+                    {"recipe_grams_per_piece": ss.recipe_grams_per_piece}, snap_label.strip(),
+                )
+                st.success(f"Saved snapshot #{sid} ({n_changed} changed rows).")
+
+            snaps = list_snapshots(snap_conn)
+            if snaps.empty:
+                st.caption("No snapshots yet.")
+            else:
+                st.dataframe(snaps.drop(columns="Full"), use_container_width=True, hide_index=True)
+                snap_ids = snaps["Id"].tolist()
+                snap_names = {r.Id: f"#{r.Id} {r.Label or ''} ({r.Created})" for r in snaps.itertuples()}
+
+                restore_id = st.selectbox("Restore a snapshot", snap_ids, format_func=snap_names.get, key="snapshot_restore_id")
+                if st.button("↩️ Restore", key="restore_snapshot_btn"):
+                    frames, snap_inputs, snap_values = checkout_snapshot(snap_conn, restore_id)
+                    for name, df in frames.items():
+                        ss[name] = df
+                    ss.inputs.update(snap_inputs)
+                    ss.recipe_grams_per_piece = float(snap_values.get("recipe_grams_per_piece", ss.recipe_grams_per_piece))
+                    # Rerun so the recipe editor, drawn earlier in this run, shows the restored recipe
+                    ss._snapshot_restored = restore_id
+                    st.rerun()
+                if "_snapshot_restored" in ss:
+                    st.success(f"Restored snapshot #{ss.pop('_snapshot_restored')}.")
+
+                if len(snap_ids) > 1:
+                    st.markdown("**Price changes between snapshots**")
+                    d1, d2, d3 = st.columns([2, 2, 1])
+                    old_id = d1.selectbox("From", snap_ids, index=1, format_func=snap_names.get, key="snapshot_diff_old")
+                    new_id = d2.selectbox("To", snap_ids, index=0, format_func=snap_names.get, key="snapshot_diff_new")
+                    # Reprices both snapshots, so only on request; snapshots never change, so the ids identify the result
+                    pair = (ss._studio_db_path, old_id, new_id)
+                    if d3.button("🔍 Compare", key="snapshot_compare_btn"):
+                        ss._snapshot_diff = (pair, snapshot_price_diff(snap_conn, old_id, new_id))
+                    shown = ss.get("_snapshot_diff")
+                    if shown and shown[0] == pair:
+                        diff = shown[1]
+                        money_cols = {c: st.column_config.NumberColumn(c.replace("_", " "), format="$%.2f") for c in diff.columns if c != "Form"}
+                        st.dataframe(diff, column_config=money_cols, use_container_width=True, hide_index=True)
+                    else:
+                        st.caption("Pick two snapshots and press **Compare**.")
 
     # Show current unified forms status
     with st.expander("📊 Current unified forms database", expanded=False):
@@ -3197,12 +3100,11 @@ with tabs[8]:
          
 
 # ------------ Report ------------
-with tabs[10]:
+with tabs[10], perf_section("tab: Report"):
     ip = ss.inputs
-    grams_pp = float(ss.get("recipe_grams_per_piece", 8.0))
-    _, glaze_pp_from_recipe = glaze_per_piece_from_recipe(ss.catalog_df, ss.recipe_df, grams_pp)
-    other_pp, _, _ = other_materials_pp(ss.other_mat_df, int(ss.inputs["units_made"]))
-    totals = calc_totals(ip, glaze_pp_from_recipe, other_pp)
+    _, glaze_pp_from_recipe = derived("glaze_recipe", ip)
+    other_pp, _, _ = derived("other_materials", ip)
+    totals = derived("totals", ip, glaze_pp=glaze_pp_from_recipe, other_pp=other_pp)
 
     st.subheader("Per piece totals")
 
@@ -3239,7 +3141,7 @@ with tabs[10]:
     st.caption("Glaze costs calculated from Catalog cost per lb/kg and recipe percents.")
 
 # ------------ About ------------
-with tabs[11]:
+with tabs[11], perf_section("tab: About"):
     
     st.subheader("About this app")
     st.markdown("""
@@ -3258,7 +3160,7 @@ This app was created to help potters understand the true costs behind every piec
 
 ## 2. Per Unit
 - **Unified form management**: One database for clay weights, glaze amounts, timing data, and kiln info
-- **Form presets**: Choose from extensive library or create custom forms
+- **Form presets**: Add forms from the shared preset library by category, or create custom forms
 - **Clay costing**: Bag prices, yield calculations, and shrink rate helpers
 - **Advanced shrink tools**: Wet-to-fired calculations, lid remake helper with gallery height
 - **Glaze integration**: Connect to recipe tab or manual glaze costing
@@ -3307,8 +3209,10 @@ This app was created to help potters understand the true costs behind every piec
 ## 9. Save & Load
 - **Complete backup**: Download all settings, forms, and recipes as JSON
 - **Easy restore**: Upload saved settings to restore your complete setup
+- **Compact archive**: Large setups can be saved as a zip of Arrow tables that loads much faster
 - **Form management**: Export/import unified forms database as CSV
 - **Backward compatibility**: Automatically migrates old saved files
+- **Studio database**: Turn on the sidebar option to keep everything in a local SQLite file between sessions
 
 ## 10. Shipping & Tariffs
 - **Domestic shipping**: U.S. zones, dimensional weight, insurance calculations
@@ -3347,4 +3251,48 @@ Creek Road Pottery LLC
 ---
     """)
 
-    
+
+# ------------ Studio database sync (end of every rerun) ------------
+if ss.get("_studio_db_path"):
+    try:
+        with perf_section("studio database sync"):
+            sync_studio_db()
+    except Exception as e:
+        st.sidebar.error(f"Could not save to studio database. {e}")
+
+# ------------ Profiler panel ------------
+perf_breakdown = perf_end()
+if perf_breakdown is not None:
+    with st.sidebar:
+        st.subheader("⏱️ This rerun")
+        last_run = ss._perf_history[-1]
+        st.caption(
+            f"{last_run['Rerun_ms']:.0f} ms • {last_run['DataFrame_copies']} DataFrame copies • "
+            f"session state {last_run['Session_MB']:.2f} MB "
+            f"(+ {shared_forms_bytes() / 1e6:.2f} MB of forms shared by all sessions)"
+        )
+        st.dataframe(
+            perf_breakdown,
+            column_config={
+                "Total_ms": st.column_config.NumberColumn("Total ms", format="%.1f"),
+                "Mean_ms": st.column_config.NumberColumn("Mean ms", format="%.2f"),
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
+        with st.expander("Session memory by key"):
+            st.dataframe(session_memory(), hide_index=True, use_container_width=True)
+        with st.expander("Derived costs: recomputed vs reused"):
+            st.dataframe(ss.cost_graph.stats(), hide_index=True, use_container_width=True)
+        with st.expander("Table edits: recent change events"):
+            st.caption(" • ".join(f"{name} r{rev}" for name, rev in ss.table_revisions.items()) or "No edits yet.")
+            if ss.change_events:
+                st.dataframe(pd.DataFrame(ss.change_events[::-1]), hide_index=True, use_container_width=True)
+        perf_history = pd.DataFrame(ss._perf_history)
+        st.line_chart(perf_history[["Rerun_ms"]], height=150)
+        st.download_button(
+            "Download profiler history CSV",
+            perf_history.to_csv(index=False).encode("utf-8"),
+            file_name="rerun_profile_history.csv",
+            mime="text/csv",
+        )
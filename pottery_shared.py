@@ -0,0 +1,569 @@
+"""
+Read-only data shared by every session on a server process: starter forms,
+the preset library, the tariff table, the shipping rate card and the
+common-materials search index. Each loads once (st.cache_resource) and is
+never modified in place; sessions copy what they change. (Common materials are a tuple constant in pottery_core.)
+
+Kept out of the app script so the cached functions are defined once per
+process instead of on every rerun.
+"""
+import streamlit as st
+import pandas as pd
+
+from pottery_core import (
+    CATEGORY_ORDER, COMMON_MATERIALS, MATERIAL_ALIASES, MaterialIndex, compact_forms, infer_category,
+    load_default_presets_unified, load_rate_card,
+)
+
+
+@st.cache_resource(show_spinner=False)
+def starter_forms() -> pd.DataFrame:
+    """Forms a new session starts with. Held once per process; never edited in place."""
+    return compact_forms(load_default_presets_unified())
+
+
+# ---- Tariff rates loader (local JSON or URL) ----
+@st.cache_resource(show_spinner=False)
+def load_tariff_table(local_path: str = "tariff_rates.json", url: str = "") -> pd.DataFrame:
+    """One table per process, shared by every session: read it, don't modify it."""
+    df = pd.DataFrame(columns=["HS_code", "Description", "Country", "Duty_rate", "VAT_rate"])
+    # try local first
+    try:
+        df = pd.read_json(local_path)
+    except Exception:
+        pass
+    # optional URL override
+    if url:
+        try:
+            df = pd.read_json(url)
+        except Exception:
+            pass
+    # normalize columns
+    for col in ["HS_code", "Description", "Country"]:
+        if col not in df.columns:
+            df[col] = ""
+    for col in ["Duty_rate", "VAT_rate"]:
+        if col not in df.columns:
+            df[col] = 0.0
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
+    # clean
+    df["HS_code"] = df["HS_code"].astype(str).str.strip()
+    df["Country"] = df["Country"].astype(str).str.strip()
+    return df[["HS_code", "Description", "Country", "Duty_rate", "VAT_rate"]]
+
+
+@st.cache_resource(show_spinner=False)
+def shipping_rate_card() -> dict:
+    """Domestic rate card, read once per process and shared by every session."""
+    return load_rate_card("shipping_rates.json")
+
+
+@st.cache_resource(show_spinner=False)
+def common_material_index() -> MaterialIndex:
+    """Search index over the common materials and their aliases, built once per process."""
+    return MaterialIndex(COMMON_MATERIALS, MATERIAL_ALIASES)
+
+
+# --- Form presets: loader + shared library --------------------------------------
+@st.cache_data(show_spinner=False)
+def load_default_presets() -> pd.DataFrame:
+    """
+    Loads presets from your GitHub RAW CSV.
+    Falls back to a built-in 'Sharon set' if the CSV can't be read.
+    Columns: Form, Clay_lb_wet, Default_glaze_g, Notes
+    """
+    cols = {"Form": "", "Clay_lb_wet": 0.0, "Default_glaze_g": 0.0, "Notes": ""}
+
+    # Try your repo first (RAW URL)
+    url = "https://raw.githubusercontent.com/creekroadpottery/pottery-pricing-app/main/form_presets.csv"
+    try:
+        df = pd.read_csv(url)
+        for c, d in cols.items():
+            if c not in df.columns:
+                df[c] = d
+        return df[list(cols.keys())]
+    except Exception:
+        pass
+
+    # Fallback: Sharon’s starter list (edit/expand anytime)
+    fallback = pd.DataFrame(
+        [
+            {"Form": "Mug (12 oz)",              "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "straight"},
+            {"Form": "Mug (14 oz)",              "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Creamer (small)",          "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Pitcher (medium)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Bowl (cereal)",            "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "≈6\""},
+            {"Form": "Bowl (small)",             "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Bowl (medium)",            "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Bowl (large)",             "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Plate (10 in dinner)",     "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Pie plate",                "Clay_lb_wet": 3.25, "Default_glaze_g": 403, "Notes": "3¼–3½ lb"},
+            {"Form": "Sugar jar",                "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Honey jar",                "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Crock (small)",            "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
+            {"Form": "Crock (medium)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Crock (large)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Small cup",                       "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": "8 oz"},
+            {"Form": "Tumbler",                         "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "12 oz"},
+            {"Form": "Beer mug",                        "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "20 oz"},
+            {"Form": "Travel mug",                      "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "with handle"},
+            {"Form": "Soup bowl",                       "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "shallow"},
+            {"Form": "Ramen bowl",                      "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "deep"},
+            {"Form": "Mixing bowl (small)",             "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "≈8 in"},
+            {"Form": "Mixing bowl (medium)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "≈10 in"},
+            {"Form": "Mixing bowl (large)",             "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "≈12 in"},
+            {"Form": "Salad bowl (family)",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "≈14 in wide"},
+            {"Form": "Small plate (6 in)",              "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Dessert plate (8 in)",            "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Dinner plate (10 in)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Charger plate (12 in)",           "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Serving platter (small oval)",    "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "oval"},
+            {"Form": "Serving platter (medium 14 in)",  "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "round"},
+            {"Form": "Serving platter (large 16 in)",   "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": "round"},
+            {"Form": "Pasta bowl (wide rim)",           "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Pie dish (9 in)",                 "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Casserole (small, with lid)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Casserole (medium, with lid)",    "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Casserole (large, with lid)",     "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Covered jar (small)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "lidded"},
+            {"Form": "Covered jar (medium)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "lidded"},
+            {"Form": "Covered jar (large)",             "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "lidded"},
+            {"Form": "Pitcher (small)",                 "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Pitcher (medium)",                "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Pitcher (large)",                 "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Teapot (2-cup)",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "with lid"},
+            {"Form": "Teapot (4-cup)",                  "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with lid"},
+            {"Form": "Teapot (6-cup)",                  "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with lid"},
+            {"Form": "Teapot (8-cup)",                  "Clay_lb_wet": 6.50, "Default_glaze_g": 806, "Notes": "with lid"},
+            {"Form": "Sugar jar",                       "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Creamer",                         "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "spout"},
+            {"Form": "Butter dish (with lid)",          "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Salt cellar",                     "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Sponge holder",                   "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "cutouts"},
+            {"Form": "Utensil crock (small)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "tall"},
+            {"Form": "Utensil crock (large)",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "tall"},
+            {"Form": "Planter (4 in)",                  "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "drainage"},
+            {"Form": "Planter (6 in)",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "drainage"},
+            {"Form": "Planter (8 in)",                  "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "drainage"},
+            {"Form": "Planter (10 in)",                 "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "drainage"},
+            {"Form": "Vase (bud, 5 in)",                "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Vase (medium, 8 in)",             "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Vase (tall, 12 in)",              "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Luminary (small)",                "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "cutouts"},
+            {"Form": "Luminary (large)",                "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "cutouts"},
+            {"Form": "Baking dish (small rectangular)", "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Baking dish (large rectangular)", "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Loaf pan (small)",               "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Loaf pan (large)",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Batter bowl (with handle)",      "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "pour spout"},
+            {"Form": "Serving dish (oval, small)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Serving dish (oval, medium)",    "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Serving dish (oval, large)",     "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Chip & dip platter",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with center bowl"},
+            {"Form": "Cake stand (small)",             "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "6–8 in top"},
+            {"Form": "Cake stand (large)",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "10–12 in top"},
+            {"Form": "Covered butter keeper",          "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "French style"},
+            {"Form": "Egg baker",                      "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Soup tureen (small)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "with lid"},
+            {"Form": "Soup tureen (large)",            "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "with lid"},
+            {"Form": "Gravy boat",                     "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "with saucer"},
+            {"Form": "Serving spoon rest",             "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Oil cruet",                      "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pour spout"},
+            {"Form": "Honey pot",                      "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "with lid & dipper"},
+            {"Form": "Garlic keeper",                  "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pierced"},
+            {"Form": "Salsa bowl",                     "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Dip bowl (small)",               "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Dip bowl (medium)",              "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Dip bowl (large)",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Fruit bowl (small)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Fruit bowl (large)",             "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Berry bowl (pierced)",           "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "strainer style"},
+            {"Form": "Colander (small)",               "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with handles"},
+            {"Form": "Colander (large)",               "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with handles"},
+            {"Form": "Pasta bowl (individual)",        "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
+            {"Form": "Serving bowl (extra large)",     "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
+            {"Form": "Ice cream bowl",                 "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Candle holder (taper)",          "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Candle holder (pillar)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Lantern (pierced)",              "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Incense burner (cone)",          "Clay_lb_wet": 0.50, "Default_glaze_g": 62,  "Notes": ""},
+            {"Form": "Incense burner (stick)",         "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Wall pocket vase",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Wall planter",                   "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "flat back"},
+            {"Form": "Hanging planter (small)",        "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with holes"},
+            {"Form": "Hanging planter (large)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with holes"},
+            {"Form": "Orchid pot (pierced)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Succulent planter (tiny)",       "Clay_lb_wet": 0.50, "Default_glaze_g": 62,  "Notes": "2–3 in"},
+            {"Form": "Succulent planter (medium)",     "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "4–5 in"},
+            {"Form": "Succulent planter (large)",      "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "6–7 in"},
+            {"Form": "Mortar & pestle (small)",        "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with pestle"},
+            {"Form": "Mortar & pestle (large)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with pestle"},
+            {"Form": "Soup mug (with handle)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Handled bowl (breakfast)",       "Clay_lb_wet": 1.75, "Default_glaze_g": 218, "Notes": ""},
+            {"Form": "Pet bowl (small)",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Pet bowl (large)",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Water dish (animal trough)",     "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "sturdy"},
+            {"Form": "Wine goblet (small)",         "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "stemmed"},
+            {"Form": "Wine goblet (large)",         "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "stemmed"},
+            {"Form": "Beer stein (straight)",       "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "20 oz"},
+            {"Form": "Beer stein (tapered)",        "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": "24 oz"},
+            {"Form": "Tankard",                     "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "handle"},
+            {"Form": "Shot glass",                  "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": "single"},
+            {"Form": "Whiskey tumbler",             "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "lowball"},
+            {"Form": "Highball glass",              "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "tall"},
+            {"Form": "Cocktail coupe",              "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Martini glass",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Pitcher (extra large)",       "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": "gallon size"},
+            {"Form": "Serving bowl (pasta)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "wide"},
+            {"Form": "Serving bowl (salad)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": "extra large"},
+            {"Form": "Mixing bowl (small)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Mixing bowl (medium)",        "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Mixing bowl (large)",         "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Mortar bowl",                 "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with pestle"},
+            {"Form": "Colander (small)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with holes"},
+            {"Form": "Colander (large)",            "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with holes"},
+            {"Form": "Fruit bowl (small)",          "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Fruit bowl (large)",          "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Chip and dip platter",        "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "center dip"},
+            {"Form": "Deviled egg platter",         "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "indents"},
+            {"Form": "Butter dish",                 "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": "with lid"},
+            {"Form": "Cheese dome",                 "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "with plate"},
+            {"Form": "Cake stand",                  "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": "pedestal"},
+            {"Form": "Cupcake stand",               "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "tiered"},
+            {"Form": "Serving spoon rest",          "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Chopstick rest",              "Clay_lb_wet": 0.25, "Default_glaze_g": 31,  "Notes": ""},
+            {"Form": "Sushi plate (small)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Sushi plate (large)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Soy sauce dish",              "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
+            {"Form": "Rice bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Donburi bowl",                "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "Japanese large rice bowl"},
+            {"Form": "Noodle bowl",                 "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "ramen"},
+            {"Form": "Soup tureen",                 "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": "with lid"},
+            {"Form": "Handled soup bowl",           "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "with handle"},
+            {"Form": "Handled casserole",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "with lid"},
+            {"Form": "Bread pan",                   "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Loaf pan",                    "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
+            {"Form": "Bundt pan",                   "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Muffin pan (6 cup)",          "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Muffin pan (12 cup)",         "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Tart pan (small)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Tart pan (large)",            "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Candle holder (small)",       "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": "votive"},
+            {"Form": "Candle holder (taper)",       "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Candle holder (pillar)",      "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Lamp base (small)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Lamp base (large)",           "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Vase (bud)",                  "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Vase (small)",                "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Vase (medium)",               "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Vase (large)",                "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Vase (floor)",                "Clay_lb_wet": 12.0, "Default_glaze_g": 1488,"Notes": "tall"},
+            {"Form": "Urn (small)",                 "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Urn (medium)",                "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Urn (large)",                 "Clay_lb_wet": 10.0, "Default_glaze_g": 1240,"Notes": ""},
+            {"Form": "Planter (small)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Planter (medium)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Planter (large)",             "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Hanging planter",             "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with holes"},
+            {"Form": "Wall planter",                "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "flat back"},
+            {"Form": "Teapot (1 cup)",              "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "body only"},
+            {"Form": "Teapot (2 cup)",              "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Teapot (4 cup)",              "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Teapot (6 cup)",              "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
+            {"Form": "Teapot lid (small)",          "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
+            {"Form": "Teapot lid (medium)",         "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
+            {"Form": "Teapot lid (large)",          "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
+            {"Form": "Jar (1 pint)",                "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Jar (1 quart)",               "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Jar (half gallon)",           "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Jar (1 gallon)",              "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Cookie jar",                  "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "with lid"},
+            {"Form": "Canister (small)",            "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with lid"},
+            {"Form": "Canister (medium)",           "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Canister (large)",            "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Storage jar (extra large)",   "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Pitcher (small)",             "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Pitcher (medium)",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Pitcher (large)",             "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Tankard pitcher",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "sturdy"},
+            {"Form": "Ewer (decorative pitcher)",   "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Oil cruet",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pouring spout"},
+            {"Form": "Vinegar cruet",               "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "pouring spout"},
+            {"Form": "Salt cellar",                 "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": "with lid"},
+            {"Form": "Pepper cellar",               "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
+            {"Form": "Spice jar",                   "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
+            {"Form": "Honey pot",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "with lid and dipper"},
+            {"Form": "Garlic keeper",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "vent holes"},
+            {"Form": "Olive dish",                  "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "elongated"},
+            {"Form": "Relish tray",                 "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "compartments"},
+            {"Form": "Serving tray (small)",        "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Serving tray (medium)",       "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Serving tray (large)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Serving tray (extra large)",  "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Oval platter",                "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Rectangular platter",         "Clay_lb_wet": 6.50, "Default_glaze_g": 806, "Notes": ""},
+            {"Form": "Square platter",              "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Chip and dip tray",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "attached bowl"},
+            {"Form": "Deviled egg tray",            "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "12 wells"},
+            {"Form": "Cake plate (8 in)",           "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "footed"},
+            {"Form": "Cake plate (10 in)",          "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Cake plate (12 in)",          "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Cake stand (small)",          "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Cake stand (large)",          "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
+            {"Form": "Pie plate (8 in)",            "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Pie plate (9 in)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Pie plate (10 in)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Tart pan (8 in)",             "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": "fluted"},
+            {"Form": "Tart pan (10 in)",            "Clay_lb_wet": 2.75, "Default_glaze_g": 341, "Notes": ""},
+            {"Form": "Tart pan (12 in)",            "Clay_lb_wet": 3.25, "Default_glaze_g": 403, "Notes": ""},
+            {"Form": "Bread pan (standard)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Bread pan (large)",          "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Lasagna pan (small)",        "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Lasagna pan (large)",        "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Casserole (1 qt)",           "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with lid"},
+            {"Form": "Casserole (2 qt)",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "with lid"},
+            {"Form": "Casserole (3 qt)",           "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Casserole (4 qt)",           "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
+            {"Form": "Covered casserole (small)",  "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Covered casserole (large)",  "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
+            {"Form": "Dutch oven (small)",         "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Dutch oven (large)",         "Clay_lb_wet": 9.00, "Default_glaze_g": 1116,"Notes": ""},
+            {"Form": "Soup tureen (small)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
+            {"Form": "Soup tureen (large)",        "Clay_lb_wet": 10.0, "Default_glaze_g": 1240,"Notes": ""},
+            {"Form": "Stew pot",                   "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Bean pot",                   "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "with lid"},
+            {"Form": "Sauce pot (small)",          "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Sauce pot (medium)",         "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Sauce pot (large)",          "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
+            {"Form": "Baker (small)",              "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Baker (medium)",             "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Baker (large)",              "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Baker (rectangular)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Pizza stone (12 in)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Pizza stone (14 in)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": ""},
+            {"Form": "Pizza stone (16 in)",        "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Pizza pan (12 in)",          "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Pizza pan (14 in)",          "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Pizza pan (16 in)",          "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Tagine (small)",             "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": "with lid"},
+            {"Form": "Tagine (large)",             "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
+            {"Form": "Gratin dish (small)",        "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Gratin dish (medium)",       "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Gratin dish (large)",        "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Soufflé dish (small)",       "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Soufflé dish (medium)",      "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Soufflé dish (large)",       "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Mixing bowl (1 qt)",         "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Mixing bowl (2 qt)",         "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Mixing bowl (3 qt)",         "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Mixing bowl (4 qt)",         "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Mixing bowl (5 qt)",         "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
+            {"Form": "Colander (small)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "pierced"},
+            {"Form": "Colander (large)",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Berry bowl",                 "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "holes, drip plate"},
+            {"Form": "Strainer bowl",              "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Salad bowl (8 in)",          "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Salad bowl (10 in)",         "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Salad bowl (12 in)",         "Clay_lb_wet": 6.50, "Default_glaze_g": 806, "Notes": ""},
+            {"Form": "Punch bowl (large)",         "Clay_lb_wet": 10.0, "Default_glaze_g": 1240,"Notes": ""},
+            {"Form": "Serving bowl (small)",       "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Serving bowl (medium)",      "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Serving bowl (large)",       "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Serving bowl (XL)",          "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Serving platter (oval)",     "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Serving platter (rect)",     "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
+            {"Form": "Serving platter (round)",    "Clay_lb_wet": 8.00, "Default_glaze_g": 992, "Notes": ""},
+            {"Form": "Serving tray (handles)",     "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Chip bowl",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Dip bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Chip-and-dip set",           "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "combined"},
+            {"Form": "Soup bowl (shallow)",        "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Soup bowl (deep)",           "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": ""},
+            {"Form": "Stew bowl",                  "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "French onion soup crock",    "Clay_lb_wet": 2.75, "Default_glaze_g": 341, "Notes": "with handles"},
+            {"Form": "Soup mug",                   "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Ramen bowl",                 "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "deep, wide"},
+            {"Form": "Pho bowl",                   "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Pasta bowl (wide)",          "Clay_lb_wet": 2.75, "Default_glaze_g": 341, "Notes": ""},
+            {"Form": "Pasta bowl (deep)",          "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Ice cream bowl",             "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Dessert bowl",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Custard cup",                "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Ramekin (small)",            "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
+            {"Form": "Ramekin (large)",            "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": ""},
+            {"Form": "Pudding bowl",               "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Trifle bowl",                "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Compote dish (small)",       "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "stemmed"},
+            {"Form": "Compote dish (large)",       "Clay_lb_wet": 2.25, "Default_glaze_g": 279, "Notes": ""},
+            {"Form": "Candy dish",                 "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Nut bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Relish tray (3-part)",       "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Relish tray (5-part)",       "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Divided dish",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Butter dish (tray)",         "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Butter dish (covered)",      "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "with lid"},
+            {"Form": "Mug (12 oz)",                 "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "straight"},
+            {"Form": "Mug (14 oz)",                 "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Creamer (small)",             "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": ""},
+            {"Form": "Pitcher (medium)",            "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Bowl (cereal)",               "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "≈6\""},
+            {"Form": "Bowl (small)",                "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Bowl (medium)",               "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Bowl (large)",                "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": ""},
+            {"Form": "Plate (10 in dinner)",        "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Pie plate",                   "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "3¼–3½ lb"},
+            {"Form": "Sugar jar",                   "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Honey jar",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Crock (small)",               "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": ""},
+            {"Form": "Crock (medium)",              "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Crock (large)",               "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Small cup",                   "Clay_lb_wet": 0.75, "Default_glaze_g": 93,  "Notes": "8 oz"},
+            {"Form": "Tumbler",                     "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": "12 oz"},
+            {"Form": "Beer mug",                    "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "20 oz"},
+            {"Form": "Travel mug",                  "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": "with handle"},
+            {"Form": "Soup bowl",                   "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": "shallow"},
+            {"Form": "Ramen bowl",                  "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "deep"},
+            {"Form": "Mixing bowl (small)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "≈8 in"},
+            {"Form": "Mixing bowl (medium)",        "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "≈10 in"},
+            {"Form": "Mixing bowl (large)",         "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": "≈12 in"},
+            {"Form": "Pasta bowl (wide)",           "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
+            {"Form": "Serving bowl (small)",        "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
+            {"Form": "Serving bowl (medium)",       "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
+            {"Form": "Serving bowl (large)",        "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": ""},
+            {"Form": "Salad bowl (medium)",         "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": ""},
+            {"Form": "Salad bowl (large)",          "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Batter bowl (small)",         "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": "with spout"},
+            {"Form": "Batter bowl (large)",         "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": "with handle"},
+            {"Form": "Casserole (1 qt, covered)",   "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": ""},
+            {"Form": "Casserole (2 qt, covered)",   "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": ""},
+            {"Form": "Baker (rect, small)",         "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Baker (rect, large)",         "Clay_lb_wet": 5.00, "Default_glaze_g": 620, "Notes": ""},
+            {"Form": "Bread pan",                   "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Lasagna pan",                 "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Gratin dish (oval)",          "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
+            {"Form": "Tart pan (9 in)",             "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": ""},
+            {"Form": "Quiche dish (9 in)",          "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
+            {"Form": "Custard cup",                 "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
+            {"Form": "Ramekin (large)",             "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": ""},
+            {"Form": "Pie bird",                    "Clay_lb_wet": 0.25, "Default_glaze_g": 32,  "Notes": ""},
+            {"Form": "Butter dish (covered)",       "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Cheese dome (small)",         "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": "with plate"},
+            {"Form": "Chip and dip set",            "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": "2-piece"},
+            {"Form": "Relish tray (3-section)",     "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
+            {"Form": "Divided dish (oval)",         "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Dinner plate (8 in)",         "Clay_lb_wet": 1.80, "Default_glaze_g": 224, "Notes": ""},
+            {"Form": "Dinner plate (9 in)",         "Clay_lb_wet": 2.10, "Default_glaze_g": 261, "Notes": ""},
+            {"Form": "Dinner plate (10 in)",        "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Dinner plate (11 in)",        "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Dinner plate (12 in)",        "Clay_lb_wet": 3.60, "Default_glaze_g": 447, "Notes": "charger"},
+            {"Form": "Salad plate (8 in)",          "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": ""},
+            {"Form": "Dessert plate (7 in)",        "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Bread plate (6 in)",          "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": ""},
+            {"Form": "Charger (13 in)",             "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": ""},
+            {"Form": "Sushi plate (rect small)",    "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": ""},
+            {"Form": "Sushi plate (rect large)",    "Clay_lb_wet": 2.20, "Default_glaze_g": 273, "Notes": ""},
+            {"Form": "Platter (oval small)",        "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
+            {"Form": "Platter (oval medium)",       "Clay_lb_wet": 4.00, "Default_glaze_g": 496, "Notes": ""},
+            {"Form": "Platter (oval large)",        "Clay_lb_wet": 5.50, "Default_glaze_g": 682, "Notes": ""},
+            {"Form": "Platter (rect small)",        "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": ""},
+            {"Form": "Platter (rect large)",        "Clay_lb_wet": 5.25, "Default_glaze_g": 651, "Notes": ""},
+            {"Form": "Sectional platter",           "Clay_lb_wet": 4.50, "Default_glaze_g": 558, "Notes": "party"},
+            {"Form": "Gobo cup (sake)",             "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
+            {"Form": "Tea cup (handle-less)",       "Clay_lb_wet": 0.70, "Default_glaze_g": 87,  "Notes": ""},
+            {"Form": "Goblet",                      "Clay_lb_wet": 1.25, "Default_glaze_g": 155, "Notes": ""},
+            {"Form": "Wine goblet (large)",         "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": ""},
+            {"Form": "Beer stein (heavy)",          "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": ""},
+            {"Form": "Highball",                    "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Lowball",                     "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": ""},
+            {"Form": "Martini coupe",               "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": ""},
+            {"Form": "Shot cup",                    "Clay_lb_wet": 0.35, "Default_glaze_g": 44,  "Notes": ""},
+            {"Form": "Teapot (2-cup)",              "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": "w/ lid"},
+            {"Form": "Teapot (4-cup)",              "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "w/ lid"},
+            {"Form": "Creamer (medium)",            "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": ""},
+            {"Form": "Sugar jar (with lid)",        "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": ""},
+            {"Form": "Coffee server",               "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": "pour spout"},
+            {"Form": "Pour-over dripper",           "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "cone"},
+            {"Form": "Pitcher (small)",             "Clay_lb_wet": 1.50, "Default_glaze_g": 186, "Notes": ""},
+            {"Form": "Pitcher (large)",             "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
+            {"Form": "Ewer (decorative)",           "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": ""},
+            {"Form": "Canister (small)",            "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "with lid"},
+            {"Form": "Canister (medium)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "with lid"},
+            {"Form": "Canister (large)",            "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "with lid"},
+            {"Form": "Cookie jar",                  "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": "with lid"},
+            {"Form": "Utensil crock",               "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "tall"},
+            {"Form": "Salt pig",                    "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": ""},
+            {"Form": "Spice jar",                   "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
+            {"Form": "Butter keeper (water seal)",  "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": ""},
+            {"Form": "Olive dish",                  "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "narrow"},
+            {"Form": "Relish dish (long)",          "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": ""},
+            {"Form": "Tray w/ handles (small)",     "Clay_lb_wet": 1.80, "Default_glaze_g": 224, "Notes": ""},
+            {"Form": "Tray w/ handles (large)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": ""},
+            {"Form": "Deviled egg plate",           "Clay_lb_wet": 2.40, "Default_glaze_g": 298, "Notes": "12 wells"},
+            {"Form": "Mortar & pestle (small)",     "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": ""},
+            {"Form": "Mortar & pestle (large)",     "Clay_lb_wet": 2.75, "Default_glaze_g": 342, "Notes": ""},
+            {"Form": "Colander (small)",            "Clay_lb_wet": 1.80, "Default_glaze_g": 224, "Notes": "pierced"},
+            {"Form": "Colander (large)",            "Clay_lb_wet": 2.80, "Default_glaze_g": 347, "Notes": "pierced"},
+            {"Form": "Oil cruet",                   "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "cork"},
+            {"Form": "Syrup pitcher",               "Clay_lb_wet": 1.00, "Default_glaze_g": 124, "Notes": ""},
+            {"Form": "Soap dispenser bottle",       "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": "pump"},
+            {"Form": "Utensil holder (wide)",       "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": ""},
+            {"Form": "Lamp base (small)",           "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": "wired"},
+            {"Form": "Lamp base (large)",           "Clay_lb_wet": 4.25, "Default_glaze_g": 528, "Notes": "wired"},
+            {"Form": "Candle holder (taper)",       "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": ""},
+            {"Form": "Votive/tea-light",            "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": "luminary"},
+            {"Form": "Lantern (pierced)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "cutouts"},
+            {"Form": "Planter (4 in)",              "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": "with hole"},
+            {"Form": "Planter (6 in)",              "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "with hole"},
+            {"Form": "Planter (8 in)",              "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "with hole"},
+            {"Form": "Planter (10 in)",             "Clay_lb_wet": 4.75, "Default_glaze_g": 589, "Notes": "with hole"},
+            {"Form": "Hanging planter (small)",     "Clay_lb_wet": 1.75, "Default_glaze_g": 217, "Notes": "with holes"},
+            {"Form": "Hanging planter (large)",     "Clay_lb_wet": 3.00, "Default_glaze_g": 372, "Notes": "with holes"},
+            {"Form": "Self-watering planter",       "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "insert"},
+            {"Form": "Bird feeder",                 "Clay_lb_wet": 2.00, "Default_glaze_g": 248, "Notes": "hanging"},
+            {"Form": "Bird bath (bowl)",            "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "wide"},
+            {"Form": "Wind chime tubes (set)",      "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": "stringing"},
+            {"Form": "Wind bell",                   "Clay_lb_wet": 0.90, "Default_glaze_g": 112, "Notes": "clapper"},
+            {"Form": "Tile (4×4 in)",               "Clay_lb_wet": 0.40, "Default_glaze_g": 50,  "Notes": ""},
+            {"Form": "Tile (6×6 in)",               "Clay_lb_wet": 0.85, "Default_glaze_g": 106, "Notes": ""},
+            {"Form": "Trivet (round)",              "Clay_lb_wet": 1.20, "Default_glaze_g": 149, "Notes": "feet"},
+            {"Form": "Switch plate (double)",       "Clay_lb_wet": 0.50, "Default_glaze_g": 62,  "Notes": ""},
+            {"Form": "Vase (bud)",                  "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
+            {"Form": "Vase (table)",                "Clay_lb_wet": 2.25, "Default_glaze_g": 280, "Notes": ""},
+            {"Form": "Vase (floor)",                "Clay_lb_wet": 6.50, "Default_glaze_g": 807, "Notes": "tall"},
+            {"Form": "Urn (small)",                 "Clay_lb_wet": 3.75, "Default_glaze_g": 465, "Notes": "lid"},
+            {"Form": "Urn (large)",                 "Clay_lb_wet": 6.00, "Default_glaze_g": 744, "Notes": "lid"},
+            {"Form": "Sculpture (small)",           "Clay_lb_wet": 2.50, "Default_glaze_g": 310, "Notes": "figurine"},
+            {"Form": "Sculpture (bust)",            "Clay_lb_wet": 7.50, "Default_glaze_g": 930, "Notes": ""},
+            {"Form": "Mask (wall)",                 "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": "hang loop"},
+            {"Form": "Clock face (pottery)",        "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": "fit movement"},
+            {"Form": "Sponge holder",               "Clay_lb_wet": 0.60, "Default_glaze_g": 75,  "Notes": "kitchen"},
+            {"Form": "Spoon rest",                  "Clay_lb_wet": 0.80, "Default_glaze_g": 100, "Notes": ""},
+            {"Form": "Measuring cup (1 cup)",       "Clay_lb_wet": 1.10, "Default_glaze_g": 137, "Notes": "spout"},
+            {"Form": "Measuring cup (2 cup)",       "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": "spout"},
+            {"Form": "Gravy boat",                  "Clay_lb_wet": 1.40, "Default_glaze_g": 174, "Notes": "with saucer"},
+            {"Form": "Soup tureen (large)",         "Clay_lb_wet": 6.50, "Default_glaze_g": 807, "Notes": "with lid"},
+            {"Form": "Tagine (base+lid)",           "Clay_lb_wet": 6.25, "Default_glaze_g": 775, "Notes": "oven"},
+            {"Form": "Pizza stone (round)",         "Clay_lb_wet": 5.25, "Default_glaze_g": 651, "Notes": "unglazed surface"},
+            {"Form": "Baguette tray",               "Clay_lb_wet": 3.50, "Default_glaze_g": 434, "Notes": "vented"},
+            {"Form": "Roaster (oval)",              "Clay_lb_wet": 5.75, "Default_glaze_g": 713, "Notes": "handles"},
+            {"Form": "Dutch oven (covered)",        "Clay_lb_wet": 7.00, "Default_glaze_g": 868, "Notes": "heavy"},
+            {"Form": "Cloche (bread dome)",         "Clay_lb_wet": 5.75, "Default_glaze_g": 713, "Notes": "base+lid"},
+            {"Form": "Watering can (ceramic)",      "Clay_lb_wet": 3.25, "Default_glaze_g": 404, "Notes": "garden"},
+            {"Form": "Fountain bowl",               "Clay_lb_wet": 7.25, "Default_glaze_g": 899, "Notes": "outdoor"},
+            {"Form": "Wall pocket (planter)",       "Clay_lb_wet": 1.60, "Default_glaze_g": 199, "Notes": "hang loop"},           
+            
+
+
+        ]
+    )
+    return fallback
+
+@st.cache_resource(show_spinner=False)
+def preset_library() -> pd.DataFrame:
+    """
+    The full preset list in unified form, held once per process and shared by
+    every session. Sessions copy rows out of it; nothing writes to it.
+    """
+    library = compact_forms(load_default_presets()).drop_duplicates(subset=["Form"], keep="last").reset_index(drop=True)
+    library["Category"] = pd.Categorical(library["Form"].map(infer_category), categories=CATEGORY_ORDER)
+    return library